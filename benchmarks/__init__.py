@@ -0,0 +1,7 @@
+"""
+성능 벤치마크 패키지
+
+합성 OHLCV 데이터로 주요 계산 경로의 실행 시간을 측정하고
+JSON 기준값(baseline)과 비교하여 성능 회귀를 검출합니다.
+네트워크 접근 없이 완전히 오프라인으로 동작합니다.
+"""
@@ -0,0 +1,68 @@
+"""
+지표/시그널 데이터프레임 조립 벤치마크 모듈
+
+``TechnicalIndicator.calculate_all`` 과 ``SignalGenerator.generate_all`` 의 실행 시간과
+``tracemalloc`` 으로 측정한 최대 메모리 사용량(peak)을 출력합니다.
+
+사용 예시:
+    python -m benchmarks.assembly --bars 1000000 --freq min
+    python -m benchmarks.assembly --workers 4
+"""
+
+import argparse
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.harness import add_baseline_arguments, finish, time_call
+from benchmarks.synthetic import generate_ohlcv
+from src.signal_generator import SignalGenerator
+from src.technical_indicator import TechnicalIndicator
+
+
+def peak_memory(fn: Callable[[], object]) -> float:
+    """함수 실행 중 새로 할당된 메모리의 최대값(MB)을 반환합니다."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024**2
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """조립 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="지표/시그널 조립 벤치마크")
+    parser.add_argument("--bars", type=int, default=100_000, help="봉 개수")
+    parser.add_argument("--freq", default="min", help="봉 주기")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--workers", type=int, default=1, help="지표 계산 스레드 수")
+    add_baseline_arguments(parser, "assembly")
+    args = parser.parse_args(argv)
+
+    indicator = TechnicalIndicator(
+        df=generate_ohlcv(args.bars, seed=42, freq=args.freq),
+        max_workers=args.workers,
+    )
+    indicator.calculate_all()
+    generator = SignalGenerator(indicators_df=indicator.indicators_df)
+
+    cases: Dict[str, Callable[[], object]] = {
+        "assembly.calculate_all": indicator.calculate_all,
+        "assembly.generate_all": generator.generate_all,
+    }
+    results: Dict[str, float] = {}
+    for name, fn in cases.items():
+        results[name] = time_call(fn, args.repeat)
+        peak = peak_memory(fn)
+        print(f"{name}: {results[name]:.3f}s, 최대 메모리 {peak:.1f} MB")
+
+    frame = indicator.indicators_df
+    data_mb = frame.memory_usage(index=True).sum() / 1024**2
+    print(f"지표 데이터 {frame.shape[1]}칼럼 {data_mb:.1f} MB\n")
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
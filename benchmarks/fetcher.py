@@ -0,0 +1,78 @@
+"""
+다중 심볼 수집 벤치마크 모듈
+
+합성 유니버스를 파일로 저장하고 지연을 흉내 낸 ``FileProvider`` 로
+동시 수집 시간을 측정합니다. 직렬 왕복 시간(심볼 수 × 지연)과
+속도 제한 하한(심볼 수 / 초당 요청 수)을 함께 출력합니다.
+
+사용 예시:
+    python -m benchmarks.fetcher --symbols 500 --latency 0.05 --rate-limit 100
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.harness import add_baseline_arguments, finish
+from benchmarks.synthetic import generate_universe, write_universe
+from src.fetcher import MultiSymbolFetcher
+from src.providers import FileProvider
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """수집 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="다중 심볼 동시 수집 벤치마크")
+    parser.add_argument("--symbols", type=int, default=500, help="심볼 개수")
+    parser.add_argument("--bars", type=int, default=250, help="심볼당 봉 개수")
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="요청당 왕복 지연 (초)"
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.02, help="일시적 실패 확률"
+    )
+    parser.add_argument("--rate-limit", type=float, default=100.0, help="초당 요청 수")
+    parser.add_argument("--workers", type=int, default=16, help="동시 요청 스레드 수")
+    add_baseline_arguments(parser, "fetcher")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        universe = generate_universe(args.bars, args.symbols, seed=42)
+        write_universe(universe, Path(tmp))
+
+        provider = FileProvider(
+            Path(tmp), latency=args.latency, failure_rate=args.failure_rate, seed=0
+        )
+        fetcher = MultiSymbolFetcher(
+            provider,
+            max_workers=args.workers,
+            rate_limit=args.rate_limit,
+            burst=args.workers,
+            backoff_base=0.05,
+            backoff_max=0.5,
+        )
+        result = fetcher.fetch_all(universe.keys(), start=date(1900, 1, 1))
+
+    summary = result.summary()
+    serial = summary["requests"] * args.latency
+    rate_bound = summary["requests"] / args.rate_limit
+    print(
+        f"심볼 {summary['succeeded']}/{summary['symbols']}개, "
+        f"요청 {summary['requests']}회 (재시도 {summary['retries']}회)"
+    )
+    print(f"동시 수집:        {summary['elapsed']:8.2f}s")
+    print(f"직렬 왕복 추정:   {serial:8.2f}s")
+    print(f"속도 제한 하한:   {rate_bound:8.2f}s")
+    print()
+
+    results = {f"fetch.{args.symbols}symbols": summary["elapsed"]}
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
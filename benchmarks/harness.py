@@ -0,0 +1,164 @@
+"""
+벤치마크 실행 및 기준값 비교 모듈
+
+측정 결과를 JSON 기준값으로 저장하고, 허용 오차를 넘는 성능 회귀를 검출합니다.
+"""
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# 이 값보다 작은 절대 증가량은 측정 잡음으로 간주
+DEFAULT_MIN_DELTA = 0.002
+
+
+def time_call(fn: Callable[[], Any], repeat: int = 3) -> float:
+    """함수 실행 시간을 측정합니다.
+
+    Args:
+        fn (Callable[[], Any]): 측정할 함수
+        repeat (int): 반복 횟수
+
+    Returns:
+        float: 반복 측정값 중 최솟값 (초)
+    """
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def environment() -> Dict[str, str]:
+    """측정 환경 정보를 반환합니다."""
+    import numpy as np
+    import pandas as pd
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "created": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, float]]:
+    """기준값 파일을 읽습니다. 파일이 없으면 None을 반환합니다."""
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: Path, results: Dict[str, float]) -> None:
+    """측정 결과를 기준값 파일로 저장합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"meta": environment(), "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> List[str]:
+    """측정 결과를 기준값과 비교하여 회귀한 항목을 반환합니다.
+
+    Args:
+        results (Dict[str, float]): 현재 측정값
+        baseline (Dict[str, float]): 기준값
+        tolerance (float): 허용 상대 증가율 (0.25 = 25%)
+        min_delta (float): 회귀로 판단할 최소 절대 증가량 (초)
+
+    Returns:
+        List[str]: 회귀한 항목 이름 목록
+    """
+    regressions = []
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if value > base * (1 + tolerance) and value - base > min_delta:
+            regressions.append(name)
+    return regressions
+
+
+def print_report(
+    results: Dict[str, float],
+    baseline: Optional[Dict[str, float]],
+    regressions: List[str],
+) -> None:
+    """측정 결과 표를 출력합니다."""
+    width = max((len(name) for name in results), default=10)
+    print(f"{'benchmark':<{width}}  {'current':>10}  {'baseline':>10}  {'ratio':>7}")
+    for name, value in results.items():
+        base = baseline.get(name) if baseline else None
+        base_str = f"{base:10.4f}" if base is not None else f"{'-':>10}"
+        ratio_str = f"{value / base:7.2f}" if base else f"{'-':>7}"
+        flag = "  << REGRESSION" if name in regressions else ""
+        print(f"{name:<{width}}  {value:10.4f}  {base_str}  {ratio_str}{flag}")
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser, default_name: str) -> None:
+    """기준값 관련 공통 명령행 인자를 추가합니다."""
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE_DIR / f"{default_name}.json",
+        help="기준값 JSON 파일 경로",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="현재 측정값으로 기준값을 갱신",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="허용 상대 증가율 (기본 0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA,
+        help="회귀로 판단할 최소 절대 증가량 (초)",
+    )
+
+
+def finish(results: Dict[str, float], args: argparse.Namespace) -> int:
+    """결과를 출력하고 기준값과 비교하거나 갱신합니다.
+
+    Returns:
+        int: 종료 코드 (회귀가 있으면 1)
+    """
+    baseline = load_baseline(args.baseline)
+
+    if args.update_baseline:
+        print_report(results, baseline, [])
+        save_baseline(args.baseline, results)
+        print(f"\n기준값 저장 완료: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print_report(results, None, [])
+        print(f"\n기준값 없음: {args.baseline} (--update-baseline 으로 생성)")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta)
+    print_report(results, baseline, regressions)
+    if regressions:
+        print(f"\n성능 회귀 {len(regressions)}건 (허용 오차 {args.tolerance:.0%})")
+        return 1
+    print("\n성능 회귀 없음")
+    return 0
@@ -0,0 +1,104 @@
+"""
+CSV 로더 벤치마크 모듈
+
+기존 방식(``pd.read_csv`` + 추론 ``pd.to_datetime``)과 ``src.loader`` 의
+타입 지정 파싱, 스냅샷 생성, 스냅샷 재사용 시간을 비교합니다.
+
+사용 예시:
+    python -m benchmarks.loader --bars 1000000 --freq min
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import add_baseline_arguments, finish, time_call
+from benchmarks.synthetic import generate_ohlcv
+from src.loader import load_csv, read_ohlcv, snapshot_path
+
+
+def _legacy_load(path: Path) -> pd.DataFrame:
+    """변경 전 로드 방식"""
+    df = pd.read_csv(path)
+    df["Date"] = pd.to_datetime(df["Date"])
+    return df
+
+
+def _write_wide(ohlcv: pd.DataFrame, path: Path, n_columns: int) -> None:
+    """지표 파일과 같은 모양(날짜 + 실수 칼럼 다수)의 파일을 씁니다."""
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal((len(ohlcv), n_columns))
+    wide = pd.DataFrame(values, columns=[f"IND_{i}(14)" for i in range(n_columns)])
+    wide.insert(0, "Date", ohlcv["Date"])
+    wide.to_csv(path, index=False)
+
+
+def bench_file(name: str, path: Path, loader, repeat: int) -> Dict[str, float]:
+    """한 파일에 대해 로드 방식별 시간을 측정합니다."""
+    snap = snapshot_path(path)
+
+    def cold() -> None:
+        if snap.exists():
+            snap.unlink()
+        loader(path, snapshot=True)
+
+    def touched() -> None:
+        # 내용은 같고 수정 시각만 바뀐 경우 (해시 비교 경로)
+        os.utime(path)
+        loader(path, snapshot=True)
+
+    results = {
+        f"load.{name}.legacy": time_call(lambda: _legacy_load(path), repeat),
+        f"load.{name}.typed": time_call(lambda: loader(path, snapshot=False), repeat),
+        f"load.{name}.snapshot_cold": time_call(cold, repeat),
+    }
+    loader(path, snapshot=True)
+    results[f"load.{name}.snapshot_warm"] = time_call(
+        lambda: loader(path, snapshot=True), repeat
+    )
+    results[f"load.{name}.snapshot_touched"] = time_call(touched, repeat)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """로더 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="CSV 로더/스냅샷 벤치마크")
+    parser.add_argument("--bars", type=int, default=200_000, help="봉 개수")
+    parser.add_argument("--freq", default="min", help="봉 주기")
+    parser.add_argument("--columns", type=int, default=40, help="지표 파일 칼럼 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    add_baseline_arguments(parser, "loader")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        ohlcv = generate_ohlcv(args.bars, seed=42, freq=args.freq)
+        ohlcv_file = Path(tmp) / "ohlcv.csv"
+        ohlcv.to_csv(ohlcv_file, index=False)
+        wide_file = Path(tmp) / "indicators.csv"
+        _write_wide(ohlcv, wide_file, args.columns)
+
+        results.update(bench_file("ohlcv", ohlcv_file, read_ohlcv, args.repeat))
+        results.update(bench_file("indicators", wide_file, load_csv, args.repeat))
+
+        # 결과 동일성 확인
+        assert read_ohlcv(ohlcv_file).equals(read_ohlcv(ohlcv_file, snapshot=False))
+
+    for name in ["ohlcv", "indicators"]:
+        legacy = results[f"load.{name}.legacy"]
+        warm = results[f"load.{name}.snapshot_warm"]
+        print(
+            f"{name}: 기존 {legacy:.3f}s → 스냅샷 {warm:.4f}s ({legacy / warm:.0f}배)"
+        )
+    print()
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
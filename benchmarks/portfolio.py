@@ -0,0 +1,102 @@
+"""
+포트폴리오 백테스트 벤치마크 모듈
+
+상위 k개 리밸런싱 포트폴리오 백테스트 방식의 시간을 비교합니다.
+
+- loop: 봉마다 보유 수량으로 평가하고 리밸런싱 날짜에 다시 매수하는 기준 구현
+- vectorized: ``src.portfolio.backtest`` (리밸런싱 구간 단위 배열 연산)
+- variants: 파라미터 조합별 ``run_variants`` 순차 계산과 프로세스 풀 계산
+
+사용 예시:
+    python -m benchmarks.portfolio --bars 7560 --symbols 3000 --workers 4
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import add_baseline_arguments, finish, time_call
+from src.portfolio import backtest, forward_fill, rebalance_rows, run_variants
+
+
+def _loop(
+    scores: np.ndarray, prices: np.ndarray, dates: np.ndarray, top_k: int
+) -> np.ndarray:
+    """봉 단위 루프로 NAV를 계산합니다 (비용 10bp, 제한 없음)."""
+    prices = forward_fill(prices)
+    rows = set(rebalance_rows(dates, "W-FRI").tolist())
+    nav = np.ones(len(prices))
+    units = np.zeros(prices.shape[1])
+    cash = 1.0
+    for t in range(len(prices)):
+        held = units > 0
+        value = cash + float((units[held] * prices[t, held]).sum())
+        if t in rows:
+            current = np.zeros_like(units)
+            current[held] = units[held] * prices[t, held] / value
+            valid = np.isfinite(scores[t]) & np.isfinite(prices[t])
+            ranked = np.where(valid, -scores[t], np.inf)
+            chosen = np.argsort(ranked, kind="stable")[:top_k]
+            chosen = chosen[valid[chosen]]
+            target = np.zeros_like(units)
+            target[chosen] = 1.0 / top_k
+            value *= 1.0 - np.abs(target - current).sum() * 10.0 / 10_000.0
+            units = np.zeros_like(units)
+            units[chosen] = target[chosen] * value / prices[t, chosen]
+            cash = value * (1.0 - target.sum())
+        nav[t] = value
+    return nav
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """포트폴리오 백테스트 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="포트폴리오 백테스트 벤치마크")
+    parser.add_argument("--bars", type=int, default=2_520, help="봉 개수")
+    parser.add_argument("--symbols", type=int, default=1_000, help="심볼 개수")
+    parser.add_argument("--top-k", type=int, default=20, help="보유 심볼 수")
+    parser.add_argument("--workers", type=int, default=2, help="작업 프로세스 수")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수")
+    add_baseline_arguments(parser, "portfolio")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(42)
+    shape = (args.bars, args.symbols)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, shape), axis=0))
+    scores = rng.standard_normal(shape)
+    dates = pd.bdate_range("1995-01-02", periods=args.bars).to_numpy()
+
+    expected = _loop(scores, prices, dates, args.top_k)
+    actual = backtest(
+        scores, prices, dates, top_k=args.top_k, cost_bps=10.0, min_score=None
+    )
+    assert np.allclose(actual.nav, expected)
+
+    results: Dict[str, float] = {}
+    results["portfolio.loop"] = time_call(
+        lambda: _loop(scores, prices, dates, args.top_k), args.repeat
+    )
+    results["portfolio.vectorized"] = time_call(
+        lambda: backtest(scores, prices, dates, top_k=args.top_k), args.repeat
+    )
+
+    variants = [
+        {"top_k": top_k, "cost_bps": cost_bps}
+        for top_k in (10, 20, 50, 100)
+        for cost_bps in (5.0, 20.0)
+    ]
+    results["portfolio.variants.sequential"] = time_call(
+        lambda: run_variants(scores, prices, dates, variants, max_workers=1),
+        args.repeat,
+    )
+    results["portfolio.variants.pool"] = time_call(
+        lambda: run_variants(scores, prices, dates, variants, args.workers),
+        args.repeat,
+    )
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
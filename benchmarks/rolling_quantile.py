@@ -0,0 +1,69 @@
+"""
+롤링 분위수 벤치마크 모듈
+
+적응형 임계값에 쓰는 롤링 분위수 계산 방식의 시간을 창 크기별로 비교합니다.
+
+- naive: 창마다 ``np.quantile`` 로 다시 계산 (O(w) 또는 O(w log w) / 봉)
+- pandas: ``rolling().quantile`` (C 스킵 리스트, 일괄 계산에 사용)
+- heap: ``RollingQuantile`` 두 힙 증분 구조 (봉 단위 스트리밍에 사용)
+
+사용 예시:
+    python -m benchmarks.rolling_quantile --bars 20000 --windows 63 252 2520
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.harness import add_baseline_arguments, finish, time_call
+from src.rolling_stats import RollingQuantile, rolling_quantile
+
+
+def _naive(values: np.ndarray, window: int, q: float) -> np.ndarray:
+    """창마다 분위수를 다시 계산합니다."""
+    result = np.full(len(values), np.nan)
+    for i in range(window - 1, len(values)):
+        start, stop = i + 1 - window, i + 1
+        result[i] = np.quantile(values[start:stop], q)
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """롤링 분위수 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="롤링 분위수 벤치마크")
+    parser.add_argument("--bars", type=int, default=20_000, help="봉 개수")
+    parser.add_argument(
+        "--windows",
+        type=int,
+        nargs="+",
+        default=[21, 252, 1260, 2520],
+        help="창 크기 목록",
+    )
+    parser.add_argument("--q", type=float, default=0.1, help="분위수")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수")
+    add_baseline_arguments(parser, "rolling_quantile")
+    args = parser.parse_args(argv)
+
+    values = np.random.default_rng(42).standard_normal(args.bars).cumsum()
+    results: Dict[str, float] = {}
+    for window in args.windows:
+        expected = rolling_quantile(values, window, args.q)
+        actual = RollingQuantile(window, args.q).update_many(values)
+        assert np.allclose(actual, expected, equal_nan=True)
+
+        results[f"rolling_quantile.naive.w{window}"] = time_call(
+            lambda: _naive(values, window, args.q), args.repeat
+        )
+        results[f"rolling_quantile.pandas.w{window}"] = time_call(
+            lambda: rolling_quantile(values, window, args.q), args.repeat
+        )
+        results[f"rolling_quantile.heap.w{window}"] = time_call(
+            lambda: RollingQuantile(window, args.q).update_many(values), args.repeat
+        )
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
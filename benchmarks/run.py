@@ -0,0 +1,259 @@
+"""
+핵심 경로 벤치마크 실행 모듈
+
+합성 OHLCV 데이터로 다음 경로의 실행 시간을 측정합니다.
+- ``OHLCVValidator`` 전체/증분 데이터 검증
+- ``TechnicalIndicator._calculate_*`` 개별 지표 계산
+- ``SignalGenerator.generate_all`` 전체 시그널 생성
+- 각 단계의 CSV 로드/저장
+- ``TradingVisualizer`` 대시보드 렌더링
+
+사용 예시:
+    python -m benchmarks.run --profile small --update-baseline
+    python -m benchmarks.run --profile small --tolerance 0.2
+    python -m benchmarks.run --bars 5000 --symbols 50
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")  # 화면 없이 렌더링
+
+
+from benchmarks.harness import add_baseline_arguments, finish, time_call  # noqa: E402
+from benchmarks.synthetic import generate_universe, write_universe  # noqa: E402
+from src.settings import TECHNICAL_INDICATORS  # noqa: E402
+from src.signal_generator import SignalGenerator  # noqa: E402
+from src.technical_indicator import TechnicalIndicator  # noqa: E402
+from src.validator import OHLCVValidator  # noqa: E402
+from src.visualizer import TradingVisualizer  # noqa: E402
+
+# 프로파일별 (봉 개수, 심볼 개수, 봉 주기)
+PROFILES: Dict[str, Tuple[int, int, str]] = {
+    "small": (1_000, 1, "B"),
+    "medium": (100_000, 1, "min"),
+    "large": (1_000_000, 1, "min"),
+    "universe": (1_000, 1_000, "B"),
+}
+
+
+def indicator_calculations() -> List[Tuple[str, tuple]]:
+    """측정할 ``_calculate_*`` 메서드와 설정 인자 목록을 반환합니다."""
+    momentum = TECHNICAL_INDICATORS["모멘텀 지표"]
+    contrarian = TECHNICAL_INDICATORS["반대매매 지표"]
+    return [
+        ("_calculate_sma", (momentum["SMA"]["periods"][0],)),
+        ("_calculate_ema", (momentum["EMA"]["periods"][0],)),
+        (
+            "_calculate_tsi",
+            (momentum["TSI"]["short_period"], momentum["TSI"]["long_period"]),
+        ),
+        (
+            "_calculate_macd",
+            (
+                momentum["MACD"]["short_period"],
+                momentum["MACD"]["long_period"],
+                momentum["MACD"]["signal_period"],
+            ),
+        ),
+        (
+            "_calculate_psar",
+            (
+                momentum["PSAR"]["af_start"],
+                momentum["PSAR"]["af_increment"],
+                momentum["PSAR"]["af_max"],
+            ),
+        ),
+        ("_calculate_adx", (momentum["ADX"]["period"],)),
+        ("_calculate_aroon", (momentum["Aroon"]["period"],)),
+        ("_calculate_adl", (momentum["ADL"]["period"],)),
+        ("_calculate_adr", (momentum["ADR"]["period"],)),
+        (
+            "_calculate_ichimoku",
+            (
+                momentum["Ichimoku"]["tenkan_period"],
+                momentum["Ichimoku"]["kijun_period"],
+            ),
+        ),
+        (
+            "_calculate_keltner",
+            (momentum["Keltner"]["period"], momentum["Keltner"]["multiplier"]),
+        ),
+        ("_calculate_rsi", (contrarian["RSI"]["period"],)),
+        ("_calculate_bb", (contrarian["BB"]["period"], contrarian["BB"]["std_dev"])),
+        ("_calculate_cci", (contrarian["CCI"]["period"],)),
+        (
+            "_calculate_stoch",
+            (contrarian["Stoch"]["k_period"], contrarian["Stoch"]["d_period"]),
+        ),
+        ("_calculate_williams", (contrarian["Williams"]["period"],)),
+        ("_calculate_cmo", (contrarian["CMO"]["period"],)),
+        ("_calculate_demarker", (contrarian["DeMarker"]["period"],)),
+        ("_calculate_donchian", (contrarian["Donchian"]["period"],)),
+        ("_calculate_pivot", (contrarian["Pivot"]["method"],)),
+        ("_calculate_psy", (contrarian["PSY"]["period"],)),
+        ("_calculate_npsy", (contrarian["NPSY"]["period"],)),
+    ]
+
+
+def run_benchmarks(
+    n_bars: int,
+    n_symbols: int,
+    freq: str,
+    repeat: int,
+    seed: int,
+    render: bool,
+) -> Dict[str, float]:
+    """전체 벤치마크를 실행합니다.
+
+    Args:
+        n_bars (int): 심볼당 봉 개수
+        n_symbols (int): 심볼 개수
+        freq (str): 봉 주기
+        repeat (int): 반복 횟수
+        seed (int): 합성 데이터 난수 시드
+        render (bool): 대시보드 렌더링 측정 여부
+
+    Returns:
+        Dict[str, float]: 항목별 실행 시간 (초, 전체 심볼 합계)
+    """
+    results: Dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        universe = generate_universe(n_bars, n_symbols, seed=seed, freq=freq)
+        data_files = write_universe(universe, tmp_dir / "data")
+        del universe
+
+        indicator_files = [tmp_dir / f"{p.stem}_indicators.csv" for p in data_files]
+        signal_files = [tmp_dir / f"{p.stem}_signals.csv" for p in data_files]
+        event_files = [tmp_dir / f"{p.stem}_signal_events.csv" for p in data_files]
+
+        # OHLCV CSV 로드
+        results["csv.load.ohlcv"] = time_call(
+            lambda: [
+                TechnicalIndicator(data_file=d, output_file=o, use_cache=False)
+                for d, o in zip(data_files, indicator_files)
+            ],
+            repeat,
+        )
+        indicators = [
+            TechnicalIndicator(data_file=d, output_file=o, use_cache=False)
+            for d, o in zip(data_files, indicator_files)
+        ]
+
+        # OHLCV 검증: 전체 검사와 마지막 봉만 추가된 경우의 증분 검사
+        results["validate.ohlcv.full"] = time_call(
+            lambda: [OHLCVValidator().validate(i.df) for i in indicators], repeat
+        )
+        best = float("inf")
+        for _ in range(max(repeat, 1)):
+            validators = [OHLCVValidator() for _ in indicators]
+            for validator, indicator in zip(validators, indicators):
+                validator.validate(indicator.df.head(len(indicator.df) - 1))
+            start = time.perf_counter()
+            for validator, indicator in zip(validators, indicators):
+                validator.validate(indicator.df)
+            best = min(best, time.perf_counter() - start)
+        results["validate.ohlcv.append"] = best
+
+        # 개별 지표 계산
+        for indicator in indicators:
+            indicator.reset_columns()
+        for method, args in indicator_calculations():
+            results[f"indicator.{method}"] = time_call(
+                lambda: [getattr(i, method)(*args) for i in indicators], repeat
+            )
+
+        # 전체 지표 계산 및 저장
+        results["indicator.calculate_all"] = time_call(
+            lambda: [i.calculate_all() for i in indicators], repeat
+        )
+        results["csv.save.indicators"] = time_call(
+            lambda: [i.save_indicators() for i in indicators], repeat
+        )
+
+        # 시그널 생성
+        results["csv.load.indicators"] = time_call(
+            lambda: [
+                SignalGenerator(indicators_file=i, output_file=o, events_file=e)
+                for i, o, e in zip(indicator_files, signal_files, event_files)
+            ],
+            repeat,
+        )
+        generators = [
+            SignalGenerator(indicators_file=i, output_file=o, events_file=e)
+            for i, o, e in zip(indicator_files, signal_files, event_files)
+        ]
+        results["signal.generate_all"] = time_call(
+            lambda: [g.generate_all() for g in generators], repeat
+        )
+        results["csv.save.signals"] = time_call(
+            lambda: [g.save_signals() for g in generators], repeat
+        )
+
+        # 대시보드 렌더링 (최근 구간만 그리므로 첫 심볼만 측정)
+        if render:
+
+            def make_visualizer() -> TradingVisualizer:
+                return TradingVisualizer(
+                    signals_file=signal_files[0],
+                    price_file=data_files[0],
+                    output_file=tmp_dir / "dashboard.png",
+                )
+
+            results["csv.load.visualizer"] = time_call(make_visualizer, repeat)
+
+            def render_dashboard() -> None:
+                visualizer = make_visualizer()
+                visualizer.create_dashboard()
+                visualizer.save_dashboard()
+
+            results["render.dashboard"] = time_call(render_dashboard, repeat)
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="핵심 경로 성능 벤치마크")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small")
+    parser.add_argument("--bars", type=int, help="심볼당 봉 개수 (프로파일 대체)")
+    parser.add_argument("--symbols", type=int, help="심볼 개수 (프로파일 대체)")
+    parser.add_argument("--freq", help="봉 주기 (프로파일 대체)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument("--no-render", action="store_true", help="렌더링 측정 생략")
+    parser.add_argument("--cases", help="비교할 항목 이름 필터 (부분 문자열)")
+    args, _ = parser.parse_known_args(argv)
+
+    n_bars, n_symbols, freq = PROFILES[args.profile]
+    custom = args.bars is not None or args.symbols is not None
+    n_bars = args.bars or n_bars
+    n_symbols = args.symbols or n_symbols
+    freq = args.freq or freq
+    default_name = f"bars{n_bars}_symbols{n_symbols}" if custom else args.profile
+
+    add_baseline_arguments(parser, default_name)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    print(f"합성 데이터: {n_bars} bars x {n_symbols} symbols (freq={freq})\n")
+
+    results = run_benchmarks(
+        n_bars, n_symbols, freq, args.repeat, args.seed, not args.no_render
+    )
+    if args.cases:
+        results = {k: v for k, v in results.items() if args.cases in k}
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+서비스 모드 부하 벤치마크 모듈
+
+합성 데이터로 ``SignalService`` 를 띄우고, 여러 클라이언트 프로세스가
+keep-alive 연결로 엔드포인트를 반복 호출하여 초당 처리량을 측정합니다.
+
+사용 예시:
+    python -m benchmarks.service_load --clients 4 --duration 5
+"""
+
+import argparse
+import http.client
+import logging
+import multiprocessing as mp
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.harness import add_baseline_arguments, finish
+from benchmarks.synthetic import generate_ohlcv
+from src.service import SignalService
+
+ENDPOINTS = [
+    "/signals/latest",
+    "/score",
+    "/indicators?from=2010-01-01&to=2010-03-31",
+]
+
+
+def _client(port: int, path: str, duration: float, counter: "mp.Value") -> None:
+    """지정 시간 동안 같은 경로를 반복 호출합니다."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    done = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        done += 1
+    conn.close()
+    with counter.get_lock():
+        counter.value += done
+
+
+def measure_throughput(port: int, path: str, clients: int, duration: float) -> float:
+    """엔드포인트의 초당 요청 처리량을 측정합니다."""
+    counter = mp.Value("q", 0)
+    procs = [
+        mp.Process(target=_client, args=(port, path, duration, counter))
+        for _ in range(clients)
+    ]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - start
+    return counter.value / elapsed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """서비스 부하 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="서비스 모드 처리량 벤치마크")
+    parser.add_argument("--bars", type=int, default=5_000, help="합성 봉 개수")
+    parser.add_argument("--clients", type=int, default=4, help="클라이언트 프로세스 수")
+    parser.add_argument("--duration", type=float, default=3.0, help="측정 시간 (초)")
+    add_baseline_arguments(parser, "service_load")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / "ohlcv.csv"
+        generate_ohlcv(args.bars, seed=42).to_csv(data_file, index=False)
+
+        service = SignalService(data_file=data_file, watch_dir=Path(tmp) / "incoming")
+        service.load()
+        server = service.make_server(port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        throughput: Dict[str, float] = {}
+        try:
+            for path in ENDPOINTS:
+                rps = measure_throughput(
+                    server.server_port, path, args.clients, args.duration
+                )
+                throughput[path] = rps
+                print(f"{path}: {rps:,.0f} req/s")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    # 기준값 비교는 요청당 평균 시간(초)으로 수행 (클수록 느림)
+    results = {f"service{path}": 1.0 / rps for path, rps in throughput.items()}
+    print()
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+공유 메모리 데이터 전달 벤치마크 모듈
+
+프로세스 풀 작업자에게 지표 블록을 넘기는 두 방식의 시간과 전송량을 비교합니다.
+
+- pickle: 작업마다 데이터프레임을 피클하여 전달 (작업자마다 사본 생성)
+- shared: ``SharedFrame`` 으로 한 번 게시하고 작업자는 핸들로 붙어 읽기 전용 뷰 사용
+
+사용 예시:
+    python -m benchmarks.shared_memory --bars 1000000 --workers 4
+"""
+
+import argparse
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import add_baseline_arguments, finish, time_call
+from benchmarks.synthetic import generate_ohlcv
+from src.shared_frame import SharedFrame, SharedFrameHandle
+
+
+def _indicator_block(bars: int, n_columns: int) -> pd.DataFrame:
+    """OHLCV 뒤에 지표 블록 크기의 실수 칼럼을 붙인 데이터를 만듭니다."""
+    ohlcv = generate_ohlcv(bars, seed=42, freq="min")
+    rng = np.random.default_rng(0)
+    columns = {f"IND_{i}(14)": rng.standard_normal(bars) for i in range(n_columns)}
+    return pd.DataFrame({**ohlcv, **columns})
+
+
+def _summarize(df: pd.DataFrame) -> float:
+    """작업자가 하는 일: 칼럼별 평균의 합"""
+    return float(df.drop(columns="Date").mean().sum())
+
+
+def _pickled_task(df: pd.DataFrame) -> float:
+    return _summarize(df)
+
+
+def _shared_task(handle: SharedFrameHandle) -> float:
+    with SharedFrame.attach(handle) as frame:
+        return _summarize(frame.to_frame())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """공유 메모리 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="공유 메모리 데이터 전달 벤치마크")
+    parser.add_argument("--bars", type=int, default=200_000, help="봉 개수")
+    parser.add_argument("--columns", type=int, default=40, help="지표 칼럼 개수")
+    parser.add_argument("--workers", type=int, default=4, help="작업 프로세스 수")
+    parser.add_argument("--tasks", type=int, default=16, help="작업 개수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    add_baseline_arguments(parser, "shared_memory")
+    args = parser.parse_args(argv)
+
+    df = _indicator_block(args.bars, args.columns)
+    results: Dict[str, float] = {}
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # 작업자 프로세스 시작 비용은 측정에서 제외
+        list(pool.map(abs, range(args.workers)))
+
+        results["shared_memory.pickle"] = time_call(
+            lambda: list(pool.map(_pickled_task, [df] * args.tasks)), args.repeat
+        )
+
+        def shared() -> None:
+            with SharedFrame.publish(df) as frame:
+                list(pool.map(_shared_task, [frame.handle] * args.tasks))
+
+        results["shared_memory.shared"] = time_call(shared, args.repeat)
+
+        with SharedFrame.publish(df) as frame:
+            handle_bytes = len(pickle.dumps(frame.handle))
+            expected = _summarize(df)
+            assert np.isclose(_shared_task(frame.handle), expected)
+
+    frame_bytes = len(pickle.dumps(df))
+    print(
+        f"작업당 전송량: pickle {frame_bytes / 1024**2:.1f} MB, "
+        f"shared {handle_bytes / 1024:.1f} KB (게시 1회 "
+        f"{df.memory_usage(index=False).sum() / 1024**2:.1f} MB)\n"
+    )
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+시작 시간 벤치마크 모듈
+
+``python -X importtime`` 으로 기존 ``main.py`` 의 즉시 임포트 방식과
+``src.cli signals`` 서브커맨드의 지연 임포트 방식의 콜드 스타트 비용을 비교합니다.
+
+사용 예시:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --update-baseline
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.harness import add_baseline_arguments, finish
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 측정 대상별 임포트 구문
+SCENARIOS: Dict[str, str] = {
+    # 기존 main.py가 모듈 로드 시점에 임포트하던 모듈 전체
+    "eager": (
+        "import src.update_spy, src.technical_indicator, "
+        "src.signal_generator, src.visualizer"
+    ),
+    # signals 서브커맨드가 실제로 임포트하는 모듈
+    "lazy.signals": "import src.cli, src.signal_generator",
+}
+
+HEAVY_MODULES = ["yfinance", "matplotlib", "mplfinance"]
+
+
+def measure_importtime(statement: str) -> Tuple[float, List[str]]:
+    """``-X importtime`` 출력으로 임포트 시간을 측정합니다.
+
+    Args:
+        statement (str): 실행할 임포트 구문
+
+    Returns:
+        Tuple[float, List[str]]: 전체 임포트 시간 (초)과 임포트된 모듈 목록
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.split(":", 1)[1].split("|")
+        total_us += int(self_us)
+        modules.append(name.strip())
+    return total_us / 1e6, modules
+
+
+def measure_wall(statement: str, repeat: int) -> float:
+    """인터프리터 시작부터 종료까지의 벽시계 시간 중앙값을 측정합니다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=PROJECT_ROOT, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """시작 시간 벤치마크 명령행 진입점"""
+    parser = argparse.ArgumentParser(description="CLI 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    add_baseline_arguments(parser, "startup")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, float] = {}
+    for name, statement in SCENARIOS.items():
+        # 첫 실행으로 바이트코드 캐시를 채운 뒤 측정
+        measure_importtime(statement)
+        import_times = []
+        for _ in range(args.repeat):
+            seconds, modules = measure_importtime(statement)
+            import_times.append(seconds)
+        results[f"startup.{name}.importtime"] = statistics.median(import_times)
+        results[f"startup.{name}.wall"] = measure_wall(statement, args.repeat)
+
+        roots = {m.split(".")[0] for m in modules}
+        loaded = [m for m in HEAVY_MODULES if m in roots]
+        print(f"{name}: 무거운 의존성 {loaded or '없음'}")
+
+    eager = results["startup.eager.importtime"]
+    lazy = results["startup.lazy.signals.importtime"]
+    print(
+        f"signals 콜드 스타트 임포트 시간: {eager * 1000:.0f}ms -> {lazy * 1000:.0f}ms "
+        f"({(1 - lazy / eager):.0%} 감소)\n"
+    )
+    return finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+합성 OHLCV 데이터 생성 모듈
+
+시드가 고정된 기하 브라운 운동으로 재현 가능한 OHLCV 데이터를 생성합니다.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def generate_ohlcv(
+    n_bars: int,
+    seed: int = 0,
+    freq: str = "B",
+    start: str = "2000-01-03",
+    start_price: float = 1000.0,
+) -> pd.DataFrame:
+    """합성 OHLCV 데이터를 생성합니다.
+
+    Args:
+        n_bars (int): 생성할 봉 개수
+        seed (int): 난수 시드
+        freq (str): 봉 주기 (일봉 "B", 분봉 "min" 등)
+        start (str): 시작 날짜
+        start_price (float): 시작 가격
+
+    Returns:
+        pd.DataFrame: Date, Open, High, Low, Close, Volume 칼럼을 가진 데이터프레임
+    """
+    rng = np.random.default_rng(seed)
+
+    # 종가: 기하 브라운 운동
+    returns = rng.normal(0.0003, 0.012, n_bars)
+    close = start_price * np.exp(np.cumsum(returns))
+
+    # 시가: 이전 종가에서 작은 갭
+    open_ = np.empty(n_bars)
+    open_[0] = start_price
+    open_[1:] = close[:-1] * (1 + rng.normal(0, 0.002, n_bars - 1))
+
+    # 고가/저가: 시가와 종가를 감싸는 범위
+    spread = np.abs(rng.normal(0, 0.006, n_bars)) * close
+    high = np.maximum(open_, close) + spread * rng.random(n_bars)
+    low = np.minimum(open_, close) - spread * rng.random(n_bars)
+
+    volume = rng.lognormal(mean=21.0, sigma=0.3, size=n_bars).round()
+
+    return pd.DataFrame(
+        {
+            "Date": pd.date_range(start=start, periods=n_bars, freq=freq),
+            "Open": open_,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": volume,
+        }
+    )
+
+
+def generate_universe(
+    n_bars: int,
+    n_symbols: int,
+    seed: int = 0,
+    freq: str = "B",
+) -> Dict[str, pd.DataFrame]:
+    """여러 심볼의 합성 OHLCV 데이터를 생성합니다.
+
+    심볼별 시드는 ``seed + 심볼 순번`` 으로 고정되어 크기와 관계없이 재현됩니다.
+
+    Args:
+        n_bars (int): 심볼당 봉 개수
+        n_symbols (int): 심볼 개수
+        seed (int): 기본 난수 시드
+        freq (str): 봉 주기
+
+    Returns:
+        Dict[str, pd.DataFrame]: 심볼별 OHLCV 데이터
+    """
+    return {
+        f"SYM{i:04d}": generate_ohlcv(n_bars, seed=seed + i, freq=freq)
+        for i in range(n_symbols)
+    }
+
+
+def write_universe(universe: Dict[str, pd.DataFrame], directory: Path) -> List[Path]:
+    """합성 데이터를 심볼별 CSV 파일로 저장합니다.
+
+    Args:
+        universe (Dict[str, pd.DataFrame]): 심볼별 OHLCV 데이터
+        directory (Path): 저장할 디렉토리
+
+    Returns:
+        List[Path]: 저장된 파일 경로 목록
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for symbol, df in universe.items():
+        path = directory / f"{symbol}.csv"
+        df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
@@ -0,0 +1,80 @@
+"""
+청크 단위 지표 계산 모듈
+
+메모리에 한 번에 올릴 수 없는 긴 OHLCV 이력을 시간 순서의 청크로 나누어 읽고,
+청크마다 지표를 계산해 칼럼 저장소에 이어 씁니다.
+
+    청크 = 이전 청크 끝 max_lookback 개 봉(후광) + 새 봉
+
+- 이동 창 지표는 후광 봉을 창으로 사용합니다.
+- EMA, PSAR, 누적합(ADL, Aroon)은 이전 청크의 재귀 상태(``carry_out``)에서 이어서
+  계산하므로 전체 구간 계산과 같은 순서의 연산이 됩니다.
+
+메모리 사용량은 전체 이력이 아니라 청크 크기에 비례합니다.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from src.columnar import ColumnarStore
+from src.loader import iter_ohlcv
+from src.lookback import max_lookback
+from src.settings import CHUNK_SETTINGS, INDICATORS_STORE_DIR, SPY_DATA_FILE
+from src.technical_indicator import TechnicalIndicator
+from src.validator import validate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_chunked(
+    data_file: Path = SPY_DATA_FILE,
+    output_dir: Path = INDICATORS_STORE_DIR,
+    chunk_size: int = CHUNK_SETTINGS["chunk_size"],
+    benchmark: Optional[pd.DataFrame] = None,
+) -> ColumnarStore:
+    """OHLCV 파일을 청크 단위로 읽어 지표를 계산하고 칼럼 저장소에 씁니다.
+
+    Args:
+        data_file (Path): 날짜순으로 정렬된 OHLCV 데이터 파일 경로
+        output_dir (Path): 칼럼 저장소 디렉토리 (기존 내용은 지움)
+        chunk_size (int): 한 번에 읽을 봉 개수 (2 이상)
+        benchmark (Optional[pd.DataFrame]): 기준 지수 OHLCV 데이터 (상대강도 지표용)
+
+    Returns:
+        ColumnarStore: 지표가 저장된 칼럼 저장소
+    """
+    if chunk_size < 2:
+        raise ValueError(f"chunk_size는 2 이상이어야 합니다: {chunk_size}")
+
+    store = ColumnarStore(output_dir)
+    try:
+        store.clear()
+        halo_bars = max_lookback()
+        halo: Optional[pd.DataFrame] = None
+        carry: Dict[str, Any] = {}
+
+        for number, chunk in enumerate(iter_ohlcv(data_file, chunk_size)):
+            validate_ohlcv(chunk, source=f"{data_file.name}#{number}")
+            if halo is not None and chunk["Date"].iloc[0] <= halo["Date"].iloc[-1]:
+                raise ValueError(f"청크 {number}의 날짜가 이전 청크보다 앞섭니다")
+
+            window = chunk if halo is None else pd.concat([halo, chunk])
+            offset = 0 if halo is None else len(halo)
+            indicator = TechnicalIndicator(
+                data_file, df=window, carry=carry, halo=offset, benchmark=benchmark
+            )
+            indicator.calculate_all()
+            store.append(indicator.indicators_df.iloc[offset:])
+
+            carry = indicator.carry_out
+            halo = window.tail(halo_bars)
+            logger.info(f"청크 {number} 계산 완료: 누적 {store.rows}개 봉")
+
+        return store
+
+    except Exception as e:
+        logger.error(f"청크 지표 계산 실패: {str(e)}")
+        raise
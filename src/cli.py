@@ -0,0 +1,534 @@
+"""
+명령행 인터페이스 모듈
+
+서브커맨드별로 필요한 모듈만 실행 시점에 임포트하여 시작 시간을 줄입니다.
+예를 들어 ``signals`` 는 yfinance, matplotlib, mplfinance를 임포트하지 않습니다.
+모듈 임포트 시에는 디렉토리 생성이나 로깅 설정 같은 부수 효과가 없습니다.
+
+사용 예시:
+    python -m src.cli fetch --symbol ^GSPC
+    python -m src.cli fetch --dry-run
+    python -m src.cli indicators
+    python -m src.cli indicators --start 2024-01-01
+    python -m src.cli indicators --chunk-size 100000
+    python -m src.cli indicators --workers 4
+    python -m src.cli indicators --data data/aapl.csv --benchmark data/spy_data.csv
+    python -m src.cli signals
+    python -m src.cli events --since 2025-01-01
+    python -m src.cli screen "[RSI(14)] < 30 and Close > [SMA_(50)]"
+    python -m src.cli relative AAPL MSFT NVDA
+    python -m src.cli flips --open 5650 --price 5600
+    python -m src.cli timeframes --data data/spy_data.csv
+    python -m src.cli backtest --top-k 20 --cost-bps 10
+    python -m src.cli render --days 30
+    python -m src.cli all
+    python -m src.cli serve --port 8765
+    python -m src.cli stream --replay data/spy_data.csv --history-bars 1000
+    python -m src.cli memory --compact --symbols 1000
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from src.signal_generator import SignalGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def _setup_logging() -> None:
+    """로그 디렉토리를 만들고 파일/콘솔 로깅을 설정합니다."""
+    from src.settings import (
+        APP_LOG_FILE,
+        LOGGING_FORMAT,
+        LOGGING_LEVEL,
+        ensure_directories,
+    )
+
+    ensure_directories()
+    logging.basicConfig(
+        level=LOGGING_LEVEL,
+        format=LOGGING_FORMAT,
+        handlers=[
+            logging.FileHandler(APP_LOG_FILE),
+            logging.StreamHandler(),
+        ],
+    )
+
+
+def run_fetch(args: argparse.Namespace) -> None:
+    """가격 데이터를 업데이트합니다."""
+    if getattr(args, "dry_run", False):
+        # 로컬 파일 가져오기만 수행하고 제공자 요청은 보내지 않음
+        from src.fetch_planner import FetchPlanner
+        from src.settings import SPY_DATA_FILE
+        from src.store import OHLCVStore
+        from src.update_spy import import_data_file
+
+        store = OHLCVStore()
+        import_data_file(args.symbol, SPY_DATA_FILE, store)
+        planner = FetchPlanner(store)
+        print(planner.report(planner.plan([args.symbol])))
+        return
+
+    from src.update_spy import update_spy_data
+
+    logger.info("spy 데이터 업데이트 시작")
+    update_spy_data(symbol=args.symbol, days_back=args.days_back)
+    logger.info("spy 데이터 업데이트 완료")
+
+
+def run_indicators(args: argparse.Namespace) -> None:
+    """기술적 지표를 계산하고 저장합니다."""
+    from src.settings import SPY_DATA_FILE
+    from src.technical_indicator import TechnicalIndicator
+
+    logger.info("기술적 지표 생성 시작")
+    data_file = Path(getattr(args, "data", None) or SPY_DATA_FILE)
+    benchmark = None
+    if getattr(args, "benchmark", None):
+        from src.loader import read_ohlcv
+
+        # 기준 지수 대비 상대강도 지표도 계산
+        benchmark = read_ohlcv(Path(args.benchmark))
+
+    chunk_size = getattr(args, "chunk_size", None)
+    if chunk_size:
+        from src.chunked import calculate_chunked
+
+        # 청크 단위로 읽어 칼럼 저장소에 기록
+        store = calculate_chunked(data_file, chunk_size=chunk_size, benchmark=benchmark)
+        logger.info(f"기술적 지표 생성 완료: {store.root} ({store.rows}개 봉)")
+        return
+
+    indicator = TechnicalIndicator(
+        data_file,
+        max_workers=getattr(args, "workers", None),
+        use_cache=False if getattr(args, "no_cache", False) else None,
+        benchmark=benchmark,
+    )
+    start, end = getattr(args, "start", None), getattr(args, "end", None)
+    if start or end:
+        # 요청 구간과 워밍업 구간만 계산
+        indicator.calculate_range(start, end)
+    else:
+        indicator.calculate_all()
+    indicator.save_indicators()
+    logger.info("기술적 지표 생성 완료")
+
+
+def run_signals(args: argparse.Namespace) -> None:
+    """매매 시그널을 생성하고 저장합니다."""
+    from src.signal_generator import SignalGenerator
+
+    logger.info("매매 시그널 생성 시작")
+    generator = SignalGenerator()
+    generator.generate_all()
+    generator.save_signals()
+    _update_screener(generator)
+    logger.info("매매 시그널 생성 완료")
+
+
+def _update_screener(generator: "SignalGenerator") -> None:
+    """시그널 생성 결과의 최신 봉을 스크리너 스냅샷 파일에 반영합니다."""
+    from src.screener import Screener
+    from src.settings import SCREENER_SETTINGS
+
+    screener = Screener.load()
+    screener.update_frame(
+        SCREENER_SETTINGS["symbol"], generator.indicators_df, generator.signals_df
+    )
+    screener.save()
+
+
+def run_screen(args: argparse.Namespace) -> None:
+    """스크리너 스냅샷에서 조건식을 만족하는 심볼을 출력합니다."""
+    from src.screener import Screener
+
+    screener = Screener.load()
+    columns = args.columns.split(";") if args.columns else []
+    print(screener.screen(args.query, columns=columns).to_string())
+
+
+def run_relative(args: argparse.Namespace) -> None:
+    """저장소 심볼 패널의 상대강도 지표를 계산하고 최신 값을 스크리너에 반영합니다."""
+    from src.relative_strength import close_panel, latest_snapshot, relative_panel
+    from src.screener import Screener
+    from src.store import OHLCVStore
+
+    store = OHLCVStore()
+    symbols = args.symbols or store.symbols()
+    closes = close_panel(symbols, store, benchmark=args.benchmark)
+    snapshot = latest_snapshot(relative_panel(closes, benchmark=args.benchmark))
+
+    screener = Screener.load()
+    screener.load_frame(snapshot)
+    screener.save()
+    print(snapshot.to_string())
+
+
+def run_flips(args: argparse.Namespace) -> None:
+    """다음 봉의 시그널 전환 가격을 계산하여 출력합니다."""
+    from src.flip_levels import FlipLevels
+    from src.loader import read_ohlcv
+
+    flips = FlipLevels(read_ohlcv(Path(args.data)), search_range=args.range)
+    levels = flips.compute(
+        open_=args.open, high=args.high, low=args.low, volume=args.volume
+    )
+    print(levels.to_string(index=False))
+    if args.price is not None:
+        changed = flips.check(args.price)
+        print(f"{args.price}에서 바뀌는 시그널: {', '.join(changed) or '없음'}")
+
+
+def run_timeframes(args: argparse.Namespace) -> None:
+    """주봉/월봉 시그널을 계산하여 일봉 날짜에 맞춰 저장합니다."""
+    from src.loader import read_ohlcv
+    from src.settings import TIMEFRAME_SETTINGS
+    from src.timeframes import MultiTimeframe
+
+    signals = MultiTimeframe().run(read_ohlcv(Path(args.data)))
+    output_file = Path(args.output or TIMEFRAME_SETTINGS["output_file"])
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    signals.to_csv(output_file, index=False)
+    logger.info(f"다중 시간 프레임 시그널 저장 완료: {output_file}")
+
+
+def run_backtest(args: argparse.Namespace) -> None:
+    """저장소 심볼의 종합 점수 상위 k개 포트폴리오를 백테스트합니다."""
+    from src.portfolio import backtest, score_panel
+    from src.relative_strength import close_panel
+    from src.store import OHLCVStore
+
+    store = OHLCVStore()
+    symbols = args.symbols or store.symbols()
+    closes = close_panel(symbols, store, benchmark=args.benchmark)
+    if args.benchmark not in symbols:
+        closes = closes.drop(columns=[args.benchmark])
+    scores = score_panel(list(closes.columns), closes.index, store)
+
+    result = backtest(
+        scores.to_numpy(),
+        closes.to_numpy(),
+        closes.index.to_numpy(),
+        top_k=args.top_k,
+        rebalance=args.rebalance,
+        cost_bps=args.cost_bps,
+        min_score=args.min_score,
+    )
+    for name, value in result.summary().items():
+        print(f"{name:>14}: {value:.4f}")
+    if args.output:
+        result.to_frame().to_csv(args.output, index=False)
+        logger.info(f"포트폴리오 NAV 저장 완료: {args.output}")
+
+
+def run_events(args: argparse.Namespace) -> None:
+    """저장된 시그널 전환 이벤트를 출력합니다."""
+    import pandas as pd
+
+    from src.signal_events import read_signal_events
+
+    events = read_signal_events()
+    if args.since:
+        events = events[events["Date"] >= pd.Timestamp(args.since)]
+    if args.changes_only:
+        # 처음 나타난 시그널의 등록 이벤트(0 -> 0) 제외
+        events = events[events["Old"] != events["New"]]
+    print(events.to_string(index=False))
+
+
+def run_render(args: argparse.Namespace) -> None:
+    """대시보드를 렌더링하고 저장합니다."""
+    import matplotlib
+
+    matplotlib.use("Agg")  # 화면 없이 파일로만 저장
+
+    from src.visualizer import TradingVisualizer
+
+    logger.info("시각화 생성 시작")
+    visualizer = TradingVisualizer()
+    visualizer.create_dashboard(last_n_trading_days=args.days)
+    visualizer.save_dashboard()
+    logger.info("시각화 생성 완료")
+
+
+def run_all(args: argparse.Namespace) -> None:
+    """데이터 업데이트부터 시각화까지 전체 파이프라인을 실행합니다."""
+    run_fetch(args)
+    run_indicators(args)
+    run_signals(args)
+    run_render(args)
+
+
+def run_serve(args: argparse.Namespace) -> None:
+    """메모리 상주 HTTP/JSON 서비스를 실행합니다."""
+    from src.service import SignalService
+
+    SignalService().serve_forever(host=args.host, port=args.port)
+
+
+def run_stream(args: argparse.Namespace) -> None:
+    """파일을 재생하여 스트리밍 파이프라인을 실행하고 지연 시간을 보고합니다."""
+    import asyncio
+
+    from src.streaming import ReplaySource, StreamingPipeline
+
+    # 워밍업에 사용한 구간을 제외한 나머지만 재생
+    data = ReplaySource.read(args.replay)
+    history = data.head(args.history_bars)
+    source = ReplaySource(args.replay, speed=args.speed, data=data.drop(history.index))
+    pipeline = StreamingPipeline(source, history=history, freq=args.freq)
+    report = asyncio.run(pipeline.run())
+    logger.info(f"봉→시그널 지연 시간: {report}")
+
+
+def run_memory(args: argparse.Namespace) -> None:
+    """OHLCV, 지표, 시그널 데이터의 메모리 사용량을 출력합니다."""
+    from src.settings import COMPACT_SETTINGS
+
+    if args.compact:
+        COMPACT_SETTINGS["enabled"] = True
+
+    from src.compact import memory_report
+    from src.signal_generator import SignalGenerator
+    from src.technical_indicator import TechnicalIndicator
+
+    indicator = TechnicalIndicator()
+    indicator.calculate_all()
+    generator = SignalGenerator(indicators_df=indicator.indicators_df)
+    generator.generate_all()
+    frames = {
+        "ohlcv": indicator.df,
+        "indicators": indicator.indicators_df,
+        "signals": generator.signals_df,
+    }
+    print(memory_report(frames, symbols=args.symbols))
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "fetch": run_fetch,
+    "indicators": run_indicators,
+    "signals": run_signals,
+    "events": run_events,
+    "screen": run_screen,
+    "relative": run_relative,
+    "flips": run_flips,
+    "timeframes": run_timeframes,
+    "backtest": run_backtest,
+    "render": run_render,
+    "all": run_all,
+    "serve": run_serve,
+    "stream": run_stream,
+    "memory": run_memory,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 인자 파서를 생성합니다."""
+    from src.settings import (
+        FLIP_SETTINGS,
+        PORTFOLIO_SETTINGS,
+        RELATIVE_SETTINGS,
+        SERVICE_SETTINGS,
+        SPY_DATA_FILE,
+        STREAMING_SETTINGS,
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="ta", description="기술적 지표 분석 파이프라인"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_options = argparse.ArgumentParser(add_help=False)
+    fetch_options.add_argument("--symbol", default="^GSPC", help="다운로드할 심볼")
+    fetch_options.add_argument(
+        "--days-back",
+        type=int,
+        default=None,
+        help="누락 구간 대신 최근 N일을 다시 다운로드",
+    )
+
+    render_options = argparse.ArgumentParser(add_help=False)
+    render_options.add_argument(
+        "--days", type=int, default=30, help="대시보드에 표시할 거래일 수"
+    )
+
+    fetch_parser = subparsers.add_parser(
+        "fetch", parents=[fetch_options], help="가격 데이터 업데이트"
+    )
+    fetch_parser.add_argument(
+        "--dry-run", action="store_true", help="다운로드 없이 수집 계획만 출력"
+    )
+    indicators_parser = subparsers.add_parser("indicators", help="기술적 지표 계산")
+    indicators_parser.add_argument("--start", help="계산 시작 날짜 (YYYY-MM-DD)")
+    indicators_parser.add_argument("--end", help="계산 종료 날짜 (YYYY-MM-DD)")
+    indicators_parser.add_argument(
+        "--workers", type=int, help="지표 계열을 동시에 계산할 스레드 수"
+    )
+    indicators_parser.add_argument(
+        "--no-cache", action="store_true", help="지표 캐시를 사용하지 않고 전체 계산"
+    )
+    indicators_parser.add_argument(
+        "--chunk-size", type=int, help="청크 단위 계산 봉 개수 (칼럼 저장소에 기록)"
+    )
+    indicators_parser.add_argument(
+        "--data", help=f"OHLCV 데이터 파일 (기본값: {SPY_DATA_FILE})"
+    )
+    indicators_parser.add_argument(
+        "--benchmark", help="기준 지수 OHLCV 파일 (주어지면 상대강도 지표 계산)"
+    )
+    subparsers.add_parser("signals", help="매매 시그널 생성")
+    events_parser = subparsers.add_parser("events", help="시그널 전환 이벤트 출력")
+    events_parser.add_argument(
+        "--since", help="이 날짜 이후 이벤트만 출력 (YYYY-MM-DD)"
+    )
+    events_parser.add_argument(
+        "--changes-only", action="store_true", help="값이 바뀐 이벤트만 출력"
+    )
+    screen_parser = subparsers.add_parser("screen", help="최신 봉 스냅샷 스크리닝")
+    screen_parser.add_argument(
+        "query", help='조건식 (예: "[RSI(14)] < 30 and Close > [SMA_(50)]")'
+    )
+    screen_parser.add_argument(
+        "--columns", help='함께 출력할 칼럼 (세미콜론 구분, 예: "Close;RSI(14)")'
+    )
+    relative_parser = subparsers.add_parser(
+        "relative", help="저장소 심볼의 기준 지수 대비 상대강도 계산"
+    )
+    relative_parser.add_argument(
+        "symbols", nargs="*", help="심볼 목록 (기본값: 저장소의 모든 심볼)"
+    )
+    relative_parser.add_argument(
+        "--benchmark",
+        default=RELATIVE_SETTINGS["benchmark_symbol"],
+        help="기준 지수 심볼",
+    )
+    flips_parser = subparsers.add_parser("flips", help="다음 봉 시그널 전환 가격 계산")
+    flips_parser.add_argument(
+        "--data", default=str(SPY_DATA_FILE), help="직전 봉까지의 OHLCV 파일"
+    )
+    flips_parser.add_argument(
+        "--open", type=float, help="다음 봉 시가 (기본값: 직전 종가)"
+    )
+    flips_parser.add_argument("--high", type=float, help="현재까지의 장중 고가")
+    flips_parser.add_argument("--low", type=float, help="현재까지의 장중 저가")
+    flips_parser.add_argument("--volume", type=float, help="다음 봉 거래량")
+    flips_parser.add_argument(
+        "--range",
+        type=float,
+        default=FLIP_SETTINGS["search_range"],
+        help="기준가 대비 탐색 범위 비율",
+    )
+    flips_parser.add_argument(
+        "--price", type=float, help="이 가격에서 바뀌는 시그널 출력"
+    )
+    timeframes_parser = subparsers.add_parser(
+        "timeframes", help="주봉/월봉 시그널을 일봉 날짜에 맞춰 저장"
+    )
+    timeframes_parser.add_argument(
+        "--data", default=str(SPY_DATA_FILE), help="일봉 OHLCV 파일"
+    )
+    timeframes_parser.add_argument(
+        "--output", help="출력 파일 (기본값: TIMEFRAME_SETTINGS 출력 파일)"
+    )
+    backtest_parser = subparsers.add_parser(
+        "backtest", help="종합 점수 상위 k개 포트폴리오 백테스트"
+    )
+    backtest_parser.add_argument(
+        "symbols", nargs="*", help="심볼 목록 (기본값: 저장소의 모든 심볼)"
+    )
+    backtest_parser.add_argument(
+        "--top-k", type=int, default=PORTFOLIO_SETTINGS["top_k"], help="보유 심볼 수"
+    )
+    backtest_parser.add_argument(
+        "--rebalance",
+        default=PORTFOLIO_SETTINGS["rebalance"],
+        help="리밸런싱 주기 (pandas 기간 주기)",
+    )
+    backtest_parser.add_argument(
+        "--cost-bps",
+        type=float,
+        default=PORTFOLIO_SETTINGS["cost_bps"],
+        help="거래 금액 대비 편도 비용 (bp)",
+    )
+    backtest_parser.add_argument(
+        "--min-score",
+        type=float,
+        default=PORTFOLIO_SETTINGS["min_score"],
+        help="이 점수 이하 심볼은 보유하지 않음",
+    )
+    backtest_parser.add_argument(
+        "--benchmark",
+        default=RELATIVE_SETTINGS["benchmark_symbol"],
+        help="거래일 기준 심볼",
+    )
+    backtest_parser.add_argument("--output", help="날짜별 NAV 저장 파일")
+    subparsers.add_parser("render", parents=[render_options], help="대시보드 렌더링")
+    subparsers.add_parser(
+        "all", parents=[fetch_options, render_options], help="전체 파이프라인 실행"
+    )
+    serve_parser = subparsers.add_parser("serve", help="HTTP/JSON 서비스 실행")
+    serve_parser.add_argument(
+        "--host", default=SERVICE_SETTINGS["host"], help="바인딩 주소"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=SERVICE_SETTINGS["port"], help="포트"
+    )
+
+    stream_parser = subparsers.add_parser("stream", help="파일 재생 스트리밍 실행")
+    stream_parser.add_argument(
+        "--replay", type=Path, default=SPY_DATA_FILE, help="재생할 CSV/Parquet 파일"
+    )
+    stream_parser.add_argument(
+        "--speed",
+        type=float,
+        default=STREAMING_SETTINGS["speed"],
+        help="재생 배속 (0: 최대 속도)",
+    )
+    stream_parser.add_argument(
+        "--freq", default=STREAMING_SETTINGS["freq"], help="봉 주기"
+    )
+    stream_parser.add_argument(
+        "--history-bars",
+        type=int,
+        default=0,
+        help="앞부분 N개 봉은 워밍업에만 사용하고 나머지를 재생",
+    )
+
+    memory_parser = subparsers.add_parser("memory", help="메모리 사용량 출력")
+    memory_parser.add_argument(
+        "--compact", action="store_true", help="메모리 절약 모드로 계산"
+    )
+    memory_parser.add_argument(
+        "--symbols", type=int, default=1, help="예상 총량을 계산할 심볼 수"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점
+
+    Args:
+        argv (Optional[List[str]]): 명령행 인자 (기본값: sys.argv[1:])
+
+    Returns:
+        int: 종료 코드
+    """
+    args = build_parser().parse_args(argv)
+    _setup_logging()
+
+    try:
+        COMMANDS[args.command](args)
+    except Exception as e:
+        logger.error(f"실행 중 오류 발생: {str(e)}")
+        raise
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
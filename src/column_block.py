@@ -0,0 +1,112 @@
+"""
+칼럼 블록 조립 모듈
+
+계산 결과 칼럼을 미리 할당한 2차원 배열에 채운 뒤 마지막에 데이터프레임을 한 번만
+만듭니다. 데이터프레임에 칼럼을 하나씩 추가할 때 생기는 블록 분할과 반복적인
+블록 병합(복사)을 피하기 위한 것입니다.
+
+배열은 (칼럼 수, 행 수) 모양의 C 순서로 할당하므로 각 칼럼이 연속된 메모리를
+차지합니다. 이 모양은 pandas 내부 블록과 같으므로, 완성된 데이터프레임의 계산 칼럼은
+복사 없이 이 배열 하나를 그대로 쓰는 단일 블록이 됩니다.
+
+칼럼 수가 용량을 넘으면 새 배열을 할당하여 기존 칼럼을 옮깁니다. 제자리 재할당
+(``ndarray.resize``)은 ``__getitem__`` 으로 내준 뷰를 해제된 메모리를 가리키게 하므로
+사용하지 않습니다.
+"""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnBlock:
+    """미리 할당한 2차원 배열에 칼럼을 채우는 클래스"""
+
+    def __init__(
+        self,
+        n_rows: int,
+        dtype: str = "float64",
+        capacity: int = 64,
+        leading: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        Args:
+            n_rows (int): 행 개수
+            dtype (str): 칼럼 dtype
+            capacity (int): 처음 할당할 칼럼 수 (넘으면 두 배로 늘림)
+            leading (Optional[Dict[str, np.ndarray]]): 데이터프레임 앞에 둘 칼럼
+                (예: Date, OHLCV). 블록과 dtype이 같은 칼럼은 블록 앞부분에 복사하여 같은
+                블록에 넣고, 다른 dtype 칼럼은 ``to_frame`` 에서 그대로 끼워 넣습니다.
+        """
+        self.n_rows = n_rows
+        self._values = np.empty((max(capacity, 1), n_rows), dtype=dtype)
+        self._slots: Dict[str, int] = {}
+        self._leading_names = list(leading or {})
+        self._inserted: Dict[str, np.ndarray] = {}
+        for name, values in (leading or {}).items():
+            values = np.asarray(values)
+            if values.dtype == self._values.dtype:
+                self[name] = values
+            else:
+                self._inserted[name] = values
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._slots
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """칼럼 값의 뷰를 반환합니다.
+
+        블록이 커져도 뷰는 이전 배열을 붙잡고 있어 유효하지만, 그 뒤에 같은 칼럼을
+        덮어쓴 값은 반영되지 않습니다.
+        """
+        return self._values[self._slots[name]]
+
+    def __setitem__(self, name: str, values) -> None:
+        """칼럼 값을 씁니다. 같은 이름이 이미 있으면 덮어씁니다."""
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = len(self._slots)
+            if slot == len(self._values):
+                # 새 배열로 옮김 (이전 배열의 뷰는 그대로 유효)
+                grown = np.empty(
+                    (max(2 * slot, 8), self.n_rows), dtype=self._values.dtype
+                )
+                grown[:slot] = self._values[:slot]
+                self._values = grown
+            self._slots[name] = slot
+        self._values[slot] = np.asarray(values)
+
+    def to_frame(self, index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """채운 칼럼으로 데이터프레임을 만듭니다.
+
+        블록의 칼럼은 (칼럼 수, 행 수) 배열 하나를 복사 없이 쓰는 단일 블록이 되고,
+        dtype이 다른 앞 칼럼만 따로 끼워 넣습니다. 여유 칼럼이 용량의 1/4을 넘으면
+        사용한 칼럼만 복사하여 해제합니다. 블록은 빈 상태로 초기화됩니다.
+
+        Args:
+            index (Optional[pd.Index]): 인덱스
+
+        Returns:
+            pd.DataFrame: 앞 칼럼 + 계산 칼럼 데이터프레임
+        """
+        n = len(self._slots)
+        values = self._values[:n]
+        if 4 * (len(self._values) - n) > len(self._values):
+            values = values.copy()
+        names = sorted(self._slots, key=self._slots.get)
+        frame = pd.DataFrame(values.T, index=index, columns=names, copy=False)
+        for position, name in enumerate(self._leading_names):
+            if name in self._inserted:
+                frame.insert(position, name, self._inserted[name])
+        self._slots = {}
+        self._inserted = {}
+        self._leading_names = []
+        self._values = np.empty((0, self.n_rows), dtype=self._values.dtype)
+        return frame
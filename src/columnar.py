@@ -0,0 +1,145 @@
+"""
+칼럼 단위 저장소 모듈
+
+데이터프레임을 칼럼별 원시 바이너리 파일과 메타데이터로 저장합니다.
+
+    {root}/meta.json   칼럼 이름, dtype, 커밋된 행 수
+    {root}/{순번}.bin  칼럼 값 (행 순서대로 이어 붙인 고정 길이 값)
+
+청크 단위로 뒤에 이어 쓰고, 읽을 때는 ``np.memmap`` 으로 필요한 칼럼과 행 구간만
+읽으므로 전체 데이터를 메모리에 올리지 않습니다. 메타데이터의 행 수가 커밋 지점이며,
+쓰기 도중 중단되어 칼럼 파일 끝에 남은 값은 다음 쓰기에서 잘라냅니다.
+"""
+
+import json
+import logging
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.store import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+
+
+class ColumnarStore:
+    """칼럼별 바이너리 파일 저장소 클래스"""
+
+    def __init__(self, root: Path):
+        """
+        Args:
+            root (Path): 저장소 디렉토리
+        """
+        self.root = Path(root)
+        self._meta: Optional[Dict] = None
+
+    @property
+    def meta(self) -> Optional[Dict]:
+        """메타데이터를 반환합니다. 저장된 데이터가 없으면 None입니다."""
+        if self._meta is None:
+            path = self.root / META_FILE
+            if path.exists():
+                self._meta = json.loads(path.read_text(encoding="utf-8"))
+        return self._meta
+
+    @property
+    def rows(self) -> int:
+        return self.meta["rows"] if self.meta else 0
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.meta["columns"]) if self.meta else []
+
+    def _column_file(self, position: int) -> Path:
+        return self.root / f"{position}.bin"
+
+    def clear(self) -> None:
+        """저장된 데이터를 모두 삭제합니다."""
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        self._meta = None
+
+    def append(self, df: pd.DataFrame) -> int:
+        """데이터를 뒤에 이어 씁니다.
+
+        첫 쓰기에서 칼럼 이름과 dtype이 정해지며, 이후 데이터는 그 dtype으로 변환합니다.
+
+        Args:
+            df (pd.DataFrame): 추가할 데이터
+
+        Returns:
+            int: 추가 후 전체 행 수
+        """
+        try:
+            meta = self.meta
+            if meta is None:
+                self.root.mkdir(parents=True, exist_ok=True)
+                meta = {
+                    "columns": list(df.columns),
+                    "dtypes": [str(dtype) for dtype in df.dtypes],
+                    "rows": 0,
+                }
+            elif list(df.columns) != meta["columns"]:
+                raise ValueError("저장된 칼럼과 추가할 데이터의 칼럼이 다릅니다")
+
+            for position, (column, dtype) in enumerate(
+                zip(meta["columns"], meta["dtypes"])
+            ):
+                values = np.ascontiguousarray(df[column].to_numpy(dtype=dtype))
+                path = self._column_file(position)
+                with open(path, "r+b" if path.exists() else "wb") as f:
+                    # 커밋되지 않은 값은 덮어씀
+                    f.truncate(meta["rows"] * values.itemsize)
+                    f.seek(0, 2)
+                    f.write(values.tobytes())
+
+            meta = dict(meta, rows=meta["rows"] + len(df))
+            atomic_write_json(meta, self.root / META_FILE)
+            self._meta = meta
+            return meta["rows"]
+
+        except Exception as e:
+            logger.error(f"칼럼 저장소 쓰기 실패 ({self.root}): {str(e)}")
+            raise
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """칼럼과 행 구간 [start, stop)만 읽습니다.
+
+        Args:
+            columns (Optional[List[str]]): 읽을 칼럼 (기본값: 전체)
+            start (int): 시작 행
+            stop (Optional[int]): 끝 행 (포함하지 않음, 기본값: 마지막 행)
+
+        Returns:
+            pd.DataFrame: 읽은 데이터
+        """
+        meta = self.meta
+        if meta is None:
+            return pd.DataFrame(columns=columns or [])
+        rows = meta["rows"]
+        stop = rows if stop is None else min(stop, rows)
+        start = min(max(start, 0), stop)
+
+        data = {}
+        for column in columns or meta["columns"]:
+            position = meta["columns"].index(column)
+            dtype = np.dtype(meta["dtypes"][position])
+            if rows == 0:
+                data[column] = np.empty(0, dtype=dtype)
+                continue
+            mapped = np.memmap(
+                self._column_file(position), dtype=dtype, mode="r", shape=(rows,)
+            )
+            data[column] = np.array(mapped[start:stop])
+            del mapped
+        return pd.DataFrame(data, index=pd.RangeIndex(start, stop))
@@ -0,0 +1,121 @@
+"""
+메모리 절약 모드 모듈
+
+지표는 float64로 계산한 뒤, float32로 바꿔도 원래 값과의 차이가 허용 오차 안인
+칼럼만 float32로 보관합니다. 시그널(-1, 0, 1)은 int8로 보관합니다.
+``COMPACT_SETTINGS["enabled"]`` 가 True일 때 지표 계산, 시그널 생성, 파일 로드에서
+적용됩니다.
+
+    float64 지표 → float32 변환 → |x32 - x64| <= atol + rtol * |x64| 검사 → 통과 칼럼만 변환
+"""
+
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.settings import COMPACT_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+def compact_enabled() -> bool:
+    """메모리 절약 모드 사용 여부"""
+    return bool(COMPACT_SETTINGS["enabled"])
+
+
+def signal_dtype() -> str:
+    """시그널 칼럼 dtype (메모리 절약 모드에서는 int8)"""
+    return COMPACT_SETTINGS["signal_dtype"] if compact_enabled() else "int64"
+
+
+def downcast_floats(
+    df: pd.DataFrame,
+    exclude: Iterable[str] = (),
+    dtype: str = COMPACT_SETTINGS["float_dtype"],
+    rtol: float = COMPACT_SETTINGS["rtol"],
+    atol: float = COMPACT_SETTINGS["atol"],
+) -> Tuple[pd.DataFrame, List[str]]:
+    """float64 칼럼을 허용 오차 안에서 더 작은 실수 dtype으로 변환합니다.
+
+    결측 위치는 그대로 유지되어야 하며, 변환 중 범위를 넘어 무한대가 되는 값이
+    있으면 해당 칼럼은 float64로 남깁니다.
+
+    Args:
+        df (pd.DataFrame): 변환할 데이터
+        exclude (Iterable[str]): 변환하지 않을 칼럼
+        dtype (str): 변환할 dtype
+        rtol (float): 허용 상대 오차
+        atol (float): 허용 절대 오차
+
+    Returns:
+        Tuple[pd.DataFrame, List[str]]: 변환된 데이터와 float64로 남긴 칼럼 목록
+    """
+    excluded = set(exclude)
+    columns = [
+        column
+        for column in df.columns
+        if column not in excluded and df[column].dtype == np.float64
+    ]
+    if not columns:
+        return df, []
+
+    values = df[columns].to_numpy(dtype=np.float64)
+    with np.errstate(invalid="ignore", over="ignore"):
+        narrow = values.astype(dtype)
+        error = np.abs(narrow.astype(np.float64) - values)
+        close = (error <= atol + rtol * np.abs(values)) | (
+            np.isnan(values) & np.isnan(narrow)
+        )
+    passed = close.all(axis=0)
+
+    kept = [column for column, ok in zip(columns, passed) if not ok]
+    if kept:
+        logger.info(f"허용 오차를 넘어 float64로 유지하는 칼럼: {', '.join(kept)}")
+    converted = {column: narrow[:, j] for j, column in enumerate(columns) if passed[j]}
+    return df.assign(**converted), kept
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """데이터프레임의 메모리 사용량(바이트, 인덱스 포함)을 반환합니다."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def format_bytes(size: float) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환합니다."""
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def memory_report(frames: Dict[str, pd.DataFrame], symbols: int = 1) -> str:
+    """데이터프레임별 메모리 사용량을 표로 반환합니다.
+
+    Args:
+        frames (Dict[str, pd.DataFrame]): 이름별 데이터프레임 (한 심볼 기준)
+        symbols (int): 전체 유니버스 심볼 수 (1보다 크면 예상 총량을 함께 표시)
+
+    Returns:
+        str: 메모리 사용량 표
+    """
+    lines = [f"{'데이터':<12}{'행':>10}{'칼럼':>6}{'봉당':>10}{'메모리':>12}  dtype"]
+    total = 0
+    for name, df in frames.items():
+        size = frame_memory(df)
+        total += size
+        dtypes = ", ".join(
+            f"{dtype} {count}"
+            for dtype, count in df.dtypes.astype(str).value_counts().items()
+        )
+        per_row = size / len(df) if len(df) else 0.0
+        lines.append(
+            f"{name:<12}{len(df):>10}{len(df.columns):>6}"
+            f"{per_row:>9.0f}B{format_bytes(size):>12}  {dtypes}"
+        )
+    lines.append(f"합계 {format_bytes(total)}")
+    if symbols > 1:
+        lines.append(f"심볼 {symbols}개 예상 {format_bytes(total * symbols)}")
+    return "\n".join(lines)
@@ -0,0 +1,442 @@
+"""
+사용자 정의 지표 수식 모듈
+
+``EMA(Close, 20) - SMA(Close, 50)`` 이나 ``(Close - Donchian_Lower(20)) / ATR(14)`` 같은
+수식을 계산 그래프로 변환하고 NumPy 배열 단위로 한 번에 계산합니다.
+
+문법:
+    수식   := 항 (('+' | '-') 항)*
+    항     := 단항 (('*' | '/') 단항)*
+    단항   := '-' 단항 | 거듭제곱
+    거듭제곱 := 원자 ('^' 단항)?
+    원자   := 숫자 | 이름 | 이름 '(' 인자, ... ')' | '[' 칼럼 ']' | '(' 수식 ')'
+
+- 이름: OHLCV 칼럼(Open, High, Low, Close, Volume), 함수, 매크로
+- ``[RSI(14)]`` 처럼 대괄호로 이미 계산된 지표 칼럼을 참조합니다.
+- 같은 부분 수식은 모든 수식에 걸쳐 노드 하나로 합쳐지며(공통 부분식 제거), ``+``, ``*``
+  는 피연산자 순서와 관계없이 같은 노드가 됩니다. 내장 지표와 같은 수식은 이미 계산된
+  내장 지표 칼럼을 그대로 사용합니다.
+- 중간 결과는 마지막으로 사용된 뒤 바로 해제합니다.
+"""
+
+import logging
+import re
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.settings import TECHNICAL_INDICATORS
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+# 노드: (종류, 속성, 자식 노드 ID 튜플)
+Node = Tuple[str, Any, Tuple[int, ...]]
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<ref>\[[^\]]+\])"
+    r"|(?P<op>[-+*/^(),]))"
+)
+
+
+def _rolling(method: str) -> Callable[[np.ndarray, int], np.ndarray]:
+    def apply(x: np.ndarray, n: int) -> np.ndarray:
+        return getattr(pd.Series(x).rolling(window=n), method)().to_numpy()
+
+    return apply
+
+
+def _ema(x: np.ndarray, n: int) -> np.ndarray:
+    return pd.Series(x).ewm(span=n, adjust=False).mean().to_numpy()
+
+
+def _lag(x: np.ndarray, n: int) -> np.ndarray:
+    return pd.Series(x).shift(n).to_numpy()
+
+
+# 함수 이름 → (계열 인자 수(None이면 2개 이상 가변), 기간 인자 수, 계산 함수)
+FUNCTIONS: Dict[str, Tuple[Optional[int], int, Callable[..., np.ndarray]]] = {
+    "SMA": (1, 1, _rolling("mean")),
+    "EMA": (1, 1, _ema),
+    "STD": (1, 1, _rolling("std")),
+    "SUM": (1, 1, _rolling("sum")),
+    "MAX": (1, 1, _rolling("max")),
+    "MIN": (1, 1, _rolling("min")),
+    "LAG": (1, 1, _lag),
+    "ABS": (1, 0, np.abs),
+    "LOG": (1, 0, np.log),
+    "SQRT": (1, 0, np.sqrt),
+    # 결측값을 건너뛰는 원소별 최대/최소 (pd.concat(...).max(axis=1)과 같음)
+    "GREATEST": (None, 0, lambda *xs: np.fmax.reduce(np.stack(xs))),
+    "LEAST": (None, 0, lambda *xs: np.fmin.reduce(np.stack(xs))),
+}
+
+# 매크로 이름 → (매개변수, 본문 수식). 본문은 함수와 다른 매크로로 정의합니다.
+MACROS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "DIFF": (("x", "n"), "x - LAG(x, n)"),
+    "TR": (
+        (),
+        "GREATEST(High - Low, ABS(High - LAG(Close, 1)), ABS(Low - LAG(Close, 1)))",
+    ),
+    "ATR": (("n",), "SMA(TR, n)"),
+    "Typical": ((), "(High + Low + Close) / 3"),
+    "Donchian_Upper": (("n",), "MAX(High, n)"),
+    "Donchian_Lower": (("n",), "MIN(Low, n)"),
+    "BB_Upper": (("n", "k"), "SMA(Close, n) + k * STD(Close, n)"),
+    "BB_Lower": (("n", "k"), "SMA(Close, n) - k * STD(Close, n)"),
+    "Keltner_Upper": (("n", "k"), "EMA(Close, n) + k * ATR(n)"),
+    "Keltner_Lower": (("n", "k"), "EMA(Close, n) - k * ATR(n)"),
+}
+
+_BINARY: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.divide,
+    "^": np.power,
+}
+_COMMUTATIVE = ("+", "*")
+
+
+def builtin_formulas(config: Dict[str, Any] = TECHNICAL_INDICATORS) -> Dict[str, str]:
+    """내장 지표 칼럼 중 수식으로 표현할 수 있는 칼럼과 그 수식을 반환합니다."""
+    momentum = config["모멘텀 지표"]
+    contrarian = config["반대매매 지표"]
+    formulas = {}
+    for period in momentum["SMA"]["periods"]:
+        formulas[f"SMA_({period})"] = f"SMA(Close, {period})"
+    for period in momentum["EMA"]["periods"]:
+        formulas[f"EMA_({period})"] = f"EMA(Close, {period})"
+    keltner = momentum["Keltner"]
+    for side in ("Upper", "Lower"):
+        args = f"{keltner['period']},{keltner['multiplier']}"
+        formulas[f"Keltner_{side}({args})"] = f"Keltner_{side}({args})"
+        args = f"{contrarian['BB']['period']},{contrarian['BB']['std_dev']}"
+        formulas[f"BB_{side}({args})"] = f"BB_{side}({args})"
+        period = contrarian["Donchian"]["period"]
+        formulas[f"Donchian_{side}({period})"] = f"Donchian_{side}({period})"
+    return formulas
+
+
+def _tokenize(formula: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    position = 0
+    formula = formula.rstrip()
+    while position < len(formula):
+        match = _TOKEN.match(formula, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"수식 해석 실패: '{formula}' (위치 {position})")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind), match.start(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """재귀 하강 파서 (구문 트리: 튜플)"""
+
+    def __init__(self, formula: str):
+        self.formula = formula
+        self.tokens = _tokenize(formula)
+        self.position = 0
+
+    def parse(self) -> Tuple:
+        tree = self._expression()
+        if self.position < len(self.tokens):
+            self._fail("예상하지 못한 토큰")
+        return tree
+
+    def _peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][1]
+        return None
+
+    def _next(self) -> Tuple[str, str, int]:
+        if self.position >= len(self.tokens):
+            self._fail("수식이 끝났습니다")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _expect(self, text: str) -> None:
+        if self._next()[1] != text:
+            self.position -= 1
+            self._fail(f"'{text}' 이(가) 필요합니다")
+
+    def _fail(self, message: str) -> None:
+        at = (
+            self.tokens[self.position][2]
+            if self.position < len(self.tokens)
+            else len(self.formula)
+        )
+        raise ValueError(f"수식 해석 실패: '{self.formula}' (위치 {at}): {message}")
+
+    def _expression(self) -> Tuple:
+        tree = self._term()
+        while self._peek() in ("+", "-"):
+            op = self._next()[1]
+            tree = ("bin", op, tree, self._term())
+        return tree
+
+    def _term(self) -> Tuple:
+        tree = self._unary()
+        while self._peek() in ("*", "/"):
+            op = self._next()[1]
+            tree = ("bin", op, tree, self._unary())
+        return tree
+
+    def _unary(self) -> Tuple:
+        if self._peek() == "-":
+            self._next()
+            return ("neg", self._unary())
+        return self._power()
+
+    def _power(self) -> Tuple:
+        tree = self._atom()
+        if self._peek() == "^":
+            self._next()
+            tree = ("bin", "^", tree, self._unary())
+        return tree
+
+    def _atom(self) -> Tuple:
+        kind, text, _ = self._next()
+        if kind == "number":
+            return ("num", float(text))
+        if kind == "ref":
+            return ("ref", text[1:-1].strip())
+        if kind == "name":
+            if self._peek() != "(":
+                return ("name", text)
+            self._next()
+            args = []
+            if self._peek() != ")":
+                args.append(self._expression())
+                while self._peek() == ",":
+                    self._next()
+                    args.append(self._expression())
+            self._expect(")")
+            return ("call", text, args)
+        if text == "(":
+            tree = self._expression()
+            self._expect(")")
+            return tree
+        self.position -= 1
+        self._fail("피연산자가 필요합니다")
+
+
+class ExpressionGraph:
+    """공통 부분식을 합친 수식 계산 그래프 클래스"""
+
+    def __init__(self):
+        self._nodes: List[Node] = []
+        self._ids: Dict[Node, int] = {}
+        self._macro_trees: Dict[str, Tuple] = {}
+
+    def __len__(self) -> int:
+        """고유 노드 개수"""
+        return len(self._nodes)
+
+    def node(self, node_id: int) -> Node:
+        return self._nodes[node_id]
+
+    def add(self, formula: str) -> int:
+        """수식을 그래프에 추가하고 결과 노드 ID를 반환합니다."""
+        return self._build(_Parser(formula).parse(), {}, formula)
+
+    def _intern(self, node: Node) -> int:
+        node_id = self._ids.get(node)
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._nodes.append(node)
+            self._ids[node] = node_id
+        return node_id
+
+    def _const(self, node_id: int) -> Optional[float]:
+        kind, value, _ = self._nodes[node_id]
+        return value if kind == "const" else None
+
+    def _build(self, tree: Tuple, env: Dict[str, int], formula: str) -> int:
+        kind = tree[0]
+        if kind == "num":
+            return self._intern(("const", tree[1], ()))
+        if kind == "ref":
+            return self._intern(("col", tree[1], ()))
+        if kind == "name":
+            name = tree[1]
+            if name in env:
+                return env[name]
+            if name in PRICE_COLUMNS:
+                return self._intern(("col", name, ()))
+            if name in MACROS:
+                return self._expand(name, [], formula)
+            raise ValueError(f"알 수 없는 이름: {name} ('{formula}')")
+        if kind == "neg":
+            child = self._build(tree[1], env, formula)
+            value = self._const(child)
+            if value is not None:
+                return self._intern(("const", -value, ()))
+            return self._intern(("op", "neg", (child,)))
+        if kind == "bin":
+            op = tree[1]
+            left = self._build(tree[2], env, formula)
+            right = self._build(tree[3], env, formula)
+            a, b = self._const(left), self._const(right)
+            if a is not None and b is not None:
+                with np.errstate(all="ignore"):
+                    return self._intern(("const", float(_BINARY[op](a, b)), ()))
+            if op in _COMMUTATIVE and right < left:
+                left, right = right, left
+            return self._intern(("op", op, (left, right)))
+
+        # 함수 호출
+        name, args = tree[1], tree[2]
+        children = [self._build(arg, env, formula) for arg in args]
+        if name in MACROS:
+            return self._expand(name, children, formula)
+        if name not in FUNCTIONS:
+            raise ValueError(f"알 수 없는 함수: {name} ('{formula}')")
+        n_series, n_windows, _ = FUNCTIONS[name]
+        if n_series is None:
+            if len(children) < 2:
+                raise ValueError(
+                    f"{name}은(는) 인자가 2개 이상 필요합니다 ('{formula}')"
+                )
+            n_series = len(children)
+        if len(children) != n_series + n_windows:
+            raise ValueError(
+                f"{name}은(는) 인자가 {n_series + n_windows}개 필요합니다 ('{formula}')"
+            )
+        windows = []
+        for child in children[n_series:]:
+            value = self._const(child)
+            if (
+                value is None
+                or not np.isfinite(value)
+                or value != int(value)
+                or value < 1
+            ):
+                raise ValueError(
+                    f"{name}의 기간은 1 이상의 정수여야 합니다 ('{formula}')"
+                )
+            windows.append(int(value))
+        return self._intern(("fn", (name, tuple(windows)), tuple(children[:n_series])))
+
+    def _expand(self, name: str, args: List[int], formula: str) -> int:
+        params, body = MACROS[name]
+        if len(args) != len(params):
+            raise ValueError(
+                f"{name}은(는) 인자가 {len(params)}개 필요합니다 ('{formula}')"
+            )
+        if name not in self._macro_trees:
+            self._macro_trees[name] = _Parser(body).parse()
+        return self._build(self._macro_trees[name], dict(zip(params, args)), formula)
+
+    def evaluate(
+        self,
+        outputs: Dict[str, int],
+        columns: Mapping[str, np.ndarray],
+        known: Optional[Dict[int, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """결과 노드들을 계산합니다.
+
+        Args:
+            outputs (Dict[str, int]): 결과 이름별 노드 ID
+            columns (Mapping[str, np.ndarray]): 칼럼 이름별 값 (OHLCV, 계산된 지표)
+            known (Optional[Dict[int, np.ndarray]]): 이미 계산된 노드 값 (내장 지표)
+
+        Returns:
+            Dict[str, np.ndarray]: 결과 이름별 값
+        """
+        known = known or {}
+
+        # 필요한 노드와 노드별 남은 사용 횟수
+        needed = set()
+        stack = list(outputs.values())
+        while stack:
+            node_id = stack.pop()
+            if node_id in needed:
+                continue
+            needed.add(node_id)
+            if node_id not in known:
+                stack.extend(self._nodes[node_id][2])
+        uses = {node_id: 0 for node_id in needed}
+        for node_id in needed:
+            if node_id not in known:
+                for child in self._nodes[node_id][2]:
+                    uses[child] += 1
+        keep = set(outputs.values())
+
+        values: Dict[int, Any] = {}
+        with np.errstate(all="ignore"):
+            # 자식 노드는 항상 부모보다 먼저 추가되므로 ID 순서가 위상 순서
+            for node_id in sorted(needed):
+                values[node_id] = self._compute(node_id, values, columns, known)
+                if node_id in known:
+                    continue
+                for child in self._nodes[node_id][2]:
+                    uses[child] -= 1
+                    if uses[child] == 0 and child not in keep:
+                        del values[child]
+
+        results = {}
+        for name, node_id in outputs.items():
+            value = values[node_id]
+            if np.ndim(value) == 0:
+                value = np.full(len(columns["Close"]), value, dtype=float)
+            # 입력 칼럼이나 내장 지표의 뷰가 그대로 결과가 될 수 있으므로 복사
+            results[name] = np.array(value, dtype=float)
+        return results
+
+    def _compute(
+        self,
+        node_id: int,
+        values: Dict[int, Any],
+        columns: Mapping[str, np.ndarray],
+        known: Dict[int, np.ndarray],
+    ) -> Any:
+        if node_id in known:
+            return known[node_id]
+        kind, attr, children = self._nodes[node_id]
+        if kind == "const":
+            return attr
+        if kind == "col":
+            try:
+                return np.asarray(columns[attr], dtype=float)
+            except KeyError:
+                raise ValueError(f"알 수 없는 칼럼: {attr}") from None
+        args = [values[child] for child in children]
+        if kind == "op":
+            return np.negative(args[0]) if attr == "neg" else _BINARY[attr](*args)
+        name, windows = attr
+        return FUNCTIONS[name][2](*args, *windows)
+
+
+def evaluate_formulas(
+    formulas: Dict[str, str],
+    columns: Mapping[str, np.ndarray],
+    builtins: Optional[Mapping[str, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
+    """수식들을 그래프 하나로 컴파일하여 계산합니다.
+
+    Args:
+        formulas (Dict[str, str]): 결과 이름별 수식
+        columns (Mapping[str, np.ndarray]): 칼럼 이름별 값 (OHLCV, 계산된 지표)
+        builtins (Optional[Mapping[str, np.ndarray]]): 이미 계산된 내장 지표 칼럼.
+            ``builtin_formulas()`` 의 수식과 같은 부분식은 다시 계산하지 않습니다.
+
+    Returns:
+        Dict[str, np.ndarray]: 결과 이름별 값
+    """
+    graph = ExpressionGraph()
+    outputs = {name: graph.add(formula) for name, formula in formulas.items()}
+    known = {}
+    if builtins is not None:
+        for column, formula in builtin_formulas().items():
+            if column in builtins:
+                known[graph.add(formula)] = np.asarray(builtins[column])
+    logger.debug(f"사용자 지표 {len(outputs)}개: 고유 노드 {len(graph)}개")
+    return graph.evaluate(outputs, columns, known)
@@ -0,0 +1,367 @@
+"""
+누락 구간 수집 계획 모듈
+
+저장소의 날짜 인덱스를 거래소 거래일 달력과 비교하여 심볼별로 빠진 거래일만 찾고,
+이를 최소한의 날짜 구간으로 묶어 수집 요청을 계획합니다.
+같은 구간이 빠진 심볼들(``max_gap`` 이 있으면 비슷한 구간이 빠진 심볼들)은 한 번의
+제공자 호출로 묶습니다.
+
+    계획 = 심볼별 누락 거래일 → 인접 구간 병합 → 같은(비슷한) 구간끼리 심볼 묶음
+"""
+
+import logging
+from datetime import date
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+
+from src.providers import DataProvider
+from src.settings import FETCH_SETTINGS
+from src.store import OHLCVStore
+
+logger = logging.getLogger(__name__)
+
+# 정기 휴장일 외 임시 휴장일 (9/11, 허리케인 샌디, 전직 대통령 추모일)
+NYSE_SPECIAL_CLOSURES = [
+    "2001-09-11",
+    "2001-09-12",
+    "2001-09-13",
+    "2001-09-14",
+    "2004-06-11",
+    "2007-01-02",
+    "2012-10-29",
+    "2012-10-30",
+    "2018-12-05",
+    "2025-01-09",
+]
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """뉴욕증권거래소 정기 휴장일 달력 (2000년 이후 기준)"""
+
+    rules = [
+        # 토요일인 신정은 전 금요일로 당기지 않음
+        Holiday("NewYearsDay", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday(
+            "Juneteenth",
+            month=6,
+            day=19,
+            start_date="2022-01-01",
+            observance=nearest_workday,
+        ),
+        Holiday("IndependenceDay", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+NYSE_HOLIDAYS = (
+    NYSEHolidayCalendar()
+    .holidays(start="1990-01-01", end="2100-12-31")
+    .append(pd.DatetimeIndex(NYSE_SPECIAL_CLOSURES))
+    .to_numpy()
+    .astype("datetime64[D]")
+)
+NYSE_BUSDAYCAL = np.busdaycalendar(holidays=NYSE_HOLIDAYS)
+
+
+def trading_sessions(start: date, end: date) -> pd.DatetimeIndex:
+    """기간 안의 거래일을 반환합니다 (양 끝 포함)."""
+    days = np.arange(
+        np.datetime64(pd.Timestamp(start).date()),
+        np.datetime64(pd.Timestamp(end).date()) + 1,
+    )
+    sessions = days[np.is_busday(days, busdaycal=NYSE_BUSDAYCAL)]
+    return pd.DatetimeIndex(sessions.astype("datetime64[ns]"))
+
+
+def count_sessions(start: date, end: date) -> int:
+    """기간 안의 거래일 수를 반환합니다 (양 끝 포함)."""
+    return int(
+        np.busday_count(
+            np.datetime64(pd.Timestamp(start).date()),
+            np.datetime64(pd.Timestamp(end).date()) + 1,
+            busdaycal=NYSE_BUSDAYCAL,
+        )
+    )
+
+
+class FetchRequest(NamedTuple):
+    """한 번의 제공자 호출로 수집할 요청"""
+
+    symbols: Tuple[str, ...]
+    start: date
+    end: date
+    sessions: int  # 요청 구간의 거래일 수
+
+
+class FetchPlanner:
+    """저장소와 거래일 달력을 비교하여 누락 구간만 수집하도록 계획하는 클래스"""
+
+    def __init__(
+        self,
+        store: Optional[OHLCVStore] = None,
+        history_start: str = FETCH_SETTINGS["history_start"],
+        max_gap: int = 0,
+    ):
+        """
+        Args:
+            store (Optional[OHLCVStore]): 파티션 저장소
+            history_start (str): 저장된 데이터가 없는 심볼의 수집 시작일
+                (저장된 심볼은 첫 저장일이 더 늦으면 그날부터 계획)
+            max_gap (int): 이 거래일 수 이하로 떨어진 누락 구간은 하나로 병합
+                (이미 있는 봉을 조금 다시 받는 대신 요청 수를 줄임)
+        """
+        self.store = store or OHLCVStore()
+        self.history_start = pd.Timestamp(history_start)
+        self.max_gap = max_gap
+
+    @staticmethod
+    def default_end(now: Optional[pd.Timestamp] = None) -> date:
+        """기본 계획 종료일: 마감된 마지막 거래일
+
+        거래소 시간대 기준으로 오늘이 거래일이고 정규장이 마감되었으면 오늘, 아니면
+        직전 거래일입니다. 조기 폐장일도 정규 마감 시각 이후에 마감된 것으로 봅니다.
+
+        Args:
+            now (Optional[pd.Timestamp]): 기준 시각 (시간대가 없으면 UTC, 기본값: 현재)
+
+        Returns:
+            date: 마감된 마지막 거래일
+        """
+        now = pd.Timestamp.now(tz="UTC") if now is None else pd.Timestamp(now)
+        if now.tzinfo is None:
+            now = now.tz_localize("UTC")
+        local = now.tz_convert(FETCH_SETTINGS["market_timezone"])
+        today = np.datetime64(local.date())
+        close = pd.Timestamp(FETCH_SETTINGS["market_close"]).time()
+        if local.time() >= close and np.is_busday(today, busdaycal=NYSE_BUSDAYCAL):
+            return local.date()
+        previous = np.busday_offset(
+            today - 1, 0, roll="backward", busdaycal=NYSE_BUSDAYCAL
+        )
+        return pd.Timestamp(previous).date()
+
+    def _stored_dates(
+        self, symbol: str, sessions: pd.DatetimeIndex
+    ) -> pd.DatetimeIndex:
+        """기간 안의 저장된 날짜를 반환합니다.
+
+        인덱스상 행 수가 해당 구간의 거래일 수와 같은 파티션은 빠진 날이 없으므로
+        파일을 읽지 않고 거래일을 그대로 사용합니다.
+        """
+        stored = []
+        for year, meta in self.store.index(symbol).items():
+            first, last = pd.Timestamp(meta["first"]), pd.Timestamp(meta["last"])
+            in_year = sessions[sessions.year == int(year)]
+            if in_year.empty:
+                continue
+            if meta["rows"] == count_sessions(first, last):
+                stored.append(in_year[(in_year >= first) & (in_year <= last)])
+            else:
+                df = self.store.read(symbol, meta["first"], meta["last"])
+                stored.append(pd.DatetimeIndex(df["Date"]))
+        if not stored:
+            return pd.DatetimeIndex([])
+        return stored[0].append(stored[1:]) if len(stored) > 1 else stored[0]
+
+    def first_stored(self, symbol: str) -> Optional[pd.Timestamp]:
+        """심볼의 첫 저장일을 반환합니다. 저장된 데이터가 없으면 None입니다."""
+        firsts = [meta["first"] for meta in self.store.index(symbol).values()]
+        return pd.Timestamp(min(firsts)) if firsts else None
+
+    def _window(
+        self, symbol: str, start: Optional[date], end: Optional[date]
+    ) -> pd.DatetimeIndex:
+        """심볼의 계획 기간 거래일을 반환합니다.
+
+        시작일을 지정하지 않으면 history_start와 첫 저장일 중 늦은 날부터 계획합니다.
+        history_start 이후 상장된 심볼은 첫 수집에서 상장일부터 저장되므로, 상장 전
+        거래일을 매번 누락으로 다시 계획하지 않습니다. 더 앞의 이력을 채우려면
+        ``start`` 를 지정합니다.
+        """
+        if start is not None:
+            start_ts = pd.Timestamp(start)
+        else:
+            first = self.first_stored(symbol)
+            start_ts = (
+                self.history_start if first is None else max(first, self.history_start)
+            )
+        end_ts = pd.Timestamp(end if end is not None else self.default_end())
+        return trading_sessions(start_ts, end_ts)
+
+    def missing_sessions(
+        self,
+        symbol: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> pd.DatetimeIndex:
+        """심볼에서 빠진 거래일을 반환합니다."""
+        sessions = self._window(symbol, start, end)
+        return sessions.difference(self._stored_dates(symbol, sessions))
+
+    def missing_ranges(
+        self,
+        symbol: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[Tuple[date, date, int]]:
+        """빠진 거래일을 인접 구간으로 병합하여 (시작일, 종료일, 거래일 수) 목록으로 반환합니다."""
+        sessions = self._window(symbol, start, end)
+        missing = sessions.difference(self._stored_dates(symbol, sessions))
+        if missing.empty:
+            return []
+
+        # 거래일 순번이 max_gap + 1 이하로 이어지면 같은 구간
+        positions = sessions.get_indexer(missing)
+        breaks = pd.Series(positions).diff().fillna(1).gt(self.max_gap + 1).cumsum()
+        ranges = []
+        for _, group in pd.Series(positions).groupby(breaks.to_numpy()):
+            first, last = group.iloc[0], group.iloc[-1]
+            ranges.append(
+                (
+                    sessions[first].date(),
+                    sessions[last].date(),
+                    int(last - first + 1),
+                )
+            )
+        return ranges
+
+    def plan(
+        self,
+        symbols: Iterable[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[FetchRequest]:
+        """여러 심볼의 수집 요청을 계획합니다.
+
+        같은 구간이 빠진 심볼들은 하나의 요청으로 묶습니다. ``max_gap`` 이 있으면 서로
+        다른 구간도 합집합 구간으로 묶되, 묶인 어느 심볼도 자기 누락 구간 밖의 거래일을
+        ``max_gap`` 개보다 많이 다시 받지 않는 경우에만 묶습니다. 따라서 짧은 누락
+        구간이 다른 심볼의 긴 구간(예: 새 심볼의 전체 이력)에 끌려가지 않습니다.
+
+        Args:
+            symbols (Iterable[str]): 심볼 목록
+            start (Optional[date]): 계획 시작일 (기본값: history_start와 심볼의
+                첫 저장일 중 늦은 날)
+            end (Optional[date]): 계획 종료일 (기본값: 마감된 마지막 거래일)
+
+        Returns:
+            List[FetchRequest]: 시작일 순 수집 요청 목록
+        """
+        ranges = [
+            (first, last, symbol)
+            for symbol in symbols
+            for first, last, _ in self.missing_ranges(symbol, start, end)
+        ]
+        ranges.sort(key=lambda r: (r[0], r[1]))
+        # 구간 양 끝의 거래일 순번 (거래일 수 = last - first + 1)
+        epoch = np.datetime64("1970-01-01")
+        ends = np.array([r[:2] for r in ranges], dtype="datetime64[D]").reshape(-1, 2)
+        positions = np.busday_count(epoch, ends, busdaycal=NYSE_BUSDAYCAL).tolist()
+
+        # (합집합 시작 순번, 끝 순번, 가장 짧은 심볼 구간의 거래일 수, 심볼)
+        groups: List[Tuple[int, int, int, Dict[str, None]]] = []
+        for (first, last), (_, _, symbol) in zip(positions, ranges):
+            sessions = last - first + 1
+            # 그룹은 시작 순번순으로 쌓이므로 시작이 max_gap 보다 더 앞선 그룹에서 멈춤
+            joined = False
+            for i in range(len(groups) - 1, -1, -1):
+                group_first, group_last, shortest, members = groups[i]
+                if group_first < first - self.max_gap:
+                    break
+                union_last = max(group_last, last)
+                shortest = min(shortest, sessions)
+                # 합집합 요청으로 다시 받는 봉이 어느 심볼이든 max_gap 개 이하일 때만 묶음
+                if union_last - group_first + 1 - shortest <= self.max_gap:
+                    members[symbol] = None
+                    groups[i] = (group_first, union_last, shortest, members)
+                    joined = True
+                    break
+            if not joined:
+                groups.append((first, last, sessions, {symbol: None}))
+
+        requests = [
+            FetchRequest(
+                tuple(members),
+                self._session_date(first, epoch),
+                self._session_date(last, epoch),
+                last - first + 1,
+            )
+            for first, last, _, members in groups
+        ]
+        requests.sort(key=lambda r: (r.start, r.end, r.symbols))
+        logger.info(
+            f"수집 계획: 요청 {len(requests)}회, "
+            f"{sum(len(r.symbols) * r.sessions for r in requests)}개 봉"
+        )
+        return requests
+
+    @staticmethod
+    def _session_date(position: int, epoch: np.datetime64) -> date:
+        """거래일 순번을 날짜로 바꿉니다."""
+        day = np.busday_offset(
+            epoch, position, roll="forward", busdaycal=NYSE_BUSDAYCAL
+        )
+        return pd.Timestamp(day).date()
+
+    @staticmethod
+    def report(requests: List[FetchRequest]) -> str:
+        """수집 계획을 사람이 읽을 수 있는 표로 반환합니다 (dry-run 용)."""
+        if not requests:
+            return "누락된 거래일이 없습니다."
+
+        lines = [f"{'시작일':<12}{'종료일':<12}{'거래일':>6}  심볼"]
+        for request in requests:
+            symbols = ", ".join(request.symbols[:5])
+            if len(request.symbols) > 5:
+                symbols += f" 외 {len(request.symbols) - 5}개"
+            lines.append(
+                f"{request.start.isoformat():<12}{request.end.isoformat():<12}"
+                f"{request.sessions:>6}  {symbols}"
+            )
+        bars = sum(len(r.symbols) * r.sessions for r in requests)
+        lines.append(f"요청 {len(requests)}회, 예상 {bars}개 봉")
+        return "\n".join(lines)
+
+    def execute(self, requests: List[FetchRequest], provider: DataProvider) -> int:
+        """계획된 요청을 수집하여 저장소에 반영합니다.
+
+        Args:
+            requests (List[FetchRequest]): 수집 요청 목록
+            provider (DataProvider): 데이터 제공자
+
+        Returns:
+            int: 저장소에 새로 반영된 봉 개수
+        """
+        changed = 0
+        for request in requests:
+            try:
+                data = provider.fetch_many(request.symbols, request.start, request.end)
+                for symbol, df in data.items():
+                    changed += len(self.store.upsert(symbol, df))
+            except Exception as e:
+                logger.error(
+                    f"{request.start}~{request.end} 수집 실패 "
+                    f"({', '.join(request.symbols)}): {str(e)}"
+                )
+                raise
+        return changed
@@ -0,0 +1,193 @@
+"""
+다중 심볼 데이터 수집 모듈
+
+여러 심볼을 스레드 풀로 동시에 수집합니다. 모든 요청은 전역 속도 제한기를 거치고,
+실패한 요청은 지터가 있는 지수 백오프로 재시도하며, 심볼마다 제한 시간을 둡니다.
+따라서 전체 소요 시간은 심볼 수만큼의 직렬 왕복이 아니라 속도 제한에 의해 결정됩니다.
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+from src.providers import DataProvider
+from src.settings import FETCH_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """스레드 안전 토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            burst (int): 순간적으로 허용할 최대 요청 수 (버킷 크기)
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰을 하나 얻을 때까지 대기합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchResult:
+    """다중 심볼 수집 결과"""
+
+    def __init__(self):
+        self.data: Dict[str, pd.DataFrame] = {}
+        self.errors: Dict[str, str] = {}
+        self.requests = 0
+        self.retries = 0
+        self.elapsed = 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """수집 통계를 반환합니다."""
+        return {
+            "symbols": len(self.data) + len(self.errors),
+            "succeeded": len(self.data),
+            "failed": len(self.errors),
+            "requests": self.requests,
+            "retries": self.retries,
+            "elapsed": self.elapsed,
+        }
+
+
+class MultiSymbolFetcher:
+    """동시성, 속도 제한, 재시도를 갖춘 다중 심볼 수집기"""
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        max_workers: int = FETCH_SETTINGS["max_workers"],
+        rate_limit: float = FETCH_SETTINGS["rate_limit"],
+        burst: int = FETCH_SETTINGS["burst"],
+        max_retries: int = FETCH_SETTINGS["max_retries"],
+        backoff_base: float = FETCH_SETTINGS["backoff_base"],
+        backoff_max: float = FETCH_SETTINGS["backoff_max"],
+        timeout: float = FETCH_SETTINGS["timeout"],
+    ):
+        """
+        Args:
+            provider (DataProvider): 데이터 제공자
+            max_workers (int): 동시 요청 스레드 수
+            rate_limit (float): 전역 초당 요청 수 제한
+            burst (int): 순간 허용 요청 수
+            max_retries (int): 심볼당 최대 재시도 횟수
+            backoff_base (float): 백오프 기본 대기 시간 (초)
+            backoff_max (float): 백오프 최대 대기 시간 (초)
+            timeout (float): 심볼당 제한 시간 (재시도 포함, 초)
+        """
+        self.provider = provider
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(rate_limit, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self._random = random.Random()
+        self._stats_lock = threading.Lock()
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 대기 시간에 전체 지터를 적용합니다."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return self._random.uniform(0, ceiling)
+
+    def _fetch_one(
+        self,
+        symbol: str,
+        start: date,
+        end: Optional[date],
+        result: FetchResult,
+    ) -> pd.DataFrame:
+        """한 심볼을 제한 시간 안에서 재시도하며 수집합니다."""
+        deadline = time.monotonic() + self.timeout
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{symbol} 제한 시간 초과 ({self.timeout}s)")
+            with self._stats_lock:
+                result.requests += 1
+            try:
+                return self.provider.fetch(symbol, start, end, timeout=remaining)
+            except FileNotFoundError:
+                raise
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = min(self._backoff(attempt), deadline - time.monotonic())
+                if delay <= 0:
+                    raise
+                logger.warning(
+                    f"{symbol} 수집 실패, {delay:.2f}초 후 재시도 "
+                    f"({attempt + 1}/{self.max_retries}): {str(e)}"
+                )
+                with self._stats_lock:
+                    result.retries += 1
+                time.sleep(delay)
+                attempt += 1
+
+    def fetch_all(
+        self,
+        symbols: Iterable[str],
+        start: date,
+        end: Optional[date] = None,
+    ) -> FetchResult:
+        """여러 심볼을 동시에 수집합니다.
+
+        한 심볼의 실패는 다른 심볼 수집을 중단시키지 않고 결과의 ``errors`` 에 기록됩니다.
+
+        Args:
+            symbols (Iterable[str]): 수집할 심볼 목록
+            start (date): 시작 날짜
+            end (Optional[date]): 종료 날짜
+
+        Returns:
+            FetchResult: 심볼별 데이터, 실패 사유, 통계
+        """
+        result = FetchResult()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._fetch_one, symbol, start, end, result): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    result.data[symbol] = future.result()
+                except Exception as e:
+                    result.errors[symbol] = str(e)
+                    logger.error(f"{symbol} 수집 실패: {str(e)}")
+        result.elapsed = time.perf_counter() - started
+
+        summary = result.summary()
+        logger.info(
+            f"{self.provider.name} 수집 완료: {summary['succeeded']}/{summary['symbols']}개 "
+            f"심볼, 요청 {summary['requests']}회, {summary['elapsed']:.2f}초"
+        )
+        return result
@@ -0,0 +1,294 @@
+"""
+시그널 전환 가격 모듈
+
+전일까지의 지표 상태에서 다음 봉의 종가가 얼마가 되면 각 시그널이 바뀌는지(예: 종가가
+``SMA_(20)`` 을 넘는 가격, RSI(14)가 30이 되는 가격)를 장 시작 전에 한 번 계산합니다.
+장중에는 틱 가격을 미리 계산한 전환 가격 벡터와 비교만 하므로, 틱마다 지표를 다시
+계산하지 않고 시그널 개수만큼의 비교로 알림을 판단할 수 있습니다.
+
+- 후보 종가 평가: 과거 데이터로 한 번 계산한 재귀 상태(``carry_out``)와 후광 봉에
+  후보 봉 하나를 붙여 지표를 이어서 계산합니다 (청크 계산과 같은 방식). 후보 봉은
+  시가/고가/저가/거래량을 고정하고 고가/저가만 후보 종가로 넓힙니다.
+- 전환 가격 탐색: 기준가 ±``search_range`` 구간의 격자 가격을 평가한 뒤, 시그널이 바뀐
+  격자 구간만 이분법으로 ``tolerance`` 까지 좁힙니다. 한 번의 평가로 모든 시그널 값을
+  얻으므로 구간 하나의 이분법은 그 구간에서 바뀌는 모든 시그널이 함께 사용합니다.
+- 격자 간격 안에서 두 번 바뀌었다가 돌아오는 시그널은 찾지 못할 수 있습니다
+  (``grid_points`` 를 늘리면 줄어듭니다).
+- 고가/저가를 사용하는 시그널(Stoch, Williams, CCI, Donchian 등)의 전환 가격은 계산 시점의
+  장중 고가/저가를 가정합니다. 장중 범위가 넓어지면 ``compute`` 를 다시 호출합니다.
+"""
+
+import logging
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.lookback import max_lookback
+from src.rolling_stats import RollingQuantiles
+from src.settings import ADAPTIVE_THRESHOLDS, FLIP_SETTINGS
+from src.signal_generator import SignalGenerator
+from src.technical_indicator import TechnicalIndicator
+
+logger = logging.getLogger(__name__)
+
+LEVEL_COLUMNS = ["Signal", "Price", "Old", "New"]
+
+
+class _NextBarQuantiles(RollingQuantiles):
+    """후보 봉마다 직전 봉까지의 창에 자기 값만 더한 롤링 분위수
+
+    후보 봉은 서로 독립인 다음 봉이므로, 한 후보의 값이 다른 후보의 분위수 창에
+    들어가지 않도록 ``RollingQuantiles.update`` 를 대신합니다.
+    """
+
+    def __init__(self, indicators_df: pd.DataFrame, window: int, min_periods: int):
+        super().__init__(window, min_periods)
+        self._indicators_df = indicators_df
+
+    def update(self, key: str, q: float, values: np.ndarray) -> np.ndarray:
+        past = self._indicators_df[key].to_numpy(dtype=np.float64)
+        skip = max(len(past) - (self.window - 1), 0)
+        past = np.sort(past[skip:][~np.isnan(past[skip:])])
+        x = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(x)
+        n = len(past) + valid.astype(int)
+        position = q * np.maximum(n - 1, 0)
+        lower = np.floor(position).astype(int)
+        fraction = position - lower
+        inserted = np.searchsorted(past, np.where(valid, x, 0.0))
+
+        def order(k: np.ndarray) -> np.ndarray:
+            """과거 값과 후보 값을 합친 집합의 k번째 작은 값"""
+            at = past[np.clip(k, 0, max(len(past) - 1, 0))] if len(past) else x
+            before = past[np.clip(k - 1, 0, max(len(past) - 1, 0))] if len(past) else x
+            merged = np.where(k < inserted, at, np.where(k == inserted, x, before))
+            return np.where(valid, merged, at)
+
+        low = order(lower)
+        high = order(np.minimum(lower + 1, n - 1))
+        level = np.where(fraction > 0, low + (high - low) * fraction, low)
+        return np.where((n > 0) & (n >= self.min_periods), level, np.nan)
+
+
+class FlipLevels:
+    """다음 봉 종가 기준 시그널 전환 가격 계산 클래스"""
+
+    def __init__(
+        self,
+        history: pd.DataFrame,
+        search_range: float = FLIP_SETTINGS["search_range"],
+        grid_points: int = FLIP_SETTINGS["grid_points"],
+        tolerance: float = FLIP_SETTINGS["tolerance"],
+    ):
+        """
+        Args:
+            history (pd.DataFrame): 직전 봉까지의 날짜순 OHLCV 데이터
+            search_range (float): 기준가 대비 탐색 범위 비율
+            grid_points (int): 처음 평가할 격자 가격 개수 (2 이상)
+            tolerance (float): 전환 가격 허용 오차 (기준가 대비 비율)
+        """
+        if grid_points < 2:
+            raise ValueError(f"격자 가격 개수는 2 이상이어야 합니다: {grid_points}")
+        self.search_range = search_range
+        self.grid_points = grid_points
+        self.tolerance = tolerance
+
+        history = history.reset_index(drop=True)
+        indicator = TechnicalIndicator(df=history, use_cache=False, max_workers=1)
+        indicator.calculate_all()
+        self._carry = indicator.carry_out
+        self._halo = history.tail(max_lookback()).reset_index(drop=True)
+        self._quantiles: Optional[RollingQuantiles] = None
+        if ADAPTIVE_THRESHOLDS["enabled"]:
+            self._quantiles = _NextBarQuantiles(
+                indicator.indicators_df,
+                ADAPTIVE_THRESHOLDS["window"],
+                ADAPTIVE_THRESHOLDS["min_periods"],
+            )
+
+        last = history.iloc[-1]
+        self.last_close = float(last["Close"])
+        self.date = pd.Timestamp(last["Date"]) + pd.offsets.BDay(1)
+        self._bar = {
+            "Open": self.last_close,
+            "High": self.last_close,
+            "Low": self.last_close,
+            "Volume": float(last["Volume"]),
+        }
+        self.evaluations = 0
+
+        self.reference = self.last_close
+        self.signals: List[str] = []
+        self.base = np.zeros(0, dtype=int)
+        self.lower = np.zeros(0)
+        self.upper = np.zeros(0)
+        self.levels = pd.DataFrame(columns=LEVEL_COLUMNS)
+
+    def evaluate(self, closes: np.ndarray) -> pd.DataFrame:
+        """후보 종가마다 다음 봉의 시그널을 계산합니다.
+
+        Args:
+            closes (np.ndarray): 후보 종가
+
+        Returns:
+            pd.DataFrame: (후보, 시그널) 값. 인덱스는 후보 종가입니다.
+        """
+        rows = []
+        offset = len(self._halo)
+        for close in np.asarray(closes, dtype=np.float64):
+            bar = pd.DataFrame(
+                [
+                    {
+                        "Date": self.date,
+                        "Open": self._bar["Open"],
+                        "High": max(self._bar["High"], close),
+                        "Low": min(self._bar["Low"], close),
+                        "Close": close,
+                        "Volume": self._bar["Volume"],
+                    }
+                ]
+            )
+            indicator = TechnicalIndicator(
+                df=pd.concat([self._halo, bar], ignore_index=True),
+                carry=self._carry,
+                halo=offset,
+                max_workers=1,
+                use_cache=False,
+            )
+            indicator.calculate_all()
+            rows.append(indicator.indicators_df.iloc[-1])
+        self.evaluations += len(rows)
+
+        generator = SignalGenerator(
+            indicators_df=pd.DataFrame(rows).infer_objects(), quantiles=self._quantiles
+        )
+        generator.generate_all()
+        signals = generator.signals_df.drop(columns=["Date"])
+        signals.index = pd.Index(closes, name="Close")
+        return signals
+
+    def compute(
+        self,
+        open_: Optional[float] = None,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        volume: Optional[float] = None,
+        reference: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """기준가 주변의 시그널 전환 가격을 계산합니다.
+
+        Args:
+            open_ (Optional[float]): 다음 봉 시가 (기본값: 직전 종가)
+            high (Optional[float]): 현재까지의 장중 고가 (기본값: 시가)
+            low (Optional[float]): 현재까지의 장중 저가 (기본값: 시가)
+            volume (Optional[float]): 다음 봉 거래량 (기본값: 직전 봉 거래량)
+            reference (Optional[float]): 탐색 중심 가격 (기본값: 시가)
+
+        Returns:
+            pd.DataFrame: 가격순 전환 목록 (Signal, Price, Old, New). Old는 Price 바로
+                아래 가격에서의 값, New는 바로 위 가격에서의 값입니다.
+        """
+        try:
+            open_ = self.last_close if open_ is None else float(open_)
+            self._bar["Open"] = open_
+            self._bar["High"] = open_ if high is None else float(high)
+            self._bar["Low"] = open_ if low is None else float(low)
+            if volume is not None:
+                self._bar["Volume"] = float(volume)
+            self.reference = open_ if reference is None else float(reference)
+
+            start = self.evaluations
+            span = self.search_range * self.reference
+            grid = np.linspace(
+                self.reference - span, self.reference + span, self.grid_points
+            )
+            values = self.evaluate(grid)
+            self.signals = list(values.columns)
+            matrix = values.to_numpy(dtype=int)
+            brackets = [
+                (grid[i], grid[i + 1], matrix[i], matrix[i + 1])
+                for i in range(len(grid) - 1)
+                if (matrix[i] != matrix[i + 1]).any()
+            ]
+            flips = self._bisect(brackets)
+
+            levels = pd.DataFrame(flips, columns=LEVEL_COLUMNS)
+            self.levels = levels.sort_values(["Price", "Signal"]).reset_index(drop=True)
+            self._build_vectors(grid, matrix)
+            logger.info(
+                f"시그널 전환 가격 계산 완료: {len(self.levels)}개 전환, "
+                f"{self.evaluations - start}회 평가"
+            )
+            return self.levels
+
+        except Exception as e:
+            logger.error(f"시그널 전환 가격 계산 실패: {str(e)}")
+            raise
+
+    def _bisect(self, brackets: List) -> List:
+        """시그널이 바뀐 가격 구간을 허용 오차까지 좁혀 (시그널, 가격, 이전, 이후)를 반환합니다.
+
+        매 단계에서 남은 모든 구간의 중간 가격을 한 번에 평가합니다.
+        """
+        flips = []
+        width = self.tolerance * self.reference
+        while brackets:
+            done = [b for b in brackets if b[1] - b[0] <= width]
+            brackets = [b for b in brackets if b[1] - b[0] > width]
+            for lo, hi, left, right in done:
+                for j in np.flatnonzero(left != right):
+                    flips.append(
+                        (self.signals[j], (lo + hi) / 2, int(left[j]), int(right[j]))
+                    )
+            if not brackets:
+                break
+            mids = np.array([(lo + hi) / 2 for lo, hi, _, _ in brackets])
+            middle = self.evaluate(mids).to_numpy(dtype=int)
+            narrowed = []
+            for (lo, hi, left, right), mid, center in zip(brackets, mids, middle):
+                if (left != center).any():
+                    narrowed.append((lo, mid, left, center))
+                if (center != right).any():
+                    narrowed.append((mid, hi, center, right))
+            brackets = narrowed
+        return flips
+
+    def _build_vectors(self, grid: np.ndarray, matrix: np.ndarray) -> None:
+        """기준가의 시그널 값과 시그널별 가장 가까운 아래/위 전환 가격 벡터를 만듭니다."""
+        center = int(np.argmin(np.abs(grid - self.reference)))
+        if not math.isclose(grid[center], self.reference):
+            self.base = self.evaluate(np.array([self.reference])).to_numpy(int)[0]
+        else:
+            self.base = matrix[center]
+
+        self.lower = np.full(len(self.signals), -np.inf)
+        self.upper = np.full(len(self.signals), np.inf)
+        positions = {signal: j for j, signal in enumerate(self.signals)}
+        for signal, price in zip(self.levels["Signal"], self.levels["Price"]):
+            j = positions[signal]
+            if price <= self.reference:
+                self.lower[j] = max(self.lower[j], price)
+            else:
+                self.upper[j] = min(self.upper[j], price)
+
+    def check(self, price: float) -> List[str]:
+        """틱 가격에서 기준가와 값이 달라지는 시그널 이름을 반환합니다 (O(시그널 수))."""
+        crossed = (price <= self.lower) | (price >= self.upper)
+        return [self.signals[j] for j in np.flatnonzero(crossed)]
+
+    def signals_at(self, price: float) -> Dict[str, int]:
+        """전환 목록으로 틱 가격에서의 시그널 값을 구합니다 (탐색 범위 안에서 유효)."""
+        values = dict(zip(self.signals, self.base.tolist()))
+        up = self.levels[
+            (self.levels["Price"] > self.reference) & (self.levels["Price"] <= price)
+        ]
+        for signal, new in zip(up["Signal"], up["New"]):
+            values[signal] = int(new)
+        down = self.levels[
+            (self.levels["Price"] <= self.reference) & (self.levels["Price"] >= price)
+        ]
+        for signal, old in zip(down["Signal"][::-1], down["Old"][::-1]):
+            values[signal] = int(old)
+        return values
@@ -0,0 +1,311 @@
+"""
+지표 칼럼 디스크 캐시 모듈
+
+지표 계열(``TechnicalIndicator`` 의 ``Family``)별 계산 결과를 ``output/indicator_cache/``
+에 저장해 같은 데이터로 같은 지표를 다시 계산하지 않도록 합니다.
+
+    {root}/index.json   항목별 키, 행 수, 데이터 지문, 크기, 마지막 사용 시각
+    {root}/{항목}.npz   지표 칼럼 값과 재귀 상태(``carry_out``)
+
+- 키: 코드 버전, 계열 이름, 계산 메서드, ``TECHNICAL_INDICATORS`` 의 인자 튜플, 데이터
+  앞부분 지문. 코드 버전은 ``CACHE_VERSION`` 과 지표 계산 모듈 소스의 해시이므로
+  ``_calculate_*`` 메서드나 보조 함수를 고치면 이전 항목은 더 이상 적중하지 않습니다.
+- 데이터 지문: 날짜와 OHLCV 값의 blake2b 해시 (행 구간 [0, rows))
+- 부분 적중: 저장된 항목의 데이터가 현재 데이터의 앞부분과 같으면 뒤에 추가된 봉만
+  재귀 상태에서 이어서 계산합니다 (청크 계산과 같은 방식).
+- 크기 제한: 전체 크기가 ``max_bytes`` 를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.loader import OHLCV_COLUMNS
+from src.settings import INDICATOR_CACHE_DIR, INDICATOR_CACHE_SETTINGS
+from src.store import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+
+# 계산 모듈 밖의 변경(예: 재귀 상태 형식)으로 기존 항목을 버려야 할 때 올림
+CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def source_version(module: ModuleType) -> str:
+    """모듈 소스의 해시 (지표 계산 코드가 바뀌면 달라짐)"""
+    source = inspect.getsource(module)
+    return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+
+
+class DataFingerprint:
+    """OHLCV 데이터 앞부분 구간의 지문을 계산하고 재사용하는 클래스"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df (pd.DataFrame): OHLCV 데이터
+        """
+        self._arrays = [
+            np.ascontiguousarray(df[column].to_numpy())
+            .view(np.uint8)
+            .reshape(len(df), -1)
+            for column in OHLCV_COLUMNS
+        ]
+        self.rows = len(df)
+        self._prefixes: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def prefix(self, rows: int) -> str:
+        """행 구간 [0, rows)의 지문을 반환합니다."""
+        with self._lock:
+            if rows not in self._prefixes:
+                digest = hashlib.blake2b(digest_size=16)
+                for values in self._arrays:
+                    digest.update(values[:rows])
+                self._prefixes[rows] = digest.hexdigest()
+            return self._prefixes[rows]
+
+    @property
+    def head(self) -> str:
+        """데이터 식별용 앞부분 지문 (심볼이 다르면 달라짐)"""
+        return self.prefix(min(self.rows, INDICATOR_CACHE_SETTINGS["head_rows"]))
+
+
+class CacheEntry:
+    """캐시에서 읽은 지표 계열 결과"""
+
+    def __init__(
+        self, rows: int, columns: Dict[str, np.ndarray], carry: Dict[str, Any]
+    ):
+        self.rows = rows
+        self.columns = columns
+        self.carry = carry
+
+
+class IndicatorCache:
+    """지표 계열 결과 디스크 캐시 클래스 (LRU 크기 제한)"""
+
+    def __init__(
+        self,
+        root: Path = INDICATOR_CACHE_DIR,
+        max_bytes: int = INDICATOR_CACHE_SETTINGS["max_bytes"],
+        version: str = "",
+    ):
+        """
+        Args:
+            root (Path): 캐시 디렉토리
+            max_bytes (int): 캐시 파일 전체 크기 상한
+            version (str): 계산 코드 버전 (예: ``source_version`` 결과). 키에 포함되므로
+                버전이 다른 항목은 적중하지 않습니다.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.version = f"{CACHE_VERSION}.{version}"
+        self.stats = {"hits": 0, "prefix_hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def index(self) -> Dict[str, Dict[str, Any]]:
+        """항목 ID별 메타데이터"""
+        if self._index is None:
+            path = self.root / INDEX_FILE
+            try:
+                self._index = json.loads(path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._index = {}
+            except ValueError as e:
+                logger.warning(f"지표 캐시 인덱스 손상, 초기화: {str(e)}")
+                self._index = {}
+        return self._index
+
+    def family_key(self, family: Tuple[str, str, Tuple[Any, ...]]) -> str:
+        """코드 버전, 계열 이름, 메서드, 인자로 키 문자열을 만듭니다."""
+        name, method, args = family
+        return f"{self.version}|{name}|{method}|{args!r}"
+
+    @staticmethod
+    def _entry_id(key: str, head: str) -> str:
+        return hashlib.blake2b(f"{key}|{head}".encode(), digest_size=12).hexdigest()
+
+    def _entry_file(self, entry_id: str) -> Path:
+        return self.root / f"{entry_id}.npz"
+
+    def lookup(
+        self,
+        family: Tuple[str, str, Tuple[Any, ...]],
+        fingerprint: DataFingerprint,
+    ) -> Optional[CacheEntry]:
+        """현재 데이터 또는 그 앞부분으로 계산한 항목을 찾습니다.
+
+        Args:
+            family (Tuple[str, str, Tuple[Any, ...]]): 지표 계열
+            fingerprint (DataFingerprint): 현재 데이터 지문
+
+        Returns:
+            Optional[CacheEntry]: 저장된 결과 (``rows`` 가 현재 행 수보다 작으면 부분 적중)
+        """
+        key = self.family_key(family)
+        entry_id = self._entry_id(key, fingerprint.head)
+        with self._lock:
+            meta = self.index.get(entry_id)
+        if (
+            meta is None
+            or meta["key"] != key
+            or meta["rows"] > fingerprint.rows
+            or meta["fingerprint"] != fingerprint.prefix(meta["rows"])
+        ):
+            self._count("misses")
+            return None
+
+        try:
+            entry = self._read(entry_id, meta["rows"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"지표 캐시 항목 읽기 실패 ({family[0]}): {str(e)}")
+            self._count("misses")
+            return None
+
+        with self._lock:
+            meta["last_used"] = time.time()
+        self._count("hits" if entry.rows == fingerprint.rows else "prefix_hits")
+        return entry
+
+    def store(
+        self,
+        family: Tuple[str, str, Tuple[Any, ...]],
+        fingerprint: DataFingerprint,
+        columns: Dict[str, np.ndarray],
+        carry: Dict[str, Any],
+    ) -> None:
+        """계열 결과를 저장하고 크기 상한을 넘으면 오래된 항목을 삭제합니다.
+
+        Args:
+            family (Tuple[str, str, Tuple[Any, ...]]): 지표 계열
+            fingerprint (DataFingerprint): 결과를 계산한 데이터 지문
+            columns (Dict[str, np.ndarray]): 칼럼별 값
+            carry (Dict[str, Any]): 재귀 상태 (부분 적중 시 이어서 계산하는 데 사용)
+        """
+        key = self.family_key(family)
+        entry_id = self._entry_id(key, fingerprint.head)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            size = self._write(entry_id, columns, carry)
+            with self._lock:
+                self.index[entry_id] = {
+                    "key": key,
+                    "rows": fingerprint.rows,
+                    "fingerprint": fingerprint.prefix(fingerprint.rows),
+                    "bytes": size,
+                    "last_used": time.time(),
+                }
+                self._evict()
+        except OSError as e:
+            # 캐시 저장 실패는 계산 결과에 영향을 주지 않음
+            logger.warning(f"지표 캐시 저장 실패 ({family[0]}): {str(e)}")
+
+    def flush(self) -> None:
+        """마지막 사용 시각을 포함한 인덱스를 저장합니다."""
+        if self._index is None:
+            return
+        with self._lock:
+            self._save_index()
+
+    def clear(self) -> None:
+        """캐시 항목을 모두 삭제합니다."""
+        with self._lock:
+            for entry_id in list(self.index):
+                self._remove(entry_id)
+            self._save_index()
+
+    def summary(self) -> str:
+        """적중 통계를 문자열로 반환합니다."""
+        total_bytes = sum(meta["bytes"] for meta in self.index.values())
+        return (
+            f"적중 {self.stats['hits']}, 부분 적중 {self.stats['prefix_hits']}, "
+            f"미스 {self.stats['misses']}, 삭제 {self.stats['evictions']} "
+            f"(항목 {len(self.index)}개, {total_bytes / 1024**2:.1f} MB)"
+        )
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _evict(self) -> None:
+        """크기 상한을 넘으면 마지막 사용 시각이 오래된 항목부터 삭제합니다 (잠금 안에서 호출)."""
+        total = sum(meta["bytes"] for meta in self.index.values())
+        for entry_id in sorted(self.index, key=lambda e: self.index[e]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self.index[entry_id]["bytes"]
+            self._remove(entry_id)
+            self.stats["evictions"] += 1
+        self._save_index()
+
+    def _save_index(self) -> None:
+        """인덱스를 원자적으로 저장합니다 (잠금 안에서 호출)."""
+        if self.root.exists():
+            atomic_write_json(self.index, self.root / INDEX_FILE)
+
+    def _remove(self, entry_id: str) -> None:
+        self.index.pop(entry_id, None)
+        try:
+            self._entry_file(entry_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write(
+        self, entry_id: str, columns: Dict[str, np.ndarray], carry: Dict[str, Any]
+    ) -> int:
+        """항목 파일을 원자적으로 쓰고 크기를 반환합니다."""
+        arrays = {f"col:{name}": np.asarray(values) for name, values in columns.items()}
+        for key, value in carry.items():
+            if isinstance(value, dict):
+                for field, item in value.items():
+                    arrays[f"carry:{key}:{field}"] = np.asarray(item)
+            else:
+                arrays[f"carry:{key}"] = np.asarray(value)
+
+        path = self._entry_file(entry_id)
+        fd, tmp = tempfile.mkstemp(
+            dir=self.root, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        return path.stat().st_size
+
+    def _read(self, entry_id: str, rows: int) -> CacheEntry:
+        """항목 파일을 읽습니다."""
+        columns: Dict[str, np.ndarray] = {}
+        carry: Dict[str, Any] = {}
+        with np.load(self._entry_file(entry_id)) as data:
+            for name in data.files:
+                kind, _, rest = name.partition(":")
+                if kind == "col":
+                    columns[rest] = data[name]
+                elif ":" in rest:
+                    key, field = rest.split(":", 1)
+                    carry.setdefault(key, {})[field] = data[name].item()
+                else:
+                    value = data[name]
+                    carry[rest] = value.item() if value.ndim == 0 else value
+        return CacheEntry(rows, columns, carry)
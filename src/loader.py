@@ -0,0 +1,217 @@
+"""
+CSV 로더 모듈
+
+CSV 파일을 명시적 dtype, 고정 날짜 형식(ISO 8601), 필요한 칼럼(usecols)만으로 읽고,
+파싱 결과를 바이너리 스냅샷(``{파일명}.snapshot.npz``)으로 저장합니다. 프로젝트 안의
+파일은 ``SNAPSHOT_DIR`` 아래 같은 상대 경로에 저장하므로 게시되는 ``output/`` 에 스냅샷이
+섞이지 않습니다.
+
+스냅샷은 원본 파일의 크기, 수정 시각, blake2b 해시와 읽기 옵션으로 식별됩니다.
+- 크기와 수정 시각이 같으면 해시 계산 없이 스냅샷을 사용합니다.
+- 수정 시각만 다르면 해시를 비교하여 내용이 같을 때 스냅샷을 사용합니다.
+- 그 외에는 CSV를 다시 파싱하고 스냅샷을 새로 씁니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.compact import compact_enabled, downcast_floats, signal_dtype
+from src.settings import PROJECT_ROOT, SNAPSHOT_DIR
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".snapshot.npz"
+DATE_COLUMN = "Date"
+DATE_FORMAT = "ISO8601"  # 2000-01-03, 2000-01-03 09:30:00 모두 추론 없이 파싱
+
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+OHLCV_DTYPES = {column: "float64" for column in OHLCV_COLUMNS[1:]}
+
+
+def snapshot_path(path: Path) -> Path:
+    """원본 CSV 파일의 스냅샷 경로를 반환합니다.
+
+    프로젝트 안의 파일은 ``SNAPSHOT_DIR`` 아래 같은 상대 경로에, 프로젝트 밖의 파일(예:
+    임시 디렉토리)은 원본 옆에 둡니다.
+    """
+    path = Path(path).resolve()
+    name = path.name + SNAPSHOT_SUFFIX
+    try:
+        relative = path.parent.relative_to(PROJECT_ROOT.resolve())
+    except ValueError:
+        return path.with_name(name)
+    return SNAPSHOT_DIR / relative / name
+
+
+def file_hash(path: Path) -> str:
+    """파일 내용의 blake2b 해시를 반환합니다."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _options_key(
+    usecols: Optional[List[str]], dtype: Optional[Dict[str, str]], default_dtype: str
+) -> str:
+    """읽기 옵션을 스냅샷 식별 문자열로 변환합니다."""
+    return json.dumps(
+        {"usecols": usecols, "dtype": dtype, "default": default_dtype},
+        sort_keys=True,
+    )
+
+
+def _load_snapshot(path: Path, options: str) -> Optional[pd.DataFrame]:
+    """원본과 일치하는 스냅샷이 있으면 읽어서 반환합니다."""
+    snap = snapshot_path(path)
+    if not snap.exists():
+        return None
+    try:
+        with np.load(snap, allow_pickle=False) as data:
+            meta = json.loads(str(data["__meta__"]))
+            stat = path.stat()
+            if meta["options"] != options or meta["size"] != stat.st_size:
+                return None
+            if meta["mtime_ns"] != stat.st_mtime_ns and meta["hash"] != file_hash(path):
+                return None
+            columns = data["__columns__"].tolist()
+            if "block" in data:
+                # 같은 dtype의 숫자 칼럼은 2차원 블록 하나로 복원 (칼럼별 복사 없음)
+                df = pd.DataFrame(data["block"], columns=columns[1:], copy=False)
+                df.insert(0, columns[0], data["c0"])
+                return df
+            return pd.DataFrame(
+                {column: data[f"c{i}"] for i, column in enumerate(columns)}
+            )
+    except Exception as e:
+        logger.warning(f"스냅샷 로드 실패, CSV를 다시 읽습니다 ({snap}): {str(e)}")
+        return None
+
+
+def _save_snapshot(path: Path, df: pd.DataFrame, options: str) -> None:
+    """파싱 결과를 스냅샷으로 원자적으로 저장합니다."""
+    snap = snapshot_path(path)
+    stat = path.stat()
+    meta = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": file_hash(path),
+        "options": options,
+    }
+    values = df.drop(columns=df.columns[0])
+    if df.columns[0] == DATE_COLUMN and values.dtypes.nunique() == 1:
+        arrays = {"c0": df[DATE_COLUMN].to_numpy(), "block": values.to_numpy()}
+    else:
+        arrays = {f"c{i}": df[column].to_numpy() for i, column in enumerate(df.columns)}
+    snap.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=snap.parent, prefix=f".{snap.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                __meta__=np.array(json.dumps(meta)),
+                __columns__=np.array(list(df.columns), dtype=str),
+                **arrays,
+            )
+        os.replace(tmp, snap)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_csv(
+    path: Path,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    default_dtype: str = "float64",
+    snapshot: bool = True,
+    float_precision: Optional[str] = None,
+) -> pd.DataFrame:
+    """Date 칼럼과 숫자 칼럼으로 이루어진 CSV 파일을 읽습니다.
+
+    Args:
+        path (Path): CSV 파일 경로
+        usecols (Optional[List[str]]): 읽을 칼럼 (None이면 전체)
+        dtype (Optional[Dict[str, str]]): 칼럼별 dtype
+        default_dtype (str): dtype에 지정되지 않은 숫자 칼럼의 dtype
+        snapshot (bool): 바이너리 스냅샷 사용 여부
+        float_precision (Optional[str]): 실수 파서 ("round_trip" 이면 정확히 왕복 변환,
+            스냅샷을 사용하지 않음)
+
+    Returns:
+        pd.DataFrame: Date 칼럼이 datetime64로 변환된 데이터
+    """
+    path = Path(path)
+    if float_precision is not None:
+        snapshot = False
+    options = _options_key(usecols, dtype, default_dtype)
+
+    if snapshot:
+        df = _load_snapshot(path, options)
+        if df is not None:
+            logger.debug(f"스냅샷 로드: {snapshot_path(path)}")
+            return df
+
+    if dtype is None or usecols is None:
+        header = pd.read_csv(path, nrows=0).columns
+        columns = usecols or list(header)
+        dtype = {
+            column: (dtype or {}).get(column, default_dtype)
+            for column in columns
+            if column != DATE_COLUMN
+        }
+
+    df = pd.read_csv(
+        path, usecols=usecols, dtype=dtype, float_precision=float_precision
+    )
+    df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN], format=DATE_FORMAT)
+
+    if snapshot:
+        try:
+            _save_snapshot(path, df, options)
+        except OSError as e:
+            logger.warning(f"스냅샷 저장 실패 ({snapshot_path(path)}): {str(e)}")
+    return df
+
+
+def read_ohlcv(path: Path, snapshot: bool = True) -> pd.DataFrame:
+    """OHLCV 파일을 읽습니다."""
+    return load_csv(path, usecols=OHLCV_COLUMNS, dtype=OHLCV_DTYPES, snapshot=snapshot)
+
+
+def iter_ohlcv(path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """OHLCV 파일을 chunk_size 개 봉씩 순서대로 읽습니다 (스냅샷 사용 안 함)."""
+    reader = pd.read_csv(
+        path, usecols=OHLCV_COLUMNS, dtype=OHLCV_DTYPES, chunksize=chunk_size
+    )
+    with reader:
+        for chunk in reader:
+            chunk[DATE_COLUMN] = pd.to_datetime(chunk[DATE_COLUMN], format=DATE_FORMAT)
+            yield chunk
+
+
+def read_indicators(path: Path, snapshot: bool = True) -> pd.DataFrame:
+    """기술적 지표 파일을 읽습니다.
+
+    지표 칼럼은 float64이며, 메모리 절약 모드에서는 허용 오차 안의 칼럼만 float32로
+    변환합니다.
+    """
+    df = load_csv(path, snapshot=snapshot)
+    if compact_enabled():
+        df, _ = downcast_floats(df, exclude=OHLCV_COLUMNS)
+    return df
+
+
+def read_signals(path: Path, snapshot: bool = True) -> pd.DataFrame:
+    """매매 시그널 파일을 읽습니다 (시그널 칼럼은 int64, 메모리 절약 모드에서는 int8)."""
+    return load_csv(path, default_dtype=signal_dtype(), snapshot=snapshot)
@@ -0,0 +1,137 @@
+"""
+지표 워밍업(lookback) 길이 모듈
+
+각 지표가 과거 데이터 없이 시작했을 때 전체 구간 계산과 같은 값을 내기까지 필요한
+봉 수를 선언합니다. 기간 지정 계산(``TechnicalIndicator.calculate_range``)은 요청
+구간 앞에 이 길이만큼의 봉을 더 읽어 계산한 뒤 잘라냅니다.
+
+- 이동 창 지표: 가장 긴 창 길이 (차분/중첩 창은 길이를 더함)
+- EMA 기반 지표: 초기값 영향 (1 - alpha)^k 가 tolerance 이하가 되는 k
+- PSAR: 추세 반전 시 상태가 초기화되므로 고정 봉 수 (``psar_bars``)
+- 누적 지표(ADL, Aroon): 창 길이만 선언하고, 수준은 전체 구간 값에 맞춰 보정
+- 상대강도 지표(``RELATIVE_INDICATORS``): 기간 (수익률 창은 1봉 더 필요)
+- 사용자 정의 지표(``CUSTOM_INDICATORS``): 수식 그래프에서 계산
+"""
+
+import math
+from typing import Any, Callable, Dict
+
+from src.expression import ExpressionGraph
+from src.settings import (
+    CUSTOM_INDICATORS,
+    LOOKBACK_SETTINGS,
+    RELATIVE_INDICATORS,
+    TECHNICAL_INDICATORS,
+)
+
+# 누적합을 사용하여 시작 위치에 따라 수준(level)이 달라지는 지표
+CUMULATIVE_INDICATORS = ("Aroon", "ADL")
+
+
+def ema_horizon(span: int, tolerance: float = LOOKBACK_SETTINGS["tolerance"]) -> int:
+    """adjust=False EMA에서 초기값의 영향이 tolerance 이하로 줄어드는 봉 수를 반환합니다.
+
+    alpha = 2 / (span + 1) 이고 k봉 뒤 초기값의 가중치는 (1 - alpha)^k 입니다.
+    """
+    alpha = 2 / (span + 1)
+    return math.ceil(math.log(tolerance) / math.log(1 - alpha))
+
+
+# 지표 이름별 워밍업 봉 수 (설정값, tolerance) → 봉 수
+LOOKBACKS: Dict[str, Callable[[Dict[str, Any], float], int]] = {
+    "SMA": lambda p, tol: max(p["periods"]),
+    "EMA": lambda p, tol: max(ema_horizon(period, tol) for period in p["periods"]),
+    "TSI": lambda p, tol: (
+        1 + ema_horizon(p["long_period"], tol) + 2 * ema_horizon(p["short_period"], tol)
+    ),
+    "MACD": lambda p, tol: (
+        ema_horizon(p["long_period"], tol) + ema_horizon(p["signal_period"], tol)
+    ),
+    "PSAR": lambda p, tol: LOOKBACK_SETTINGS["psar_bars"],
+    "ADX": lambda p, tol: 2 * p["period"] + 1,
+    "Aroon": lambda p, tol: p["period"],
+    "ADL": lambda p, tol: p["period"],
+    "ADR": lambda p, tol: 2 * p["period"] + 1,
+    "Ichimoku": lambda p, tol: max(p["tenkan_period"], p["kijun_period"]),
+    "Keltner": lambda p, tol: max(ema_horizon(p["period"], tol), p["period"] + 1),
+    "RSI": lambda p, tol: p["period"] + 1,
+    "BB": lambda p, tol: p["period"],
+    "CCI": lambda p, tol: p["period"],
+    "Stoch": lambda p, tol: p["k_period"] + p["d_period"],
+    "Williams": lambda p, tol: p["period"],
+    "CMO": lambda p, tol: p["period"] + 1,
+    "DeMarker": lambda p, tol: p["period"] + 1,
+    "Donchian": lambda p, tol: p["period"],
+    "Pivot": lambda p, tol: 0,
+    "PSY": lambda p, tol: p["period"] + 1,
+    "NPSY": lambda p, tol: p["period"] + 1,
+    "RS": lambda p, tol: p["period"],
+    "Beta": lambda p, tol: p["period"] + 1,
+    "Corr": lambda p, tol: p["period"] + 1,
+}
+
+
+def formula_lookbacks(
+    formulas: Dict[str, str] = CUSTOM_INDICATORS,
+    tolerance: float = LOOKBACK_SETTINGS["tolerance"],
+) -> Dict[str, int]:
+    """사용자 정의 지표 수식별 워밍업 봉 수를 반환합니다.
+
+    수식 그래프의 각 경로에서 함수 기간(EMA는 ``ema_horizon``)을 더한 값 중 최대값입니다.
+    ``[칼럼]`` 으로 참조한 내장 지표의 워밍업은 내장 지표 쪽에서 이미 포함됩니다.
+    """
+    graph = ExpressionGraph()
+    memo: Dict[int, int] = {}
+
+    def walk(node_id: int) -> int:
+        if node_id not in memo:
+            kind, attr, children = graph.node(node_id)
+            own = 0
+            if kind == "fn":
+                name, windows = attr
+                if name == "EMA":
+                    own = ema_horizon(windows[0], tolerance)
+                elif windows:
+                    own = windows[0]
+            memo[node_id] = own + max((walk(child) for child in children), default=0)
+        return memo[node_id]
+
+    return {name: walk(graph.add(formula)) for name, formula in formulas.items()}
+
+
+def indicator_lookbacks(
+    config: Dict[str, Any] = TECHNICAL_INDICATORS,
+    tolerance: float = LOOKBACK_SETTINGS["tolerance"],
+    formulas: Dict[str, str] = CUSTOM_INDICATORS,
+    relative: Dict[str, Any] = RELATIVE_INDICATORS,
+) -> Dict[str, int]:
+    """설정된 지표별 워밍업 봉 수를 반환합니다.
+
+    Args:
+        config (Dict[str, Any]): 지표 설정 (``TECHNICAL_INDICATORS`` 형식)
+        tolerance (float): EMA 초기값 영향 허용 비율
+        formulas (Dict[str, str]): 사용자 정의 지표 수식 (``CUSTOM_INDICATORS`` 형식)
+        relative (Dict[str, Any]): 상대강도 지표 설정 (``RELATIVE_INDICATORS`` 형식)
+
+    Returns:
+        Dict[str, int]: 지표 이름별 워밍업 봉 수
+    """
+    lookbacks = {}
+    for group in [*config.values(), relative]:
+        for name, params in group.items():
+            if name not in LOOKBACKS:
+                raise KeyError(f"워밍업 길이가 선언되지 않은 지표: {name}")
+            lookbacks[name] = LOOKBACKS[name](params, tolerance)
+    lookbacks.update(formula_lookbacks(formulas, tolerance))
+    return lookbacks
+
+
+def max_lookback(
+    config: Dict[str, Any] = TECHNICAL_INDICATORS,
+    tolerance: float = LOOKBACK_SETTINGS["tolerance"],
+    formulas: Dict[str, str] = CUSTOM_INDICATORS,
+    relative: Dict[str, Any] = RELATIVE_INDICATORS,
+) -> int:
+    """모든 지표를 만족하는 워밍업 봉 수를 반환합니다."""
+    lookbacks = indicator_lookbacks(config, tolerance, formulas, relative)
+    return max(lookbacks.values(), default=0)
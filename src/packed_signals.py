@@ -0,0 +1,431 @@
+"""
+비트 압축 시그널 저장소 모듈
+
+시그널 값(-1, 0, 1)을 칸당 2비트로 압축하여 여러 심볼의 긴 시그널 이력을 메모리에 올려
+둔 채로 조회합니다. 심볼마다 시그널별 매수/매도 비트 평면을 두고, 날짜를 64개씩 묶어
+uint64 워드 하나(날짜 블록)에 담습니다.
+
+    buy[s, w]  비트 i = 시그널 s가 날짜 64*w + i에 매수(1)
+    sell[s, w] 비트 i = 시그널 s가 날짜 64*w + i에 매도(-1)
+
+- 압축/해제: ``np.packbits`` / ``np.unpackbits`` 로 행렬 전체를 한 번에 변환
+- 조회: 날짜 범위에 걸친 워드와 필요한 시그널 평면만 해제
+- 합의 조회: "k개 이상의 모멘텀 시그널이 매수인 날짜" 를 해제하지 않고 워드 단위
+  비트 연산(비트 슬라이스 덧셈기와 상수 비교)으로 계산
+
+1,000개 심볼 × 24개 시그널 × 30년(약 7,600 거래일) 이력의 비트 평면은 약 46 MB입니다
+(int8 행렬 182 MB).
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.compact import signal_dtype
+from src.loader import DATE_COLUMN
+from src.settings import PACKED_SIGNALS_DIR, TECHNICAL_INDICATORS
+
+logger = logging.getLogger(__name__)
+
+WORD_BITS = 64
+SignalSelector = Union[str, Sequence[str], None]
+
+
+def _pack_bits(mask: np.ndarray) -> np.ndarray:
+    """(시그널, 날짜) bool 행렬을 (시그널, 워드) uint64 행렬로 압축합니다."""
+    n_signals, rows = mask.shape
+    padded = -(-rows // WORD_BITS) * WORD_BITS
+    if padded != rows:
+        mask = np.pad(mask, ((0, 0), (0, padded - rows)))
+    packed = np.packbits(mask, axis=1, bitorder="little")
+    return np.ascontiguousarray(packed).view("<u8").reshape(n_signals, -1)
+
+
+def _unpack_bits(words: np.ndarray, offset: int, count: int) -> np.ndarray:
+    """(시그널, 워드) 행렬에서 비트 구간 [offset, offset + count)를 bool로 해제합니다."""
+    first = offset // WORD_BITS
+    last = -(-(offset + count) // WORD_BITS)
+    chunk = np.ascontiguousarray(words[:, first:last]).view(np.uint8)
+    bits = np.unpackbits(chunk, axis=1, bitorder="little")
+    start = offset - first * WORD_BITS
+    stop = start + count
+    return bits[:, start:stop].astype(bool)
+
+
+def _at_least(planes: np.ndarray, k: int) -> np.ndarray:
+    """(평면, 워드) 행렬에서 k개 이상의 평면에 켜진 비트를 워드 배열로 반환합니다.
+
+    평면을 비트 슬라이스 카운터(자리별 워드 배열)에 차례로 더한 뒤, 상위 자리부터
+    카운터와 k를 비교하여 ``counter > k`` 와 ``counter == k`` 마스크를 갱신합니다.
+    """
+    n_planes, n_words = planes.shape
+    ones = np.iinfo(np.uint64).max
+    if k <= 0:
+        return np.full(n_words, ones, dtype=np.uint64)
+    if k > n_planes:
+        return np.zeros(n_words, dtype=np.uint64)
+
+    counter = [np.zeros(n_words, dtype=np.uint64) for _ in range(n_planes.bit_length())]
+    for plane in planes:
+        carry = plane
+        for j in range(len(counter)):
+            counter[j], carry = counter[j] ^ carry, counter[j] & carry
+            if not carry.any():
+                break
+
+    greater = np.zeros(n_words, dtype=np.uint64)
+    equal = np.full(n_words, ones, dtype=np.uint64)
+    for j in reversed(range(len(counter))):
+        if (k >> j) & 1:
+            equal &= counter[j]
+        else:
+            greater |= equal & counter[j]
+            equal &= ~counter[j]
+    return greater | equal
+
+
+def group_signals(columns: Iterable[str], group: str) -> List[str]:
+    """``TECHNICAL_INDICATORS`` 의 지표 분류(예: "모멘텀 지표")에 속한 시그널 칼럼을 반환합니다."""
+    names = tuple(TECHNICAL_INDICATORS[group])
+    prefixes = tuple(f"{name}(" for name in names) + tuple(
+        f"{name}_(" for name in names
+    )
+    return [column for column in columns if column.startswith(prefixes)]
+
+
+class PackedSignals:
+    """심볼 하나의 2비트 압축 시그널 이력 클래스"""
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        signals: List[str],
+        buy: np.ndarray,
+        sell: np.ndarray,
+    ):
+        """
+        Args:
+            dates (np.ndarray): 날짜순 날짜 (datetime64[ns])
+            signals (List[str]): 시그널 칼럼 이름
+            buy (np.ndarray): (시그널, 워드) 매수 비트 평면
+            sell (np.ndarray): (시그널, 워드) 매도 비트 평면
+        """
+        self.dates = np.asarray(dates, dtype="datetime64[ns]")
+        self.signals = list(signals)
+        self.buy = buy
+        self.sell = sell
+        self._positions = {signal: i for i, signal in enumerate(self.signals)}
+
+    @classmethod
+    def pack(cls, signals_df: pd.DataFrame) -> "PackedSignals":
+        """시그널 데이터를 압축합니다.
+
+        Args:
+            signals_df (pd.DataFrame): 날짜순 시그널 데이터 (Date + 시그널 칼럼)
+
+        Returns:
+            PackedSignals: 압축된 시그널 이력
+        """
+        signals = [column for column in signals_df.columns if column != DATE_COLUMN]
+        matrix = signals_df[signals].to_numpy(dtype=np.int8).T
+        invalid = (matrix < -1) | (matrix > 1)
+        if invalid.any():
+            raise ValueError(
+                f"시그널 값은 -1, 0, 1이어야 합니다: {np.unique(matrix[invalid])}"
+            )
+        dates = signals_df[DATE_COLUMN].to_numpy(dtype="datetime64[ns]")
+        if len(dates) > 1 and not (np.diff(dates) > np.timedelta64(0)).all():
+            raise ValueError("시그널 날짜가 날짜순이 아니거나 중복되었습니다")
+        return cls(dates, signals, _pack_bits(matrix == 1), _pack_bits(matrix == -1))
+
+    @property
+    def rows(self) -> int:
+        """날짜 개수"""
+        return len(self.dates)
+
+    @property
+    def nbytes(self) -> int:
+        """비트 평면과 날짜의 메모리 크기"""
+        return self.buy.nbytes + self.sell.nbytes + self.dates.nbytes
+
+    def extend(self, signals_df: pd.DataFrame) -> None:
+        """마지막 날짜 이후의 시그널을 이어 붙입니다 (마지막 워드만 다시 압축).
+
+        Args:
+            signals_df (pd.DataFrame): 추가할 시그널 데이터 (칼럼 구성이 같아야 함)
+        """
+        if self.rows:
+            signals_df = signals_df[signals_df[DATE_COLUMN] > self.dates[-1]]
+        tail = PackedSignals.pack(signals_df)
+        if tail.signals != self.signals:
+            raise ValueError("추가할 시그널의 칼럼 구성이 다릅니다")
+
+        kept = self.rows // WORD_BITS * WORD_BITS
+        partial = self.rows - kept
+        new_rows = tail.rows
+        planes = []
+        for words, new_words in ((self.buy, tail.buy), (self.sell, tail.sell)):
+            head = _unpack_bits(words, kept, partial)
+            bits = np.concatenate([head, _unpack_bits(new_words, 0, new_rows)], axis=1)
+            full_words = words[:, : kept // WORD_BITS]
+            planes.append(np.concatenate([full_words, _pack_bits(bits)], axis=1))
+        self.buy, self.sell = planes
+        self.dates = np.concatenate([self.dates, tail.dates])
+
+    def _row_range(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> slice:
+        """날짜 범위 [start, end]에 해당하는 행 구간"""
+        first, last = 0, self.rows
+        if start is not None:
+            first = np.searchsorted(self.dates, pd.Timestamp(start).to_datetime64())
+        if end is not None:
+            last = np.searchsorted(
+                self.dates, pd.Timestamp(end).to_datetime64(), side="right"
+            )
+        return slice(int(first), int(max(first, last)))
+
+    def _select(self, signals: SignalSelector) -> List[str]:
+        """시그널 이름 목록, 지표 분류 이름, 또는 None(전체)을 칼럼 목록으로 바꿉니다."""
+        if signals is None:
+            return self.signals
+        if isinstance(signals, str):
+            if signals in TECHNICAL_INDICATORS:
+                return group_signals(self.signals, signals)
+            signals = [signals]
+        missing = [signal for signal in signals if signal not in self._positions]
+        if missing:
+            raise KeyError(f"저장소에 없는 시그널: {', '.join(missing)}")
+        return list(signals)
+
+    def unpack(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        signals: SignalSelector = None,
+    ) -> pd.DataFrame:
+        """날짜 범위와 시그널을 골라 시그널 데이터로 해제합니다.
+
+        Args:
+            start (Optional[str]): 시작 날짜 (포함)
+            end (Optional[str]): 종료 날짜 (포함)
+            signals (SignalSelector): 시그널 칼럼 목록 또는 지표 분류 이름 (기본값: 전체)
+
+        Returns:
+            pd.DataFrame: Date + 선택한 시그널 칼럼
+        """
+        rows = self._row_range(start, end)
+        columns = self._select(signals)
+        index = [self._positions[column] for column in columns]
+        count = rows.stop - rows.start
+        buy = _unpack_bits(self.buy[index], rows.start, count)
+        sell = _unpack_bits(self.sell[index], rows.start, count)
+        values = (buy.astype(np.int8) - sell.astype(np.int8)).astype(signal_dtype())
+
+        data = {DATE_COLUMN: self.dates[rows]}
+        data.update({column: values[i] for i, column in enumerate(columns)})
+        return pd.DataFrame(data)
+
+    def _planes(
+        self,
+        signals: SignalSelector,
+        value: int,
+        start: Optional[str],
+        end: Optional[str],
+    ) -> Tuple[np.ndarray, int, int]:
+        """날짜 범위에 걸친 워드의 매수 또는 매도 평면과 (첫 워드 안의 비트 위치, 날짜 수)"""
+        if value not in (1, -1):
+            raise ValueError(f"value는 1 또는 -1이어야 합니다: {value}")
+        rows = self._row_range(start, end)
+        index = [self._positions[column] for column in self._select(signals)]
+        words = slice(rows.start // WORD_BITS, -(-rows.stop // WORD_BITS))
+        planes = (self.buy if value == 1 else self.sell)[index, words]
+        return planes, rows.start - words.start * WORD_BITS, rows.stop - rows.start
+
+    def consensus_mask(
+        self,
+        k: int,
+        signals: SignalSelector = None,
+        value: int = 1,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> np.ndarray:
+        """k개 이상의 시그널이 ``value`` 인 날짜를 bool 배열로 반환합니다.
+
+        압축된 워드에서 비트 슬라이스 덧셈과 상수 비교로 계산하고 결과만 해제합니다.
+
+        Args:
+            k (int): 최소 시그널 개수
+            signals (SignalSelector): 시그널 칼럼 목록 또는 지표 분류 이름 (기본값: 전체)
+            value (int): 1이면 매수, -1이면 매도
+            start (Optional[str]): 시작 날짜 (포함)
+            end (Optional[str]): 종료 날짜 (포함)
+
+        Returns:
+            np.ndarray: 날짜 범위의 행별 bool 배열
+        """
+        planes, offset, count = self._planes(signals, value, start, end)
+        return _unpack_bits(_at_least(planes, k)[np.newaxis, :], offset, count)[0]
+
+    def consensus(
+        self,
+        k: int,
+        signals: SignalSelector = None,
+        value: int = 1,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DatetimeIndex:
+        """k개 이상의 시그널이 ``value`` 인 날짜를 반환합니다 (인자는 ``consensus_mask`` 참고)."""
+        mask = self.consensus_mask(k, signals, value, start, end)
+        return pd.DatetimeIndex(self.dates[self._row_range(start, end)][mask])
+
+    def save(self, path: Path) -> None:
+        """npz 파일로 저장합니다."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            dates=self.dates.view(np.int64),
+            signals=np.array(self.signals, dtype=str),
+            buy=self.buy,
+            sell=self.sell,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "PackedSignals":
+        """npz 파일에서 읽습니다."""
+        with np.load(path) as data:
+            return cls(
+                data["dates"].view("datetime64[ns]"),
+                data["signals"].tolist(),
+                data["buy"],
+                data["sell"],
+            )
+
+
+class PackedSignalStore:
+    """심볼별 압축 시그널 이력 저장소 클래스
+
+    ``{root}/{심볼}.npz`` 파일에 심볼별 이력을 저장하고, 조회한 심볼은 메모리에 유지합니다.
+    거래일이 같은 심볼은 날짜 배열 하나를 공유합니다.
+    """
+
+    def __init__(self, root: Path = PACKED_SIGNALS_DIR):
+        """
+        Args:
+            root (Path): 저장소 디렉토리
+        """
+        self.root = Path(root)
+        self._symbols: Dict[str, PackedSignals] = {}
+        self._calendars: Dict[Tuple[int, int, int], np.ndarray] = {}
+
+    def _path(self, symbol: str) -> Path:
+        return self.root / f"{symbol}.npz"
+
+    @property
+    def symbols(self) -> List[str]:
+        """저장된 심볼 목록"""
+        stored = {path.stem for path in self.root.glob("*.npz")}
+        return sorted(stored | set(self._symbols))
+
+    @property
+    def nbytes(self) -> int:
+        """메모리에 올린 이력의 크기 (공유하는 날짜 배열은 한 번만 계산)"""
+        packed = self._symbols.values()
+        dates = {id(item.dates): item.dates.nbytes for item in packed}
+        return sum(item.buy.nbytes + item.sell.nbytes for item in packed) + sum(
+            dates.values()
+        )
+
+    def _share_calendar(self, packed: PackedSignals) -> PackedSignals:
+        """같은 날짜 배열을 이미 가진 심볼이 있으면 그 배열을 공유합니다."""
+        if packed.rows:
+            dates = packed.dates.view(np.int64)
+            key = (packed.rows, int(dates[0]), int(dates[-1]))
+            shared = self._calendars.setdefault(key, packed.dates)
+            if shared is not packed.dates and np.array_equal(shared, packed.dates):
+                packed.dates = shared
+        return packed
+
+    def get(self, symbol: str) -> PackedSignals:
+        """심볼의 이력을 반환합니다 (처음 조회 시 파일에서 읽음)."""
+        if symbol not in self._symbols:
+            packed = PackedSignals.load(self._path(symbol))
+            self._symbols[symbol] = self._share_calendar(packed)
+        return self._symbols[symbol]
+
+    def write(self, symbol: str, signals_df: pd.DataFrame) -> PackedSignals:
+        """심볼의 시그널을 압축하여 저장합니다. 기존 이력이 있으면 뒤에 이어 붙입니다.
+
+        Args:
+            symbol (str): 심볼
+            signals_df (pd.DataFrame): 날짜순 시그널 데이터
+
+        Returns:
+            PackedSignals: 저장된 이력
+        """
+        try:
+            if symbol in self._symbols or self._path(symbol).exists():
+                packed = self.get(symbol)
+                packed.extend(signals_df)
+            else:
+                packed = PackedSignals.pack(signals_df)
+            packed.save(self._path(symbol))
+            self._symbols[symbol] = self._share_calendar(packed)
+            logger.info(
+                f"압축 시그널 저장: {symbol} ({packed.rows}일, {packed.nbytes:,} bytes)"
+            )
+            return packed
+
+        except Exception as e:
+            logger.error(f"압축 시그널 저장 실패 ({symbol}): {str(e)}")
+            raise
+
+    def consensus(
+        self,
+        k: int,
+        signals: SignalSelector = None,
+        value: int = 1,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        symbols: Optional[List[str]] = None,
+    ) -> Dict[str, pd.DatetimeIndex]:
+        """심볼별로 k개 이상의 시그널이 ``value`` 인 날짜를 반환합니다.
+
+        선택한 시그널 개수가 같은 심볼들의 평면을 워드 방향으로 이어 붙여 한 번에
+        계산합니다 (워드마다 독립이므로 심볼별 날짜가 달라도 됨).
+
+        Args:
+            k (int): 최소 시그널 개수
+            signals (SignalSelector): 시그널 칼럼 목록 또는 지표 분류 이름 (기본값: 전체)
+            value (int): 1이면 매수, -1이면 매도
+            start (Optional[str]): 시작 날짜 (포함)
+            end (Optional[str]): 종료 날짜 (포함)
+            symbols (Optional[List[str]]): 조회할 심볼 (기본값: 전체)
+
+        Returns:
+            Dict[str, pd.DatetimeIndex]: 심볼별 날짜
+        """
+        symbols = symbols or self.symbols
+        parts = {
+            symbol: self.get(symbol)._planes(signals, value, start, end)
+            for symbol in symbols
+        }
+        groups: Dict[int, List[str]] = {}
+        for symbol, (planes, _, _) in parts.items():
+            groups.setdefault(len(planes), []).append(symbol)
+
+        result: Dict[str, pd.DatetimeIndex] = {}
+        for members in groups.values():
+            words = _at_least(np.hstack([parts[symbol][0] for symbol in members]), k)
+            split = np.cumsum([parts[symbol][0].shape[1] for symbol in members])[:-1]
+            for symbol, symbol_words in zip(members, np.split(words, split)):
+                _, offset, count = parts[symbol]
+                mask = _unpack_bits(symbol_words[np.newaxis, :], offset, count)[0]
+                packed = self.get(symbol)
+                dates = packed.dates[packed._row_range(start, end)]
+                result[symbol] = pd.DatetimeIndex(dates[mask])
+        return {symbol: result[symbol] for symbol in symbols}
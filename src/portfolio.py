@@ -0,0 +1,347 @@
+"""
+포트폴리오 백테스트 모듈
+
+(봉, 심볼) 종합 시그널 점수 패널과 종가 패널로, 리밸런싱 날짜마다 점수 상위 k개 심볼을
+같은 비중으로 보유하는 포트폴리오를 시뮬레이션합니다.
+
+- 리밸런싱: ``rebalance`` 주기(기본 ``W-FRI``)의 기간별 마지막 거래일 종가에 점수를 보고
+  매매하며, 새 비중은 다음 봉부터 수익률에 반영됩니다. 마지막 기간(진행 중)은 리밸런싱하지
+  않습니다.
+- 비중: 상위 k개 슬롯마다 ``1 / k`` 이고, 점수/가격이 없거나 ``min_score`` 이하인 심볼로
+  채우지 못한 슬롯은 현금(수익률 0)입니다. 같은 점수는 칼럼 순서가 앞선 심볼이 우선합니다.
+- 회전율과 비용: 직전 리밸런싱 이후 가격 변동으로 바뀐 비중과 새 비중의 차이 합계
+  ``sum |w_new - w_drift|`` 를 회전율로 두고, ``cost_bps`` (거래 금액 대비 bp)를 곱한
+  비용을 리밸런싱 시점 NAV에서 뺍니다.
+- NAV: 리밸런싱 구간마다 보유 심볼의 가격 비율만 모아 계산하므로 봉 단위 루프 없이
+  (리밸런싱, k) 배열 연산으로 끝납니다. 구간 시작 NAV는 구간 수익률과 비용의 누적곱입니다.
+
+종가는 앞 방향으로 채우므로 보유 중 상장 폐지되거나 거래가 없는 심볼은 마지막 가격으로
+평가됩니다. 파라미터 조합별 백테스트(``run_variants``)는 점수/가격 패널을
+``SharedFrame`` 으로 한 번 게시하고 프로세스 풀 작업자가 공유 메모리 뷰로 계산합니다.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.loader import DATE_COLUMN
+from src.settings import PORTFOLIO_SETTINGS
+from src.shared_frame import SharedFrame, SharedFrameHandle
+from src.signal_generator import SignalGenerator
+from src.store import OHLCVStore
+from src.technical_indicator import TechnicalIndicator
+from src.timeframes import period_codes
+
+logger = logging.getLogger(__name__)
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """(봉, 심볼) 배열의 결측값을 심볼별 직전 값으로 채웁니다 (첫 관측 전은 NaN)."""
+    if np.isfinite(values).all():
+        return values
+    rows = np.where(np.isfinite(values), np.arange(len(values))[:, np.newaxis], 0)
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    return np.take_along_axis(values, rows, axis=0)
+
+
+def rebalance_rows(dates: np.ndarray, freq: str) -> np.ndarray:
+    """기간별 마지막 거래일의 행 위치를 반환합니다 (마지막 진행 중 기간 제외)."""
+    codes = period_codes(pd.Series(dates), freq)
+    return np.flatnonzero(codes[1:] != codes[:-1])
+
+
+def select_top_k(
+    scores: np.ndarray,
+    prices: np.ndarray,
+    top_k: int,
+    min_score: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """리밸런싱 날짜별 상위 k개 심볼과 슬롯 비중을 선택합니다.
+
+    Args:
+        scores (np.ndarray): (리밸런싱, 심볼) 점수
+        prices (np.ndarray): (리밸런싱, 심볼) 종가
+        top_k (int): 보유 심볼 수
+        min_score (Optional[float]): 이 점수 이하 심볼은 보유하지 않음
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (리밸런싱, k) 심볼 위치와 비중 (빈 슬롯은 0)
+    """
+    if top_k < 1:
+        raise ValueError(f"보유 심볼 수는 1 이상이어야 합니다: {top_k}")
+    valid = np.isfinite(scores) & np.isfinite(prices) & (prices > 0)
+    if min_score is not None:
+        valid &= scores > min_score
+    ranked = np.where(valid, -scores, np.inf)
+    k = min(top_k, ranked.shape[1])
+    if k == 0:
+        return np.zeros((len(ranked), 0), dtype=np.intp), np.zeros((len(ranked), 0))
+
+    # k번째 값보다 작은 심볼은 모두 선택하고, k번째 값과 같은 심볼은 칼럼 순서대로 채움
+    kth = np.partition(ranked, k - 1, axis=1)[:, k - 1, np.newaxis]
+    chosen = ranked < kth
+    ties = ranked == kth
+    room = k - chosen.sum(axis=1, keepdims=True)
+    chosen |= ties & (np.cumsum(ties, axis=1) <= room)
+    slots = np.nonzero(chosen)[1].reshape(len(ranked), k)
+    weights = np.take_along_axis(valid, slots, axis=1) / top_k
+    return slots, weights
+
+
+class BacktestResult:
+    """포트폴리오 백테스트 결과 클래스"""
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        nav: np.ndarray,
+        rows: np.ndarray,
+        holdings: np.ndarray,
+        weights: np.ndarray,
+        turnover: np.ndarray,
+        costs: np.ndarray,
+        params: Dict[str, Any],
+    ):
+        """
+        Args:
+            dates (np.ndarray): (봉,) 날짜
+            nav (np.ndarray): (봉,) 순자산 가치 (시작 1.0)
+            rows (np.ndarray): (리밸런싱,) 리밸런싱 행 위치
+            holdings (np.ndarray): (리밸런싱, k) 보유 심볼 위치
+            weights (np.ndarray): (리밸런싱, k) 매수 시점 비중
+            turnover (np.ndarray): (리밸런싱,) 회전율
+            costs (np.ndarray): (리밸런싱,) NAV 대비 비용 비율
+            params (Dict[str, Any]): 백테스트 파라미터
+        """
+        self.dates = dates
+        self.nav = nav
+        self.rows = rows
+        self.holdings = holdings
+        self.weights = weights
+        self.turnover = turnover
+        self.costs = costs
+        self.params = params
+
+    def summary(self) -> Dict[str, float]:
+        """누적 수익률, 연환산 수익률/변동성, 샤프 비율, 최대 낙폭, 평균 회전율"""
+        periods = PORTFOLIO_SETTINGS["periods_per_year"]
+        returns = self.nav[1:] / self.nav[:-1] - 1.0
+        years = max(len(returns), 1) / periods
+        volatility = float(returns.std() * np.sqrt(periods)) if len(returns) else 0.0
+        mean = float(returns.mean() * periods) if len(returns) else 0.0
+        drawdown = self.nav / np.maximum.accumulate(self.nav) - 1.0
+        return {
+            "total_return": float(self.nav[-1] - 1.0),
+            "cagr": float(self.nav[-1] ** (1.0 / years) - 1.0),
+            "volatility": volatility,
+            "sharpe": mean / volatility if volatility > 0 else 0.0,
+            "max_drawdown": float(drawdown.min()),
+            "mean_turnover": float(self.turnover.mean()) if len(self.rows) else 0.0,
+            "total_cost": float(self.costs.sum()),
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """날짜별 NAV 데이터프레임을 반환합니다."""
+        return pd.DataFrame({DATE_COLUMN: self.dates, "NAV": self.nav})
+
+
+def backtest(
+    scores: np.ndarray,
+    prices: np.ndarray,
+    dates: np.ndarray,
+    top_k: int = PORTFOLIO_SETTINGS["top_k"],
+    rebalance: str = PORTFOLIO_SETTINGS["rebalance"],
+    cost_bps: float = PORTFOLIO_SETTINGS["cost_bps"],
+    min_score: Optional[float] = PORTFOLIO_SETTINGS["min_score"],
+    fill_prices: bool = True,
+) -> BacktestResult:
+    """상위 k개 동일 비중 포트폴리오를 백테스트합니다.
+
+    Args:
+        scores (np.ndarray): (봉, 심볼) 종합 시그널 점수 (NaN은 보유 불가)
+        prices (np.ndarray): (봉, 심볼) 종가
+        dates (np.ndarray): (봉,) 날짜
+        top_k (int): 보유 심볼 수
+        rebalance (str): 리밸런싱 주기 (pandas 기간 주기)
+        cost_bps (float): 거래 금액 대비 편도 비용 (bp)
+        min_score (Optional[float]): 이 점수 이하 심볼은 보유하지 않음 (None이면 제한 없음)
+        fill_prices (bool): 종가 결측값을 직전 값으로 채울지 여부
+            (이미 채운 패널이면 False로 복사를 생략)
+
+    Returns:
+        BacktestResult: 백테스트 결과
+    """
+    params = {
+        "top_k": top_k,
+        "rebalance": rebalance,
+        "cost_bps": cost_bps,
+        "min_score": min_score,
+    }
+    scores = np.asarray(scores, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    if scores.shape != prices.shape or len(dates) != len(prices):
+        raise ValueError(
+            f"패널 크기가 맞지 않습니다: 점수 {scores.shape}, 종가 {prices.shape}, "
+            f"날짜 {len(dates)}"
+        )
+    if fill_prices:
+        prices = forward_fill(prices)
+
+    rows = rebalance_rows(dates, rebalance)
+    holdings, weights = select_top_k(scores[rows], prices[rows], top_k, min_score)
+    cash = 1.0 - weights.sum(axis=1)
+
+    # 구간별 보유 심볼의 가격 비율 (구간 끝 = 다음 리밸런싱 또는 마지막 봉)
+    ends = np.append(rows, len(prices) - 1)[1:]
+    entry = np.take_along_axis(prices[rows], holdings, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = np.take_along_axis(prices[ends], holdings, axis=1) / entry
+    held = np.where(weights > 0, weights * growth, 0.0)
+    period_growth = cash + held.sum(axis=1)
+
+    # 직전 구간 가격 변동 후 비중과 새 비중의 차이 (첫 리밸런싱은 현금에서 매수)
+    target = np.zeros((len(rows), prices.shape[1]))
+    np.put_along_axis(target, holdings, weights, axis=1)
+    drifted = np.zeros_like(target)
+    if len(rows) > 1:
+        previous = np.zeros((len(rows) - 1, prices.shape[1]))
+        np.put_along_axis(
+            previous, holdings[:-1], held[:-1] / period_growth[:-1, np.newaxis], axis=1
+        )
+        drifted[1:] = previous
+    turnover = np.abs(target - drifted).sum(axis=1)
+    costs = turnover * cost_bps / 10_000.0
+
+    # 리밸런싱 직후 NAV = 이전 구간 수익률 누적곱 x 비용 차감 누적곱
+    carried = np.ones(len(rows))
+    carried[1:] = period_growth[:-1]
+    start_nav = np.cumprod(carried * (1.0 - costs))
+
+    nav = np.ones(len(prices))
+    segment = np.searchsorted(rows, np.arange(len(prices)), side="right") - 1
+    invested = segment >= 0
+    if invested.any():
+        bars = np.flatnonzero(invested)
+        seg = segment[invested]
+        columns = holdings[seg]
+        current = prices[bars[:, np.newaxis], columns]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = np.where(weights[seg] > 0, current / entry[seg], 0.0)
+        nav[bars] = start_nav[seg] * (cash[seg] + (weights[seg] * relative).sum(axis=1))
+
+    return BacktestResult(
+        dates=np.asarray(dates),
+        nav=nav,
+        rows=rows,
+        holdings=holdings,
+        weights=weights,
+        turnover=turnover,
+        costs=costs,
+        params=params,
+    )
+
+
+def _variant_task(
+    handle: SharedFrameHandle,
+    shape: Tuple[int, int],
+    dates: np.ndarray,
+    params: Dict[str, Any],
+) -> BacktestResult:
+    """작업 프로세스: 공유 메모리 패널에 붙어 파라미터 조합 하나를 백테스트합니다."""
+    with SharedFrame.attach(handle) as frame:
+        arrays = frame.arrays()
+        scores = arrays["scores"].reshape(shape)
+        prices = arrays["prices"].reshape(shape)
+        return backtest(scores, prices, dates, fill_prices=False, **params)
+
+
+def run_variants(
+    scores: np.ndarray,
+    prices: np.ndarray,
+    dates: np.ndarray,
+    variants: List[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> List[BacktestResult]:
+    """파라미터 조합별로 백테스트합니다.
+
+    Args:
+        scores (np.ndarray): (봉, 심볼) 종합 시그널 점수
+        prices (np.ndarray): (봉, 심볼) 종가
+        dates (np.ndarray): (봉,) 날짜
+        variants (List[Dict[str, Any]]): ``backtest`` 키워드 인자 목록
+            (예: ``{"top_k": 20, "cost_bps": 5.0}``)
+        max_workers (Optional[int]): 작업 프로세스 수
+            (기본값: ``PORTFOLIO_SETTINGS["max_workers"]``, 1이면 순차 계산)
+
+    Returns:
+        List[BacktestResult]: ``variants`` 순서의 결과
+    """
+    try:
+        workers = (
+            PORTFOLIO_SETTINGS["max_workers"] if max_workers is None else max_workers
+        )
+        prices = forward_fill(np.asarray(prices, dtype=np.float64))
+        if workers <= 1 or len(variants) <= 1:
+            return [
+                backtest(scores, prices, dates, fill_prices=False, **params)
+                for params in variants
+            ]
+
+        panel = pd.DataFrame(
+            {
+                "scores": np.asarray(scores, dtype=np.float64).ravel(),
+                "prices": prices.ravel(),
+            }
+        )
+        shape = prices.shape
+        with SharedFrame.publish(panel) as frame:
+            del panel
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_variant_task, frame.handle, shape, dates, params)
+                    for params in variants
+                ]
+                results = [future.result() for future in futures]
+        logger.info(
+            f"포트폴리오 백테스트 완료: {len(variants)}개 조합, {workers}개 프로세스"
+        )
+        return results
+
+    except Exception as e:
+        logger.error(f"포트폴리오 백테스트 실패: {str(e)}")
+        raise
+
+
+def score_panel(
+    symbols: List[str], dates: pd.DatetimeIndex, store: Optional[OHLCVStore] = None
+) -> pd.DataFrame:
+    """저장소 심볼마다 지표와 시그널을 계산하여 종합 점수 패널을 만듭니다.
+
+    Args:
+        symbols (List[str]): 심볼 목록
+        dates (pd.DatetimeIndex): 패널 날짜 (예: ``close_panel`` 의 인덱스)
+        store (Optional[OHLCVStore]): OHLCV 저장소 (기본값: ``STORE_DIR``)
+
+    Returns:
+        pd.DataFrame: (Date 인덱스, 심볼 칼럼) 종합 점수. 데이터가 없는 날짜는 NaN입니다.
+    """
+    store = store or OHLCVStore()
+    series = {}
+    for symbol in symbols:
+        df = store.read(symbol)
+        if df.empty:
+            logger.warning(f"저장된 데이터가 없는 심볼 제외: {symbol}")
+            continue
+        indicator = TechnicalIndicator(df=df)
+        indicator.calculate_all()
+        generator = SignalGenerator(indicators_df=indicator.indicators_df)
+        generator.generate_all()
+        score = generator.calculate_score()
+        score.index = pd.DatetimeIndex(generator.signals_df[DATE_COLUMN])
+        series[symbol] = score[~score.index.duplicated(keep="last")]
+    panel = pd.DataFrame(series).reindex(dates)
+    panel.index.name = DATE_COLUMN
+    return panel
@@ -0,0 +1,182 @@
+"""
+가격 데이터 제공자 모듈
+
+데이터 수집 코드가 특정 라이브러리에 묶이지 않도록 제공자 인터페이스를 정의합니다.
+- ``YFinanceProvider``: yfinance 기반 실제 제공자
+- ``FileProvider``: 로컬 CSV 파일 기반 가짜 제공자 (오프라인 테스트/벤치마크용)
+"""
+
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+class DataProvider(ABC):
+    """가격 데이터 제공자 인터페이스"""
+
+    name = "base"
+
+    @abstractmethod
+    def fetch(
+        self,
+        symbol: str,
+        start: date,
+        end: Optional[date] = None,
+        timeout: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """심볼의 일봉 OHLCV 데이터를 가져옵니다.
+
+        Args:
+            symbol (str): 심볼
+            start (date): 시작 날짜 (포함)
+            end (Optional[date]): 종료 날짜 (포함, None이면 최신까지)
+            timeout (Optional[float]): 요청 제한 시간 (초)
+
+        Returns:
+            pd.DataFrame: Date(date), Open, High, Low, Close, Volume 칼럼의 데이터
+        """
+
+    def fetch_many(
+        self,
+        symbols: Iterable[str],
+        start: date,
+        end: Optional[date] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """여러 심볼의 같은 구간을 가져옵니다.
+
+        기본 구현은 심볼마다 ``fetch`` 를 호출합니다. 한 번의 호출로 여러 심볼을
+        받을 수 있는 제공자는 이 메서드를 재정의합니다.
+
+        Returns:
+            Dict[str, pd.DataFrame]: 심볼별 OHLCV 데이터
+        """
+        return {symbol: self.fetch(symbol, start, end, timeout) for symbol in symbols}
+
+
+class YFinanceProvider(DataProvider):
+    """yfinance 기반 데이터 제공자"""
+
+    name = "yfinance"
+
+    def fetch(
+        self,
+        symbol: str,
+        start: date,
+        end: Optional[date] = None,
+        timeout: Optional[float] = None,
+    ) -> pd.DataFrame:
+        import yfinance as yf
+
+        df = yf.Ticker(symbol).history(**self._date_kwargs(start, end, timeout))
+        return self._normalize(df)
+
+    def fetch_many(
+        self,
+        symbols: Iterable[str],
+        start: date,
+        end: Optional[date] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        import yfinance as yf
+
+        symbols = list(symbols)
+        if len(symbols) == 1:
+            return {symbols[0]: self.fetch(symbols[0], start, end, timeout)}
+
+        df = yf.download(
+            symbols,
+            group_by="ticker",
+            auto_adjust=True,
+            progress=False,
+            threads=False,
+            **self._date_kwargs(start, end, timeout),
+        )
+        return {
+            symbol: self._normalize(df[symbol].dropna(how="all"))
+            for symbol in symbols
+            if symbol in df.columns.get_level_values(0)
+        }
+
+    @staticmethod
+    def _date_kwargs(
+        start: date, end: Optional[date], timeout: Optional[float]
+    ) -> Dict[str, object]:
+        """yfinance 요청 인자를 만듭니다."""
+        kwargs = {"start": start.strftime("%Y-%m-%d")}
+        if end is not None:
+            # yfinance의 end는 배타적이므로 하루 뒤로 지정
+            kwargs["end"] = (pd.Timestamp(end) + pd.Timedelta(days=1)).strftime(
+                "%Y-%m-%d"
+            )
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return kwargs
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """yfinance 결과를 표준 OHLCV 칼럼으로 변환합니다."""
+        df = df.reset_index()
+        df["Date"] = pd.to_datetime(df["Date"]).dt.date
+        return df[OHLCV_COLUMNS]
+
+
+class FileProvider(DataProvider):
+    """로컬 CSV 파일 기반 가짜 데이터 제공자
+
+    ``{directory}/{symbol}.csv`` 파일을 읽어 요청 구간만 반환합니다.
+    네트워크 왕복 지연과 일시적 실패를 흉내 낼 수 있어
+    수집기의 동시성, 재시도, 속도 제한을 오프라인에서 측정할 수 있습니다.
+    """
+
+    name = "file"
+
+    def __init__(
+        self,
+        directory: Path,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            directory (Path): 심볼별 CSV 파일이 있는 디렉토리
+            latency (float): 요청마다 추가할 지연 시간 (초)
+            failure_rate (float): 일시적 실패(ConnectionError) 확률 (0~1)
+            seed (Optional[int]): 실패 난수 시드
+        """
+        self.directory = Path(directory)
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+
+    def fetch(
+        self,
+        symbol: str,
+        start: date,
+        end: Optional[date] = None,
+        timeout: Optional[float] = None,
+    ) -> pd.DataFrame:
+        if timeout is not None and self.latency > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"{symbol} 요청 시간 초과 ({timeout:.1f}s)")
+        time.sleep(self.latency)
+        if self._random.random() < self.failure_rate:
+            raise ConnectionError(f"{symbol} 일시적 연결 실패")
+
+        df = pd.read_csv(self.directory / f"{symbol}.csv")
+        df["Date"] = pd.to_datetime(df["Date"]).dt.date
+        mask = df["Date"] >= start
+        if end is not None:
+            mask &= df["Date"] <= end
+        return df.loc[mask, OHLCV_COLUMNS].reset_index(drop=True)
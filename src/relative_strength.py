@@ -0,0 +1,225 @@
+"""
+상대강도 지표 모듈
+
+기준 지수(기본값: ``^GSPC``) 대비 심볼의 상대강도, 롤링 베타/알파, 롤링 상관계수를
+계산합니다. 모든 함수는 (봉, 심볼) 종가 패널과 (봉,) 기준 지수 종가를 받아 심볼 축으로
+한 번에 계산하므로, 단일 심볼(``TechnicalIndicator``)과 저장소 전체 심볼 패널이 같은
+코드를 사용합니다.
+
+- RS(n): n봉 수익률 비율 ``(P_t / P_{t-n}) / (B_t / B_{t-n}) - 1``
+- Beta(n), Alpha(n): 최근 n개 일간 수익률의 회귀 기울기와 봉당 초과 수익률
+  ``mean(r) - beta * mean(r_b)``
+- Corr(n): 최근 n개 일간 수익률의 상관계수
+
+롤링 공분산/분산은 수익률, 제곱, 곱의 누적합(prefix sum)을 한 번 구한 뒤 창 양 끝의
+차이로 창 합계를 얻으므로 창 크기와 관계없이 봉·심볼당 O(1)입니다. 수익률이 결측인 봉은
+관측 개수에서 제외하고, 창 안의 관측이 n개보다 적으면 NaN입니다.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.loader import DATE_COLUMN
+from src.settings import RELATIVE_INDICATORS, RELATIVE_SETTINGS
+from src.store import OHLCVStore
+
+logger = logging.getLogger(__name__)
+
+
+def _as_panel(closes: np.ndarray) -> np.ndarray:
+    """종가를 (봉, 심볼) float64 배열로 변환합니다."""
+    panel = np.asarray(closes, dtype=np.float64)
+    return panel[:, np.newaxis] if panel.ndim == 1 else panel
+
+
+def _returns(closes: np.ndarray) -> np.ndarray:
+    """(봉, 심볼) 일간 수익률 (첫 봉은 NaN)"""
+    returns = np.full(closes.shape, np.nan)
+    returns[1:] = closes[1:] / closes[:-1] - 1.0
+    return returns
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """누적합의 차이로 (봉, 심볼) 롤링 창 합계를 구합니다 (첫 window - 1 봉은 0)."""
+    prefix = np.zeros((len(values) + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=prefix[1:])
+    sums = np.zeros(values.shape)
+    start = window - 1
+    sums[start:] = prefix[window:] - prefix[:-window]
+    return sums
+
+
+def relative_strength(
+    closes: np.ndarray, benchmark: np.ndarray, period: int
+) -> np.ndarray:
+    """기준 지수 대비 n봉 상대강도를 계산합니다.
+
+    Args:
+        closes (np.ndarray): (봉,) 또는 (봉, 심볼) 종가
+        benchmark (np.ndarray): (봉,) 기준 지수 종가
+        period (int): 수익률 기간
+
+    Returns:
+        np.ndarray: (봉, 심볼) 상대강도 (0보다 크면 기준 지수보다 강함)
+    """
+    panel = _as_panel(closes)
+    bench = np.asarray(benchmark, dtype=np.float64)[:, np.newaxis]
+    result = np.full(panel.shape, np.nan)
+    if period < len(panel):
+        ratio = panel[period:] / panel[:-period]
+        result[period:] = ratio / (bench[period:] / bench[:-period]) - 1.0
+    return result
+
+
+def rolling_regression(
+    closes: np.ndarray, benchmark: np.ndarray, window: int
+) -> Dict[str, np.ndarray]:
+    """기준 지수 수익률에 대한 롤링 베타, 알파, 상관계수를 계산합니다.
+
+    Args:
+        closes (np.ndarray): (봉,) 또는 (봉, 심볼) 종가
+        benchmark (np.ndarray): (봉,) 기준 지수 종가
+        window (int): 수익률 관측 개수 (2 이상)
+
+    Returns:
+        Dict[str, np.ndarray]: "beta", "alpha", "corr" → (봉, 심볼) 값
+    """
+    if window < 2:
+        raise ValueError(f"창 크기는 2 이상이어야 합니다: {window}")
+    panel = _as_panel(closes)
+    x = _returns(panel)
+    y = np.broadcast_to(_returns(_as_panel(benchmark)), x.shape)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+
+    n = _window_sums(valid.astype(np.float64), window)
+    sx, sy = _window_sums(x, window), _window_sums(y, window)
+    sxx, syy = _window_sums(x * x, window), _window_sums(y * y, window)
+    sxy = _window_sums(x * y, window)
+
+    full = n == window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # n * 분산 (누적합 차이의 반올림 오차로 음수가 되지 않도록 0에서 자름)
+        var_x = np.maximum(sxx - sx * sx / window, 0.0)
+        var_y = np.maximum(syy - sy * sy / window, 0.0)
+        cov = sxy - sx * sy / window
+        beta = np.where(full & (var_y > 0), cov / var_y, np.nan)
+        alpha = (sx - beta * sy) / window
+        corr = np.where(
+            full & (var_x > 0) & (var_y > 0), cov / np.sqrt(var_x * var_y), np.nan
+        )
+    return {"beta": beta, "alpha": alpha, "corr": np.clip(corr, -1.0, 1.0)}
+
+
+def relative_columns(
+    closes: np.ndarray,
+    benchmark: np.ndarray,
+    config: Dict[str, Dict[str, int]] = RELATIVE_INDICATORS,
+) -> Dict[str, np.ndarray]:
+    """설정된 상대강도 지표를 칼럼 이름별 (봉, 심볼) 배열로 계산합니다."""
+    columns = {}
+    period = config["RS"]["period"]
+    columns[f"RS({period})"] = relative_strength(closes, benchmark, period)
+    period = config["Beta"]["period"]
+    regression = rolling_regression(closes, benchmark, period)
+    columns[f"Beta({period})"] = regression["beta"]
+    columns[f"Alpha({period})"] = regression["alpha"]
+    period = config["Corr"]["period"]
+    columns[f"Corr({period})"] = rolling_regression(closes, benchmark, period)["corr"]
+    return columns
+
+
+def align_benchmark(dates: pd.Series, benchmark: pd.DataFrame) -> np.ndarray:
+    """기준 지수 종가를 주어진 날짜에 맞춥니다.
+
+    기준 지수에 없는 날짜(휴장일 차이)는 직전 종가를 사용하고, 기준 지수 시작 전은
+    NaN입니다.
+    """
+    close = benchmark.drop_duplicates(DATE_COLUMN, keep="last").set_index(DATE_COLUMN)
+    close = close["Close"].sort_index()
+    aligned = close.reindex(pd.DatetimeIndex(dates), method="ffill")
+    return aligned.to_numpy(dtype=np.float64)
+
+
+def close_panel(
+    symbols: List[str],
+    store: Optional[OHLCVStore] = None,
+    benchmark: str = RELATIVE_SETTINGS["benchmark_symbol"],
+) -> pd.DataFrame:
+    """저장소의 심볼 종가를 기준 지수 거래일에 맞춘 패널로 읽습니다.
+
+    Args:
+        symbols (List[str]): 심볼 목록
+        store (Optional[OHLCVStore]): OHLCV 저장소 (기본값: ``STORE_DIR``)
+        benchmark (str): 기준 지수 심볼 (패널의 첫 칼럼)
+
+    Returns:
+        pd.DataFrame: (Date 인덱스, 기준 지수 + 심볼 칼럼) 종가. 상장 전이나 누락된
+            봉은 NaN입니다.
+    """
+    store = store or OHLCVStore()
+    series = {}
+    for symbol in [benchmark] + [s for s in symbols if s != benchmark]:
+        df = store.read(symbol)
+        if df.empty:
+            logger.warning(f"저장된 데이터가 없는 심볼 제외: {symbol}")
+            continue
+        series[symbol] = df.drop_duplicates(DATE_COLUMN).set_index(DATE_COLUMN)["Close"]
+    if benchmark not in series:
+        raise ValueError(f"기준 지수 데이터가 없습니다: {benchmark}")
+    panel = pd.DataFrame(series).reindex(series[benchmark].index)
+    panel.index.name = DATE_COLUMN
+    return panel.astype(np.float64)
+
+
+def relative_panel(
+    closes: pd.DataFrame,
+    benchmark: str = RELATIVE_SETTINGS["benchmark_symbol"],
+    config: Dict[str, Dict[str, int]] = RELATIVE_INDICATORS,
+) -> Dict[str, pd.DataFrame]:
+    """종가 패널의 모든 심볼에 대해 상대강도 지표를 한 번에 계산합니다.
+
+    Args:
+        closes (pd.DataFrame): ``close_panel`` 형식의 종가 패널
+        benchmark (str): 기준 지수 칼럼 이름
+        config (Dict[str, Dict[str, int]]): 지표 설정 (``RELATIVE_INDICATORS`` 형식)
+
+    Returns:
+        Dict[str, pd.DataFrame]: 지표 칼럼 이름 → (Date, 심볼) 값
+    """
+    try:
+        symbols = [column for column in closes.columns if column != benchmark]
+        columns = relative_columns(
+            closes[symbols].to_numpy(dtype=np.float64),
+            closes[benchmark].to_numpy(dtype=np.float64),
+            config,
+        )
+        logger.info(
+            f"상대강도 지표 계산 완료: {len(symbols)}개 심볼, {len(closes)}개 봉"
+        )
+        return {
+            name: pd.DataFrame(values, index=closes.index, columns=symbols)
+            for name, values in columns.items()
+        }
+
+    except Exception as e:
+        logger.error(f"상대강도 지표 계산 실패: {str(e)}")
+        raise
+
+
+def latest_snapshot(panel: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """지표 패널의 심볼별 마지막 관측 값을 (심볼 인덱스, Date + 지표) 데이터로 반환합니다.
+
+    결과는 ``Screener.load_frame`` 에 그대로 넣을 수 있습니다.
+    """
+    frames = {}
+    for name, values in panel.items():
+        frames[name] = values.ffill().iloc[-1]
+    snapshot = pd.DataFrame(frames)
+    first = next(iter(panel.values()))
+    snapshot.insert(0, DATE_COLUMN, first.apply(pd.Series.last_valid_index))
+    return snapshot.dropna(subset=[DATE_COLUMN])
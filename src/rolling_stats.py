@@ -0,0 +1,205 @@
+"""
+롤링 순서 통계 모듈
+
+적응형 시그널 임계값(예: RSI가 최근 1년 10% 분위수보다 낮으면 매수)에 쓰는 롤링
+분위수를 계산합니다.
+
+- ``RollingQuantile``: 값을 하나씩 받아 최근 ``window`` 개 값의 분위수를 반환하는 증분
+  구조. 두 힙(하위 구간 최대 힙, 상위 구간 최소 힙)과 지연 삭제로 갱신마다 O(log w)
+  입니다. 스트리밍처럼 봉이 하나씩 들어오는 경우에 사용합니다.
+- ``rolling_quantile``: 배열 전체의 롤링 분위수. pandas ``rolling().quantile`` 은 창을
+  다시 정렬하지 않고 C로 구현된 스킵 리스트를 갱신하므로(O(log w)) 일괄 계산에 그대로
+  사용합니다.
+
+두 방식 모두 pandas와 같은 선형 보간(``q * (n - 1)`` 위치)을 사용하고, 결측값은 창 안의
+관측 개수에서 제외합니다. 관측 개수가 ``min_periods`` 보다 적으면 NaN입니다.
+"""
+
+import heapq
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def rolling_quantile(
+    values: np.ndarray, window: int, q: float, min_periods: Optional[int] = None
+) -> np.ndarray:
+    """배열의 롤링 분위수를 계산합니다.
+
+    Args:
+        values (np.ndarray): 입력 값
+        window (int): 창 크기 (현재 값 포함)
+        q (float): 분위수 (0 ~ 1)
+        min_periods (Optional[int]): 최소 관측 개수 (기본값: window)
+
+    Returns:
+        np.ndarray: 위치별 분위수
+    """
+    rolling = pd.Series(values, dtype=np.float64).rolling(
+        window, min_periods=window if min_periods is None else min_periods
+    )
+    return rolling.quantile(q).to_numpy()
+
+
+class RollingQuantile:
+    """두 힙 기반 증분 롤링 분위수 클래스
+
+    하위 힙은 순위 0..k, 상위 힙은 나머지 값을 가지며(k = floor(q * (n - 1))),
+    창에서 빠지는 값은 바로 꺼내지 않고 힙의 맨 위에 올라올 때 버립니다.
+    """
+
+    def __init__(self, window: int, q: float, min_periods: Optional[int] = None):
+        """
+        Args:
+            window (int): 창 크기 (현재 값 포함)
+            q (float): 분위수 (0 ~ 1)
+            min_periods (Optional[int]): 최소 관측 개수 (기본값: window)
+        """
+        if window < 1:
+            raise ValueError(f"창 크기는 1 이상이어야 합니다: {window}")
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"분위수는 0 ~ 1 사이여야 합니다: {q}")
+        self.window = window
+        self.q = q
+        self.min_periods = window if min_periods is None else min_periods
+        self._values: Deque[float] = deque()
+        self._low: List[float] = []  # 최대 힙 (부호 반전)
+        self._high: List[float] = []  # 최소 힙
+        self._low_size = 0
+        self._high_size = 0
+        self._low_deleted: Dict[float, int] = {}
+        self._high_deleted: Dict[float, int] = {}
+
+    def __len__(self) -> int:
+        """창 안의 관측 개수 (결측값 제외)"""
+        return self._low_size + self._high_size
+
+    def update(self, value: float) -> float:
+        """값을 추가하고 현재 창의 분위수를 반환합니다."""
+        value = float(value)
+        self._values.append(value)
+        if not math.isnan(value):
+            self._insert(value)
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            if not math.isnan(old):
+                self._remove(old)
+        self._rebalance()
+        if len(self._low) + len(self._high) > 2 * self.window + 64:
+            self._rebuild()
+        return self.value
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        """값을 차례로 추가하고 위치별 분위수를 반환합니다."""
+        return np.array([self.update(value) for value in values], dtype=np.float64)
+
+    @property
+    def value(self) -> float:
+        """현재 창의 분위수 (관측 개수가 부족하면 NaN)"""
+        n = len(self)
+        if n == 0 or n < self.min_periods:
+            return math.nan
+        position = self.q * (n - 1)
+        low = -self._low[0]
+        fraction = position - math.floor(position)
+        if fraction == 0 or not self._high_size:
+            return low
+        return low + (self._high[0] - low) * fraction
+
+    def _insert(self, value: float) -> None:
+        if self._low_size and value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+
+    def _remove(self, value: float) -> None:
+        # value가 하위 힙의 최댓값 이하이면 하위 힙에 같은 값이 있음
+        if self._low_size and value <= -self._low[0]:
+            self._low_deleted[value] = self._low_deleted.get(value, 0) + 1
+            self._low_size -= 1
+            self._prune(self._low, self._low_deleted, sign=-1.0)
+        else:
+            self._high_deleted[value] = self._high_deleted.get(value, 0) + 1
+            self._high_size -= 1
+            self._prune(self._high, self._high_deleted, sign=1.0)
+
+    @staticmethod
+    def _prune(heap: List[float], deleted: Dict[float, int], sign: float) -> None:
+        """맨 위의 삭제 예정 값을 꺼냅니다."""
+        while heap:
+            value = sign * heap[0]
+            count = deleted.get(value)
+            if not count:
+                return
+            heapq.heappop(heap)
+            if count == 1:
+                del deleted[value]
+            else:
+                deleted[value] = count - 1
+
+    def _rebalance(self) -> None:
+        n = len(self)
+        target = int(math.floor(self.q * (n - 1))) + 1 if n else 0
+        while self._low_size > target:
+            value = -heapq.heappop(self._low)
+            self._low_size -= 1
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+            self._prune(self._low, self._low_deleted, sign=-1.0)
+        while self._low_size < target and self._high_size:
+            value = heapq.heappop(self._high)
+            self._high_size -= 1
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+            self._prune(self._high, self._high_deleted, sign=1.0)
+
+    def _rebuild(self) -> None:
+        """삭제 예정 값이 쌓이면 창의 값으로 두 힙을 다시 만듭니다."""
+        values = sorted(value for value in self._values if not math.isnan(value))
+        n = len(values)
+        target = int(math.floor(self.q * (n - 1))) + 1 if n else 0
+        self._low = [-value for value in reversed(values[:target])]
+        self._high = values[target:]
+        self._low_size, self._high_size = target, n - target
+        self._low_deleted.clear()
+        self._high_deleted.clear()
+
+
+class RollingQuantiles:
+    """키별 ``RollingQuantile`` 을 보관하는 증분 분위수 묶음 클래스
+
+    스트리밍 파이프라인처럼 봉 단위로 ``SignalGenerator`` 를 만들 때 시그널별 분위수
+    상태를 봉 사이에 유지합니다.
+    """
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        """
+        Args:
+            window (int): 창 크기
+            min_periods (Optional[int]): 최소 관측 개수 (기본값: window)
+        """
+        self.window = window
+        self.min_periods = min_periods
+        self._trackers: Dict[Tuple[str, float], RollingQuantile] = {}
+
+    def update(self, key: str, q: float, values: np.ndarray) -> np.ndarray:
+        """키의 값 배열을 이어서 추가하고 위치별 분위수를 반환합니다.
+
+        Args:
+            key (str): 값 계열 이름 (예: 칼럼 이름)
+            q (float): 분위수
+            values (np.ndarray): 새 값
+
+        Returns:
+            np.ndarray: 위치별 분위수
+        """
+        tracker = self._trackers.get((key, q))
+        if tracker is None:
+            tracker = RollingQuantile(self.window, q, self.min_periods)
+            self._trackers[(key, q)] = tracker
+        return tracker.update_many(values)
@@ -0,0 +1,444 @@
+"""
+종목 스크리너 모듈
+
+심볼별 최신 봉의 지표와 시그널 값을 (심볼 × 칼럼) 실수 행렬 하나에 보관하고,
+``[RSI(14)] < 30 and [MACD(12,26,9)_Signal] is buy and Close > [SMA_(50)]`` 같은 조건식을
+모든 심볼에 대해 한 번에 계산합니다. 심볼마다 ``indicators.csv`` 를 읽지 않아도 됩니다.
+
+문법:
+    조건   := 논리곱 ('or' 논리곱)*
+    논리곱 := 부정 ('and' 부정)*
+    부정   := 'not' 부정 | 비교
+    비교   := 산술 (('<' | '<=' | '>' | '>=' | '==' | '!=' | 'is') 산술)?
+    산술   := 항 (('+' | '-') 항)*
+    항     := 단항 (('*' | '/') 단항)*
+    단항   := '-' 단항 | 원자
+    원자   := 숫자 | buy | sell | neutral | 칼럼 이름 | '[' 칼럼 ']' | '(' 조건 ')'
+
+- ``buy``, ``sell``, ``neutral`` 은 각각 1, -1, 0입니다.
+- 칼럼과 상수의 비교는 칼럼별 정렬 인덱스에서 이진 탐색으로 계산합니다. 인덱스는 처음
+  사용할 때 만들고, 이후 봉 하나가 갱신되면 바뀐 값의 위치만 옮깁니다.
+- 결측값과의 비교는 거짓입니다.
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.loader import DATE_COLUMN
+from src.settings import SCREENER_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+KEYWORDS = {"and", "or", "not", "is"}
+CONSTANTS = {"buy": 1.0, "sell": -1.0, "neutral": 0.0}
+COMPARISONS = ("<", "<=", ">", ">=", "==", "!=", "is")
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<ref>\[[^\]]+\])"
+    r"|(?P<op><=|>=|==|!=|[-+*/<>()]))"
+)
+
+
+def _tokenize(predicate: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    position = 0
+    predicate = predicate.rstrip()
+    while position < len(predicate):
+        match = _TOKEN.match(predicate, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"조건식 해석 실패: '{predicate}' (위치 {position})")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "name" and text.lower() in KEYWORDS:
+            kind, text = "op", text.lower()
+        tokens.append((kind, text, match.start(kind)))
+        position = match.end()
+    return tokens
+
+
+class _PredicateParser:
+    """재귀 하강 파서 (구문 트리: 튜플)"""
+
+    def __init__(self, predicate: str):
+        self.predicate = predicate
+        self.tokens = _tokenize(predicate)
+        self.position = 0
+
+    def parse(self) -> Tuple:
+        tree = self._or()
+        if self.position < len(self.tokens):
+            self._fail("예상하지 못한 토큰")
+        return tree
+
+    def _peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][1]
+        return None
+
+    def _next(self) -> Tuple[str, str, int]:
+        if self.position >= len(self.tokens):
+            self._fail("조건식이 끝났습니다")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _fail(self, message: str) -> None:
+        at = (
+            self.tokens[self.position][2]
+            if self.position < len(self.tokens)
+            else len(self.predicate)
+        )
+        raise ValueError(f"조건식 해석 실패: '{self.predicate}' (위치 {at}): {message}")
+
+    def _or(self) -> Tuple:
+        tree = self._and()
+        while self._peek() == "or":
+            self._next()
+            tree = ("or", tree, self._and())
+        return tree
+
+    def _and(self) -> Tuple:
+        tree = self._not()
+        while self._peek() == "and":
+            self._next()
+            tree = ("and", tree, self._not())
+        return tree
+
+    def _not(self) -> Tuple:
+        if self._peek() == "not":
+            self._next()
+            return ("not", self._not())
+        tree = self._sum()
+        if self._peek() in COMPARISONS:
+            op = self._next()[1]
+            tree = ("cmp", "==" if op == "is" else op, tree, self._sum())
+        return tree
+
+    def _sum(self) -> Tuple:
+        tree = self._term()
+        while self._peek() in ("+", "-"):
+            op = self._next()[1]
+            tree = ("bin", op, tree, self._term())
+        return tree
+
+    def _term(self) -> Tuple:
+        tree = self._unary()
+        while self._peek() in ("*", "/"):
+            op = self._next()[1]
+            tree = ("bin", op, tree, self._unary())
+        return tree
+
+    def _unary(self) -> Tuple:
+        if self._peek() == "-":
+            self._next()
+            return ("neg", self._unary())
+        return self._atom()
+
+    def _atom(self) -> Tuple:
+        kind, text, _ = self._next()
+        if kind == "number":
+            return ("num", float(text))
+        if kind == "ref":
+            return ("col", text[1:-1].strip())
+        if kind == "name":
+            if text.lower() in CONSTANTS:
+                return ("num", CONSTANTS[text.lower()])
+            return ("col", text)
+        if text == "(":
+            tree = self._or()
+            if self._next()[1] != ")":
+                self.position -= 1
+                self._fail("')' 이(가) 필요합니다")
+            return tree
+        self.position -= 1
+        self._fail("피연산자가 필요합니다")
+
+
+class Screener:
+    """심볼별 최신 봉 스냅샷과 칼럼별 정렬 인덱스를 가진 스크리너 클래스"""
+
+    def __init__(self, columns: Optional[List[str]] = None, capacity: int = 1024):
+        """
+        Args:
+            columns (Optional[List[str]]): 초기 칼럼 (갱신 시 새 칼럼은 자동 추가)
+            capacity (int): 초기 심볼 수용량 (부족하면 두 배로 늘림)
+        """
+        self.columns: List[str] = list(columns or [])
+        self.symbols: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._positions = {column: j for j, column in enumerate(self.columns)}
+        self._values = np.full((capacity, len(self.columns)), np.nan)
+        self._dates = np.full(capacity, np.datetime64("NaT"), dtype="datetime64[ns]")
+        # 칼럼 → (결측값을 제외하고 정렬한 값, 해당 행 번호)
+        self._indexes: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def values(self) -> np.ndarray:
+        """(심볼, 칼럼) 스냅샷 값 (읽기 전용으로 사용)"""
+        return self._values[: len(self.symbols)]
+
+    def _add_columns(self, columns: List[str]) -> None:
+        new = [column for column in columns if column not in self._positions]
+        if not new:
+            return
+        for column in new:
+            self._positions[column] = len(self.columns)
+            self.columns.append(column)
+        padding = np.full((len(self._values), len(new)), np.nan)
+        self._values = np.hstack([self._values, padding])
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            row = len(self.symbols)
+            if row == len(self._values):
+                grow = max(len(self._values), 1)
+                self._values = np.vstack(
+                    [self._values, np.full((grow, len(self.columns)), np.nan)]
+                )
+                self._dates = np.concatenate(
+                    [self._dates, np.full(grow, np.datetime64("NaT"), "datetime64[ns]")]
+                )
+            self._rows[symbol] = row
+            self.symbols.append(symbol)
+        return row
+
+    def update(self, symbol: str, date: Any, values: Mapping[str, float]) -> bool:
+        """심볼의 최신 봉 값을 갱신합니다.
+
+        기존 스냅샷보다 이전 날짜의 봉은 무시하고, 같은 날짜이면 값을 교체합니다.
+        만들어진 정렬 인덱스는 바뀐 값의 위치만 옮깁니다.
+
+        Args:
+            symbol (str): 심볼
+            date (Any): 봉 날짜
+            values (Mapping[str, float]): 칼럼별 값 (지표와 시그널)
+
+        Returns:
+            bool: 갱신 여부
+        """
+        date = pd.Timestamp(date).to_datetime64()
+        row = self._rows.get(symbol)
+        if row is not None and date < self._dates[row]:
+            logger.debug(f"이전 날짜 봉 무시: {symbol} {date}")
+            return False
+
+        self._add_columns([column for column in values if column != DATE_COLUMN])
+        row = self._row(symbol)
+        self._dates[row] = date
+        for column, value in values.items():
+            if column == DATE_COLUMN:
+                continue
+            j = self._positions[column]
+            old = self._values[row, j]
+            new = np.nan if value is None else float(value)
+            if old == new or (np.isnan(old) and np.isnan(new)):
+                continue
+            self._values[row, j] = new
+            if column in self._indexes:
+                self._move_index_entry(column, row, old, new)
+        return True
+
+    def update_frame(
+        self, symbol: str, indicators_df: pd.DataFrame, signals_df: pd.DataFrame
+    ) -> bool:
+        """지표와 시그널 데이터의 마지막 행으로 심볼의 스냅샷을 갱신합니다."""
+        latest = indicators_df.iloc[-1].to_dict()
+        latest.update(signals_df.drop(columns=[DATE_COLUMN]).iloc[-1].to_dict())
+        date = latest.pop(DATE_COLUMN)
+        return self.update(symbol, date, latest)
+
+    def load_frame(self, snapshot: pd.DataFrame) -> None:
+        """(심볼 인덱스, Date + 값 칼럼) 데이터로 여러 심볼을 한 번에 갱신합니다.
+
+        정렬 인덱스는 다음 조회 때 다시 만듭니다.
+        """
+        columns = [column for column in snapshot.columns if column != DATE_COLUMN]
+        self._add_columns(columns)
+        self._indexes.clear()
+        rows = np.array(
+            [self._row(str(symbol)) for symbol in snapshot.index], dtype=int
+        )
+        positions = [self._positions[column] for column in columns]
+        self._values[np.ix_(rows, positions)] = snapshot[columns].to_numpy(
+            dtype=np.float64
+        )
+        self._dates[rows] = snapshot[DATE_COLUMN].to_numpy(dtype="datetime64[ns]")
+
+    def _index(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """칼럼의 정렬 인덱스를 반환합니다 (없으면 생성)."""
+        if column not in self._indexes:
+            values = self.values[:, self._positions[column]]
+            rows = np.flatnonzero(~np.isnan(values))
+            order = np.argsort(values[rows], kind="stable")
+            self._indexes[column] = (values[rows][order], rows[order])
+        return self._indexes[column]
+
+    def _move_index_entry(self, column: str, row: int, old: float, new: float) -> None:
+        """정렬 인덱스에서 한 행의 값을 old에서 new 위치로 옮깁니다."""
+        sorted_values, rows = self._indexes[column]
+        if not np.isnan(old):
+            lo = np.searchsorted(sorted_values, old, side="left")
+            hi = np.searchsorted(sorted_values, old, side="right")
+            at = lo + int(np.flatnonzero(rows[lo:hi] == row)[0])
+            sorted_values = np.delete(sorted_values, at)
+            rows = np.delete(rows, at)
+        if not np.isnan(new):
+            at = np.searchsorted(sorted_values, new, side="right")
+            sorted_values = np.insert(sorted_values, at, new)
+            rows = np.insert(rows, at, row)
+        self._indexes[column] = (sorted_values, rows)
+
+    def _compare_index(self, column: str, op: str, constant: float) -> np.ndarray:
+        """정렬 인덱스에서 ``칼럼 op 상수`` 를 만족하는 행을 bool 배열로 반환합니다."""
+        sorted_values, rows = self._index(column)
+        lo = np.searchsorted(sorted_values, constant, side="left")
+        hi = np.searchsorted(sorted_values, constant, side="right")
+        selected = {
+            "<": rows[:lo],
+            "<=": rows[:hi],
+            ">": rows[hi:],
+            ">=": rows[lo:],
+            "==": rows[lo:hi],
+            "!=": np.concatenate([rows[:lo], rows[hi:]]),
+        }[op]
+        mask = np.zeros(len(self.symbols), dtype=bool)
+        mask[selected] = True
+        return mask
+
+    def _evaluate(self, tree: Tuple) -> Any:
+        kind = tree[0]
+        if kind == "num":
+            return tree[1]
+        if kind == "col":
+            if tree[1] not in self._positions:
+                raise KeyError(f"스냅샷에 없는 칼럼: {tree[1]}")
+            return self.values[:, self._positions[tree[1]]]
+        if kind == "neg":
+            return -self._evaluate(tree[1])
+        if kind == "bin":
+            left, right = self._evaluate(tree[2]), self._evaluate(tree[3])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return {
+                    "+": np.add,
+                    "-": np.subtract,
+                    "*": np.multiply,
+                    "/": np.divide,
+                }[tree[1]](left, right)
+        if kind == "cmp":
+            return self._evaluate_comparison(*tree[1:])
+        if kind == "not":
+            return ~self._as_mask(self._evaluate(tree[1]))
+        left = self._as_mask(self._evaluate(tree[1]))
+        right = self._as_mask(self._evaluate(tree[2]))
+        return left & right if kind == "and" else left | right
+
+    def _evaluate_comparison(self, op: str, left: Tuple, right: Tuple) -> np.ndarray:
+        # 칼럼과 상수의 비교는 정렬 인덱스 사용
+        if left[0] == "col" and right[0] == "num" and left[1] in self._positions:
+            return self._compare_index(left[1], op, right[1])
+        if left[0] == "num" and right[0] == "col" and right[1] in self._positions:
+            mirrored = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}.get(op, op)
+            return self._compare_index(right[1], mirrored, left[1])
+
+        a, b = self._evaluate(left), self._evaluate(right)
+        with np.errstate(invalid="ignore"):
+            result = {
+                "<": np.less,
+                "<=": np.less_equal,
+                ">": np.greater,
+                ">=": np.greater_equal,
+                "==": np.equal,
+                "!=": np.not_equal,
+            }[op](a, b)
+        if op == "!=":
+            # 결측값과의 비교는 거짓
+            result &= ~(np.isnan(a) | np.isnan(b))
+        return self._as_mask(result)
+
+    def _as_mask(self, value: Any) -> np.ndarray:
+        if np.ndim(value) == 0:
+            if isinstance(value, (bool, np.bool_)):
+                return np.full(len(self.symbols), bool(value))
+            raise ValueError("조건식의 결과가 참/거짓이 아닙니다")
+        value = np.asarray(value)
+        if value.dtype != bool:
+            raise ValueError("조건식의 결과가 참/거짓이 아닙니다")
+        return value
+
+    def mask(self, predicate: str) -> np.ndarray:
+        """조건식을 만족하는 심볼을 bool 배열로 반환합니다 (``symbols`` 순서)."""
+        try:
+            return self._as_mask(self._evaluate(_PredicateParser(predicate).parse()))
+        except Exception as e:
+            logger.error(f"조건식 계산 실패: {str(e)}")
+            raise
+
+    def select(self, predicate: str) -> List[str]:
+        """조건식을 만족하는 심볼 목록을 반환합니다."""
+        return [self.symbols[row] for row in np.flatnonzero(self.mask(predicate))]
+
+    def screen(
+        self, predicate: str, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """조건식을 만족하는 심볼의 스냅샷을 반환합니다.
+
+        Args:
+            predicate (str): 조건식
+            columns (Optional[List[str]]): 반환할 칼럼 (기본값: 전체)
+
+        Returns:
+            pd.DataFrame: 심볼 인덱스, Date + 선택한 칼럼
+        """
+        rows = np.flatnonzero(self.mask(predicate))
+        return self.to_frame(columns).iloc[rows]
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """스냅샷 전체를 데이터프레임으로 반환합니다 (심볼 인덱스)."""
+        columns = self.columns if columns is None else columns
+        positions = [self._positions[column] for column in columns]
+        data = {DATE_COLUMN: self._dates[: len(self.symbols)]}
+        data.update(
+            {column: self.values[:, j] for column, j in zip(columns, positions)}
+        )
+        return pd.DataFrame(data, index=pd.Index(self.symbols, name="Symbol"))
+
+    def save(self, path: Path = SCREENER_SETTINGS["snapshot_file"]) -> None:
+        """스냅샷을 npz 파일로 저장합니다."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            symbols=np.array(self.symbols, dtype=str),
+            columns=np.array(self.columns, dtype=str),
+            values=self.values,
+            dates=self._dates[: len(self.symbols)].view(np.int64),
+        )
+        logger.info(f"스크리너 스냅샷 저장: {path} ({len(self)}개 심볼)")
+
+    @classmethod
+    def load(cls, path: Path = SCREENER_SETTINGS["snapshot_file"]) -> "Screener":
+        """저장된 스냅샷을 읽습니다. 파일이 없으면 빈 스크리너를 반환합니다."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        with np.load(path) as data:
+            screener = cls(
+                data["columns"].tolist(), capacity=max(len(data["symbols"]), 1)
+            )
+            symbols = data["symbols"].tolist()
+            screener.symbols = symbols
+            screener._rows = {symbol: i for i, symbol in enumerate(symbols)}
+            screener._values[: len(symbols)] = data["values"]
+            screener._dates[: len(symbols)] = data["dates"].view("datetime64[ns]")
+        return screener
@@ -0,0 +1,432 @@
+"""
+서비스 모드 모듈
+
+OHLCV, 기술적 지표, 매매 시그널을 한 번만 로드하여 메모리에 배열로 유지하고
+로컬 HTTP/JSON API로 제공합니다. 감시 디렉토리에 새 봉 파일이 들어오면
+최근 구간만 증분 재계산합니다.
+
+엔드포인트:
+- ``GET /signals/latest``: 최신 날짜의 시그널
+- ``GET /indicators?from=YYYY-MM-DD&to=YYYY-MM-DD``: 기간별 기술적 지표
+- ``GET /score``: ``SIGNAL_WEIGHTS`` 기반 종합 점수
+- ``GET /screen?q=조건식``: 최신 봉 스냅샷에서 조건식을 만족하는 심볼 (``src/screener.py``)
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from src.loader import read_ohlcv
+from src.screener import Screener
+from src.settings import (
+    ADAPTIVE_THRESHOLDS,
+    SCREENER_SETTINGS,
+    SERVICE_SETTINGS,
+    SPY_DATA_FILE,
+)
+from src.signal_generator import SignalGenerator, signal_weight_vector
+from src.technical_indicator import CUMULATIVE_PREFIXES, TechnicalIndicator
+from src.validator import OHLCVValidator, validate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class _State:
+    """한 시점의 메모리 데이터 (교체 방식으로만 갱신되는 읽기 전용 스냅샷)"""
+
+    def __init__(
+        self,
+        ohlcv: pd.DataFrame,
+        indicator_columns: List[str],
+        indicator_values: np.ndarray,
+        signal_columns: List[str],
+        signal_values: np.ndarray,
+        version: int,
+    ):
+        self.ohlcv = ohlcv
+        self.dates = ohlcv["Date"].to_numpy()
+        self.indicator_columns = indicator_columns
+        self.indicator_values = indicator_values
+        self.signal_columns = signal_columns
+        self.signal_values = signal_values
+        self.version = version
+
+
+class SignalService:
+    """메모리 상주 시그널 서비스 클래스"""
+
+    def __init__(
+        self,
+        data_file: Path = SPY_DATA_FILE,
+        watch_dir: Path = SERVICE_SETTINGS["watch_dir"],
+        recompute_window: int = SERVICE_SETTINGS["recompute_window"],
+        cache_size: int = SERVICE_SETTINGS["cache_size"],
+        screener: Optional[Screener] = None,
+        symbol: str = SCREENER_SETTINGS["symbol"],
+    ):
+        """
+        Args:
+            data_file (Path): OHLCV 데이터 파일 경로
+            watch_dir (Path): 새 봉 파일(CSV)을 감시할 디렉토리
+            recompute_window (int): 증분 재계산 시 변경 지점 이전에 포함할 봉 개수
+            cache_size (int): 응답 캐시 항목 수
+            screener (Optional[Screener]): 다른 심볼의 스냅샷을 가진 스크리너
+                (기본값: 빈 스크리너)
+            symbol (str): 스크리너에 기록할 이 서비스 데이터의 심볼 이름
+        """
+        self.data_file = data_file
+        self.watch_dir = watch_dir
+        self.recompute_window = recompute_window
+        self.cache_size = cache_size
+        self.state: Optional[_State] = None
+        self._update_lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[int, str], bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._seen_files: Dict[str, int] = {}
+        self._validator = OHLCVValidator()
+        self._stop = threading.Event()
+        self.screener = screener if screener is not None else Screener()
+        self.symbol = symbol
+        self._screener_lock = threading.Lock()
+
+    def load(self) -> None:
+        """OHLCV를 읽고 전체 지표와 시그널을 한 번 계산합니다."""
+        try:
+            ohlcv = read_ohlcv(self.data_file)
+            ohlcv = ohlcv.sort_values("Date").reset_index(drop=True)
+            self._validator.reset()
+            validate_ohlcv(ohlcv, self.data_file.name, self._validator)
+            indicators, signals = self._compute(ohlcv)
+            self.state = _State(
+                ohlcv,
+                list(indicators.columns),
+                # 메모리 절약 모드에서 모든 지표가 float32이면 float32 배열로 보관
+                indicators.to_numpy(dtype=np.result_type(*indicators.dtypes)),
+                list(signals.columns),
+                signals.to_numpy(dtype=np.int8),
+                version=0,
+            )
+            self._update_screener()
+            logger.info(f"서비스 데이터 로드 완료: {len(ohlcv)}개 데이터 포인트")
+        except Exception as e:
+            logger.error(f"서비스 데이터 로드 실패: {str(e)}")
+            raise
+
+    @staticmethod
+    def _compute(ohlcv: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """OHLCV 구간에 대해 지표와 시그널을 계산합니다."""
+        indicator = TechnicalIndicator(df=ohlcv)
+        indicator.calculate_all()
+        generator = SignalGenerator(indicators_df=indicator.indicators_df)
+        generator.generate_all()
+        indicators = indicator.indicators_df.drop(columns=["Date"] + OHLCV_COLUMNS)
+        signals = generator.signals_df.drop(columns=["Date"])
+        return indicators.reset_index(drop=True), signals.reset_index(drop=True)
+
+    def ingest(self, bars: pd.DataFrame) -> int:
+        """새 봉을 반영하고 변경 지점 이후만 증분 재계산합니다.
+
+        기존 날짜와 겹치는 봉은 값을 교체합니다. 재계산은 변경 지점 이전
+        ``recompute_window`` 개 봉부터 수행하고, 누적 지표는 변경 지점 직전 값에
+        맞춰 수준을 보정합니다.
+
+        Args:
+            bars (pd.DataFrame): Date, Open, High, Low, Close, Volume 칼럼을 가진 새 봉
+
+        Returns:
+            int: 재계산된 봉 개수
+        """
+        with self._update_lock:
+            state = self.state
+            bars = bars[["Date"] + OHLCV_COLUMNS].copy()
+            bars["Date"] = pd.to_datetime(bars["Date"])
+
+            ohlcv = pd.concat([state.ohlcv, bars], ignore_index=True)
+            ohlcv = ohlcv.drop_duplicates(subset=["Date"], keep="last")
+            ohlcv = ohlcv.sort_values("Date").reset_index(drop=True)
+
+            # 변경 지점: 새 봉 중 가장 이른 날짜의 위치
+            first_changed = int(
+                np.searchsorted(
+                    ohlcv["Date"].to_numpy(), bars["Date"].min().to_datetime64()
+                )
+            )
+            # 기존 봉이 교체되었으면 처음부터, 아니면 새 봉만 검증
+            if first_changed < self._validator.checked_rows:
+                self._validator.reset()
+            validate_ohlcv(ohlcv, "ingest", self._validator)
+
+            start = max(0, first_changed - self.recompute_window)
+            indicators, signals = self._compute(ohlcv.iloc[start:])
+            offset = first_changed - start
+
+            dtype = state.indicator_values.dtype
+            indicator_values = indicators.to_numpy(dtype=dtype)[offset:]
+            if first_changed > 0:
+                # 누적 지표 수준 보정: 변경 지점 직전 값이 기존 값과 같아지도록 이동
+                anchor_old = state.indicator_values[first_changed - 1]
+                anchor_new = indicators.to_numpy(dtype=dtype)[offset - 1]
+                for j, column in enumerate(state.indicator_columns):
+                    if column.startswith(CUMULATIVE_PREFIXES):
+                        indicator_values[:, j] += anchor_old[j] - anchor_new[j]
+                # 보정된 지표로 시그널 재생성 (고정 임계값 시그널은 행 단위 계산이고,
+                # 적응형 임계값은 변경 지점 이전 분위수 창의 지표 값이 필요)
+                signal_start = first_changed
+                if ADAPTIVE_THRESHOLDS["enabled"]:
+                    window = ADAPTIVE_THRESHOLDS["window"]
+                    signal_start = max(0, first_changed - window + 1)
+                values = np.concatenate(
+                    [
+                        state.indicator_values[signal_start:first_changed],
+                        indicator_values,
+                    ]
+                )
+                frame = pd.concat(
+                    [
+                        ohlcv.iloc[signal_start:].reset_index(drop=True),
+                        pd.DataFrame(values, columns=state.indicator_columns),
+                    ],
+                    axis=1,
+                )
+                generator = SignalGenerator(indicators_df=frame)
+                generator.generate_all()
+                signals = generator.signals_df.drop(columns=["Date"])
+                skip = first_changed - signal_start
+                signal_values = signals.to_numpy(dtype=np.int8)[skip:]
+            else:
+                signal_values = signals.to_numpy(dtype=np.int8)
+
+            self.state = _State(
+                ohlcv,
+                state.indicator_columns,
+                np.concatenate(
+                    [state.indicator_values[:first_changed], indicator_values]
+                ),
+                state.signal_columns,
+                np.concatenate([state.signal_values[:first_changed], signal_values]),
+                version=state.version + 1,
+            )
+            self._update_screener()
+            with self._cache_lock:
+                self._cache.clear()
+
+            recomputed = len(ohlcv) - first_changed
+            logger.info(f"증분 재계산 완료: {recomputed}개 봉 갱신")
+            return recomputed
+
+    def _update_screener(self) -> None:
+        """스크리너 스냅샷에 이 심볼의 최신 봉을 반영합니다."""
+        state = self.state
+        values = state.ohlcv.iloc[-1].drop(labels="Date").to_dict()
+        values.update(zip(state.indicator_columns, state.indicator_values[-1].tolist()))
+        values.update(zip(state.signal_columns, state.signal_values[-1].tolist()))
+        with self._screener_lock:
+            self.screener.update(self.symbol, state.dates[-1], values)
+
+    def screen(self, predicate: Optional[str]) -> dict:
+        """스크리너 조건식을 만족하는 심볼과 스냅샷 날짜를 반환합니다.
+
+        Args:
+            predicate (Optional[str]): 조건식 (예: ``[RSI(14)] < 30 and Close > [SMA_(50)]``)
+        """
+        if not predicate:
+            raise ValueError("조건식(q)이 필요합니다")
+        with self._screener_lock:
+            try:
+                frame = self.screener.screen(predicate, columns=[])
+            except KeyError as e:
+                raise ValueError(e.args[0]) from e
+        return {
+            "query": predicate,
+            "symbols": {
+                symbol: _format_date(date)
+                for symbol, date in zip(frame.index, frame["Date"].to_numpy())
+            },
+        }
+
+    def poll_watch_dir(self) -> int:
+        """감시 디렉토리에서 새로 들어오거나 변경된 CSV 파일을 반영합니다.
+
+        Returns:
+            int: 반영한 파일 개수
+        """
+        if not self.watch_dir.exists():
+            return 0
+        count = 0
+        for path in sorted(self.watch_dir.glob("*.csv")):
+            mtime = path.stat().st_mtime_ns
+            if self._seen_files.get(path.name) == mtime:
+                continue
+            try:
+                self.ingest(pd.read_csv(path))
+                count += 1
+            except Exception as e:
+                logger.error(f"새 봉 파일 반영 실패 ({path.name}): {str(e)}")
+            self._seen_files[path.name] = mtime
+        return count
+
+    def _watch_loop(self, interval: float) -> None:
+        """감시 디렉토리를 주기적으로 확인합니다."""
+        while not self._stop.wait(interval):
+            self.poll_watch_dir()
+
+    def latest_signals(self) -> dict:
+        """최신 날짜의 시그널을 반환합니다."""
+        state = self.state
+        values = state.signal_values[-1]
+        return {
+            "date": _format_date(state.dates[-1]),
+            "signals": dict(zip(state.signal_columns, values.tolist())),
+        }
+
+    def indicators(self, start: Optional[str], end: Optional[str]) -> dict:
+        """기간 내 기술적 지표를 반환합니다.
+
+        Args:
+            start (Optional[str]): 시작 날짜 (포함)
+            end (Optional[str]): 종료 날짜 (포함)
+        """
+        state = self.state
+        lo = 0
+        hi = len(state.dates)
+        if start:
+            lo = int(np.searchsorted(state.dates, np.datetime64(start), side="left"))
+        if end:
+            hi = int(np.searchsorted(state.dates, np.datetime64(end), side="right"))
+        frame = pd.DataFrame(
+            state.indicator_values[lo:hi],
+            columns=state.indicator_columns,
+            index=pd.DatetimeIndex(state.dates[lo:hi]).strftime("%Y-%m-%d"),
+        )
+        return json.loads(frame.to_json(orient="split", double_precision=10))
+
+    def score(self) -> dict:
+        """최신 날짜의 종합 점수를 반환합니다."""
+        state = self.state
+        weights = signal_weight_vector(state.signal_columns)
+        score = float(state.signal_values[-1] @ weights / weights.sum())
+        return {
+            "date": _format_date(state.dates[-1]),
+            "score": score,
+            "weights": {
+                c: w for c, w in zip(state.signal_columns, weights.tolist()) if w
+            },
+        }
+
+    def handle(self, target: str) -> Tuple[int, bytes]:
+        """요청 경로를 처리하고 (상태 코드, JSON 바이트)를 반환합니다.
+
+        같은 데이터 버전의 같은 요청은 캐시된 응답을 재사용합니다.
+        """
+        key = (self.state.version, target)
+        with self._cache_lock:
+            body = self._cache.get(key)
+            if body is not None:
+                self._cache.move_to_end(key)
+                return 200, body
+
+        url = urlsplit(target)
+        if url.path == "/screen":
+            # 스크리너는 다른 심볼의 갱신으로도 바뀌므로 캐시하지 않음
+            try:
+                payload = self.screen(parse_qs(url.query).get("q", [None])[0])
+            except ValueError as e:
+                return 400, json.dumps({"error": str(e)}, ensure_ascii=False).encode()
+            return 200, json.dumps(payload, ensure_ascii=False).encode()
+
+        try:
+            if url.path == "/signals/latest":
+                payload = self.latest_signals()
+            elif url.path == "/indicators":
+                query = parse_qs(url.query)
+                payload = self.indicators(
+                    query.get("from", [None])[0], query.get("to", [None])[0]
+                )
+            elif url.path == "/score":
+                payload = self.score()
+            else:
+                return 404, b'{"error": "not found"}'
+        except ValueError as e:
+            return 400, json.dumps({"error": str(e)}).encode()
+
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        with self._cache_lock:
+            self._cache[key] = body
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return 200, body
+
+    def make_server(
+        self,
+        host: str = SERVICE_SETTINGS["host"],
+        port: int = SERVICE_SETTINGS["port"],
+    ) -> ThreadingHTTPServer:
+        """이 서비스를 제공하는 HTTP 서버를 생성합니다."""
+        server = ThreadingHTTPServer((host, port), _RequestHandler)
+        server.daemon_threads = True
+        server.service = self
+        return server
+
+    def serve_forever(
+        self,
+        host: str = SERVICE_SETTINGS["host"],
+        port: int = SERVICE_SETTINGS["port"],
+        poll_interval: float = SERVICE_SETTINGS["poll_interval"],
+    ) -> None:
+        """데이터를 로드하고 감시 스레드와 HTTP 서버를 실행합니다."""
+        if self.state is None:
+            self.load()
+        watcher = threading.Thread(
+            target=self._watch_loop, args=(poll_interval,), daemon=True
+        )
+        watcher.start()
+
+        server = self.make_server(host, port)
+        logger.info(f"서비스 시작: http://{host}:{server.server_port}")
+        try:
+            server.serve_forever()
+        finally:
+            self._stop.set()
+            server.server_close()
+            logger.info("서비스 종료")
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """서비스 HTTP 요청 처리기 (keep-alive 지원)"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문이 나뉘어 전송될 때 Nagle 알고리즘으로 인한 지연 방지
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        status, body = self.server.service.handle(self.path)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format % args)
+
+
+def _format_date(value: np.datetime64) -> str:
+    """datetime64 값을 YYYY-MM-DD 문자열로 변환합니다."""
+    return str(np.datetime_as_string(value, unit="D"))
+
+
+if __name__ == "__main__":
+    from src.settings import LOGGING_FORMAT, LOGGING_LEVEL
+
+    logging.basicConfig(level=LOGGING_LEVEL, format=LOGGING_FORMAT)
+    SignalService().serve_forever()
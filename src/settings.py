@@ -15,20 +15,26 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 PROCESSED_DATA_DIR = PROJECT_ROOT / "output"
 LOG_DIR = PROJECT_ROOT / "logs"
-
-# 디렉토리 생성
-for directory in [DATA_DIR, PROCESSED_DATA_DIR, LOG_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+CACHE_DIR = PROJECT_ROOT / ".cache"  # 게시/커밋하지 않는 로컬 캐시
 
 # 파일 경로 설정
 LOG_FILE = LOG_DIR / "technical_analysis.log"
 SPY_DATA_FILE = DATA_DIR / "spy_data.csv"
+STORE_DIR = DATA_DIR / "store"  # 심볼/연도 파티션 저장소
 INDICATORS_FILE = PROCESSED_DATA_DIR / "indicators.csv"
+INDICATORS_STORE_DIR = PROCESSED_DATA_DIR / "indicators_store"  # 청크 계산 칼럼 저장소
+INDICATOR_CACHE_DIR = PROCESSED_DATA_DIR / "indicator_cache"  # 지표 칼럼 캐시
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"  # 프로젝트 CSV 파일의 로드 스냅샷
 SIGNALS_FILE = PROCESSED_DATA_DIR / "signals.csv"
+SIGNAL_EVENTS_FILE = PROCESSED_DATA_DIR / "signal_events.csv"  # 시그널 전환 이벤트
+PACKED_SIGNALS_DIR = (
+    PROCESSED_DATA_DIR / "packed_signals"
+)  # 심볼별 2비트 압축 시그널 이력
 HEATMAP_FILE = PROCESSED_DATA_DIR / "dashboard.png"
 DASHBOARD_FILE = PROCESSED_DATA_DIR / "dashboard.html"
 
 # 로깅 설정
+APP_LOG_FILE = LOG_DIR / "app.log"
 LOGGING_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOGGING_LEVEL = logging.INFO
 
@@ -115,6 +121,59 @@ TECHNICAL_INDICATORS: Dict[str, Any] = {
     },
 }
 
+# 상대강도 지표 설정 (기준 지수 데이터가 주어질 때만 계산, src/relative_strength.py 참고)
+RELATIVE_INDICATORS = {
+    "RS": {
+        "period": 63,  # 상대 수익률 기간 (약 3개월)
+    },
+    "Beta": {
+        "period": 126,  # 베타/알파 회귀 창 크기 (일간 수익률 개수)
+    },
+    "Corr": {
+        "period": 63,  # 상관계수 창 크기 (일간 수익률 개수)
+        "decoupled": 0.3,  # 이 값보다 낮으면 기준 지수와 따로 움직이는 것으로 봄
+    },
+}
+
+RELATIVE_SETTINGS = {
+    "benchmark_symbol": "^GSPC",  # 저장소 패널 계산 시 기준 지수 심볼
+}
+
+# 사용자 정의 지표 (칼럼 이름: 수식). 문법과 함수 목록은 src/expression.py 참고
+CUSTOM_INDICATORS = {
+    # "EMA_SMA_Gap(20,50)": "EMA(Close, 20) - SMA(Close, 50)",
+    # "Donchian_Position(20)": "(Close - Donchian_Lower(20)) / ATR(14)",
+}
+
+# 기간 지정 계산 워밍업 설정
+LOOKBACK_SETTINGS = {
+    "tolerance": 1e-8,  # EMA 초기값 영향이 이 비율 이하로 줄어드는 봉 수를 워밍업으로 사용
+    "psar_bars": 250,  # PSAR 워밍업 봉 수 (추세 반전 시 상태가 초기화되어 수렴)
+}
+
+# 지표 계산 실행 설정
+INDICATOR_EXECUTOR_SETTINGS = {
+    "max_workers": 1,  # 지표 계열을 동시에 계산할 스레드 수 (1이면 순차 계산)
+}
+
+# 지표 캐시 설정
+INDICATOR_CACHE_SETTINGS = {
+    "enabled": True,  # 파일에서 읽은 데이터의 지표 계산 시 캐시 사용
+    "max_bytes": 512 * 1024**2,  # 캐시 전체 크기 상한 (초과 시 오래된 항목부터 삭제)
+    "head_rows": 64,  # 데이터 식별에 사용할 앞부분 봉 개수
+}
+
+# 청크 계산 설정
+CHUNK_SETTINGS = {
+    "chunk_size": 100_000,  # 한 번에 읽고 계산할 봉 개수
+}
+
+# 다중 시간 프레임 설정
+TIMEFRAME_SETTINGS = {
+    "timeframes": {"W": "W-FRI", "M": "M"},  # 칼럼 접미사 → pandas 기간 주기
+    "output_file": PROCESSED_DATA_DIR / "mtf_signals.csv",  # 일봉에 맞춘 상위 시그널
+}
+
 # 매매 시그널 설정
 SIGNAL_THRESHOLDS = {
     "RSI": {
@@ -151,6 +210,23 @@ SIGNAL_THRESHOLDS = {
     },
 }
 
+# 적응형 시그널 임계값 설정 (고정 임계값 대신 지표의 롤링 분위수 사용)
+ADAPTIVE_THRESHOLDS = {
+    "enabled": False,  # True이면 아래 지표의 매수/매도 임계값을 롤링 분위수로 계산
+    "window": 252,  # 분위수 창 크기 (약 1년)
+    "min_periods": 126,  # 분위수를 사용할 최소 관측 개수 (그 전에는 고정 임계값 사용)
+    "lower": 0.1,  # 과매도(매수) 분위수
+    "upper": 0.9,  # 과매수(매도) 분위수
+    "indicators": ["RSI", "CCI", "Stoch", "Williams", "CMO", "DeMarker", "PSY", "NPSY"],
+}
+
+# 시그널 전환 가격 설정 (다음 봉 종가가 어디에 오면 시그널이 바뀌는지 미리 계산)
+FLIP_SETTINGS = {
+    "search_range": 0.1,  # 기준가 대비 탐색 범위 (±10%)
+    "grid_points": 33,  # 처음 평가할 격자 가격 개수 (홀수이면 기준가 포함)
+    "tolerance": 1e-4,  # 전환 가격 허용 오차 (기준가 대비 비율)
+}
+
 # 시그널 가중치 설정
 SIGNAL_WEIGHTS = {
     "RSI": 0.2,
@@ -162,6 +238,78 @@ SIGNAL_WEIGHTS = {
     "CMO": 0.1,
 }
 
+# 시그널 전환 이벤트 설정
+SIGNAL_EVENT_SETTINGS = {
+    "enabled": True,  # 시그널 저장 시 전환 이벤트를 이어 씀
+    "write_dense": True,  # 날짜별 전체 시그널 파일(signals.csv)도 저장
+}
+
+# 메모리 절약 모드 설정
+COMPACT_SETTINGS = {
+    "enabled": False,  # True이면 지표를 float32, 시그널을 int8로 보관
+    "float_dtype": "float32",  # 지표 칼럼 보관 dtype
+    "signal_dtype": "int8",  # 시그널 칼럼 보관 dtype
+    "rtol": 1e-6,  # float64 대비 허용 상대 오차 (넘는 칼럼은 float64 유지)
+    "atol": 0.0,  # float64 대비 허용 절대 오차
+}
+
+# 데이터 검증 설정
+VALIDATION_SETTINGS = {
+    "strict": False,  # True이면 오류가 있는 데이터에서 예외 발생
+    "outlier_zscore": 8.0,  # 직전 수익률 표준편차 대비 이상치 배수
+    "outlier_min_return": 0.15,  # 이상치로 볼 최소 절대 로그 수익률
+    "outlier_window": 252,  # 표준편차 계산에 사용할 직전 수익률 개수
+    "check_calendar": True,  # 일봉 거래일 누락/비거래일 검사
+}
+
+# 데이터 수집 설정
+FETCH_SETTINGS = {
+    "max_workers": 8,  # 동시 요청 스레드 수
+    "rate_limit": 5.0,  # 전역 초당 요청 수 제한
+    "burst": 5,  # 순간 허용 요청 수
+    "max_retries": 3,  # 심볼당 최대 재시도 횟수
+    "backoff_base": 0.5,  # 백오프 기본 대기 시간 (초)
+    "backoff_max": 8.0,  # 백오프 최대 대기 시간 (초)
+    "timeout": 30.0,  # 심볼당 제한 시간 (재시도 포함, 초)
+    "history_start": "2000-01-01",  # 저장된 데이터가 없는 심볼의 수집 시작일
+    "market_timezone": "America/New_York",  # 거래소 시간대
+    "market_close": "16:00",  # 정규장 마감 시각 (거래소 시간대 기준)
+}
+
+# 서비스 모드 설정
+SERVICE_SETTINGS = {
+    "host": "127.0.0.1",  # 바인딩 주소 (로컬 전용)
+    "port": 8765,  # 포트
+    "watch_dir": DATA_DIR / "incoming",  # 새 봉 파일을 감시할 디렉토리
+    "poll_interval": 1.0,  # 감시 주기 (초)
+    "recompute_window": 1000,  # 증분 재계산 시 사용할 과거 봉 개수
+    "cache_size": 256,  # 응답 캐시 항목 수
+}
+
+# 포트폴리오 백테스트 설정
+PORTFOLIO_SETTINGS = {
+    "top_k": 20,  # 보유 심볼 수 (종합 점수 상위)
+    "rebalance": "W-FRI",  # 리밸런싱 주기 (기간별 마지막 거래일)
+    "cost_bps": 10.0,  # 거래 금액 대비 편도 비용 (bp)
+    "min_score": 0.0,  # 이 점수 이하 심볼은 보유하지 않음 (None이면 제한 없음)
+    "periods_per_year": 252,  # 연환산에 사용할 연간 봉 개수
+    "max_workers": 1,  # 파라미터 조합 백테스트 프로세스 수 (1이면 순차 계산)
+}
+
+# 스크리너 설정
+SCREENER_SETTINGS = {
+    "snapshot_file": PROCESSED_DATA_DIR / "screener_snapshot.npz",  # 최신 봉 스냅샷
+    "symbol": "^GSPC",  # signals 실행 결과를 스냅샷에 기록할 심볼 이름
+}
+
+# 스트리밍 수집 설정
+STREAMING_SETTINGS = {
+    "freq": "D",  # 봉 주기 (pandas 오프셋 문자열)
+    "speed": 0.0,  # 재생 배속 (0 이하: 대기 없이 최대 속도)
+    "window": 300,  # 봉마다 지표를 재계산할 최근 봉 개수
+    "queue_size": 64,  # 단계 간 큐의 최대 크기
+}
+
 # 시각화 설정
 VISUALIZATION_SETTINGS = {
     "figure_size": (15, 10),
@@ -181,3 +329,12 @@ VISUALIZATION_SETTINGS = {
         "down": "lightblue",
     },
 }
+
+
+def ensure_directories() -> None:
+    """데이터, 출력, 로그 디렉토리를 생성합니다.
+
+    모듈 임포트 시 파일 시스템 작업이 일어나지 않도록 실행 시점에 호출합니다.
+    """
+    for directory in [DATA_DIR, PROCESSED_DATA_DIR, LOG_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,203 @@
+"""
+공유 메모리 데이터프레임 모듈
+
+OHLCV 데이터나 지표 블록을 ``multiprocessing.shared_memory`` 세그먼트 하나에 한 번만
+게시하고, 작업 프로세스는 세그먼트 이름과 칼럼 배치 정보(``SharedFrameHandle``)만 받아
+읽기 전용 NumPy 뷰로 붙습니다. 작업자마다 CSV를 다시 읽거나 피클된 데이터프레임을 받을
+때와 달리 메모리가 작업자 수만큼 늘지 않고 직렬화 비용도 없습니다.
+
+    세그먼트 = [칼럼 0 값][칼럼 1 값]...  (칼럼마다 8바이트 정렬)
+
+수명 관리:
+- 게시한 프로세스(소유자)만 세그먼트를 삭제(unlink)합니다. ``with`` 블록을 벗어나거나
+  ``close()`` 를 호출하면 삭제되며, 호출하지 않아도 객체가 수거되거나 프로세스가 끝날 때
+  삭제됩니다.
+- 작업자는 붙기만 하고 삭제하지 않습니다. 붙을 때 resource_tracker에 등록하지 않으므로
+  작업자 종료 시 작업자 쪽 tracker가 소유자의 세그먼트를 삭제하지 않습니다. 소유자가
+  비정상 종료하면 소유자 쪽 tracker가 세그먼트를 정리합니다.
+"""
+
+import logging
+import secrets
+import threading
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 세그먼트 이름 접두사 (/dev/shm 에서 누수 확인용)
+SEGMENT_PREFIX = "ta_"
+ALIGNMENT = 8
+
+_track_lock = threading.Lock()
+
+
+class SharedFrameHandle:
+    """작업 프로세스에 넘기는 세그먼트 이름과 칼럼 배치 정보 (피클 가능)"""
+
+    def __init__(
+        self,
+        name: str,
+        rows: int,
+        columns: List[Tuple[str, str, int]],
+    ):
+        """
+        Args:
+            name (str): 공유 메모리 세그먼트 이름
+            rows (int): 행 수
+            columns (List[Tuple[str, str, int]]): (칼럼 이름, dtype, 바이트 오프셋) 목록
+        """
+        self.name = name
+        self.rows = rows
+        self.columns = columns
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedFrameHandle({self.name!r}, rows={self.rows}, "
+            f"columns={len(self.columns)})"
+        )
+
+
+class SharedFrame:
+    """공유 메모리에 올린 데이터프레임 클래스"""
+
+    def __init__(
+        self,
+        segment: shared_memory.SharedMemory,
+        handle: SharedFrameHandle,
+        owner: bool,
+    ):
+        self._segment: Optional[shared_memory.SharedMemory] = segment
+        self.handle = handle
+        self.owner = owner
+        # 소유자가 close()를 호출하지 않아도 수거/종료 시 세그먼트를 삭제
+        self._finalizer = weakref.finalize(self, _release, segment, owner, handle.name)
+
+    @classmethod
+    def publish(cls, df: pd.DataFrame) -> "SharedFrame":
+        """데이터프레임의 칼럼을 새 공유 메모리 세그먼트에 복사합니다.
+
+        Args:
+            df (pd.DataFrame): 게시할 데이터 (숫자/날짜 칼럼만 지원)
+
+        Returns:
+            SharedFrame: 세그먼트를 소유한 공유 데이터프레임
+        """
+        arrays: Dict[str, np.ndarray] = {}
+        layout: List[Tuple[str, str, int]] = []
+        size = 0
+        for column in df.columns:
+            values = df[column].to_numpy()
+            if values.dtype == object:
+                raise TypeError(f"공유 메모리에 올릴 수 없는 칼럼: {column} (object)")
+            arrays[column] = values
+            layout.append((column, values.dtype.str, size))
+            size += -(-values.nbytes // ALIGNMENT) * ALIGNMENT
+
+        name = f"{SEGMENT_PREFIX}{secrets.token_hex(8)}"
+        segment = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        try:
+            for column, dtype, offset in layout:
+                target = np.ndarray(
+                    len(df), dtype=dtype, buffer=segment.buf, offset=offset
+                )
+                target[:] = arrays[column]
+                del target
+        except Exception as e:
+            logger.error(f"공유 메모리 게시 실패: {str(e)}")
+            segment.close()
+            segment.unlink()
+            raise
+
+        logger.debug(f"공유 메모리 게시: {name} ({size:,} bytes)")
+        return cls(segment, SharedFrameHandle(name, len(df), layout), owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedFrameHandle) -> "SharedFrame":
+        """다른 프로세스가 게시한 세그먼트에 붙습니다 (삭제 책임 없음).
+
+        Args:
+            handle (SharedFrameHandle): 게시한 프로세스의 ``handle``
+
+        Returns:
+            SharedFrame: 읽기 전용 공유 데이터프레임
+        """
+        segment = _attach_untracked(handle.name)
+        return cls(segment, handle, owner=False)
+
+    def arrays(self, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """칼럼별 읽기 전용 NumPy 뷰를 반환합니다 (복사 없음)."""
+        if self._segment is None:
+            raise ValueError(f"닫힌 공유 메모리입니다: {self.handle.name}")
+        wanted = None if columns is None else set(columns)
+        buffer = self._segment.buf.toreadonly()
+        views = {}
+        for column, dtype, offset in self.handle.columns:
+            if wanted is not None and column not in wanted:
+                continue
+            # frombuffer 뷰는 버퍼를 잡고 있어 뷰가 살아 있는 동안 매핑이 해제되지 않음
+            view = np.frombuffer(
+                buffer, dtype=dtype, count=self.handle.rows, offset=offset
+            )
+            views[column] = view
+        return views
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """공유 메모리 뷰로 데이터프레임을 만듭니다 (칼럼 값은 복사하지 않음)."""
+        return pd.DataFrame(self.arrays(columns), copy=False)
+
+    def close(self) -> None:
+        """세그먼트에서 분리합니다. 소유자이면 세그먼트를 삭제합니다.
+
+        뷰가 남아 있으면 매핑 해제는 뷰가 수거될 때로 미뤄지지만, 소유자의 삭제는 바로
+        이루어져 이름이 누수되지 않습니다.
+        """
+        self._segment = None
+        self._finalizer()
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _release(segment: shared_memory.SharedMemory, owner: bool, name: str) -> None:
+    """세그먼트를 분리하고 소유자이면 삭제합니다 (``weakref.finalize`` 콜백)."""
+    if owner:
+        try:
+            segment.unlink()
+            logger.debug(f"공유 메모리 삭제: {name}")
+        except FileNotFoundError:
+            pass
+    try:
+        segment.close()
+    except BufferError:
+        # 아직 살아 있는 뷰가 매핑을 참조하면 매핑 해제는 뷰가 수거될 때로 미루고
+        # 파일 디스크립터만 닫음 (SharedMemory.__del__ 의 재시도 방지)
+        segment._buf = None
+        segment._mmap = None
+        segment.close()
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """resource_tracker에 등록하지 않고 기존 세그먼트에 붙습니다.
+
+    Python 3.13 이상은 ``track=False`` 를 사용하고, 그 이전 버전은 붙는 동안만 등록
+    함수를 비활성화합니다.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    with _track_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
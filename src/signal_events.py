@@ -0,0 +1,260 @@
+"""
+시그널 전환 이벤트 모듈
+
+날짜별 전체 시그널 행렬 대신 값이 바뀐 지점만 (날짜, 시그널, 이전 값, 새 값) 이벤트로
+저장합니다. 대부분의 시그널은 가끔씩만 상태가 바뀌므로 저장 크기와 매일 커밋되는 출력의
+변경량이 크게 줄고, 알림은 새 이벤트만 읽으면 됩니다.
+
+파일에는 첫 줄의 시그널 사전(JSON 목록)과, 이벤트가 있는 날짜마다 ``코드:새 값`` 목록을
+한 줄씩 씁니다. 코드는 사전에서의 위치이고, 이전 값은 같은 시그널의 직전 새 값(처음은
+0)이므로 저장하지 않습니다.
+
+    # signals: ["SMA_(20)_Signal", "RSI(14)_Signal"]
+    Date,Changes
+    2025-03-20,1:1
+    2025-03-21,0:-1 1:0
+
+- 이벤트는 시그널 행렬에 ``np.diff`` 를 적용해 한 번에 구합니다.
+- 시그널이 처음 나타나는 날에는 값이 0이어도 등록 이벤트(Old=0)를 남겨 칼럼 목록을
+  보존합니다.
+- 실행할 때마다 마지막 이벤트 날짜 이후만 이어 쓰며, 이벤트를 누적하면(New - Old의
+  누적합) 전체 행렬을 다시 만들 수 있습니다.
+- 메모리에서는 (Date, Signal, Old, New) 데이터프레임으로 다룹니다.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.compact import signal_dtype
+from src.loader import DATE_COLUMN, DATE_FORMAT, load_csv
+from src.settings import SIGNAL_EVENTS_FILE
+
+logger = logging.getLogger(__name__)
+
+EVENT_COLUMNS = [DATE_COLUMN, "Signal", "Old", "New"]
+HEADER_PREFIX = "# signals: "
+CHANGES_COLUMN = "Changes"
+
+
+def signal_events(
+    signals_df: pd.DataFrame, state: Optional[Dict[str, int]] = None
+) -> pd.DataFrame:
+    """시그널 행렬에서 전환 이벤트를 구합니다.
+
+    Args:
+        signals_df (pd.DataFrame): 날짜순 시그널 데이터 (Date + 시그널 칼럼)
+        state (Optional[Dict[str, int]]): 첫 행 직전의 시그널 상태. 없는 시그널은 첫 행에
+            등록 이벤트를 남깁니다.
+
+    Returns:
+        pd.DataFrame: 날짜, 칼럼 순서로 정렬된 이벤트 (Date, Signal, Old, New)
+    """
+    state = state or {}
+    columns = [column for column in signals_df.columns if column != DATE_COLUMN]
+    matrix = signals_df[columns].to_numpy(dtype=np.int8)
+    base = np.array([state.get(column, 0) for column in columns], dtype=np.int8)
+
+    changed = np.diff(matrix, axis=0, prepend=base[np.newaxis, :]) != 0
+    if len(matrix):
+        changed[0] |= np.array([column not in state for column in columns], dtype=bool)
+    rows, cols = np.nonzero(changed)
+    previous = matrix[np.maximum(rows - 1, 0), cols]
+    old = np.where(rows == 0, base[cols], previous)
+
+    return pd.DataFrame(
+        {
+            DATE_COLUMN: signals_df[DATE_COLUMN].to_numpy()[rows],
+            "Signal": np.asarray(columns, dtype=object)[cols],
+            "Old": old.astype(signal_dtype()),
+            "New": matrix[rows, cols].astype(signal_dtype()),
+        }
+    )
+
+
+def final_state(events: pd.DataFrame) -> Dict[str, int]:
+    """이벤트를 모두 적용한 뒤의 시그널별 상태를 반환합니다 (등록 순서 유지)."""
+    last = events.drop_duplicates("Signal", keep="last").set_index("Signal")["New"]
+    order = events["Signal"].drop_duplicates()
+    return {signal: int(last[signal]) for signal in order}
+
+
+def reconstruct_signals(
+    events: pd.DataFrame, dates: Optional[pd.Series] = None
+) -> pd.DataFrame:
+    """이벤트를 누적하여 날짜별 시그널 행렬을 만듭니다.
+
+    Args:
+        events (pd.DataFrame): 전환 이벤트
+        dates (Optional[pd.Series]): 행렬의 날짜 (기본값: 이벤트가 있는 날짜).
+            이벤트가 주어진 날짜 사이에 있으면 그 다음 날짜부터 반영됩니다.
+
+    Returns:
+        pd.DataFrame: Date + 시그널 칼럼 (칼럼 순서는 등록 순서)
+    """
+    codes, columns = pd.factorize(events["Signal"])
+    if dates is None:
+        dates = pd.Series(np.unique(events[DATE_COLUMN].to_numpy()))
+    date_values = np.asarray(dates, dtype="datetime64[ns]")
+    rows = np.searchsorted(date_values, events[DATE_COLUMN].to_numpy(), side="left")
+    inside = rows < len(date_values)
+
+    delta = np.zeros((len(date_values), len(columns)), dtype=np.int16)
+    change = events["New"].to_numpy(np.int16) - events["Old"].to_numpy(np.int16)
+    np.add.at(delta, (rows[inside], codes[inside]), change[inside])
+    dense = np.cumsum(delta, axis=0).astype(signal_dtype())
+
+    data = {DATE_COLUMN: date_values}
+    data.update({column: dense[:, i] for i, column in enumerate(columns)})
+    return pd.DataFrame(data)
+
+
+def _read_dictionary(path: Path) -> Optional[List[str]]:
+    """이벤트 파일 첫 줄의 시그널 사전을 반환합니다 (이전 형식 파일이면 None)."""
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+    if not first.startswith(HEADER_PREFIX):
+        return None
+    return json.loads(first.removeprefix(HEADER_PREFIX))
+
+
+def encode_signal_events(events: pd.DataFrame, signals: List[str]) -> pd.DataFrame:
+    """이벤트를 날짜별 ``코드:새 값`` 목록으로 묶습니다.
+
+    Args:
+        events (pd.DataFrame): 날짜순 전환 이벤트
+        signals (List[str]): 시그널 사전 (코드 = 위치)
+
+    Returns:
+        pd.DataFrame: Date, Changes 칼럼의 날짜별 변경 목록
+    """
+    codes = pd.Index(signals).get_indexer(events["Signal"])
+    if (codes < 0).any():
+        raise ValueError("시그널 사전에 없는 시그널이 있습니다")
+    tokens = pd.Series(codes.astype(str), index=events.index).str.cat(
+        events["New"].astype(int).astype(str), sep=":"
+    )
+    grouped = tokens.groupby(events[DATE_COLUMN].to_numpy(), sort=False).agg(" ".join)
+    return pd.DataFrame({DATE_COLUMN: grouped.index, CHANGES_COLUMN: grouped.values})
+
+
+def decode_signal_events(changes: pd.DataFrame, signals: List[str]) -> pd.DataFrame:
+    """날짜별 변경 목록을 (Date, Signal, Old, New) 이벤트로 풉니다."""
+    tokens = changes[CHANGES_COLUMN].str.split(" ").explode()
+    if tokens.empty:
+        return pd.DataFrame(
+            {
+                DATE_COLUMN: pd.Series(dtype="datetime64[ns]"),
+                "Signal": pd.Series(dtype=object),
+                "Old": pd.Series(dtype=signal_dtype()),
+                "New": pd.Series(dtype=signal_dtype()),
+            }
+        )
+    parts = tokens.str.split(":", expand=True)
+    codes = parts[0].astype(np.int64).to_numpy()
+    new = parts[1].astype(np.int64)
+    old = new.groupby(codes).shift(1).fillna(0)
+    return pd.DataFrame(
+        {
+            DATE_COLUMN: changes[DATE_COLUMN].to_numpy()[tokens.index.to_numpy()],
+            "Signal": np.asarray(signals, dtype=object)[codes],
+            "Old": old.to_numpy().astype(signal_dtype()),
+            "New": new.to_numpy().astype(signal_dtype()),
+        }
+    )
+
+
+def read_signal_events(path: Path = SIGNAL_EVENTS_FILE) -> pd.DataFrame:
+    """이벤트 파일을 읽습니다 (이전의 Date,Signal,Old,New 형식도 읽음)."""
+    signals = _read_dictionary(path)
+    if signals is None:
+        dtype = {"Signal": "str", "Old": signal_dtype(), "New": signal_dtype()}
+        return load_csv(path, usecols=EVENT_COLUMNS, dtype=dtype, snapshot=False)
+
+    changes = pd.read_csv(path, skiprows=1, dtype={CHANGES_COLUMN: str})
+    changes[DATE_COLUMN] = pd.to_datetime(changes[DATE_COLUMN], format=DATE_FORMAT)
+    return decode_signal_events(changes.reset_index(drop=True), signals)
+
+
+def _matches_history(
+    events: pd.DataFrame, signals_df: pd.DataFrame, last: pd.Timestamp
+) -> bool:
+    """이벤트로 복원한 시그널이 마지막 이벤트 날짜까지 현재 시그널과 같은지 확인합니다.
+
+    현재 시그널에 마지막 이벤트 날짜가 없으면 이어 쓸 위치를 알 수 없으므로 다르다고
+    봅니다. 한쪽에만 있는 시그널 칼럼은 비교하지 않습니다.
+    """
+    overlap = signals_df[signals_df[DATE_COLUMN] <= last]
+    if overlap.empty or overlap[DATE_COLUMN].iloc[-1] != last:
+        return False
+    stored = reconstruct_signals(events, overlap[DATE_COLUMN])
+    columns = [c for c in stored.columns if c != DATE_COLUMN and c in overlap]
+    return bool(
+        np.array_equal(
+            stored[columns].to_numpy(dtype=np.int16),
+            overlap[columns].to_numpy(dtype=np.int16),
+        )
+    )
+
+
+def append_signal_events(
+    signals_df: pd.DataFrame, path: Path = SIGNAL_EVENTS_FILE
+) -> pd.DataFrame:
+    """기존 이벤트 파일의 마지막 날짜 이후 시그널만 이벤트로 이어 씁니다.
+
+    기존 이벤트로 복원한 시그널을 현재 시그널과 겹치는 모든 날짜에서 비교하고, 하나라도
+    다르면(저장소 백필, 검증기 보정, 적응형 임계값 사용 여부 변경 등으로 과거 시그널이
+    바뀐 경우) 이벤트 파일을 처음부터 다시 씁니다.
+
+    Args:
+        signals_df (pd.DataFrame): 날짜순 시그널 데이터
+        path (Path): 이벤트 파일 경로
+
+    Returns:
+        pd.DataFrame: 새로 추가된 이벤트
+    """
+    try:
+        path = Path(path)
+        state: Optional[Dict[str, int]] = None
+        signals = None
+        new_rows = signals_df
+        if path.exists() and path.stat().st_size > 0:
+            signals = _read_dictionary(path)
+            existing = read_signal_events(path)
+            last = existing[DATE_COLUMN].max()
+            state = final_state(existing)
+            columns = [c for c in signals_df.columns if c != DATE_COLUMN]
+            if signals is None or not set(columns) <= set(signals):
+                logger.info(
+                    f"시그널 이벤트 파일을 현재 형식으로 다시 작성합니다: {path}"
+                )
+                state = None
+            elif _matches_history(existing, signals_df, last):
+                new_rows = signals_df[signals_df[DATE_COLUMN] > last]
+            else:
+                logger.warning(
+                    f"시그널 이벤트가 현재 시그널과 달라 다시 작성합니다: {path}"
+                )
+                state = None
+
+        events = signal_events(new_rows, state)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if state is None:
+            signals = [c for c in signals_df.columns if c != DATE_COLUMN]
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(HEADER_PREFIX + json.dumps(signals) + "\n")
+                encode_signal_events(events, signals).to_csv(f, index=False)
+        else:
+            encode_signal_events(events, signals).to_csv(
+                path, mode="a", header=False, index=False
+            )
+        logger.info(f"시그널 이벤트 {len(events)}건 저장: {path}")
+        return events
+
+    except Exception as e:
+        logger.error(f"시그널 이벤트 저장 실패: {str(e)}")
+        raise
@@ -10,17 +10,52 @@
 
 import logging
 from pathlib import Path
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from src.column_block import ColumnBlock
+from src.compact import signal_dtype
+from src.loader import read_indicators
+from src.rolling_stats import RollingQuantiles, rolling_quantile
 from src.settings import (
+    ADAPTIVE_THRESHOLDS,
     INDICATORS_FILE,
+    RELATIVE_INDICATORS,
+    SIGNAL_EVENT_SETTINGS,
+    SIGNAL_EVENTS_FILE,
+    SIGNAL_WEIGHTS,
     SIGNALS_FILE,
     TECHNICAL_INDICATORS,
 )
+from src.signal_events import append_signal_events
 
 logger = logging.getLogger(__name__)
 
+Threshold = Union[float, np.ndarray]
+
+
+def signal_weight_vector(columns: List[str]) -> np.ndarray:
+    """시그널 칼럼 순서에 맞춘 가중치 벡터를 반환합니다.
+
+    ``SIGNAL_WEIGHTS`` 의 지표 이름으로 시작하는 시그널 칼럼(예: ``RSI(14)_Signal``)에
+    해당 가중치를 부여하고, 나머지 칼럼은 0으로 둡니다.
+
+    Args:
+        columns (List[str]): 시그널 칼럼 이름 목록
+
+    Returns:
+        np.ndarray: 칼럼별 가중치
+    """
+    weights = np.zeros(len(columns))
+    for i, column in enumerate(columns):
+        for name, weight in SIGNAL_WEIGHTS.items():
+            if column.startswith(f"{name}("):
+                weights[i] = weight
+                break
+    return weights
+
 
 class SignalGenerator:
     """매매 시그널 생성 클래스"""
@@ -29,23 +64,41 @@ class SignalGenerator:
         self,
         indicators_file: Path = INDICATORS_FILE,
         output_file: Path = SIGNALS_FILE,
+        indicators_df: Optional[pd.DataFrame] = None,
+        events_file: Optional[Path] = None,
+        quantiles: Optional[RollingQuantiles] = None,
     ):
         """
         Args:
             indicators_file (Path): 기술적 지표 데이터 파일 경로
             output_file (Path): 출력 파일 경로
+            indicators_df (Optional[pd.DataFrame]): 메모리에 있는 기술적 지표 데이터.
+                주어지면 파일을 읽지 않고 이 데이터를 사용합니다.
+            events_file (Optional[Path]): 시그널 전환 이벤트 파일 경로
+                (기본값: ``output_file`` 과 같은 디렉토리의 ``signal_events.csv``)
+            quantiles (Optional[RollingQuantiles]): 적응형 임계값의 증분 분위수 상태.
+                주어지면 이전 봉까지의 상태에 이어서 분위수를 계산합니다 (스트리밍).
         """
         self.indicators_file = indicators_file
         self.output_file = output_file
+        self.events_file = (
+            Path(output_file).with_name(SIGNAL_EVENTS_FILE.name)
+            if events_file is None
+            else events_file
+        )
+        self.quantiles = quantiles
         self.indicators_df = None
         self.signals_df = None
-        self._load_data()
+        self._columns: Optional[ColumnBlock] = None
+        if indicators_df is None:
+            self._load_data()
+        else:
+            self.indicators_df = indicators_df.reset_index(drop=True)
 
     def _load_data(self) -> None:
         """데이터를 로드합니다."""
         try:
-            self.indicators_df = pd.read_csv(self.indicators_file)
-            self.indicators_df["Date"] = pd.to_datetime(self.indicators_df["Date"])
+            self.indicators_df = read_indicators(self.indicators_file)
             logger.info("기술적 지표 데이터 로드 완료")
         except Exception as e:
             logger.error(f"기술적 지표 데이터 로드 실패: {str(e)}")
@@ -54,8 +107,12 @@ class SignalGenerator:
     def generate_all(self) -> None:
         """모든 매매 시그널을 생성합니다."""
         try:
-            # 시그널 데이터프레임 초기화
-            self.signals_df = pd.DataFrame({"Date": self.indicators_df["Date"]})
+            # 시그널 칼럼 블록 초기화 (메모리 절약 모드에서는 int8)
+            self._columns = ColumnBlock(
+                len(self.indicators_df),
+                dtype=signal_dtype(),
+                leading={"Date": self.indicators_df["Date"].to_numpy()},
+            )
 
             # 모멘텀 지표 시그널
             self._generate_momentum_signals()
@@ -63,8 +120,15 @@ class SignalGenerator:
             # 반대매매 지표 시그널
             self._generate_contrarian_signals()
 
-            # 시그널 정렬
-            self.signals_df = self.signals_df.sort_values("Date")
+            # 상대강도 지표 시그널 (지표가 계산된 경우만)
+            self._generate_relative_signals()
+
+            # 날짜 칼럼과 시그널 칼럼으로 데이터프레임을 한 번에 생성
+            self.signals_df = self._columns.to_frame(index=self.indicators_df.index)
+
+            # 시그널 정렬 (이미 날짜순이면 생략)
+            if not self.signals_df["Date"].is_monotonic_increasing:
+                self.signals_df = self.signals_df.sort_values("Date")
             logger.info("매매 시그널 생성 완료")
 
         except Exception as e:
@@ -75,20 +139,16 @@ class SignalGenerator:
         """모멘텀 지표 기반 시그널을 생성합니다."""
         # SMA
         for period in TECHNICAL_INDICATORS["모멘텀 지표"]["SMA"]["periods"]:
-            self.signals_df[f"SMA_({period})_Signal"] = self._generate_sma_signal(
-                period
-            )
+            self._columns[f"SMA_({period})_Signal"] = self._generate_sma_signal(period)
 
         # EMA
         for period in TECHNICAL_INDICATORS["모멘텀 지표"]["EMA"]["periods"]:
-            self.signals_df[f"EMA_({period})_Signal"] = self._generate_ema_signal(
-                period
-            )
+            self._columns[f"EMA_({period})_Signal"] = self._generate_ema_signal(period)
 
         # TSI
         short_period = TECHNICAL_INDICATORS["모멘텀 지표"]["TSI"]["short_period"]
         long_period = TECHNICAL_INDICATORS["모멘텀 지표"]["TSI"]["long_period"]
-        self.signals_df[f"TSI({short_period},{long_period})_Signal"] = (
+        self._columns[f"TSI({short_period},{long_period})_Signal"] = (
             self._generate_tsi_signal(short_period, long_period)
         )
 
@@ -96,45 +156,45 @@ class SignalGenerator:
         short_period = TECHNICAL_INDICATORS["모멘텀 지표"]["MACD"]["short_period"]
         long_period = TECHNICAL_INDICATORS["모멘텀 지표"]["MACD"]["long_period"]
         signal_period = TECHNICAL_INDICATORS["모멘텀 지표"]["MACD"]["signal_period"]
-        self.signals_df[
-            f"MACD({short_period},{long_period},{signal_period})_Signal"
-        ] = self._generate_macd_signal(short_period, long_period, signal_period)
+        self._columns[f"MACD({short_period},{long_period},{signal_period})_Signal"] = (
+            self._generate_macd_signal(short_period, long_period, signal_period)
+        )
 
         # PSAR
         af_start = TECHNICAL_INDICATORS["모멘텀 지표"]["PSAR"]["af_start"]
         af_increment = TECHNICAL_INDICATORS["모멘텀 지표"]["PSAR"]["af_increment"]
         af_max = TECHNICAL_INDICATORS["모멘텀 지표"]["PSAR"]["af_max"]
-        self.signals_df[f"PSAR({af_start},{af_increment},{af_max})_Signal"] = (
+        self._columns[f"PSAR({af_start},{af_increment},{af_max})_Signal"] = (
             self._generate_psar_signal(af_start, af_increment, af_max)
         )
 
         # ADX
         period = TECHNICAL_INDICATORS["모멘텀 지표"]["ADX"]["period"]
-        self.signals_df[f"ADX({period})_Signal"] = self._generate_adx_signal(period)
+        self._columns[f"ADX({period})_Signal"] = self._generate_adx_signal(period)
 
         # Aroon
         period = TECHNICAL_INDICATORS["모멘텀 지표"]["Aroon"]["period"]
-        self.signals_df[f"Aroon({period})_Signal"] = self._generate_aroon_signal(period)
+        self._columns[f"Aroon({period})_Signal"] = self._generate_aroon_signal(period)
 
         # ADL
         period = TECHNICAL_INDICATORS["모멘텀 지표"]["ADL"]["period"]
-        self.signals_df[f"ADL({period})_Signal"] = self._generate_adl_signal(period)
+        self._columns[f"ADL({period})_Signal"] = self._generate_adl_signal(period)
 
         # ADR
         period = TECHNICAL_INDICATORS["모멘텀 지표"]["ADR"]["period"]
-        self.signals_df[f"ADR({period})_Signal"] = self._generate_adr_signal(period)
+        self._columns[f"ADR({period})_Signal"] = self._generate_adr_signal(period)
 
         # Ichimoku
         tenkan_period = TECHNICAL_INDICATORS["모멘텀 지표"]["Ichimoku"]["tenkan_period"]
         kijun_period = TECHNICAL_INDICATORS["모멘텀 지표"]["Ichimoku"]["kijun_period"]
-        self.signals_df[f"Ichimoku({tenkan_period},{kijun_period})_Signal"] = (
+        self._columns[f"Ichimoku({tenkan_period},{kijun_period})_Signal"] = (
             self._generate_ichimoku_signal(tenkan_period, kijun_period)
         )
 
         # Keltner
         period = TECHNICAL_INDICATORS["모멘텀 지표"]["Keltner"]["period"]
         multiplier = TECHNICAL_INDICATORS["모멘텀 지표"]["Keltner"]["multiplier"]
-        self.signals_df[f"Keltner({period},{multiplier})_Signal"] = (
+        self._columns[f"Keltner({period},{multiplier})_Signal"] = (
             self._generate_keltner_signal(period, multiplier)
         )
 
@@ -142,59 +202,115 @@ class SignalGenerator:
         """반대매매 지표 기반 시그널을 생성합니다."""
         # RSI
         period = TECHNICAL_INDICATORS["반대매매 지표"]["RSI"]["period"]
-        self.signals_df[f"RSI({period})_Signal"] = self._generate_rsi_signal(period)
+        self._columns[f"RSI({period})_Signal"] = self._generate_rsi_signal(period)
 
         # BB
         period = TECHNICAL_INDICATORS["반대매매 지표"]["BB"]["period"]
         std_dev = TECHNICAL_INDICATORS["반대매매 지표"]["BB"]["std_dev"]
-        self.signals_df[f"BB({period},{std_dev})_Signal"] = self._generate_bb_signal(
+        self._columns[f"BB({period},{std_dev})_Signal"] = self._generate_bb_signal(
             period, std_dev
         )
 
         # CCI
         period = TECHNICAL_INDICATORS["반대매매 지표"]["CCI"]["period"]
-        self.signals_df[f"CCI({period})_Signal"] = self._generate_cci_signal(period)
+        self._columns[f"CCI({period})_Signal"] = self._generate_cci_signal(period)
 
         # Stoch
         k_period = TECHNICAL_INDICATORS["반대매매 지표"]["Stoch"]["k_period"]
         d_period = TECHNICAL_INDICATORS["반대매매 지표"]["Stoch"]["d_period"]
-        self.signals_df[f"Stoch({k_period},{d_period})_Signal"] = (
+        self._columns[f"Stoch({k_period},{d_period})_Signal"] = (
             self._generate_stoch_signal(k_period, d_period)
         )
 
         # Williams
         period = TECHNICAL_INDICATORS["반대매매 지표"]["Williams"]["period"]
-        self.signals_df[f"Williams({period})_Signal"] = self._generate_williams_signal(
+        self._columns[f"Williams({period})_Signal"] = self._generate_williams_signal(
             period
         )
 
         # CMO
         period = TECHNICAL_INDICATORS["반대매매 지표"]["CMO"]["period"]
-        self.signals_df[f"CMO({period})_Signal"] = self._generate_cmo_signal(period)
+        self._columns[f"CMO({period})_Signal"] = self._generate_cmo_signal(period)
 
         # DeMarker
         period = TECHNICAL_INDICATORS["반대매매 지표"]["DeMarker"]["period"]
-        self.signals_df[f"DeMarker({period})_Signal"] = self._generate_demarker_signal(
+        self._columns[f"DeMarker({period})_Signal"] = self._generate_demarker_signal(
             period
         )
 
         # Donchian
         period = TECHNICAL_INDICATORS["반대매매 지표"]["Donchian"]["period"]
-        self.signals_df[f"Donchian({period})_Signal"] = self._generate_donchian_signal(
+        self._columns[f"Donchian({period})_Signal"] = self._generate_donchian_signal(
             period
         )
 
         # Pivot
         method = TECHNICAL_INDICATORS["반대매매 지표"]["Pivot"]["method"]
-        self.signals_df[f"Pivot({method})_Signal"] = self._generate_pivot_signal(method)
+        self._columns[f"Pivot({method})_Signal"] = self._generate_pivot_signal(method)
 
         # PSY
         period = TECHNICAL_INDICATORS["반대매매 지표"]["PSY"]["period"]
-        self.signals_df[f"PSY({period})_Signal"] = self._generate_psy_signal(period)
+        self._columns[f"PSY({period})_Signal"] = self._generate_psy_signal(period)
 
         # NPSY
         period = TECHNICAL_INDICATORS["반대매매 지표"]["NPSY"]["period"]
-        self.signals_df[f"NPSY({period})_Signal"] = self._generate_npsy_signal(period)
+        self._columns[f"NPSY({period})_Signal"] = self._generate_npsy_signal(period)
+
+    def _generate_relative_signals(self) -> None:
+        """기준 지수 대비 상대강도 지표 기반 시그널을 생성합니다."""
+        rs_period = RELATIVE_INDICATORS["RS"]["period"]
+        if f"RS({rs_period})" not in self.indicators_df:
+            return
+
+        # RS
+        self._columns[f"RS({rs_period})_Signal"] = self._generate_rs_signal(rs_period)
+
+        # Beta
+        period = RELATIVE_INDICATORS["Beta"]["period"]
+        self._columns[f"Beta({period})_Signal"] = self._generate_beta_signal(period)
+
+        # Corr
+        period = RELATIVE_INDICATORS["Corr"]["period"]
+        decoupled = RELATIVE_INDICATORS["Corr"]["decoupled"]
+        self._columns[f"Corr({period})_Signal"] = self._generate_corr_signal(
+            period, decoupled, rs_period
+        )
+
+    def _thresholds(
+        self, name: str, values: pd.Series, oversold: float, overbought: float
+    ) -> Tuple[Threshold, Threshold]:
+        """지표의 과매도(매수)/과매수(매도) 임계값을 반환합니다.
+
+        ``ADAPTIVE_THRESHOLDS`` 가 켜져 있고 대상 지표이면 지표 값의 롤링 분위수를
+        사용하고, 관측 개수가 부족한 구간은 고정 임계값을 사용합니다.
+
+        Args:
+            name (str): 지표 이름 (``ADAPTIVE_THRESHOLDS["indicators"]`` 항목)
+            values (pd.Series): 지표 값 (칼럼 이름이 분위수 상태의 키)
+            oversold (float): 고정 과매도 임계값
+            overbought (float): 고정 과매수 임계값
+
+        Returns:
+            Tuple[Threshold, Threshold]: (과매도, 과매수) 임계값 (상수 또는 봉별 배열)
+        """
+        settings = ADAPTIVE_THRESHOLDS
+        if not settings["enabled"] or name not in settings["indicators"]:
+            return oversold, overbought
+
+        x = values.to_numpy(dtype=np.float64)
+        bounds = []
+        for q, fixed in (
+            (settings["lower"], oversold),
+            (settings["upper"], overbought),
+        ):
+            if self.quantiles is not None:
+                level = self.quantiles.update(str(values.name), q, x)
+            else:
+                level = rolling_quantile(
+                    x, settings["window"], q, settings["min_periods"]
+                )
+            bounds.append(np.where(np.isnan(level), fixed, level))
+        return bounds[0], bounds[1]
 
     def _generate_sma_signal(self, period: int) -> pd.Series:
         """SMA 시그널을 생성합니다.
@@ -397,15 +513,16 @@ class SignalGenerator:
         """RSI 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: RSI < 30
-        - 매도: RSI > 70
+        - 매수: RSI < 30 (적응형: 롤링 하위 분위수)
+        - 매도: RSI > 70 (적응형: 롤링 상위 분위수)
         - 중립: 그 외
         """
         rsi = self.indicators_df[f"RSI({period})"]
+        oversold, overbought = self._thresholds("RSI", rsi, 30, 70)
 
         signal = pd.Series(0, index=rsi.index)
-        signal[rsi < 30] = 1
-        signal[rsi > 70] = -1
+        signal[rsi < oversold] = 1
+        signal[rsi > overbought] = -1
 
         return signal
 
@@ -431,15 +548,16 @@ class SignalGenerator:
         """CCI 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: CCI < -100
-        - 매도: CCI > 100
+        - 매수: CCI < -100 (적응형: 롤링 하위 분위수)
+        - 매도: CCI > 100 (적응형: 롤링 상위 분위수)
         - 중립: 그 외
         """
         cci = self.indicators_df[f"CCI({period})"]
+        oversold, overbought = self._thresholds("CCI", cci, -100, 100)
 
         signal = pd.Series(0, index=cci.index)
-        signal[cci < -100] = 1
-        signal[cci > 100] = -1
+        signal[cci < oversold] = 1
+        signal[cci > overbought] = -1
 
         return signal
 
@@ -447,16 +565,18 @@ class SignalGenerator:
         """Stochastic Oscillator 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: %K < 20 and %D < 20
-        - 매도: %K > 80 and %D > 80
+        - 매수: %K < 20 and %D < 20 (적응형: 각각의 롤링 하위 분위수)
+        - 매도: %K > 80 and %D > 80 (적응형: 각각의 롤링 상위 분위수)
         - 중립: 그 외
         """
         k = self.indicators_df[f"Stoch_K({k_period})"]
         d = self.indicators_df[f"Stoch_D({k_period},{d_period})"]
+        k_oversold, k_overbought = self._thresholds("Stoch", k, 20, 80)
+        d_oversold, d_overbought = self._thresholds("Stoch", d, 20, 80)
 
         signal = pd.Series(0, index=k.index)
-        signal[(k < 20) & (d < 20)] = 1
-        signal[(k > 80) & (d > 80)] = -1
+        signal[(k < k_oversold) & (d < d_oversold)] = 1
+        signal[(k > k_overbought) & (d > d_overbought)] = -1
 
         return signal
 
@@ -464,15 +584,16 @@ class SignalGenerator:
         """Williams %R 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: Williams %R < -80
-        - 매도: Williams %R > -20
+        - 매수: Williams %R < -80 (적응형: 롤링 하위 분위수)
+        - 매도: Williams %R > -20 (적응형: 롤링 상위 분위수)
         - 중립: 그 외
         """
         williams = self.indicators_df[f"Williams({period})"]
+        oversold, overbought = self._thresholds("Williams", williams, -80, -20)
 
         signal = pd.Series(0, index=williams.index)
-        signal[williams < -80] = 1
-        signal[williams > -20] = -1
+        signal[williams < oversold] = 1
+        signal[williams > overbought] = -1
 
         return signal
 
@@ -480,15 +601,16 @@ class SignalGenerator:
         """CMO 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: CMO < -50
-        - 매도: CMO > 50
+        - 매수: CMO < -50 (적응형: 롤링 하위 분위수)
+        - 매도: CMO > 50 (적응형: 롤링 상위 분위수)
         - 중립: 그 외
         """
         cmo = self.indicators_df[f"CMO({period})"]
+        oversold, overbought = self._thresholds("CMO", cmo, -50, 50)
 
         signal = pd.Series(0, index=cmo.index)
-        signal[cmo < -50] = 1
-        signal[cmo > 50] = -1
+        signal[cmo < oversold] = 1
+        signal[cmo > overbought] = -1
 
         return signal
 
@@ -496,15 +618,16 @@ class SignalGenerator:
         """DeMarker 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: DeMarker < 0.2
-        - 매도: DeMarker > 0.8
+        - 매수: DeMarker < 0.2 (적응형: 롤링 하위 분위수)
+        - 매도: DeMarker > 0.8 (적응형: 롤링 상위 분위수)
         - 중립: 그 외
         """
         demarker = self.indicators_df[f"DeMarker({period})"]
+        oversold, overbought = self._thresholds("DeMarker", demarker, 0.2, 0.8)
 
         signal = pd.Series(0, index=demarker.index)
-        signal[demarker < 0.2] = 1
-        signal[demarker > 0.8] = -1
+        signal[demarker < oversold] = 1
+        signal[demarker > overbought] = -1
 
         return signal
 
@@ -548,15 +671,16 @@ class SignalGenerator:
         """Psychological Line 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: PSY < 30
-        - 매도: PSY > 70
+        - 매수: PSY < 30 (적응형: 롤링 하위 분위수)
+        - 매도: PSY > 70 (적응형: 롤링 상위 분위수)
         - 중립: 그 외
         """
         psy = self.indicators_df[f"PSY({period})"]
+        oversold, overbought = self._thresholds("PSY", psy, 30, 70)
 
         signal = pd.Series(0, index=psy.index)
-        signal[psy < 30] = 1
-        signal[psy > 70] = -1
+        signal[psy < oversold] = 1
+        signal[psy > overbought] = -1
 
         return signal
 
@@ -564,27 +688,98 @@ class SignalGenerator:
         """Negative Psychological Line 시그널을 생성합니다.
 
         시그널 생성 로직:
-        - 매수: NPSY < 30
-        - 매도: NPSY > 70
+        - 매수: NPSY < 30 (적응형: 롤링 하위 분위수)
+        - 매도: NPSY > 70 (적응형: 롤링 상위 분위수)
         - 중립: 그 외
         """
         npsy = self.indicators_df[f"NPSY({period})"]
+        oversold, overbought = self._thresholds("NPSY", npsy, 30, 70)
 
         signal = pd.Series(0, index=npsy.index)
-        signal[npsy < 30] = 1
-        signal[npsy > 70] = -1
+        signal[npsy < oversold] = 1
+        signal[npsy > overbought] = -1
 
         return signal
 
+    def _generate_rs_signal(self, period: int) -> pd.Series:
+        """상대강도 시그널을 생성합니다.
+
+        시그널 생성 로직:
+        - 매수: RS > 0 (기간 수익률이 기준 지수보다 높음)
+        - 매도: RS < 0
+        - 중립: 그 외
+        """
+        rs = self.indicators_df[f"RS({period})"]
+
+        signal = pd.Series(0, index=rs.index)
+        signal[rs > 0] = 1
+        signal[rs < 0] = -1
+
+        return signal
+
+    def _generate_beta_signal(self, period: int) -> pd.Series:
+        """베타 조정 초과 수익률(알파) 시그널을 생성합니다.
+
+        시그널 생성 로직:
+        - 매수: Alpha > 0 (베타로 설명되는 수익률보다 높음)
+        - 매도: Alpha < 0
+        - 중립: 그 외
+        """
+        alpha = self.indicators_df[f"Alpha({period})"]
+
+        signal = pd.Series(0, index=alpha.index)
+        signal[alpha > 0] = 1
+        signal[alpha < 0] = -1
+
+        return signal
+
+    def _generate_corr_signal(
+        self, period: int, decoupled: float, rs_period: int
+    ) -> pd.Series:
+        """상관계수 시그널을 생성합니다.
+
+        시그널 생성 로직:
+        - 매수: Corr < decoupled and RS > 0 (지수와 따로 움직이며 강세)
+        - 매도: Corr < decoupled and RS < 0 (지수와 따로 움직이며 약세)
+        - 중립: 그 외
+        """
+        corr = self.indicators_df[f"Corr({period})"]
+        rs = self.indicators_df[f"RS({rs_period})"]
+
+        signal = pd.Series(0, index=corr.index)
+        signal[(corr < decoupled) & (rs > 0)] = 1
+        signal[(corr < decoupled) & (rs < 0)] = -1
+
+        return signal
+
+    def calculate_score(self) -> pd.Series:
+        """``SIGNAL_WEIGHTS`` 가중 평균으로 종합 시그널 점수를 계산합니다.
+
+        Returns:
+            pd.Series: 날짜별 종합 점수 (-1 ~ 1)
+        """
+        columns = [c for c in self.signals_df.columns if c.endswith("_Signal")]
+        weights = signal_weight_vector(columns)
+        score = self.signals_df[columns].to_numpy() @ weights / weights.sum()
+        return pd.Series(score, index=self.signals_df.index, name="Score")
+
     def save_signals(self) -> None:
-        """시그널을 파일로 저장합니다."""
+        """시그널을 파일로 저장합니다.
+
+        ``SIGNAL_EVENT_SETTINGS`` 에 따라 전환 이벤트를 이어 쓰고, 날짜별 전체 시그널
+        파일을 저장합니다.
+        """
         try:
-            # 디렉토리가 없으면 생성
-            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            if SIGNAL_EVENT_SETTINGS["enabled"]:
+                append_signal_events(self.signals_df, self.events_file)
+
+            if SIGNAL_EVENT_SETTINGS["write_dense"]:
+                # 디렉토리가 없으면 생성
+                self.output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # 저장
-            self.signals_df.to_csv(self.output_file, index=False)
-            logger.info(f"매매 시그널 저장 완료: {self.output_file}")
+                # 저장
+                self.signals_df.to_csv(self.output_file, index=False)
+                logger.info(f"매매 시그널 저장 완료: {self.output_file}")
 
         except Exception as e:
             logger.error(f"매매 시그널 저장 실패: {str(e)}")
@@ -0,0 +1,203 @@
+"""
+OHLCV 파티션 저장소 모듈
+
+가격 데이터를 심볼/연도 단위 파티션 파일로 저장합니다.
+
+    {root}/{symbol}/{year}.csv   연도별 OHLCV 데이터
+    {root}/{symbol}/index.json   파티션별 시작일, 종료일, 행 수
+
+업데이트는 새 봉이 속한 파티션만 다시 쓰므로 비용이 전체 이력이 아닌 새 봉 수에 비례합니다.
+모든 파일은 임시 파일에 쓴 뒤 ``os.replace`` 로 교체하여, 쓰기 도중 중단되어도
+기존 파일이 손상되지 않습니다.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.settings import STORE_DIR
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+INDEX_FILE = "index.json"
+
+
+def atomic_write_csv(df: pd.DataFrame, path: Path) -> None:
+    """데이터프레임을 임시 파일에 쓴 뒤 원자적으로 교체합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            df.to_csv(f, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def atomic_write_json(payload: Dict, path: Path) -> None:
+    """JSON을 임시 파일에 쓴 뒤 원자적으로 교체합니다."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class OHLCVStore:
+    """심볼/연도 파티션 OHLCV 저장소 클래스"""
+
+    def __init__(self, root: Path = STORE_DIR):
+        """
+        Args:
+            root (Path): 저장소 루트 디렉토리
+        """
+        self.root = Path(root)
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self.root / symbol
+
+    def _partition_file(self, symbol: str, year: int) -> Path:
+        return self._symbol_dir(symbol) / f"{year}.csv"
+
+    def index(self, symbol: str) -> Dict[str, Dict]:
+        """심볼의 파티션 인덱스를 반환합니다. 저장된 데이터가 없으면 빈 딕셔너리입니다."""
+        path = self._symbol_dir(symbol) / INDEX_FILE
+        if not path.exists():
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def symbols(self) -> List[str]:
+        """저장된 심볼 목록을 반환합니다."""
+        if not self.root.exists():
+            return []
+        return sorted(p.parent.name for p in self.root.glob(f"*/{INDEX_FILE}"))
+
+    def last_date(self, symbol: str) -> Optional[pd.Timestamp]:
+        """심볼의 마지막 저장 날짜를 반환합니다."""
+        index = self.index(symbol)
+        if not index:
+            return None
+        return pd.Timestamp(index[max(index, key=int)]["last"])
+
+    def _read_partition(self, symbol: str, year: int) -> pd.DataFrame:
+        path = self._partition_file(symbol, year)
+        if not path.exists():
+            return pd.DataFrame()
+        df = pd.read_csv(path, float_precision="round_trip")
+        df["Date"] = pd.to_datetime(df["Date"])
+        return df
+
+    def upsert(self, symbol: str, df: pd.DataFrame) -> pd.DataFrame:
+        """새 봉을 저장소에 반영합니다.
+
+        같은 날짜의 기존 봉은 새 값으로 교체됩니다. 새 봉이 속한 연도 파티션만
+        다시 쓰고, 모든 파티션을 쓴 뒤 인덱스를 교체합니다.
+
+        Args:
+            symbol (str): 심볼
+            df (pd.DataFrame): Date, Open, High, Low, Close, Volume 칼럼의 데이터
+
+        Returns:
+            pd.DataFrame: 새로 추가되었거나 값이 바뀐 봉 (날짜순)
+        """
+        try:
+            if df.empty:
+                return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+            bars = df[OHLCV_COLUMNS].copy()
+            bars["Date"] = pd.to_datetime(bars["Date"])
+            bars = bars.drop_duplicates(subset=["Date"], keep="last")
+
+            index = self.index(symbol)
+            changed = []
+            for year, new in bars.groupby(bars["Date"].dt.year):
+                existing = self._read_partition(symbol, year)
+                if existing.empty:
+                    merged = delta = new
+                else:
+                    # 기존과 값이 같은 봉은 변경으로 보지 않음
+                    before = existing.set_index("Date")
+                    after = new.set_index("Date")
+                    common = after.index.intersection(before.index)
+                    same = (after.loc[common] == before.loc[common]).all(axis=1)
+                    delta = new[~new["Date"].isin(same[same].index)]
+                    if delta.empty:
+                        continue
+                    merged = pd.concat([existing, delta], ignore_index=True)
+                    merged = merged.drop_duplicates(subset=["Date"], keep="last")
+
+                if not merged["Date"].is_monotonic_increasing:
+                    merged = merged.sort_values("Date")
+                out = merged.assign(Date=merged["Date"].dt.strftime("%Y-%m-%d"))
+                atomic_write_csv(out, self._partition_file(symbol, year))
+                index[str(year)] = {
+                    "first": out["Date"].iloc[0],
+                    "last": out["Date"].iloc[-1],
+                    "rows": len(out),
+                }
+                changed.append(delta)
+
+            if not changed:
+                return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+            atomic_write_json(index, self._symbol_dir(symbol) / INDEX_FILE)
+            delta = pd.concat(changed, ignore_index=True).sort_values("Date")
+            logger.info(f"{symbol} 저장소 반영 완료: {len(delta)}개 봉 변경")
+            return delta.reset_index(drop=True)
+
+        except Exception as e:
+            logger.error(f"{symbol} 저장소 반영 실패: {str(e)}")
+            raise
+
+    def read(
+        self,
+        symbol: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """기간에 겹치는 파티션만 읽어 OHLCV 데이터를 반환합니다.
+
+        Args:
+            symbol (str): 심볼
+            start (Optional[str]): 시작 날짜 (포함)
+            end (Optional[str]): 종료 날짜 (포함)
+
+        Returns:
+            pd.DataFrame: 날짜순 OHLCV 데이터
+        """
+        start_ts = pd.Timestamp(start) if start is not None else None
+        end_ts = pd.Timestamp(end) if end is not None else None
+
+        frames = []
+        for year, meta in sorted(self.index(symbol).items(), key=lambda x: int(x[0])):
+            if start_ts is not None and pd.Timestamp(meta["last"]) < start_ts:
+                continue
+            if end_ts is not None and pd.Timestamp(meta["first"]) > end_ts:
+                continue
+            frames.append(self._read_partition(symbol, int(year)))
+
+        if not frames:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        df = pd.concat(frames, ignore_index=True)
+        if start_ts is not None:
+            df = df[df["Date"] >= start_ts]
+        if end_ts is not None:
+            df = df[df["Date"] <= end_ts]
+        return df.reset_index(drop=True)
@@ -0,0 +1,351 @@
+"""
+스트리밍 봉 수집 모듈
+
+틱 소스에서 들어오는 체결을 asyncio 파이프라인으로 OHLCV 봉으로 집계하고,
+완성된 봉마다 기술적 지표와 매매 시그널을 계산합니다.
+단계 사이는 크기가 제한된 큐로 연결되어, 뒤 단계가 느리면 앞 단계가 대기합니다(백프레셔).
+
+파이프라인:
+    TickSource -> [tick 큐] -> BarAggregator -> [bar 큐] -> 지표/시그널 계산 -> 콜백, 스크리너
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.rolling_stats import RollingQuantiles
+from src.screener import Screener
+from src.settings import ADAPTIVE_THRESHOLDS, SCREENER_SETTINGS, STREAMING_SETTINGS
+from src.signal_generator import SignalGenerator
+from src.technical_indicator import CUMULATIVE_PREFIXES, TechnicalIndicator
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class Tick(NamedTuple):
+    """체결 틱"""
+
+    timestamp: pd.Timestamp
+    price: float
+    size: float
+
+
+class Bar(NamedTuple):
+    """완성된 OHLCV 봉"""
+
+    date: pd.Timestamp
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    completed_at: float  # 봉이 완성된 시각 (time.perf_counter)
+
+
+class TickSource(ABC):
+    """틱 소스 인터페이스"""
+
+    @abstractmethod
+    def ticks(self) -> AsyncIterator[Tick]:
+        """틱을 순서대로 생성하는 비동기 이터레이터를 반환합니다."""
+
+
+class ReplaySource(TickSource):
+    """CSV/Parquet 파일을 재생하는 틱 소스 (실시간 피드 대체용)
+
+    파일에 ``Price`` 칼럼이 있으면 틱 데이터로, 없으면 OHLCV 봉 데이터로 간주합니다.
+    봉 데이터는 봉마다 시가 → 저가/고가 → 종가 순서의 4개 틱으로 분해합니다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        speed: float = STREAMING_SETTINGS["speed"],
+        data: Optional[pd.DataFrame] = None,
+    ):
+        """
+        Args:
+            path (Path): 재생할 CSV 또는 Parquet 파일
+            speed (float): 재생 배속 (타임스탬프 간격 / speed 만큼 대기).
+                0 이하이면 대기 없이 최대 속도로 재생합니다.
+            data (Optional[pd.DataFrame]): 이미 읽은 파일 데이터 (예: 워밍업 구간을 뺀
+                나머지). 주어지면 파일을 다시 읽지 않고 이 데이터를 재생합니다.
+        """
+        self.path = Path(path)
+        self.speed = speed
+        self.data = data
+
+    @staticmethod
+    def read(path: Path) -> pd.DataFrame:
+        """확장자에 따라 CSV 또는 Parquet 파일을 읽습니다."""
+        path = Path(path)
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path)
+        return pd.read_csv(path)
+
+    def _read(self) -> pd.DataFrame:
+        """재생할 데이터를 반환합니다."""
+        return self.data if self.data is not None else self.read(self.path)
+
+    def _to_ticks(self, df: pd.DataFrame) -> pd.DataFrame:
+        """파일 데이터를 Timestamp, Price, Size 칼럼의 틱 데이터로 변환합니다."""
+        time_column = "Timestamp" if "Timestamp" in df.columns else "Date"
+        timestamps = pd.to_datetime(df[time_column])
+
+        if "Price" in df.columns:
+            size = df["Size"] if "Size" in df.columns else 0.0
+            return pd.DataFrame(
+                {"Timestamp": timestamps, "Price": df["Price"], "Size": size}
+            )
+
+        # 봉 분해: 상승봉은 O-L-H-C, 하락봉은 O-H-L-C 순서
+        up = (df["Close"] >= df["Open"]).to_numpy()
+        second = np.where(up, df["Low"], df["High"])
+        third = np.where(up, df["High"], df["Low"])
+        prices = np.column_stack([df["Open"], second, third, df["Close"]])
+
+        # 봉 시각부터 다음 봉 전까지 4등분한 시각에 배치
+        # (주말/휴장일로 간격이 벌어져도 한 봉의 틱이 같은 주기에 머물도록 중앙값으로 제한)
+        interval = timestamps.diff().median()
+        step = timestamps.diff().shift(-1).fillna(interval).clip(upper=interval)
+        offsets = np.arange(4) / 4
+        stamps = timestamps.to_numpy()[:, None] + step.to_numpy()[:, None] * offsets
+        sizes = np.repeat(df["Volume"].to_numpy()[:, None] / 4, 4, axis=1)
+        return pd.DataFrame(
+            {
+                "Timestamp": stamps.ravel(),
+                "Price": prices.ravel(),
+                "Size": sizes.ravel(),
+            }
+        )
+
+    async def ticks(self) -> AsyncIterator[Tick]:
+        ticks = self._to_ticks(self._read())
+        previous = None
+        for row in ticks.itertuples(index=False):
+            if self.speed > 0 and previous is not None:
+                await asyncio.sleep(
+                    (row.Timestamp - previous).total_seconds() / self.speed
+                )
+            previous = row.Timestamp
+            yield Tick(row.Timestamp, float(row.Price), float(row.Size))
+
+
+class BarAggregator:
+    """틱을 고정 주기 OHLCV 봉으로 집계하는 클래스"""
+
+    def __init__(self, freq: str = STREAMING_SETTINGS["freq"]):
+        """
+        Args:
+            freq (str): 봉 주기 (pandas 오프셋 문자열, 예: "D", "5min")
+        """
+        self.freq = freq
+        self._period: Optional[pd.Timestamp] = None
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = 0.0
+
+    def add(self, tick: Tick) -> Optional[Bar]:
+        """틱을 반영하고, 새 주기가 시작되어 이전 봉이 완성되면 그 봉을 반환합니다."""
+        period = tick.timestamp.floor(self.freq)
+        completed = None
+        if self._period is not None and period != self._period:
+            completed = self.flush()
+
+        if self._period is None:
+            self._period = period
+            self._open = self._high = self._low = tick.price
+            self._volume = 0.0
+        self._high = max(self._high, tick.price)
+        self._low = min(self._low, tick.price)
+        self._close = tick.price
+        self._volume += tick.size
+        return completed
+
+    def flush(self) -> Optional[Bar]:
+        """진행 중인 봉을 완성하여 반환합니다."""
+        if self._period is None:
+            return None
+        bar = Bar(
+            self._period,
+            self._open,
+            self._high,
+            self._low,
+            self._close,
+            self._volume,
+            time.perf_counter(),
+        )
+        self._period = None
+        return bar
+
+
+class StreamingPipeline:
+    """스트리밍 봉 → 지표 → 시그널 파이프라인 클래스"""
+
+    def __init__(
+        self,
+        source: TickSource,
+        history: Optional[pd.DataFrame] = None,
+        freq: str = STREAMING_SETTINGS["freq"],
+        window: int = STREAMING_SETTINGS["window"],
+        queue_size: int = STREAMING_SETTINGS["queue_size"],
+        on_signal: Optional[Callable[[Bar, Dict[str, int]], None]] = None,
+        screener: Optional[Screener] = None,
+        symbol: str = SCREENER_SETTINGS["symbol"],
+    ):
+        """
+        Args:
+            source (TickSource): 틱 소스
+            history (Optional[pd.DataFrame]): 지표 워밍업용 과거 OHLCV 데이터
+            freq (str): 봉 주기
+            window (int): 봉마다 지표를 재계산할 최근 봉 개수
+            queue_size (int): 단계 간 큐의 최대 크기
+            on_signal (Optional[Callable]): 봉마다 (봉, 시그널) 으로 호출되는 콜백
+            screener (Optional[Screener]): 봉마다 최신 지표와 시그널을 반영할 스크리너
+            symbol (str): 스크리너에 기록할 심볼 이름
+        """
+        self.source = source
+        self.aggregator = BarAggregator(freq)
+        self.window = window
+        self.queue_size = queue_size
+        self.on_signal = on_signal
+        self.screener = screener
+        self.symbol = symbol
+        self.latencies: List[float] = []
+        self.bars_processed = 0
+
+        self._history = pd.DataFrame()
+        self._last_indicators: Optional[pd.Series] = None
+        # 적응형 임계값의 롤링 분위수 상태 (봉 사이에 유지)
+        self._quantiles: Optional[RollingQuantiles] = None
+        if ADAPTIVE_THRESHOLDS["enabled"]:
+            self._quantiles = RollingQuantiles(
+                ADAPTIVE_THRESHOLDS["window"], ADAPTIVE_THRESHOLDS["min_periods"]
+            )
+        if history is not None and not history.empty:
+            self._warm_up(history)
+
+    def _warm_up(self, history: pd.DataFrame) -> None:
+        """과거 데이터 전체로 지표를 계산하여 누적 지표의 기준 수준을 잡습니다."""
+        history = history[["Date"] + OHLCV_COLUMNS].copy()
+        history["Date"] = pd.to_datetime(history["Date"])
+        indicator = TechnicalIndicator(df=history)
+        indicator.calculate_all()
+        self._last_indicators = indicator.indicators_df.iloc[-1]
+        self._history = history.tail(self.window).reset_index(drop=True)
+        if self._quantiles is not None:
+            # 과거 지표 값으로 분위수 창을 채움
+            SignalGenerator(
+                indicators_df=indicator.indicators_df, quantiles=self._quantiles
+            ).generate_all()
+
+    def _compute_bar(self, bar: Bar) -> Dict[str, int]:
+        """새 봉을 반영하여 최근 구간의 지표를 재계산하고 시그널을 반환합니다."""
+        row = pd.DataFrame(
+            [[bar.date, bar.open, bar.high, bar.low, bar.close, bar.volume]],
+            columns=["Date"] + OHLCV_COLUMNS,
+        )
+        if self._history.empty:
+            frame = row
+        else:
+            frame = pd.concat([self._history, row], ignore_index=True)
+            frame = frame.tail(self.window).reset_index(drop=True)
+
+        indicator = TechnicalIndicator(df=frame)
+        indicator.calculate_all()
+        indicators = indicator.indicators_df
+        latest = indicators.iloc[-1].copy()
+
+        # 누적 지표는 직전 봉 값이 이전 계산과 같아지도록 수준 보정
+        if self._last_indicators is not None and len(indicators) > 1:
+            previous = indicators.iloc[-2]
+            for column in indicators.columns:
+                if column.startswith(CUMULATIVE_PREFIXES):
+                    latest[column] += self._last_indicators[column] - previous[column]
+
+        generator = SignalGenerator(
+            indicators_df=latest.to_frame().T.infer_objects(), quantiles=self._quantiles
+        )
+        generator.generate_all()
+        signals = generator.signals_df.drop(columns=["Date"]).iloc[0]
+
+        self._history = frame
+        self._last_indicators = latest
+        signals = {column: int(value) for column, value in signals.items()}
+        if self.screener is not None:
+            values = latest.drop(labels="Date").to_dict()
+            values.update(signals)
+            self.screener.update(self.symbol, bar.date, values)
+        return signals
+
+    async def _produce(self, ticks: asyncio.Queue) -> None:
+        """소스의 틱을 큐에 넣습니다. 큐가 가득 차면 대기합니다."""
+        async for tick in self.source.ticks():
+            await ticks.put(tick)
+        await ticks.put(None)
+
+    async def _aggregate(self, ticks: asyncio.Queue, bars: asyncio.Queue) -> None:
+        """틱을 봉으로 집계하여 완성된 봉을 큐에 넣습니다."""
+        while True:
+            tick = await ticks.get()
+            if tick is None:
+                break
+            bar = self.aggregator.add(tick)
+            if bar is not None:
+                await bars.put(bar)
+        bar = self.aggregator.flush()
+        if bar is not None:
+            await bars.put(bar)
+        await bars.put(None)
+
+    async def _evaluate(self, bars: asyncio.Queue) -> None:
+        """완성된 봉마다 지표와 시그널을 계산하고 지연 시간을 기록합니다."""
+        while True:
+            bar = await bars.get()
+            if bar is None:
+                break
+            # 계산은 스레드에서 수행하여 이벤트 루프가 수집을 계속하도록 함
+            signals = await asyncio.to_thread(self._compute_bar, bar)
+            self.latencies.append(time.perf_counter() - bar.completed_at)
+            self.bars_processed += 1
+            if self.on_signal is not None:
+                self.on_signal(bar, signals)
+
+    async def run(self) -> Dict[str, float]:
+        """소스가 끝날 때까지 파이프라인을 실행합니다.
+
+        Returns:
+            Dict[str, float]: 봉→시그널 지연 시간 백분위 보고서
+        """
+        ticks: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        bars: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        await asyncio.gather(
+            self._produce(ticks),
+            self._aggregate(ticks, bars),
+            self._evaluate(bars),
+        )
+        report = self.latency_report()
+        logger.info(
+            f"스트리밍 완료: {self.bars_processed}개 봉, "
+            f"지연 p50={report['p50_ms']:.1f}ms p99={report['p99_ms']:.1f}ms"
+        )
+        return report
+
+    def latency_report(self) -> Dict[str, float]:
+        """봉 완성부터 시그널 산출까지의 지연 시간 백분위를 반환합니다 (밀리초)."""
+        values = np.array(self.latencies or [0.0]) * 1000
+        p50, p90, p99 = np.percentile(values, [50, 90, 99])
+        return {
+            "count": len(self.latencies),
+            "p50_ms": float(p50),
+            "p90_ms": float(p90),
+            "p99_ms": float(p99),
+            "max_ms": float(values.max()),
+        }
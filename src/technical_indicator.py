@@ -4,16 +4,67 @@
 이 모듈은 주가 데이터로부터 다양한 기술적 지표를 계산합니다.
 """
 
+import copy
 import logging
+import sys
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-
-from src.settings import INDICATORS_FILE, SPY_DATA_FILE, TECHNICAL_INDICATORS
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.column_block import ColumnBlock
+from src.compact import compact_enabled, downcast_floats
+from src.expression import evaluate_formulas
+from src.indicator_cache import DataFingerprint, IndicatorCache, source_version
+from src.loader import OHLCV_COLUMNS, read_ohlcv
+from src.lookback import CUMULATIVE_INDICATORS, max_lookback
+from src.relative_strength import align_benchmark, relative_columns
+from src.settings import (
+    CUSTOM_INDICATORS,
+    INDICATOR_CACHE_SETTINGS,
+    INDICATOR_EXECUTOR_SETTINGS,
+    INDICATORS_FILE,
+    RELATIVE_INDICATORS,
+    SPY_DATA_FILE,
+    TECHNICAL_INDICATORS,
+)
+from src.validator import validate_ohlcv
 
 logger = logging.getLogger(__name__)
 
+# 누적합 기반 지표 칼럼 접두사. 부분 구간만 재계산하면 전체 계산과 상수만큼
+# 차이가 나므로 직전 값을 기준으로 수준(level)을 보정해야 합니다.
+CUMULATIVE_PREFIXES = ("ADL(", "ADL_SMA(", "Aroon_Up(", "Aroon_Down(")
+
+# 지표 계열: (이름, 계산 메서드 이름, 인자). 계열끼리는 서로의 결과를 읽지 않습니다.
+Family = Tuple[str, str, Tuple[Any, ...]]
+
+
+def mean_absolute_deviation(
+    values: np.ndarray, period: int, block: int = 65536
+) -> np.ndarray:
+    """롤링 평균 절대 편차 ``mean(|x - mean(x)|)`` 를 계산합니다.
+
+    ``rolling().apply`` 와 같은 연산 순서로 창 평균과 편차 평균을 구하므로 결과가 같고,
+    임시 배열이 (block, period) 크기를 넘지 않도록 구간별로 나누어 계산합니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(len(values), np.nan)
+    if len(values) < period:
+        return result
+    windows = sliding_window_view(values, period)
+    for start in range(0, len(windows), block):
+        chunk = windows[start:][:block]
+        deviation = np.abs(chunk - chunk.mean(axis=1, keepdims=True))
+        first = start + period - 1
+        last = first + len(chunk)
+        result[first:last] = deviation.mean(axis=1)
+    return result
+
 
 class TechnicalIndicator:
     """기술적 지표 계산 클래스"""
@@ -22,40 +73,117 @@ class TechnicalIndicator:
         self,
         data_file: Path = SPY_DATA_FILE,
         output_file: Path = INDICATORS_FILE,
+        df: Optional[pd.DataFrame] = None,
+        carry: Optional[Dict[str, Any]] = None,
+        halo: int = 0,
+        max_workers: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        benchmark: Optional[pd.DataFrame] = None,
     ):
         """
         Args:
             data_file (Path): OHLCV 데이터 파일 경로
             output_file (Path): 출력 파일 경로
+            df (Optional[pd.DataFrame]): 메모리에 있는 OHLCV 데이터.
+                주어지면 파일을 읽지 않고 이 데이터를 사용합니다.
+            carry (Optional[Dict[str, Any]]): 이전 청크의 재귀 상태 (``carry_out``)
+            halo (int): df 앞부분 중 이전 청크에서 가져온 후광(halo) 봉 개수.
+                carry가 있으면 후광 마지막 봉의 상태에서 이어서 계산합니다.
+            max_workers (Optional[int]): 지표 계열을 동시에 계산할 스레드 수
+                (기본값: ``INDICATOR_EXECUTOR_SETTINGS["max_workers"]``, 1이면 순차 계산)
+            use_cache (Optional[bool]): 지표 캐시 사용 여부 (기본값: 파일에서 읽은
+                데이터이고 ``INDICATOR_CACHE_SETTINGS["enabled"]`` 이면 사용)
+            benchmark (Optional[pd.DataFrame]): 기준 지수 OHLCV 데이터. 주어지면
+                상대강도 지표(``RELATIVE_INDICATORS``)도 계산합니다.
         """
         self.data_file = data_file
         self.output_file = output_file
         self.df = None
         self.indicators_df = None
-        self._load_data()
+        self._columns: Optional[ColumnBlock] = None
+        self.carry = carry or {}
+        self.halo = halo
+        self.carry_out: Dict[str, Any] = {}
+        self.benchmark = benchmark
+        self.max_workers = (
+            INDICATOR_EXECUTOR_SETTINGS["max_workers"]
+            if max_workers is None
+            else max_workers
+        )
+        if use_cache is None:
+            use_cache = INDICATOR_CACHE_SETTINGS["enabled"] and df is None
+        self.cache: Optional[IndicatorCache] = (
+            IndicatorCache(version=source_version(sys.modules[__name__]))
+            if use_cache
+            else None
+        )
+        self._fingerprint: Optional[DataFingerprint] = None
+        if df is None:
+            self._load_data()
+        else:
+            self.df = df.reset_index(drop=True)
 
     def _load_data(self) -> None:
         """데이터를 로드합니다."""
         try:
-            self.df = pd.read_csv(self.data_file)
-            self.df["Date"] = pd.to_datetime(self.df["Date"])
+            self.df = read_ohlcv(self.data_file)
+            validate_ohlcv(self.df, source=self.data_file.name)
             logger.info("OHLCV 데이터 로드 완료")
         except Exception as e:
             logger.error(f"OHLCV 데이터 로드 실패: {str(e)}")
             raise
 
+    def _ewm(self, series: pd.Series, span: int, key: str) -> pd.Series:
+        """adjust=False 지수 이동평균을 계산하고 마지막 값을 재귀 상태로 남깁니다.
+
+        이전 청크 상태가 있으면 후광 마지막 봉의 값을 그 상태로 두고 이어서 계산합니다.
+        adjust=False EMA는 첫 관측값에서 시작하므로 전체 구간 계산과 같은 순서의 연산이
+        됩니다.
+        """
+        if key in self.carry:
+            position = self.halo - 1
+            values = series.to_numpy(dtype=np.float64, copy=True)
+            values[:position] = np.nan
+            values[position] = self.carry[key]
+            series = pd.Series(values, index=series.index)
+        ema = series.ewm(span=span, adjust=False).mean()
+        self.carry_out[key] = ema.iloc[-1]
+        return ema
+
+    def _cumsum(self, series: pd.Series, key: str) -> pd.Series:
+        """누적합을 계산하고 마지막 후광 길이만큼의 값을 재귀 상태로 남깁니다.
+
+        이전 청크 상태가 있으면 후광 구간은 이전 청크의 누적합을 그대로 쓰고,
+        이후는 후광 마지막 누적합에서 이어서 더합니다.
+        """
+        if key in self.carry:
+            halo = self.halo
+            history = self.carry[key]
+            tail = series.to_numpy()[halo:]
+            continued = pd.Series(np.concatenate([history[-1:], tail])).cumsum()
+            total = pd.Series(
+                np.concatenate([history[-halo:-1], continued.to_numpy()]),
+                index=series.index,
+            )
+        else:
+            total = series.cumsum()
+        keep = max_lookback()
+        self.carry_out[key] = total.to_numpy()[-keep:]
+        return total
+
+    def reset_columns(self, leading: Optional[Dict[str, np.ndarray]] = None) -> None:
+        """지표 칼럼을 채울 블록을 새로 할당합니다 (leading: 앞에 둘 칼럼)."""
+        self._columns = ColumnBlock(len(self.df), leading=leading)
+
     def calculate_all(self) -> None:
         """모든 기술적 지표를 계산합니다."""
         try:
-            # 지표 데이터프레임 초기화
-            self.indicators_df = pd.DataFrame({"Date": self.df["Date"]})
-
-            # OHLCV 데이터 추가
-            self.indicators_df["Open"] = self.df["Open"]
-            self.indicators_df["High"] = self.df["High"]
-            self.indicators_df["Low"] = self.df["Low"]
-            self.indicators_df["Close"] = self.df["Close"]
-            self.indicators_df["Volume"] = self.df["Volume"]
+            # 지표 칼럼 블록 초기화 (OHLCV 칼럼을 앞에 두어 지표와 같은 블록에 넣음)
+            self.reset_columns(
+                leading={name: self.df[name].to_numpy() for name in OHLCV_COLUMNS}
+            )
+            if self.cache is not None:
+                self._fingerprint = DataFingerprint(self.df)
 
             # 모멘텀 지표 계산
             self._calculate_momentum_indicators()
@@ -63,116 +191,306 @@ class TechnicalIndicator:
             # 반대매매 지표 계산
             self._calculate_contrarian_indicators()
 
-            # 지표 정렬
-            self.indicators_df = self.indicators_df.sort_values("Date")
+            # 상대강도 지표 계산 (기준 지수 데이터가 있을 때만)
+            self._calculate_relative_indicators()
+
+            # 사용자 정의 지표 계산 (내장 지표 칼럼 재사용)
+            self._calculate_custom_indicators()
+
+            # 칼럼 블록으로 데이터프레임을 한 번에 생성
+            self.indicators_df = self._columns.to_frame(index=self.df.index)
+
+            # 지표 정렬 (이미 날짜순이면 생략)
+            if not self.indicators_df["Date"].is_monotonic_increasing:
+                self.indicators_df = self.indicators_df.sort_values("Date")
+
+            # 메모리 절약 모드: 허용 오차 안의 지표 칼럼만 float32로 보관
+            if compact_enabled():
+                self.indicators_df, _ = downcast_floats(
+                    self.indicators_df, exclude=OHLCV_COLUMNS
+                )
+            if self.cache is not None:
+                self.cache.flush()
+                logger.info(f"지표 캐시: {self.cache.summary()}")
             logger.info("기술적 지표 계산 완료")
 
         except Exception as e:
             logger.error(f"기술적 지표 계산 실패: {str(e)}")
             raise
 
-    def _calculate_momentum_indicators(self) -> None:
-        """모멘텀 지표를 계산합니다."""
-        # SMA
-        for period in TECHNICAL_INDICATORS["모멘텀 지표"]["SMA"]["periods"]:
-            self.indicators_df[f"SMA_({period})"] = self._calculate_sma(period)
-
-        # EMA
-        for period in TECHNICAL_INDICATORS["모멘텀 지표"]["EMA"]["periods"]:
-            self.indicators_df[f"EMA_({period})"] = self._calculate_ema(period)
-
-        # TSI
-        short_period = TECHNICAL_INDICATORS["모멘텀 지표"]["TSI"]["short_period"]
-        long_period = TECHNICAL_INDICATORS["모멘텀 지표"]["TSI"]["long_period"]
-        self._calculate_tsi(short_period, long_period)
-
-        # MACD
-        short_period = TECHNICAL_INDICATORS["모멘텀 지표"]["MACD"]["short_period"]
-        long_period = TECHNICAL_INDICATORS["모멘텀 지표"]["MACD"]["long_period"]
-        signal_period = TECHNICAL_INDICATORS["모멘텀 지표"]["MACD"]["signal_period"]
-        self._calculate_macd(short_period, long_period, signal_period)
-
-        # PSAR
-        af_start = TECHNICAL_INDICATORS["모멘텀 지표"]["PSAR"]["af_start"]
-        af_increment = TECHNICAL_INDICATORS["모멘텀 지표"]["PSAR"]["af_increment"]
-        af_max = TECHNICAL_INDICATORS["모멘텀 지표"]["PSAR"]["af_max"]
-        self.indicators_df[f"PSAR({af_start},{af_increment},{af_max})"] = (
-            self._calculate_psar(af_start, af_increment, af_max)
-        )
+    def calculate_range(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> pd.DataFrame:
+        """기간 [start, end]의 지표만 계산합니다.
 
-        # ADX
-        period = TECHNICAL_INDICATORS["모멘텀 지표"]["ADX"]["period"]
-        self._calculate_adx(period)
+        요청 구간 앞에 ``max_lookback()`` 개 봉을 워밍업으로 더 포함해 계산한 뒤
+        워밍업 구간을 잘라냅니다. 누적 지표는 전체 구간 계산의 수준에 맞춰 보정하므로
+        결과는 전체 계산과 EMA 허용 비율(``LOOKBACK_SETTINGS["tolerance"]``) 이내로
+        일치합니다.
 
-        # Aroon
-        period = TECHNICAL_INDICATORS["모멘텀 지표"]["Aroon"]["period"]
-        self._calculate_aroon(period)
+        Args:
+            start (Optional[str]): 시작 날짜 (포함, 기본값: 데이터 처음)
+            end (Optional[str]): 종료 날짜 (포함, 기본값: 데이터 끝)
 
-        # ADL
-        period = TECHNICAL_INDICATORS["모멘텀 지표"]["ADL"]["period"]
-        self._calculate_adl(period)
+        Returns:
+            pd.DataFrame: 기간 내 지표 데이터 (``indicators_df`` 에도 저장)
+        """
+        try:
+            if not self.df["Date"].is_monotonic_increasing:
+                self.df = self.df.sort_values("Date").reset_index(drop=True)
+            dates = self.df["Date"].to_numpy()
+            lo = (
+                0
+                if start is None
+                else int(np.searchsorted(dates, np.datetime64(start)))
+            )
+            hi = (
+                len(dates)
+                if end is None
+                else int(np.searchsorted(dates, np.datetime64(end), side="right"))
+            )
+            warm = max(0, lo - max_lookback())
+            offset = lo - warm
+
+            window = TechnicalIndicator(
+                self.data_file,
+                self.output_file,
+                df=self.df.iloc[warm:hi],
+                max_workers=self.max_workers,
+                benchmark=self.benchmark,
+            )
+            window.calculate_all()
+            result = window.indicators_df.iloc[offset:].reset_index(drop=True)
+
+            if warm > 0 and not result.empty:
+                # 누적 지표 수준 보정: 시작 봉의 값이 전체 구간 계산과 같아지도록 이동
+                prefix = TechnicalIndicator(
+                    self.data_file, self.output_file, df=self.df.iloc[: lo + 1]
+                )
+                prefix.reset_columns()
+                prefix._calculate_cumulative_indicators()
+                anchor = prefix._columns.to_frame().iloc[-1]
+                for column, value in anchor.items():
+                    result[column] = result[column] + (value - result[column].iloc[0])
+
+            self.indicators_df = result
+            logger.info(
+                f"기간 지표 계산 완료: {len(result)}개 봉 (워밍업 {offset}개 봉)"
+            )
+            return result
 
-        # ADR
-        period = TECHNICAL_INDICATORS["모멘텀 지표"]["ADR"]["period"]
-        self._calculate_adr(period)
+        except Exception as e:
+            logger.error(f"기간 지표 계산 실패: {str(e)}")
+            raise
 
-        # Ichimoku
-        tenkan_period = TECHNICAL_INDICATORS["모멘텀 지표"]["Ichimoku"]["tenkan_period"]
-        kijun_period = TECHNICAL_INDICATORS["모멘텀 지표"]["Ichimoku"]["kijun_period"]
-        self._calculate_ichimoku(tenkan_period, kijun_period)
+    def _calculate_cumulative_indicators(self) -> None:
+        """누적 지표(Aroon, ADL)만 계산합니다 (기간 계산의 수준 보정용)."""
+        for name in CUMULATIVE_INDICATORS:
+            period = TECHNICAL_INDICATORS["모멘텀 지표"][name]["period"]
+            getattr(self, f"_calculate_{name.lower()}")(period)
+
+    def _momentum_families(self) -> List[Family]:
+        """모멘텀 지표 계열을 칼럼 순서대로 반환합니다."""
+        params = TECHNICAL_INDICATORS["모멘텀 지표"]
+        psar = params["PSAR"]
+        psar_args = (psar["af_start"], psar["af_increment"], psar["af_max"])
+        return [
+            *(
+                (
+                    f"SMA_({period})",
+                    "_store",
+                    (f"SMA_({period})", "_calculate_sma", period),
+                )
+                for period in params["SMA"]["periods"]
+            ),
+            *(
+                (
+                    f"EMA_({period})",
+                    "_store",
+                    (f"EMA_({period})", "_calculate_ema", period),
+                )
+                for period in params["EMA"]["periods"]
+            ),
+            (
+                "TSI",
+                "_calculate_tsi",
+                (params["TSI"]["short_period"], params["TSI"]["long_period"]),
+            ),
+            (
+                "MACD",
+                "_calculate_macd",
+                (
+                    params["MACD"]["short_period"],
+                    params["MACD"]["long_period"],
+                    params["MACD"]["signal_period"],
+                ),
+            ),
+            (
+                "PSAR",
+                "_store",
+                ("PSAR({},{},{})".format(*psar_args), "_calculate_psar", *psar_args),
+            ),
+            ("ADX", "_calculate_adx", (params["ADX"]["period"],)),
+            ("Aroon", "_calculate_aroon", (params["Aroon"]["period"],)),
+            ("ADL", "_calculate_adl", (params["ADL"]["period"],)),
+            ("ADR", "_calculate_adr", (params["ADR"]["period"],)),
+            (
+                "Ichimoku",
+                "_calculate_ichimoku",
+                (
+                    params["Ichimoku"]["tenkan_period"],
+                    params["Ichimoku"]["kijun_period"],
+                ),
+            ),
+            (
+                "Keltner",
+                "_calculate_keltner",
+                (params["Keltner"]["period"], params["Keltner"]["multiplier"]),
+            ),
+        ]
+
+    def _contrarian_families(self) -> List[Family]:
+        """반대매매 지표 계열을 칼럼 순서대로 반환합니다."""
+        params = TECHNICAL_INDICATORS["반대매매 지표"]
+
+        def single(name: str) -> Family:
+            period = params[name]["period"]
+            method = f"_calculate_{name.lower()}"
+            return (name, "_store", (f"{name}({period})", method, period))
+
+        return [
+            single("RSI"),
+            ("BB", "_calculate_bb", (params["BB"]["period"], params["BB"]["std_dev"])),
+            single("CCI"),
+            (
+                "Stoch",
+                "_calculate_stoch",
+                (params["Stoch"]["k_period"], params["Stoch"]["d_period"]),
+            ),
+            single("Williams"),
+            single("CMO"),
+            single("DeMarker"),
+            ("Donchian", "_calculate_donchian", (params["Donchian"]["period"],)),
+            ("Pivot", "_calculate_pivot", (params["Pivot"]["method"],)),
+            single("PSY"),
+            single("NPSY"),
+        ]
+
+    def _store(self, column: str, method: str, *args: Any) -> None:
+        """Series를 반환하는 지표 메서드의 결과를 칼럼으로 저장합니다."""
+        self._columns[column] = getattr(self, method)(*args)
 
-        # Keltner
-        period = TECHNICAL_INDICATORS["모멘텀 지표"]["Keltner"]["period"]
-        multiplier = TECHNICAL_INDICATORS["모멘텀 지표"]["Keltner"]["multiplier"]
-        self._calculate_keltner(period, multiplier)
+    def _calculate_momentum_indicators(self) -> None:
+        """모멘텀 지표를 계산합니다."""
+        self._calculate_families(self._momentum_families())
 
     def _calculate_contrarian_indicators(self) -> None:
         """반대매매 지표를 계산합니다."""
-        # RSI
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["RSI"]["period"]
-        self.indicators_df[f"RSI({period})"] = self._calculate_rsi(period)
+        self._calculate_families(self._contrarian_families())
 
-        # BB
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["BB"]["period"]
-        std_dev = TECHNICAL_INDICATORS["반대매매 지표"]["BB"]["std_dev"]
-        self._calculate_bb(period, std_dev)
-
-        # CCI
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["CCI"]["period"]
-        self.indicators_df[f"CCI({period})"] = self._calculate_cci(period)
+    def _calculate_relative_indicators(self) -> None:
+        """기준 지수 대비 상대강도, 베타/알파, 상관계수를 계산합니다.
 
-        # Stoch
-        k_period = TECHNICAL_INDICATORS["반대매매 지표"]["Stoch"]["k_period"]
-        d_period = TECHNICAL_INDICATORS["반대매매 지표"]["Stoch"]["d_period"]
-        self._calculate_stoch(k_period, d_period)
-
-        # Williams
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["Williams"]["period"]
-        self.indicators_df[f"Williams({period})"] = self._calculate_williams(period)
-
-        # CMO
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["CMO"]["period"]
-        self.indicators_df[f"CMO({period})"] = self._calculate_cmo(period)
+        기준 지수 데이터는 지표 캐시의 데이터 지문에 포함되지 않으므로 캐시를 거치지
+        않습니다. 누적합 몇 번으로 끝나는 계산이라 매번 계산해도 비용이 작습니다.
+        """
+        if self.benchmark is None:
+            return
+        benchmark = align_benchmark(self.df["Date"], self.benchmark)
+        close = self.df["Close"].to_numpy(dtype=np.float64)
+        columns = relative_columns(close, benchmark, RELATIVE_INDICATORS)
+        for column, values in columns.items():
+            self._columns[column] = values[:, 0]
+
+    def _calculate_custom_indicators(self) -> None:
+        """``CUSTOM_INDICATORS`` 수식을 한 그래프로 계산합니다."""
+        if not CUSTOM_INDICATORS:
+            return
+        ohlcv = {name: self.df[name].to_numpy() for name in OHLCV_COLUMNS[1:]}
+        results = evaluate_formulas(
+            CUSTOM_INDICATORS,
+            ChainMap(ohlcv, self._columns),
+            builtins=self._columns,
+        )
+        for name, values in results.items():
+            self._columns[name] = values
 
-        # DeMarker
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["DeMarker"]["period"]
-        self.indicators_df[f"DeMarker({period})"] = self._calculate_demarker(period)
+    def _calculate_families(self, families: List[Family]) -> None:
+        """지표 계열을 계산해 칼럼 블록에 씁니다.
 
-        # Donchian
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["Donchian"]["period"]
-        self._calculate_donchian(period)
+        ``max_workers`` 가 2 이상이면 계열마다 칼럼 사전을 따로 둔 얕은 복사본을 스레드
+        풀에서 계산하고, 결과는 계열 순서대로 칼럼 블록에 옮깁니다. 지표 계산은 대부분
+        GIL을 놓는 NumPy/pandas 커널에서 시간을 쓰므로 한 심볼도 스레드로 나눌 수 있으며,
+        칼럼 순서와 값은 순차 계산과 같습니다. 지표 캐시를 사용하면 계열마다 캐시를 먼저
+        확인합니다.
+        """
+        use_cache = self.cache is not None and not self.carry
+        if self.max_workers <= 1 and not use_cache:
+            for _, method, args in families:
+                getattr(self, method)(*args)
+            return
+
+        run = self._cached_family if use_cache else self._compute_family
+        if self.max_workers <= 1:
+            results = [run(family) for family in families]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(run, families))
+
+        for columns, carry in results:
+            self.carry_out.update(carry)
+            for column, values in columns.items():
+                self._columns[column] = values
+
+    def _compute_family(self, family: Family) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """계열 하나를 얕은 복사본에서 계산해 (칼럼, 재귀 상태)로 반환합니다."""
+        name, method, args = family
+        worker = copy.copy(self)
+        worker._columns = {}
+        worker.carry_out = {}
+        try:
+            getattr(worker, method)(*args)
+        except Exception as e:
+            logger.error(f"{name} 지표 계산 실패: {str(e)}")
+            raise
+        return worker._columns, worker.carry_out
 
-        # Pivot
-        method = TECHNICAL_INDICATORS["반대매매 지표"]["Pivot"]["method"]
-        self._calculate_pivot(method)
+    def _cached_family(self, family: Family) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """지표 캐시를 확인하고 없는 구간만 계산합니다.
 
-        # PSY
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["PSY"]["period"]
-        self.indicators_df[f"PSY({period})"] = self._calculate_psy(period)
+        - 적중: 저장된 칼럼을 그대로 사용
+        - 부분 적중: 저장된 행 뒤에 추가된 봉만 후광과 재귀 상태로 이어서 계산
+        - 미스: 전체 계산
+        """
+        entry = self.cache.lookup(family, self._fingerprint)
+        if entry is not None and entry.rows == len(self.df):
+            return entry.columns, entry.carry
+
+        if entry is None:
+            columns, carry = self._compute_family(family)
+        else:
+            halo = min(max_lookback(), entry.rows)
+            start = entry.rows - halo
+            tail = TechnicalIndicator(
+                self.data_file,
+                self.output_file,
+                df=self.df.iloc[start:],
+                carry=entry.carry,
+                halo=halo,
+                max_workers=1,
+                use_cache=False,
+            )
+            columns, carry = tail._compute_family(family)
+            columns = {
+                column: np.concatenate(
+                    [entry.columns[column], np.asarray(values)[halo:]]
+                )
+                for column, values in columns.items()
+            }
 
-        # NPSY
-        period = TECHNICAL_INDICATORS["반대매매 지표"]["NPSY"]["period"]
-        self.indicators_df[f"NPSY({period})"] = self._calculate_npsy(period)
+        columns = {column: np.asarray(values) for column, values in columns.items()}
+        self.cache.store(family, self._fingerprint, columns, carry)
+        return columns, carry
 
     def _calculate_sma(self, period: int) -> pd.Series:
         """단순 이동평균을 계산합니다."""
@@ -180,7 +498,7 @@ class TechnicalIndicator:
 
     def _calculate_ema(self, period: int) -> pd.Series:
         """지수 이동평균을 계산합니다."""
-        return self.df["Close"].ewm(span=period, adjust=False).mean()
+        return self._ewm(self.df["Close"], period, f"ema_{period}")
 
     def _calculate_tsi(self, short_period: int, long_period: int) -> None:
         """True Strength Index를 계산합니다.
@@ -197,19 +515,21 @@ class TechnicalIndicator:
 
         # 이중 지수 이동평균
         tsi = 100 * (
-            price_change.ewm(span=long_period, adjust=False)
-            .mean()
-            .ewm(span=short_period, adjust=False)
-            .mean()
-            / abs_price_change.ewm(span=long_period, adjust=False)
-            .mean()
-            .ewm(span=short_period, adjust=False)
-            .mean()
+            self._ewm(
+                self._ewm(price_change, long_period, "tsi_change_long"),
+                short_period,
+                "tsi_change_short",
+            )
+            / self._ewm(
+                self._ewm(abs_price_change, long_period, "tsi_abs_long"),
+                short_period,
+                "tsi_abs_short",
+            )
         )
-        signal = tsi.ewm(span=short_period, adjust=False).mean()
+        signal = self._ewm(tsi, short_period, "tsi_signal")
 
-        self.indicators_df[f"TSI({short_period},{long_period})"] = tsi
-        self.indicators_df[f"TSI_Signal({short_period},{long_period})"] = signal
+        self._columns[f"TSI({short_period},{long_period})"] = tsi
+        self._columns[f"TSI_Signal({short_period},{long_period})"] = signal
 
     def _calculate_macd(
         self, short_period: int, long_period: int, signal_period: int
@@ -222,22 +542,19 @@ class TechnicalIndicator:
         - 히스토그램 = MACD 라인 - 시그널 라인
         """
         # MACD 라인
-        macd = (
-            self.df["Close"].ewm(span=short_period, adjust=False).mean()
-            - self.df["Close"].ewm(span=long_period, adjust=False).mean()
+        macd = self._ewm(self.df["Close"], short_period, "macd_short") - self._ewm(
+            self.df["Close"], long_period, "macd_long"
         )
         # 시그널 라인
-        signal = macd.ewm(span=signal_period, adjust=False).mean()
+        signal = self._ewm(macd, signal_period, "macd_signal")
         # 히스토그램
         hist = macd - signal
 
-        self.indicators_df[f"MACD({short_period},{long_period})"] = macd
-        self.indicators_df[
-            f"MACD_Signal({short_period},{long_period},{signal_period})"
-        ] = signal
-        self.indicators_df[
-            f"MACD_Hist({short_period},{long_period},{signal_period})"
-        ] = hist
+        self._columns[f"MACD({short_period},{long_period})"] = macd
+        self._columns[f"MACD_Signal({short_period},{long_period},{signal_period})"] = (
+            signal
+        )
+        self._columns[f"MACD_Hist({short_period},{long_period},{signal_period})"] = hist
 
     def _calculate_psar(
         self, af_start: float, af_increment: float, af_max: float
@@ -252,8 +569,18 @@ class TechnicalIndicator:
         af = af_start
         ep = high[0]
         psar[0] = low[0]
-
-        for i in range(1, len(close)):
+        begin = 1
+
+        state = self.carry.get("psar")
+        if state is not None:
+            # 이전 청크 마지막 봉(후광 마지막 봉)의 상태에서 이어서 계산
+            begin = self.halo
+            psar[begin - 1] = state["psar"]
+            trend[begin - 1] = state["trend"]
+            af = state["af"]
+            ep = state["ep"]
+
+        for i in range(begin, len(close)):
             if trend[i - 1] == 1:
                 psar[i] = psar[i - 1] + af * (ep - psar[i - 1])
                 psar[i] = min(psar[i], low[i - 1], low[i - 2] if i > 1 else low[i - 1])
@@ -283,6 +610,12 @@ class TechnicalIndicator:
                 else:
                     trend[i] = -1
 
+        self.carry_out["psar"] = {
+            "psar": psar.iloc[-1],
+            "trend": int(trend.iloc[-1]),
+            "af": af,
+            "ep": ep,
+        }
         return psar
 
     def _calculate_adx(self, period: int) -> None:
@@ -330,9 +663,9 @@ class TechnicalIndicator:
         dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
         adx = dx.rolling(window=period).mean()
 
-        self.indicators_df[f"ADX({period})"] = adx
-        self.indicators_df[f"ADX_Plus_DI({period})"] = plus_di
-        self.indicators_df[f"ADX_Minus_DI({period})"] = minus_di
+        self._columns[f"ADX({period})"] = adx
+        self._columns[f"ADX_Plus_DI({period})"] = plus_di
+        self._columns[f"ADX_Minus_DI({period})"] = minus_di
 
     def _calculate_aroon(self, period: int) -> None:
         """Aroon 지표를 계산합니다.
@@ -346,14 +679,18 @@ class TechnicalIndicator:
 
         # Aroon Up
         rolling_max = high.rolling(window=period).max()
-        aroon_up = 100 * (period - (high == rolling_max).cumsum()) / period
+        aroon_up = (
+            100 * (period - self._cumsum(high == rolling_max, "aroon_up")) / period
+        )
 
         # Aroon Down
         rolling_min = low.rolling(window=period).min()
-        aroon_down = 100 * (period - (low == rolling_min).cumsum()) / period
+        aroon_down = (
+            100 * (period - self._cumsum(low == rolling_min, "aroon_down")) / period
+        )
 
-        self.indicators_df[f"Aroon_Up({period})"] = aroon_up
-        self.indicators_df[f"Aroon_Down({period})"] = aroon_down
+        self._columns[f"Aroon_Up({period})"] = aroon_up
+        self._columns[f"Aroon_Down({period})"] = aroon_down
 
     def _calculate_adl(self, period: int) -> None:
         """Accumulation/Distribution Line을 계산합니다.
@@ -369,18 +706,19 @@ class TechnicalIndicator:
         volume = self.df["Volume"]
 
         # Money Flow Multiplier
+        # 고가 = 저가인 봉은 0/0이 되므로 0으로 처리
         mfm = ((close - low) - (high - close)) / (high - low)
-        mfm = mfm.replace([np.inf, -np.inf], 0)
+        mfm = mfm.where(high != low, 0.0)
 
         # Money Flow Volume
         mfv = mfm * volume
 
         # ADL
-        adl = mfv.cumsum()
+        adl = self._cumsum(mfv, "adl")
         adl_sma = adl.rolling(window=period).mean()
 
-        self.indicators_df[f"ADL({period})"] = adl
-        self.indicators_df[f"ADL_SMA({period})"] = adl_sma
+        self._columns[f"ADL({period})"] = adl
+        self._columns[f"ADL_SMA({period})"] = adl_sma
 
     def _calculate_adr(self, period: int) -> None:
         """Advance/Decline Ratio를 계산합니다."""
@@ -401,8 +739,8 @@ class TechnicalIndicator:
         )
         adr_sma = adr.rolling(window=period).mean()
 
-        self.indicators_df[f"ADR({period})"] = adr
-        self.indicators_df[f"ADR_SMA({period})"] = adr_sma
+        self._columns[f"ADR({period})"] = adr
+        self._columns[f"ADR_SMA({period})"] = adr_sma
 
     def _calculate_ichimoku(self, tenkan_period: int, kijun_period: int) -> None:
         """일목균형표를 계산합니다."""
@@ -419,8 +757,8 @@ class TechnicalIndicator:
         period_low = low.rolling(window=kijun_period).min()
         kijun = (period_high + period_low) / 2
 
-        self.indicators_df[f"Ichimoku_Tenkan({tenkan_period})"] = tenkan
-        self.indicators_df[f"Ichimoku_Kijun({kijun_period})"] = kijun
+        self._columns[f"Ichimoku_Tenkan({tenkan_period})"] = tenkan
+        self._columns[f"Ichimoku_Kijun({kijun_period})"] = kijun
 
     def _calculate_keltner(self, period: int, multiplier: float) -> None:
         """Keltner Channel을 계산합니다."""
@@ -429,7 +767,7 @@ class TechnicalIndicator:
         low = self.df["Low"]
 
         # EMA
-        ema = close.ewm(span=period, adjust=False).mean()
+        ema = self._ewm(close, period, "keltner_ema")
 
         # ATR
         tr1 = high - low
@@ -442,8 +780,8 @@ class TechnicalIndicator:
         upper = ema + multiplier * atr
         lower = ema - multiplier * atr
 
-        self.indicators_df[f"Keltner_Upper({period},{multiplier})"] = upper
-        self.indicators_df[f"Keltner_Lower({period},{multiplier})"] = lower
+        self._columns[f"Keltner_Upper({period},{multiplier})"] = upper
+        self._columns[f"Keltner_Lower({period},{multiplier})"] = lower
 
     def _calculate_rsi(self, period: int) -> pd.Series:
         """Relative Strength Index를 계산합니다.
@@ -491,8 +829,8 @@ class TechnicalIndicator:
         upper = middle + (std_dev * std)
         lower = middle - (std_dev * std)
 
-        self.indicators_df[f"BB_Upper({period},{std_dev})"] = upper
-        self.indicators_df[f"BB_Lower({period},{std_dev})"] = lower
+        self._columns[f"BB_Upper({period},{std_dev})"] = upper
+        self._columns[f"BB_Lower({period},{std_dev})"] = lower
 
     def _calculate_cci(self, period: int) -> pd.Series:
         """Commodity Channel Index를 계산합니다.
@@ -513,8 +851,8 @@ class TechnicalIndicator:
         # SMA of TP
         tp_sma = tp.rolling(window=period).mean()
 
-        # Mean Absolute Deviation
-        mad = tp.rolling(window=period).apply(lambda x: abs(x - x.mean()).mean())
+        # Mean Absolute Deviation (창마다 Series를 만들지 않고 슬라이딩 뷰로 계산)
+        mad = pd.Series(mean_absolute_deviation(tp.to_numpy(), period), index=tp.index)
 
         # CCI
         cci = (tp - tp_sma) / (0.015 * mad)
@@ -540,8 +878,8 @@ class TechnicalIndicator:
         # %D
         d = k.rolling(window=d_period).mean()
 
-        self.indicators_df[f"Stoch_K({k_period})"] = k
-        self.indicators_df[f"Stoch_D({k_period},{d_period})"] = d
+        self._columns[f"Stoch_K({k_period})"] = k
+        self._columns[f"Stoch_D({k_period},{d_period})"] = d
 
     def _calculate_williams(self, period: int) -> pd.Series:
         """Williams %R을 계산합니다.
@@ -621,8 +959,8 @@ class TechnicalIndicator:
         upper = high.rolling(window=period).max()
         lower = low.rolling(window=period).min()
 
-        self.indicators_df[f"Donchian_Upper({period})"] = upper
-        self.indicators_df[f"Donchian_Lower({period})"] = lower
+        self._columns[f"Donchian_Upper({period})"] = upper
+        self._columns[f"Donchian_Lower({period})"] = lower
 
     def _calculate_pivot(self, method: str) -> None:
         """Pivot Points를 계산합니다."""
@@ -637,8 +975,8 @@ class TechnicalIndicator:
         r1 = 2 * pivot - low
         s1 = 2 * pivot - high
 
-        self.indicators_df[f"Pivot_R1({method})"] = r1
-        self.indicators_df[f"Pivot_S1({method})"] = s1
+        self._columns[f"Pivot_R1({method})"] = r1
+        self._columns[f"Pivot_S1({method})"] = s1
 
     def _calculate_psy(self, period: int) -> pd.Series:
         """Psychological Line을 계산합니다.
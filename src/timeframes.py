@@ -0,0 +1,219 @@
+"""
+다중 시간 프레임 모듈
+
+일봉 OHLCV를 주봉/월봉으로 리샘플링하여 같은 ``TECHNICAL_INDICATORS`` 지표와 시그널을
+계산하고, 상위 시간 프레임 시그널을 미래 데이터 없이 일봉 날짜에 맞춥니다.
+
+- 리샘플링: 날짜의 기간 번호(``Period`` 서수)가 바뀌는 위치를 구간 시작으로 두고
+  ``reduceat`` 으로 시가(first)/고가(max)/저가(min)/종가(last)/거래량(sum)을 한 번에
+  계산합니다. 상위 봉의 날짜는 구간의 마지막 거래일입니다.
+- 캐시: 시간 프레임별 리샘플 결과를 ``ResampleCache`` 에 보관하고, 일봉이 뒤에 추가되면
+  첫 새 일봉이 속한 기간(진행 중인 주/월)부터만 다시 집계합니다.
+- 정렬: 상위 봉은 기간의 달력상 마지막 날(주봉은 금요일, 월봉은 말일)부터 사용할 수
+  있습니다. 일봉 날짜마다 그 날짜까지 끝난 마지막 상위 봉의 시그널을 붙이므로 진행 중인
+  주/월의 값은 기간이 끝나기 전까지 쓰이지 않습니다. 기간 마지막 날이 휴장이면 다음
+  거래일부터 사용합니다.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.loader import DATE_COLUMN, OHLCV_COLUMNS
+from src.settings import TIMEFRAME_SETTINGS
+from src.signal_generator import SignalGenerator
+from src.technical_indicator import TechnicalIndicator
+
+logger = logging.getLogger(__name__)
+
+AVAILABLE_COLUMN = "Available"
+
+
+def period_codes(dates: pd.Series, freq: str) -> np.ndarray:
+    """날짜별 기간 서수 (같은 주/월이면 같은 값)"""
+    return pd.DatetimeIndex(dates).to_period(freq).asi8
+
+
+def resample_ohlcv(daily: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """날짜순 일봉을 기간 단위 봉으로 집계합니다.
+
+    Args:
+        daily (pd.DataFrame): 날짜순 OHLCV 데이터
+        freq (str): pandas 기간 주기 (예: "W-FRI", "M")
+
+    Returns:
+        pd.DataFrame: Date(구간 마지막 거래일) + OHLCV + Available(사용 가능 날짜)
+    """
+    codes = period_codes(daily[DATE_COLUMN], freq)
+    if not len(codes):
+        return pd.DataFrame(columns=OHLCV_COLUMNS + [AVAILABLE_COLUMN])
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    lasts = np.r_[starts[1:], len(codes)] - 1
+
+    def column(name: str) -> np.ndarray:
+        return daily[name].to_numpy(dtype=np.float64)
+
+    periods = pd.PeriodIndex.from_ordinals(codes[starts], freq=freq)
+    return pd.DataFrame(
+        {
+            DATE_COLUMN: daily[DATE_COLUMN].to_numpy()[lasts],
+            "Open": column("Open")[starts],
+            "High": np.maximum.reduceat(column("High"), starts),
+            "Low": np.minimum.reduceat(column("Low"), starts),
+            "Close": column("Close")[lasts],
+            "Volume": np.add.reduceat(column("Volume"), starts),
+            AVAILABLE_COLUMN: periods.end_time.normalize().to_numpy(),
+        }
+    )
+
+
+class ResampleCache:
+    """시간 프레임별 리샘플 봉 캐시 클래스
+
+    같은 일봉에서 지표 단계와 시그널 단계가 리샘플 결과를 공유하고, 일봉이 뒤에
+    추가되면 진행 중인 기간부터만 다시 집계합니다.
+    """
+
+    def __init__(self):
+        # 주기 → (리샘플 봉, 집계한 일봉 개수, 첫/마지막 일봉 날짜, 마지막 봉 시작 위치)
+        self._entries: Dict[str, Tuple[pd.DataFrame, int, Tuple, int]] = {}
+        self.updated_bars: Dict[str, int] = {}
+
+    def bars(self, daily: pd.DataFrame, freq: str) -> pd.DataFrame:
+        """일봉의 기간 단위 봉을 반환합니다.
+
+        캐시에 집계한 일봉이 현재 일봉의 앞부분이면(첫 날짜와 캐시 마지막 위치의 날짜가
+        같으면) 캐시 마지막 봉의 기간 시작부터만 다시 집계합니다. 이전 기간의 봉은
+        바뀌지 않으므로 그대로 사용합니다. ``updated_bars[freq]`` 에 다시 집계한 봉
+        개수를 남깁니다.
+
+        Args:
+            daily (pd.DataFrame): 날짜순 OHLCV 데이터 (0부터 시작하는 인덱스)
+            freq (str): pandas 기간 주기
+
+        Returns:
+            pd.DataFrame: ``resample_ohlcv`` 형식의 봉
+        """
+        dates = daily[DATE_COLUMN]
+        entry = self._entries.get(freq)
+        if entry is not None and len(dates):
+            bars, rows, (first, last), last_start = entry
+            if (
+                rows <= len(dates)
+                and dates.iloc[0] == first
+                and dates.iloc[rows - 1] == last
+            ):
+                if rows == len(dates):
+                    self.updated_bars[freq] = 0
+                    return bars
+                tail = resample_ohlcv(daily.iloc[last_start:], freq)
+                keep = len(bars) - 1
+                bars = pd.concat([bars.iloc[:keep], tail], ignore_index=True)
+                self._store(freq, bars, daily, last_start)
+                self.updated_bars[freq] = len(tail)
+                return bars
+
+        bars = resample_ohlcv(daily, freq)
+        self._store(freq, bars, daily, 0)
+        self.updated_bars[freq] = len(bars)
+        return bars
+
+    def _store(
+        self, freq: str, bars: pd.DataFrame, daily: pd.DataFrame, offset: int
+    ) -> None:
+        """캐시 항목을 저장합니다 (offset: daily에서 ``bars`` 집계를 다시 시작한 위치)."""
+        if not len(daily):
+            return
+        dates = daily[DATE_COLUMN]
+        # 마지막 봉의 기간 시작 위치 (다음 갱신에서 여기부터 다시 집계)
+        codes = period_codes(dates.iloc[offset:], freq)
+        last_start = offset + int(np.searchsorted(codes, codes[-1]))
+        self._entries[freq] = (
+            bars,
+            len(daily),
+            (dates.iloc[0], dates.iloc[-1]),
+            last_start,
+        )
+
+
+def align_to_daily(
+    daily_dates: pd.Series, bars: pd.DataFrame, values: pd.DataFrame, suffix: str
+) -> pd.DataFrame:
+    """상위 봉 값을 일봉 날짜에 맞춥니다 (미래 데이터 없음).
+
+    일봉 날짜마다 ``Available`` 이 그 날짜 이하인 마지막 상위 봉의 값을 사용하고,
+    그런 봉이 없으면 0(중립)입니다.
+
+    Args:
+        daily_dates (pd.Series): 일봉 날짜
+        bars (pd.DataFrame): ``resample_ohlcv`` 형식의 상위 봉
+        values (pd.DataFrame): 상위 봉과 같은 행 순서의 값 (시그널 칼럼)
+        suffix (str): 칼럼 이름 뒤에 붙일 시간 프레임 표시 (예: "W")
+
+    Returns:
+        pd.DataFrame: 일봉 행 순서의 ``{칼럼}@{suffix}`` 값
+    """
+    available = bars[AVAILABLE_COLUMN].to_numpy(dtype="datetime64[ns]")
+    dates = np.asarray(daily_dates, dtype="datetime64[ns]")
+    rows = np.searchsorted(available, dates, side="right") - 1
+    matrix = values.to_numpy()
+    aligned = np.where(
+        (rows >= 0)[:, np.newaxis], matrix[np.maximum(rows, 0)], 0
+    ).astype(matrix.dtype)
+    columns = [f"{column}@{suffix}" for column in values.columns]
+    return pd.DataFrame(aligned, columns=columns)
+
+
+class MultiTimeframe:
+    """시간 프레임별 지표/시그널 계산과 일봉 정렬 클래스"""
+
+    def __init__(
+        self,
+        timeframes: Optional[Dict[str, str]] = None,
+        cache: Optional[ResampleCache] = None,
+    ):
+        """
+        Args:
+            timeframes (Optional[Dict[str, str]]): 칼럼 접미사 → pandas 기간 주기
+                (기본값: ``TIMEFRAME_SETTINGS["timeframes"]``)
+            cache (Optional[ResampleCache]): 리샘플 캐시 (기본값: 새 캐시)
+        """
+        self.timeframes = dict(timeframes or TIMEFRAME_SETTINGS["timeframes"])
+        self.cache = cache or ResampleCache()
+        self.indicators: Dict[str, pd.DataFrame] = {}
+        self.signals: Dict[str, pd.DataFrame] = {}
+
+    def run(self, daily: pd.DataFrame) -> pd.DataFrame:
+        """시간 프레임마다 지표와 시그널을 계산하고 일봉 날짜에 맞춘 시그널을 반환합니다.
+
+        Args:
+            daily (pd.DataFrame): 날짜순 OHLCV 데이터
+
+        Returns:
+            pd.DataFrame: Date + 시간 프레임별 ``{시그널}@{접미사}`` 칼럼
+        """
+        try:
+            daily = daily.reset_index(drop=True)
+            frames = [daily[[DATE_COLUMN]]]
+            for suffix, freq in self.timeframes.items():
+                bars = self.cache.bars(daily, freq)
+                indicator = TechnicalIndicator(df=bars[OHLCV_COLUMNS])
+                indicator.calculate_all()
+                generator = SignalGenerator(indicators_df=indicator.indicators_df)
+                generator.generate_all()
+                self.indicators[suffix] = indicator.indicators_df
+                self.signals[suffix] = generator.signals_df
+
+                values = generator.signals_df.drop(columns=[DATE_COLUMN])
+                frames.append(align_to_daily(daily[DATE_COLUMN], bars, values, suffix))
+                logger.info(
+                    f"{suffix} 시간 프레임 계산 완료: {len(bars)}개 봉 "
+                    f"(다시 집계 {self.cache.updated_bars[freq]}개)"
+                )
+            return pd.concat(frames, axis=1)
+
+        except Exception as e:
+            logger.error(f"다중 시간 프레임 계산 실패: {str(e)}")
+            raise
@@ -3,77 +3,122 @@ S&P 500 데이터 수집 및 관리 모듈
 """
 
 import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
-import yfinance as yf
 
-from src.settings import SPY_DATA_FILE
+from src.fetch_planner import FetchPlanner
+from src.loader import OHLCV_COLUMNS, load_csv
+from src.providers import DataProvider, YFinanceProvider
+from src.settings import LOGGING_FORMAT, LOGGING_LEVEL, SPY_DATA_FILE
+from src.store import OHLCVStore, atomic_write_csv
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
+def _last_csv_date(data_file: Path) -> Optional[str]:
+    """CSV 파일의 끝부분만 읽어 마지막 날짜를 반환합니다.
+
+    파일이 없거나 마지막 줄이 온전하지 않으면 None을 반환합니다.
+    """
+    if not data_file.exists():
+        return None
+    with open(data_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - 4096, 0))
+        tail = f.read().decode("utf-8", errors="ignore")
+    if not tail.endswith("\n"):
+        return None
+    fields = tail.rstrip("\n").rsplit("\n", 1)[-1].split(",")
+    if len(fields) != 6:
+        return None
+    try:
+        return pd.Timestamp(fields[0]).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def import_data_file(symbol: str, data_file: Path, store: OHLCVStore) -> None:
+    """저장소에 심볼 데이터가 없으면 기존 데이터 파일을 한 번만 가져옵니다."""
+    if store.last_date(symbol) is not None or not data_file.exists():
+        return
+    existing_data = load_csv(
+        data_file, usecols=OHLCV_COLUMNS, float_precision="round_trip"
+    )
+    store.upsert(symbol, existing_data)
+    logger.info(f"기존 데이터 가져오기 완료: {len(existing_data)}개 데이터 포인트")
+
+
 def update_spy_data(
     symbol: str = "^GSPC",
-    days_back: int = 7,
+    days_back: Optional[int] = None,
     data_file: Path = SPY_DATA_FILE,
+    provider: Optional[DataProvider] = None,
+    store: Optional[OHLCVStore] = None,
 ) -> None:
     """
     S&P 500 ETF 데이터를 업데이트합니다.
-    최근 7일간의 데이터를 항상 다운로드하여 저장합니다.
+    저장소에서 빠진 거래일 구간만 다운로드하여 파티션 저장소에 반영하고,
+    바뀐 봉만 데이터 파일에 추가합니다.
 
     Args:
         symbol (str): 다운로드할 심볼
-        days_back (int): 다운로드할 과거 데이터 기간 (일)
+        days_back (Optional[int]): 지정하면 누락 구간 대신 최근 N일을 다시 다운로드
         data_file (Path): 저장할 파일 경로
+        provider (Optional[DataProvider]): 데이터 제공자 (기본값: yfinance)
+        store (Optional[OHLCVStore]): 파티션 저장소 (기본값: STORE_DIR)
     """
+    provider = provider or YFinanceProvider()
+    store = store or OHLCVStore()
     try:
-        # 디렉토리가 없으면 생성
-        data_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # 기존 데이터 확인
-        existing_data = None
-        if data_file.exists():
-            try:
-                existing_data = pd.read_csv(data_file)
-                existing_data["Date"] = pd.to_datetime(existing_data["Date"]).dt.date
+        import_data_file(symbol, data_file, store)
+
+        if days_back is None:
+            # 거래일 달력 기준으로 빠진 구간만 다운로드
+            requests = FetchPlanner(store).plan([symbol])
+            frames = []
+            for request in requests:
                 logger.info(
-                    f"기존 데이터 로드 완료: {len(existing_data)}개 데이터 포인트"
+                    f"{symbol} 데이터 다운로드 시작 ({provider.name}): "
+                    f"{request.start}~{request.end}"
                 )
-            except Exception as e:
-                logger.warning(f"기존 데이터 로드 실패: {str(e)}")
-
-        # 최근 7일 데이터 다운로드
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-
-        logger.info(f"{symbol} 데이터 다운로드 시작: {start_date_str}부터")
-        ticker = yf.Ticker(symbol)
-        df = ticker.history(start=start_date_str)
-
-        # 데이터 전처리
-        df = df.reset_index()
-        df["Date"] = pd.to_datetime(df["Date"]).dt.date
-        df = df[["Date", "Open", "High", "Low", "Close", "Volume"]]
-
-        # 기존 데이터와 병합
-        if existing_data is not None and not existing_data.empty:
-            # 중복 제거 및 정렬
-            df = pd.concat([existing_data, df], ignore_index=True)
-            df = df.drop_duplicates(subset=["Date"])
-            df = df.sort_values("Date")
-            logger.info(f"데이터 병합 완료: {len(df)}개 데이터 포인트")
-
-        # 데이터 저장
-        df.to_csv(data_file, index=False)
-        logger.info(f"{symbol} 데이터 저장 완료: {len(df)}개 데이터 포인트")
+                frames.append(provider.fetch(symbol, request.start, request.end))
+            if not frames:
+                logger.info(f"{symbol} 누락된 거래일 없음")
+                return
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            # 최근 N일 데이터 다시 다운로드
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days_back)
+            start_date_str = start_date.strftime("%Y-%m-%d")
+
+            logger.info(
+                f"{symbol} 데이터 다운로드 시작 ({provider.name}): {start_date_str}부터"
+            )
+            df = provider.fetch(symbol, start_date.date())
+
+        # 영향받는 파티션만 갱신
+        changed = store.upsert(symbol, df)
+        if changed.empty:
+            logger.info(f"{symbol} 변경된 데이터 없음")
+            return
+
+        # 기존 파일 뒤에 붙일 수 있으면 추가, 아니면 저장소에서 다시 내보냄
+        last_date = _last_csv_date(data_file)
+        changed["Date"] = changed["Date"].dt.strftime("%Y-%m-%d")
+        if last_date is not None and changed["Date"].iloc[0] > last_date:
+            with open(data_file, "a", newline="") as f:
+                changed.to_csv(f, header=False, index=False)
+            logger.info(f"{symbol} 데이터 추가 완료: {len(changed)}개 데이터 포인트")
+        else:
+            full = store.read(symbol)
+            full["Date"] = full["Date"].dt.strftime("%Y-%m-%d")
+            atomic_write_csv(full, data_file)
+            logger.info(f"{symbol} 데이터 저장 완료: {len(full)}개 데이터 포인트")
 
     except Exception as e:
         logger.error(f"{symbol} 데이터 업데이트 실패: {str(e)}")
@@ -81,5 +126,8 @@ def update_spy_data(
 
 
 if __name__ == "__main__":
+    # 로깅 설정
+    logging.basicConfig(level=LOGGING_LEVEL, format=LOGGING_FORMAT)
+
     # S&P 500 데이터 업데이트
     update_spy_data()
@@ -0,0 +1,271 @@
+"""
+OHLCV 데이터 품질 검증 모듈
+
+OHLCV 배열 전체에 대해 벡터화된 검사를 수행합니다.
+- 오류: 날짜 중복/역순, 결측·무한대 가격, 고가/저가와 시가·종가 불일치, 음수 거래량
+- 경고: 고가 = 저가인 봉, 거래일 누락(일봉), 비거래일 봉(일봉), 이상 수익률
+
+검증기는 마지막으로 검사한 위치와 직전 봉 상태를 기억하므로, 데이터 뒤에 봉이
+추가되면 새 봉만 검사합니다. 수익률 이상치 판정에는 직전 ``outlier_window`` 개의
+수익률만 사용합니다.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.fetch_planner import NYSE_BUSDAYCAL
+from src.settings import VALIDATION_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
+
+ERROR_CHECKS = (
+    "duplicate_date",
+    "unordered_date",
+    "non_finite",
+    "ohlc_inconsistent",
+    "negative_volume",
+)
+WARNING_CHECKS = (
+    "zero_range",
+    "calendar_gap",
+    "non_session",
+    "outlier_return",
+)
+
+
+def _trailing_std(values: np.ndarray, start: int, window: int) -> np.ndarray:
+    """values[start:] 각 위치의 직전 window 개 값(결측 제외)의 표본 표준편차를 반환합니다.
+
+    누적합으로 계산하므로 새 위치 수에 비례하는 비용만 듭니다.
+    유효한 값이 20개 미만이면 NaN입니다.
+    """
+    finite = np.isfinite(values)
+    x = np.where(finite, values, 0.0)
+    count = np.concatenate([[0], np.cumsum(finite)])
+    total = np.concatenate([[0.0], np.cumsum(x)])
+    square = np.concatenate([[0.0], np.cumsum(x * x)])
+
+    end = np.arange(start, len(values))
+    begin = np.maximum(end - window, 0)
+    n = count[end] - count[begin]
+    s1 = total[end] - total[begin]
+    s2 = square[end] - square[begin]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (s2 - s1 * s1 / n) / (n - 1)
+    return np.where(n >= 20, np.sqrt(np.maximum(var, 0.0)), np.nan)
+
+
+class ValidationReport:
+    """검증 결과 클래스
+
+    검사 이름별로 문제가 있는 행 위치(원본 데이터 기준)를 담습니다.
+    """
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        issues: Dict[str, np.ndarray],
+        dates: np.ndarray,
+    ):
+        """
+        Args:
+            start (int): 검사한 첫 행 위치
+            end (int): 검사한 마지막 행 다음 위치
+            issues (Dict[str, np.ndarray]): 검사별 문제 행 위치
+            dates (np.ndarray): 검사한 구간의 날짜 (요약 출력용)
+        """
+        self.start = start
+        self.end = end
+        self.issues = {name: rows for name, rows in issues.items() if len(rows)}
+        self._dates = dates
+
+    @property
+    def rows_checked(self) -> int:
+        return self.end - self.start
+
+    @property
+    def ok(self) -> bool:
+        """오류 검사를 모두 통과했는지 여부"""
+        return not any(name in self.issues for name in ERROR_CHECKS)
+
+    def counts(self) -> Dict[str, int]:
+        """검사별 문제 행 개수를 반환합니다."""
+        return {name: len(rows) for name, rows in self.issues.items()}
+
+    def summary(self, examples: int = 3) -> str:
+        """한 줄 요약을 반환합니다."""
+        errors = sum(len(self.issues.get(name, [])) for name in ERROR_CHECKS)
+        warnings = sum(len(self.issues.get(name, [])) for name in WARNING_CHECKS)
+        text = (
+            f"OHLCV 검증 [{self.start}:{self.end}] {self.rows_checked}개 봉: "
+            f"오류 {errors}, 경고 {warnings}"
+        )
+        details: List[str] = []
+        for name, rows in self.issues.items():
+            sample = ", ".join(
+                str(pd.Timestamp(self._dates[row - self.start]).date())
+                for row in rows[:examples]
+            )
+            details.append(f"{name}={len(rows)} ({sample})")
+        if details:
+            text += " - " + "; ".join(details)
+        return text
+
+
+class OHLCVValidator:
+    """증분 OHLCV 데이터 검증 클래스"""
+
+    def __init__(
+        self,
+        outlier_zscore: float = VALIDATION_SETTINGS["outlier_zscore"],
+        outlier_min_return: float = VALIDATION_SETTINGS["outlier_min_return"],
+        outlier_window: int = VALIDATION_SETTINGS["outlier_window"],
+        check_calendar: bool = VALIDATION_SETTINGS["check_calendar"],
+    ):
+        """
+        Args:
+            outlier_zscore (float): 직전 수익률 표준편차 대비 이상치 배수
+            outlier_min_return (float): 이상치로 볼 최소 절대 로그 수익률
+            outlier_window (int): 표준편차 계산에 사용할 직전 수익률 개수
+            check_calendar (bool): 일봉 데이터의 거래일 누락/비거래일 검사 여부
+        """
+        self.outlier_zscore = outlier_zscore
+        self.outlier_min_return = outlier_min_return
+        self.outlier_window = outlier_window
+        self.check_calendar = check_calendar
+        self.reset()
+
+    def reset(self) -> None:
+        """검사 상태를 초기화합니다."""
+        self.checked_rows = 0
+        self._last_date: Optional[np.datetime64] = None
+        self._last_close = np.nan
+        self._returns = np.empty(0)
+
+    def validate(self, df: pd.DataFrame) -> ValidationReport:
+        """아직 검사하지 않은 봉을 검사합니다.
+
+        이전 호출 이후 뒤에 추가된 봉만 검사합니다. 데이터가 짧아졌거나 이미 검사한
+        마지막 봉의 날짜가 달라졌으면 처음부터 다시 검사합니다.
+
+        Args:
+            df (pd.DataFrame): Date, Open, High, Low, Close, Volume 칼럼의 데이터
+
+        Returns:
+            ValidationReport: 검증 결과
+        """
+        if self.checked_rows and (
+            len(df) < self.checked_rows
+            or df["Date"].iloc[self.checked_rows - 1].to_datetime64() != self._last_date
+        ):
+            self.reset()
+
+        start = self.checked_rows
+        dates = df["Date"].to_numpy(dtype="datetime64[ns]")[start:]
+        if len(dates) == 0:
+            return ValidationReport(start, start, {}, dates)
+
+        open_, high, low, close, volume = (
+            df[column].to_numpy(dtype=np.float64)[start:]
+            for column in PRICE_COLUMNS + ["Volume"]
+        )
+        prices = np.column_stack([open_, high, low, close])
+
+        issues: Dict[str, np.ndarray] = {}
+
+        # 날짜: 직전 검사 봉과 이어서 차분
+        if self._last_date is None:
+            step = np.concatenate([[np.timedelta64(1, "ns")], np.diff(dates)])
+        else:
+            step = np.diff(np.concatenate([[self._last_date], dates]))
+        issues["duplicate_date"] = step == np.timedelta64(0, "ns")
+        issues["unordered_date"] = step < np.timedelta64(0, "ns")
+
+        # 가격/거래량
+        finite = np.isfinite(prices).all(axis=1) & np.isfinite(volume)
+        issues["non_finite"] = ~finite
+        with np.errstate(invalid="ignore"):
+            body_high = np.maximum(open_, close)
+            body_low = np.minimum(open_, close)
+            issues["ohlc_inconsistent"] = finite & (
+                (high < body_high) | (low > body_low) | (high < low)
+            )
+            issues["negative_volume"] = volume < 0
+            issues["zero_range"] = finite & (high == low)
+
+        # 거래일 달력 (자정 시각만 있는 일봉 데이터에 한해)
+        days = dates.astype("datetime64[D]")
+        if self.check_calendar and (dates == days).all():
+            prev_days = np.concatenate(
+                [
+                    [days[0] if self._last_date is None else self._last_date],
+                    days[:-1],
+                ]
+            ).astype("datetime64[D]")
+            ordered = prev_days < days
+            sessions = np.zeros(len(days), dtype=np.int64)
+            sessions[ordered] = np.busday_count(
+                prev_days[ordered] + 1, days[ordered], busdaycal=NYSE_BUSDAYCAL
+            )
+            issues["calendar_gap"] = sessions > 0
+            issues["non_session"] = ~np.is_busday(days, busdaycal=NYSE_BUSDAYCAL)
+
+        # 이상 수익률: 직전 window 개 수익률의 표준편차 대비
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_close = np.log(np.concatenate([[self._last_close], close]))
+            returns = np.diff(log_close)
+        history = np.concatenate([self._returns, returns])
+        scale = _trailing_std(history, len(self._returns), self.outlier_window)
+        with np.errstate(invalid="ignore"):
+            issues["outlier_return"] = (
+                np.abs(returns) > self.outlier_zscore * scale
+            ) & (np.abs(returns) > self.outlier_min_return)
+
+        # 상태 갱신
+        self.checked_rows = len(df)
+        self._last_date = dates[-1]
+        self._last_close = close[-1]
+        window = self.outlier_window
+        self._returns = history[-window:]
+
+        return ValidationReport(
+            start,
+            len(df),
+            {name: np.flatnonzero(mask) + start for name, mask in issues.items()},
+            dates,
+        )
+
+
+def validate_ohlcv(
+    df: pd.DataFrame,
+    source: str = "OHLCV",
+    validator: Optional[OHLCVValidator] = None,
+) -> ValidationReport:
+    """OHLCV 데이터를 검증하고 결과를 로그로 남깁니다.
+
+    ``VALIDATION_SETTINGS["strict"]`` 가 True이면 오류가 있을 때 ValueError를 발생시킵니다.
+
+    Args:
+        df (pd.DataFrame): OHLCV 데이터
+        source (str): 로그에 표시할 데이터 이름
+        validator (Optional[OHLCVValidator]): 증분 검사용 검증기 (없으면 전체 검사)
+
+    Returns:
+        ValidationReport: 검증 결과
+    """
+    report = (validator or OHLCVValidator()).validate(df)
+    if not report.issues:
+        logger.debug(f"{source}: {report.summary()}")
+    elif report.ok:
+        logger.info(f"{source}: {report.summary()}")
+    else:
+        logger.warning(f"{source}: {report.summary()}")
+        if VALIDATION_SETTINGS["strict"]:
+            raise ValueError(f"{source} 데이터 검증 실패: {report.summary()}")
+    return report
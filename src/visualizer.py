@@ -12,7 +12,14 @@ import pandas as pd
 from matplotlib.colors import ListedColormap
 from mplfinance.original_flavor import candlestick_ohlc
 
-from src.settings import HEATMAP_FILE, SIGNALS_FILE, SPY_DATA_FILE
+from src.loader import read_ohlcv, read_signals
+from src.settings import (
+    HEATMAP_FILE,
+    SIGNAL_EVENTS_FILE,
+    SIGNALS_FILE,
+    SPY_DATA_FILE,
+)
+from src.signal_events import read_signal_events, reconstruct_signals
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +32,17 @@ class TradingVisualizer:
         signals_file: Path = SIGNALS_FILE,
         price_file: Path = SPY_DATA_FILE,
         output_file: Path = HEATMAP_FILE,
+        events_file: Path = SIGNAL_EVENTS_FILE,
     ):
         """
         Args:
             signals_file (Path): 매매 시그널 파일 경로
             price_file (Path): 가격 데이터 파일 경로
             output_file (Path): 출력 파일 경로
+            events_file (Path): 시그널 파일이 없을 때 사용할 전환 이벤트 파일 경로
         """
         self.signals_file = signals_file
+        self.events_file = events_file
         self.price_file = price_file
         self.output_file = output_file
         self.signals_df = None
@@ -43,11 +53,16 @@ class TradingVisualizer:
     def _load_data(self) -> None:
         """데이터를 로드합니다."""
         try:
-            self.signals_df = pd.read_csv(self.signals_file)
-            self.price_df = pd.read_csv(self.price_file)
-
-            self.signals_df["Date"] = pd.to_datetime(self.signals_df.iloc[:, 0])
-            self.price_df["Date"] = pd.to_datetime(self.price_df["Date"])
+            self.price_df = read_ohlcv(self.price_file)
+            if Path(self.signals_file).exists() or not Path(self.events_file).exists():
+                self.signals_df = read_signals(self.signals_file)
+            else:
+                # 날짜별 시그널 파일 없이 전환 이벤트만 저장한 경우
+                events = read_signal_events(self.events_file)
+                dates = self.price_df["Date"]
+                dates = dates[dates >= events["Date"].min()]
+                self.signals_df = reconstruct_signals(events, dates=dates)
+                logger.info(f"전환 이벤트로 시그널 복원: {self.events_file}")
 
             logger.info("데이터 로드 완료")
         except Exception as e:
@@ -0,0 +1,35 @@
+"""
+테스트 공용 픽스처
+
+합성 OHLCV 데이터(``benchmarks.synthetic``)로 지표와 시그널을 만들어 테스트 간에
+공유합니다. 파일은 모두 pytest 임시 디렉토리에 씁니다.
+"""
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_ohlcv
+from src.signal_generator import SignalGenerator
+from src.technical_indicator import TechnicalIndicator
+
+
+@pytest.fixture(scope="session")
+def ohlcv() -> pd.DataFrame:
+    """합성 일봉 OHLCV 데이터 (1500개 봉)"""
+    return generate_ohlcv(1500, seed=3)
+
+
+@pytest.fixture(scope="session")
+def indicators(ohlcv: pd.DataFrame) -> pd.DataFrame:
+    """전체 구간 지표 데이터"""
+    indicator = TechnicalIndicator(df=ohlcv)
+    indicator.calculate_all()
+    return indicator.indicators_df
+
+
+@pytest.fixture(scope="session")
+def signals(indicators: pd.DataFrame) -> pd.DataFrame:
+    """전체 구간 시그널 데이터"""
+    generator = SignalGenerator(indicators_df=indicators)
+    generator.generate_all()
+    return generator.signals_df
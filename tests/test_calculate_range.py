@@ -0,0 +1,38 @@
+"""기간 지표 계산(calculate_range)의 전체 계산 일치 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.technical_indicator import TechnicalIndicator
+
+
+def assert_same_indicators(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    """칼럼, 날짜, 지표 값(상대 오차 1e-7 이내)이 같은지 확인합니다."""
+    assert actual.columns.tolist() == expected.columns.tolist()
+    np.testing.assert_array_equal(
+        actual["Date"].to_numpy(), expected["Date"].to_numpy()
+    )
+    values = [column for column in expected.columns if column != "Date"]
+    np.testing.assert_allclose(
+        actual[values].to_numpy(dtype=np.float64),
+        expected[values].to_numpy(dtype=np.float64),
+        rtol=1e-7,
+        atol=1e-9,
+    )
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [("2004-01-01", "2005-06-30"), (None, "2001-03-30"), ("2005-01-03", None)],
+)
+def test_calculate_range_matches_full_run(ohlcv, indicators, start, end):
+    result = TechnicalIndicator(df=ohlcv).calculate_range(start, end)
+
+    dates = indicators["Date"]
+    selected = pd.Series(True, index=indicators.index)
+    if start is not None:
+        selected &= dates >= start
+    if end is not None:
+        selected &= dates <= end
+    assert_same_indicators(result, indicators[selected].reset_index(drop=True))
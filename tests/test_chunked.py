@@ -0,0 +1,32 @@
+"""청크 지표 계산의 전체 계산 일치 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.chunked import calculate_chunked
+
+
+def assert_same_indicators(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    """칼럼, 날짜, 지표 값(상대 오차 1e-7 이내)이 같은지 확인합니다."""
+    assert actual.columns.tolist() == expected.columns.tolist()
+    np.testing.assert_array_equal(
+        actual["Date"].to_numpy(), expected["Date"].to_numpy()
+    )
+    values = [column for column in expected.columns if column != "Date"]
+    np.testing.assert_allclose(
+        actual[values].to_numpy(dtype=np.float64),
+        expected[values].to_numpy(dtype=np.float64),
+        rtol=1e-7,
+        atol=1e-9,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [400, 999])
+def test_calculate_chunked_matches_full_run(tmp_path, ohlcv, indicators, chunk_size):
+    data_file = tmp_path / "ohlcv.csv"
+    ohlcv.to_csv(data_file, index=False)
+
+    store = calculate_chunked(data_file, tmp_path / "store", chunk_size=chunk_size)
+    assert store.rows == len(ohlcv)
+    assert_same_indicators(store.read(), indicators)
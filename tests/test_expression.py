@@ -0,0 +1,103 @@
+"""사용자 정의 지표 수식(해석, 공통 부분식, 내장 지표 재사용) 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.expression import ExpressionGraph, builtin_formulas, evaluate_formulas
+
+
+def ohlcv_columns(ohlcv: pd.DataFrame) -> dict:
+    return {column: ohlcv[column].to_numpy() for column in ohlcv.columns[1:]}
+
+
+def test_formulas_reproduce_builtin_indicators(ohlcv, indicators):
+    formulas = builtin_formulas()
+    results = evaluate_formulas(formulas, ohlcv_columns(ohlcv))
+
+    assert set(results) == set(formulas)
+    for column, values in results.items():
+        np.testing.assert_allclose(
+            values,
+            indicators[column].to_numpy(dtype=np.float64),
+            rtol=1e-6,
+            atol=1e-9,
+            err_msg=column,
+        )
+
+
+def test_builtin_columns_are_reused(ohlcv):
+    sentinel = np.arange(len(ohlcv), dtype=float)
+    results = evaluate_formulas(
+        {"double": "SMA(Close, 20) * 2", "spread": "Close - SMA(Close, 50)"},
+        ohlcv_columns(ohlcv),
+        builtins={"SMA_(20)": sentinel},
+    )
+
+    np.testing.assert_array_equal(results["double"], sentinel * 2)
+    expected = ohlcv["Close"] - ohlcv["Close"].rolling(50).mean()
+    np.testing.assert_allclose(results["spread"], expected.to_numpy())
+
+
+def test_common_subexpressions_share_nodes():
+    graph = ExpressionGraph()
+    first = graph.add("EMA(Close, 20) - SMA(Close, 50)")
+    size = len(graph)
+
+    assert graph.add("EMA(Close,20) - SMA(Close,50)") == first
+    assert graph.add("Close * Volume") == graph.add("Volume * Close")
+    graph.add("(EMA(Close, 20) + SMA(Close, 50)) / 2")
+    # 새 노드: +, /, Volume, *, 상수 2
+    assert len(graph) == size + 5
+
+
+def test_macros_expand_to_functions(ohlcv):
+    columns = ohlcv_columns(ohlcv)
+    results = evaluate_formulas(
+        {"atr": "ATR(14)", "manual": "SMA(TR, 14)", "range": "[Close] - LAG(Close, 1)"},
+        columns,
+    )
+
+    np.testing.assert_array_equal(results["atr"], results["manual"])
+    np.testing.assert_array_equal(results["range"], ohlcv["Close"].diff().to_numpy())
+
+
+@pytest.mark.parametrize(
+    "formula, expected",
+    [
+        ("1 + 2 * 3", 7.0),
+        ("-2 ^ 2", -4.0),
+        ("2 ^ 3 ^ 2", 512.0),
+        ("(1 + 2) * 3", 9.0),
+        ("10 / 4 - .5", 2.0),
+    ],
+)
+def test_operator_precedence(formula, expected):
+    results = evaluate_formulas({"x": formula}, {"Close": np.zeros(3)})
+
+    np.testing.assert_array_equal(results["x"], np.full(3, expected))
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "SMA(Close)",
+        "SMA(Close, 2.5)",
+        "SMA(Close, 0)",
+        "GREATEST(Close)",
+        "Foo(Close, 3)",
+        "Price + 1",
+        "Close +",
+        "(Close",
+        "Close $ 2",
+        "ATR()",
+    ],
+)
+def test_invalid_formulas_raise(formula):
+    with pytest.raises(ValueError):
+        ExpressionGraph().add(formula)
+
+
+def test_unknown_column_reference_raises(ohlcv):
+    with pytest.raises(ValueError):
+        evaluate_formulas({"x": "[RSI(14)] / 100"}, ohlcv_columns(ohlcv))
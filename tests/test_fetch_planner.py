@@ -0,0 +1,137 @@
+"""누락 구간 수집 계획 테스트"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.fetch_planner import FetchPlanner, trading_sessions
+from src.store import OHLCVStore
+
+
+def make_bars(start: str, end: str, close: float = 100.0) -> pd.DataFrame:
+    """기간 안의 모든 거래일에 대한 OHLCV 봉"""
+    sessions = trading_sessions(start, end)
+    return pd.DataFrame(
+        {
+            "Date": sessions,
+            "Open": close,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": 1000.0,
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path) -> OHLCVStore:
+    return OHLCVStore(tmp_path / "store")
+
+
+def test_missing_ranges_group_consecutive_sessions(store):
+    bars = make_bars("2021-01-04", "2021-03-31")
+    store.upsert("SPY", bars.drop(index=[5, 6, 7, 20]))
+    planner = FetchPlanner(store, history_start="2021-01-04")
+
+    ranges = planner.missing_ranges("SPY", end=date(2021, 3, 31))
+    assert ranges == [
+        (bars["Date"][5].date(), bars["Date"][7].date(), 3),
+        (bars["Date"][20].date(), bars["Date"][20].date(), 1),
+    ]
+    merged = FetchPlanner(store, history_start="2021-01-04", max_gap=12)
+    assert merged.missing_ranges("SPY", end=date(2021, 3, 31)) == [
+        (bars["Date"][5].date(), bars["Date"][20].date(), 16)
+    ]
+
+
+def test_missing_ranges_start_at_first_stored_date(store):
+    store.upsert("NEW", make_bars("2021-03-01", "2021-03-31"))
+    planner = FetchPlanner(store, history_start="2021-01-04")
+
+    assert planner.missing_ranges("NEW", end=date(2021, 3, 31)) == []
+    backfill = planner.missing_ranges(
+        "NEW", start=date(2021, 1, 4), end=date(2021, 3, 31)
+    )
+    assert backfill == [(date(2021, 1, 4), date(2021, 2, 26), 38)]
+    assert planner.missing_ranges("NONE", end=date(2021, 1, 8)) == [
+        (date(2021, 1, 4), date(2021, 1, 8), 5)
+    ]
+
+
+def test_plan_batches_identical_ranges(store):
+    bars = make_bars("2021-01-04", "2021-06-30")
+    for symbol in ("A", "B"):
+        store.upsert(symbol, bars.drop(index=range(10, 30)))
+    store.upsert("C", bars.drop(index=range(15, 20)))
+    planner = FetchPlanner(store, history_start="2021-01-04")
+
+    requests = planner.plan(["A", "B", "C"], end=date(2021, 6, 30))
+    assert [(r.symbols, r.sessions) for r in requests] == [
+        (("A", "B"), 20),
+        (("C",), 5),
+    ]
+
+
+def test_plan_does_not_pull_short_gap_into_new_symbol_history(store):
+    bars = make_bars("2021-01-04", "2021-06-30")
+    store.upsert("^GSPC", bars.drop(index=[60]))
+    planner = FetchPlanner(store, history_start="2021-01-04", max_gap=5)
+
+    alone = planner.plan(["^GSPC"], end=date(2021, 6, 30))
+    together = planner.plan(["^GSPC", "NEW"], end=date(2021, 6, 30))
+    assert together == [
+        (("NEW",), date(2021, 1, 4), date(2021, 6, 30), len(bars)),
+        alone[0],
+    ]
+    assert alone[0].sessions == 1
+
+
+def test_plan_groups_ranges_within_max_gap(store):
+    bars = make_bars("2021-01-04", "2021-06-30")
+    store.upsert("A", bars.drop(index=range(10, 30)))
+    store.upsert("B", bars.drop(index=range(12, 29)))
+    store.upsert("C", bars.drop(index=range(25, 40)))
+    planner = FetchPlanner(store, history_start="2021-01-04", max_gap=3)
+
+    requests = planner.plan(["A", "B", "C"], end=date(2021, 6, 30))
+    assert [r.symbols for r in requests] == [("A", "B"), ("C",)]
+    assert (requests[0].start, requests[0].end, requests[0].sessions) == (
+        bars["Date"][10].date(),
+        bars["Date"][29].date(),
+        20,
+    )
+
+
+@pytest.mark.parametrize(
+    "now, expected",
+    [
+        ("2025-03-21 21:30", date(2025, 3, 21)),  # 일일 워크플로 시각 (장 마감 후)
+        ("2025-03-21 19:59", date(2025, 3, 20)),  # 장중 (EDT 15:59)
+        ("2025-03-21 20:00", date(2025, 3, 21)),  # 마감 시각
+        ("2025-01-10 21:05", date(2025, 1, 10)),  # EST 16:05
+        ("2025-01-10 20:59", date(2025, 1, 8)),  # 장중, 전날은 임시 휴장일
+        ("2025-03-22 12:00", date(2025, 3, 21)),  # 토요일
+        ("2025-03-24 01:00", date(2025, 3, 21)),  # 월요일 새벽 (뉴욕은 일요일 밤)
+        ("2025-07-04 22:00", date(2025, 7, 3)),  # 독립기념일
+        (pd.Timestamp("2025-03-21 17:30", tz="America/New_York"), date(2025, 3, 21)),
+    ],
+)
+def test_default_end_is_last_closed_session(now, expected):
+    assert FetchPlanner.default_end(now) == expected
+
+
+def test_plan_includes_todays_closed_session(store, monkeypatch):
+    store.upsert("SPY", make_bars("2025-03-03", "2025-03-20"))
+    planner = FetchPlanner(store, history_start="2025-03-03")
+    # 일일 워크플로 시각으로 시계 고정
+    default_end = FetchPlanner.default_end
+    clock = pd.Timestamp("2025-03-21 21:30", tz="UTC")
+    monkeypatch.setattr(
+        FetchPlanner, "default_end", staticmethod(lambda now=None: default_end(clock))
+    )
+
+    requests = planner.plan(["SPY"])
+    assert [(r.start, r.end, r.sessions) for r in requests] == [
+        (date(2025, 3, 21), date(2025, 3, 21), 1)
+    ]
@@ -0,0 +1,121 @@
+"""다중 심볼 수집기(속도 제한, 재시도, 제한 시간)와 데이터 제공자 테스트"""
+
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_ohlcv
+from src.fetcher import MultiSymbolFetcher, RateLimiter
+from src.providers import FileProvider, YFinanceProvider
+
+SYMBOLS = [f"SYM{i}" for i in range(8)]
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    """심볼별 합성 OHLCV CSV 디렉토리"""
+    directory = tmp_path_factory.mktemp("provider")
+    for i, symbol in enumerate(SYMBOLS):
+        df = generate_ohlcv(300, seed=i, start="2020-01-01")
+        df.to_csv(directory / f"{symbol}.csv", index=False)
+    return directory
+
+
+def fetcher(provider, **kwargs) -> MultiSymbolFetcher:
+    """테스트용 짧은 백오프 수집기"""
+    options = {
+        "max_workers": 4,
+        "rate_limit": 1000.0,
+        "burst": 10,
+        "max_retries": 10,
+        "backoff_base": 0.001,
+        "backoff_max": 0.01,
+        "timeout": 5.0,
+    }
+    options.update(kwargs)
+    return MultiSymbolFetcher(provider, **options)
+
+
+def test_file_provider_returns_inclusive_range(data_dir):
+    df = FileProvider(data_dir).fetch("SYM0", date(2020, 3, 2), date(2020, 3, 6))
+
+    assert df.columns.tolist() == ["Date", "Open", "High", "Low", "Close", "Volume"]
+    assert df["Date"].iloc[0] == date(2020, 3, 2)
+    assert df["Date"].iloc[-1] == date(2020, 3, 6)
+    assert len(df) == 5
+
+
+def test_fetch_all_retries_transient_failures(data_dir):
+    provider = FileProvider(data_dir, failure_rate=0.3, seed=1)
+    result = fetcher(provider).fetch_all(SYMBOLS, date(2020, 1, 1))
+
+    assert sorted(result.data) == SYMBOLS
+    assert not result.errors
+    assert result.retries > 0
+    assert result.requests == len(SYMBOLS) + result.retries
+    expected = FileProvider(data_dir).fetch("SYM3", date(2020, 1, 1))
+    pd.testing.assert_frame_equal(result.data["SYM3"], expected)
+
+
+def test_missing_symbol_is_not_retried(data_dir):
+    result = fetcher(FileProvider(data_dir)).fetch_all(
+        ["SYM0", "MISSING"], date(2020, 1, 1)
+    )
+
+    assert list(result.data) == ["SYM0"]
+    assert "MISSING" in result.errors
+    assert result.requests == 2
+    assert result.retries == 0
+
+
+def test_slow_symbol_times_out(data_dir):
+    provider = FileProvider(data_dir, latency=0.2)
+    result = fetcher(provider, timeout=0.05).fetch_all(["SYM0"], date(2020, 1, 1))
+
+    assert not result.data
+    assert "SYM0" in result.errors
+    assert result.summary()["failed"] == 1
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(rate=100.0, burst=1)
+    started = time.monotonic()
+    for _ in range(21):
+        limiter.acquire()
+
+    assert time.monotonic() - started >= 0.19
+
+
+def test_fetch_many_defaults_to_fetch(data_dir):
+    provider = FileProvider(data_dir)
+    frames = provider.fetch_many(["SYM0", "SYM1"], date(2020, 2, 3), date(2020, 2, 7))
+
+    assert list(frames) == ["SYM0", "SYM1"]
+    assert all(len(df) == 5 for df in frames.values())
+
+
+def test_yfinance_end_date_is_inclusive():
+    kwargs = YFinanceProvider._date_kwargs(date(2024, 1, 2), date(2024, 1, 5), 3.0)
+
+    assert kwargs == {"start": "2024-01-02", "end": "2024-01-06", "timeout": 3.0}
+
+
+def test_yfinance_frame_is_normalized():
+    index = pd.DatetimeIndex(["2024-01-02", "2024-01-03"], tz="America/New_York")
+    raw = pd.DataFrame(
+        {
+            "Open": [1.0, 2.0],
+            "High": [1.5, 2.5],
+            "Low": [0.5, 1.5],
+            "Close": [1.2, 2.2],
+            "Volume": [100, 200],
+            "Dividends": [0.0, 0.0],
+        },
+        index=pd.Index(index, name="Date"),
+    )
+    df = YFinanceProvider._normalize(raw)
+
+    assert df.columns.tolist() == ["Date", "Open", "High", "Low", "Close", "Volume"]
+    assert df["Date"].tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
@@ -0,0 +1,92 @@
+"""시그널 전환 가격(후보 봉 평가, 전환 목록, 틱 비교) 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.flip_levels import FlipLevels
+from src.settings import ADAPTIVE_THRESHOLDS
+from src.signal_generator import SignalGenerator
+
+
+@pytest.fixture(scope="module")
+def flips(ohlcv) -> FlipLevels:
+    """마지막 봉 직전까지의 데이터로 ±3% 구간 전환 가격을 계산한 객체"""
+    levels = FlipLevels(ohlcv.iloc[:-1], search_range=0.03, grid_points=25)
+    levels.compute()
+    return levels
+
+
+def sample_prices(flips: FlipLevels) -> np.ndarray:
+    """전환 가격에서 허용 오차보다 떨어진 탐색 구간 안의 가격"""
+    span = flips.search_range * flips.reference
+    prices = np.linspace(flips.reference - span, flips.reference + span, 23)[1:-1]
+    margin = 2 * flips.tolerance * flips.reference
+    distance = np.abs(prices[:, None] - flips.levels["Price"].to_numpy()[None, :])
+    return prices[(distance > margin).all(axis=1)]
+
+
+def test_evaluate_matches_full_run(ohlcv, signals):
+    last = ohlcv.iloc[-1]
+    levels = FlipLevels(ohlcv.iloc[:-1])
+    levels._bar.update(
+        Open=last["Open"], High=last["High"], Low=last["Low"], Volume=last["Volume"]
+    )
+
+    values = levels.evaluate(np.array([last["Close"]])).iloc[0]
+    expected = signals.iloc[-1][values.index]
+    assert values.to_dict() == expected.astype(int).to_dict()
+
+
+def test_signals_at_matches_brute_force(flips):
+    prices = sample_prices(flips)
+    expected = flips.evaluate(prices)
+
+    assert len(flips.levels) > 0
+    for price, row in zip(prices, expected.itertuples(index=False)):
+        assert flips.signals_at(price) == dict(zip(expected.columns, row))
+
+
+def test_check_reports_changed_signals(flips):
+    base = dict(zip(flips.signals, flips.base.tolist()))
+    assert flips.check(flips.reference) == []
+
+    for price in sample_prices(flips):
+        values = flips.signals_at(price)
+        changed = [signal for signal in flips.signals if values[signal] != base[signal]]
+        # check는 가장 가까운 전환만 보므로 두 번 바뀌어 돌아온 시그널도 포함
+        assert set(changed) <= set(flips.check(price))
+
+
+def test_levels_bracket_each_flip(flips):
+    width = flips.tolerance * flips.reference
+    for signal, price, old, new in flips.levels.itertuples(index=False):
+        around = flips.evaluate(np.array([price - width, price + width]))
+        below, above = around[signal].tolist()
+        assert (below, above) == (old, new)
+
+
+def test_next_bar_quantiles_match_full_run(ohlcv, indicators, monkeypatch):
+    monkeypatch.setitem(ADAPTIVE_THRESHOLDS, "enabled", True)
+    generator = SignalGenerator(indicators_df=indicators)
+    generator.generate_all()
+    expected = generator.signals_df.iloc[-1]
+
+    last = ohlcv.iloc[-1]
+    levels = FlipLevels(ohlcv.iloc[:-1])
+    levels._bar.update(
+        Open=last["Open"], High=last["High"], Low=last["Low"], Volume=last["Volume"]
+    )
+    values = levels.evaluate(np.array([last["Close"]])).iloc[0]
+    assert values.to_dict() == expected[values.index].astype(int).to_dict()
+
+
+def test_grid_points_must_cover_an_interval(ohlcv):
+    with pytest.raises(ValueError):
+        FlipLevels(ohlcv.iloc[:300], grid_points=1)
+
+
+def test_levels_are_sorted_by_price(flips):
+    assert flips.levels.columns.tolist() == ["Signal", "Price", "Old", "New"]
+    assert flips.levels["Price"].is_monotonic_increasing
+    assert isinstance(flips.date, pd.Timestamp)
@@ -0,0 +1,130 @@
+"""지표 디스크 캐시(적중, 부분 적중, 버전, LRU 삭제, 인덱스 복구) 테스트"""
+
+import itertools
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+import src.indicator_cache as indicator_cache
+import src.technical_indicator as technical_indicator
+from src.indicator_cache import DataFingerprint, IndicatorCache
+from src.technical_indicator import TechnicalIndicator
+
+FAMILY = ("SMA", "_calculate_sma", (20,))
+
+
+def assert_same_indicators(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    """칼럼, 날짜, 지표 값(상대 오차 1e-7 이내)이 같은지 확인합니다."""
+    assert actual.columns.tolist() == expected.columns.tolist()
+    np.testing.assert_array_equal(
+        actual["Date"].to_numpy(), expected["Date"].to_numpy()
+    )
+    values = [column for column in expected.columns if column != "Date"]
+    np.testing.assert_allclose(
+        actual[values].to_numpy(dtype=np.float64),
+        expected[values].to_numpy(dtype=np.float64),
+        rtol=1e-7,
+        atol=1e-9,
+    )
+
+
+def cached_run(df: pd.DataFrame, cache: IndicatorCache) -> pd.DataFrame:
+    """주어진 캐시로 지표를 계산합니다."""
+    indicator = TechnicalIndicator(df=df, use_cache=False, max_workers=1)
+    indicator.cache = cache
+    indicator.calculate_all()
+    return indicator.indicators_df
+
+
+def test_prefix_hit_matches_full_recompute(tmp_path, ohlcv, indicators):
+    cached_run(ohlcv.iloc[:1200], IndicatorCache(tmp_path, version="v"))
+
+    cache = IndicatorCache(tmp_path, version="v")
+    result = cached_run(ohlcv, cache)
+    assert cache.stats["prefix_hits"] > 0
+    assert cache.stats["misses"] == 0
+    assert_same_indicators(result, indicators)
+
+    cache = IndicatorCache(tmp_path, version="v")
+    result = cached_run(ohlcv, cache)
+    assert cache.stats["prefix_hits"] == cache.stats["misses"] == 0
+    assert_same_indicators(result, indicators)
+
+
+def test_changed_history_misses(tmp_path, ohlcv):
+    cache = IndicatorCache(tmp_path, version="v")
+    cache.store(FAMILY, DataFingerprint(ohlcv), {"SMA": np.ones(len(ohlcv))}, {})
+
+    changed = ohlcv.copy()
+    changed.loc[100, "Close"] += 1.0
+    assert cache.lookup(FAMILY, DataFingerprint(changed)) is None
+    assert cache.lookup(FAMILY, DataFingerprint(ohlcv.iloc[:-1])) is None
+    assert cache.lookup(FAMILY, DataFingerprint(ohlcv)).rows == len(ohlcv)
+
+
+def test_source_version_salts_keys(tmp_path, ohlcv):
+    fingerprint = DataFingerprint(ohlcv)
+    IndicatorCache(tmp_path, version="v1").store(
+        FAMILY, fingerprint, {"SMA": np.ones(len(ohlcv))}, {}
+    )
+
+    assert IndicatorCache(tmp_path, version="v2").lookup(FAMILY, fingerprint) is None
+    assert IndicatorCache(tmp_path, version="v1").lookup(FAMILY, fingerprint)
+
+
+def test_default_version_hashes_calculation_source(ohlcv):
+    indicator = TechnicalIndicator(df=ohlcv, use_cache=True)
+    version = indicator_cache.source_version(technical_indicator)
+    assert indicator.cache.version == f"{indicator_cache.CACHE_VERSION}.{version}"
+    assert version != indicator_cache.source_version(indicator_cache)
+
+
+def test_lru_evicts_least_recently_used(tmp_path, ohlcv, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(indicator_cache, "time", SimpleNamespace(time=clock.__next__))
+    fingerprint = DataFingerprint(ohlcv)
+    columns = {"SMA": np.ones(len(ohlcv))}
+    families = [("SMA", "_calculate_sma", (period,)) for period in (5, 10, 20)]
+
+    cache = IndicatorCache(tmp_path, max_bytes=10**9, version="v")
+    cache.store(families[0], fingerprint, columns, {})
+    size = next(iter(cache.index.values()))["bytes"]
+    cache.max_bytes = 2 * size
+    cache.store(families[1], fingerprint, columns, {})
+    assert cache.lookup(families[0], fingerprint) is not None
+    cache.store(families[2], fingerprint, columns, {})
+
+    assert cache.stats["evictions"] == 1
+    assert cache.lookup(families[1], fingerprint) is None
+    assert cache.lookup(families[0], fingerprint) is not None
+    assert cache.lookup(families[2], fingerprint) is not None
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+
+def test_corrupt_index_is_reset(tmp_path, ohlcv):
+    fingerprint = DataFingerprint(ohlcv)
+    IndicatorCache(tmp_path, version="v").store(
+        FAMILY, fingerprint, {"SMA": np.ones(len(ohlcv))}, {}
+    )
+    (tmp_path / indicator_cache.INDEX_FILE).write_text("{not json", encoding="utf-8")
+
+    cache = IndicatorCache(tmp_path, version="v")
+    assert cache.lookup(FAMILY, fingerprint) is None
+    cache.store(FAMILY, fingerprint, {"SMA": np.ones(len(ohlcv))}, {})
+    index = json.loads((tmp_path / indicator_cache.INDEX_FILE).read_text())
+    assert len(index) == 1
+    assert IndicatorCache(tmp_path, version="v").lookup(FAMILY, fingerprint)
+
+
+def test_corrupt_entry_file_misses(tmp_path, ohlcv):
+    fingerprint = DataFingerprint(ohlcv)
+    cache = IndicatorCache(tmp_path, version="v")
+    cache.store(FAMILY, fingerprint, {"SMA": np.ones(len(ohlcv))}, {})
+    cache.flush()
+    next(tmp_path.glob("*.npz")).write_bytes(b"truncated")
+
+    cache = IndicatorCache(tmp_path, version="v")
+    assert cache.lookup(FAMILY, fingerprint) is None
+    assert cache.stats["misses"] == 1
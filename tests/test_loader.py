@@ -0,0 +1,44 @@
+"""CSV 로더와 바이너리 스냅샷 테스트"""
+
+import os
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_ohlcv
+from src.loader import load_csv, read_ohlcv, snapshot_path
+from src.settings import PROCESSED_DATA_DIR, SNAPSHOT_DIR
+
+
+def test_project_snapshots_stay_out_of_published_output():
+    snap = snapshot_path(PROCESSED_DATA_DIR / "indicators.csv")
+    assert snap == SNAPSHOT_DIR / "output" / "indicators.csv.snapshot.npz"
+    assert PROCESSED_DATA_DIR.resolve() not in snap.resolve().parents
+
+
+def test_snapshot_is_reused_and_matches_csv(tmp_path):
+    path = tmp_path / "ohlcv.csv"
+    generate_ohlcv(300, seed=1).to_csv(path, index=False)
+    snap = snapshot_path(path)
+    assert snap == path.resolve().with_name("ohlcv.csv.snapshot.npz")
+
+    first = read_ohlcv(path)
+    assert snap.exists()
+    mtime = snap.stat().st_mtime_ns
+    pd.testing.assert_frame_equal(read_ohlcv(path), first)
+    assert snap.stat().st_mtime_ns == mtime
+    pd.testing.assert_frame_equal(first, read_ohlcv(path, snapshot=False))
+
+    # 수정 시각만 바뀌면 해시 비교로 스냅샷을 그대로 사용
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+    pd.testing.assert_frame_equal(read_ohlcv(path), first)
+
+
+def test_snapshot_is_rebuilt_when_source_changes(tmp_path):
+    path = tmp_path / "ohlcv.csv"
+    df = generate_ohlcv(50, seed=2)
+    df.to_csv(path, index=False)
+    load_csv(path)
+
+    df.loc[10, "Close"] = 1.0
+    df.to_csv(path, index=False)
+    assert load_csv(path).loc[10, "Close"] == 1.0
@@ -0,0 +1,84 @@
+"""2비트 압축 시그널과 합의 조회 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.packed_signals import PackedSignals, group_signals
+
+
+@pytest.fixture(scope="module")
+def random_signals() -> pd.DataFrame:
+    """23개 시그널의 무작위 -1/0/1 데이터 (워드 경계에 맞지 않는 행 수)"""
+    rng = np.random.default_rng(11)
+    values = rng.choice([-1, 0, 1], size=(1000, 23), p=[0.3, 0.3, 0.4])
+    df = pd.DataFrame(values, columns=[f"S{i}" for i in range(23)])
+    df.insert(0, "Date", pd.bdate_range("2010-01-04", periods=len(df)))
+    return df
+
+
+def naive_consensus(
+    signals: pd.DataFrame, k: int, columns, value: int, start=None, end=None
+) -> np.ndarray:
+    """행마다 ``value`` 인 시그널 개수를 세어 k 이상인지 반환합니다."""
+    rows = pd.Series(True, index=signals.index)
+    if start is not None:
+        rows &= signals["Date"] >= start
+    if end is not None:
+        rows &= signals["Date"] <= end
+    return (signals.loc[rows, columns] == value).sum(axis=1).to_numpy() >= k
+
+
+def test_pack_unpack_round_trip(signals):
+    packed = PackedSignals.pack(signals)
+    pd.testing.assert_frame_equal(packed.unpack(), signals, check_dtype=False)
+
+    window = packed.unpack("2002-03-01", "2002-09-30", signals=signals.columns[1:4])
+    dates = signals["Date"]
+    expected = signals.loc[
+        (dates >= "2002-03-01") & (dates <= "2002-09-30"), signals.columns[:4]
+    ].reset_index(drop=True)
+    pd.testing.assert_frame_equal(window, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("value", [1, -1])
+@pytest.mark.parametrize(
+    "start, end", [(None, None), ("2010-02-17", "2011-05-06"), ("2013-01-01", None)]
+)
+def test_consensus_matches_naive_count(random_signals, value, start, end):
+    packed = PackedSignals.pack(random_signals)
+    columns = random_signals.columns[1:].tolist()
+    for k in range(len(columns) + 2):
+        np.testing.assert_array_equal(
+            packed.consensus_mask(k, value=value, start=start, end=end),
+            naive_consensus(random_signals, k, columns, value, start, end),
+            err_msg=f"k={k}",
+        )
+
+    subset = columns[::3]
+    np.testing.assert_array_equal(
+        packed.consensus_mask(3, signals=subset, value=value, start=start, end=end),
+        naive_consensus(random_signals, 3, subset, value, start, end),
+    )
+
+
+def test_group_consensus_matches_naive_count(signals):
+    packed = PackedSignals.pack(signals)
+    columns = group_signals(signals.columns, "모멘텀 지표")
+    assert columns
+    for k in (1, 2, len(columns) // 2, len(columns)):
+        dates = packed.consensus(k, signals="모멘텀 지표")
+        expected = signals["Date"][naive_consensus(signals, k, columns, 1)]
+        np.testing.assert_array_equal(dates.to_numpy(), expected.to_numpy())
+
+
+def test_extend_and_save_match_full_pack(tmp_path, random_signals):
+    packed = PackedSignals.pack(random_signals.iloc[:130])
+    packed.extend(random_signals.iloc[100:])
+    full = PackedSignals.pack(random_signals)
+    np.testing.assert_array_equal(packed.buy, full.buy)
+    np.testing.assert_array_equal(packed.sell, full.sell)
+
+    path = tmp_path / "packed.npz"
+    packed.save(path)
+    pd.testing.assert_frame_equal(PackedSignals.load(path).unpack(), full.unpack())
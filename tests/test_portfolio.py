@@ -0,0 +1,93 @@
+"""포트폴리오 백테스트와 봉 단위 루프 일치 테스트"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.portfolio import backtest, forward_fill, rebalance_rows, run_variants
+
+
+def loop_nav(
+    scores: np.ndarray,
+    prices: np.ndarray,
+    dates: np.ndarray,
+    top_k: int,
+    rebalance: str,
+    cost_bps: float,
+    min_score: Optional[float],
+) -> np.ndarray:
+    """봉마다 보유 수량으로 평가하고 리밸런싱 날짜에 다시 매수하는 기준 구현"""
+    prices = forward_fill(prices)
+    rows = set(rebalance_rows(dates, rebalance).tolist())
+    nav = np.ones(len(prices))
+    units = np.zeros(prices.shape[1])
+    cash = 1.0
+    for t in range(len(prices)):
+        held = units > 0
+        value = cash + float((units[held] * prices[t, held]).sum())
+        if t in rows:
+            current = np.zeros_like(units)
+            current[held] = units[held] * prices[t, held] / value
+            valid = np.isfinite(scores[t]) & np.isfinite(prices[t]) & (prices[t] > 0)
+            if min_score is not None:
+                valid &= scores[t] > min_score
+            ranked = np.where(valid, -scores[t], np.inf)
+            chosen = np.argsort(ranked, kind="stable")[:top_k]
+            chosen = chosen[valid[chosen]]
+            target = np.zeros_like(units)
+            target[chosen] = 1.0 / top_k
+            value *= 1.0 - np.abs(target - current).sum() * cost_bps / 10_000.0
+            units = np.zeros_like(units)
+            units[chosen] = target[chosen] * value / prices[t, chosen]
+            cash = value * (1.0 - target.sum())
+        nav[t] = value
+    return nav
+
+
+@pytest.fixture(scope="module")
+def panel():
+    """늦게 상장된 심볼, 결측 종가, 동점 점수가 섞인 (봉, 심볼) 패널"""
+    rng = np.random.default_rng(8)
+    shape = (400, 30)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, shape), axis=0))
+    prices[:120, 5] = np.nan
+    prices[rng.random(shape) < 0.02] = np.nan
+    scores = rng.integers(-3, 4, shape).astype(float)
+    scores[rng.random(shape) < 0.05] = np.nan
+    dates = pd.bdate_range("2015-01-01", periods=shape[0]).to_numpy()
+    return scores, prices, dates
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"top_k": 5, "rebalance": "W-FRI", "cost_bps": 10.0, "min_score": None},
+        {"top_k": 8, "rebalance": "M", "cost_bps": 25.0, "min_score": 0.0},
+        {"top_k": 40, "rebalance": "W-FRI", "cost_bps": 0.0, "min_score": 1.0},
+    ],
+)
+def test_nav_matches_per_bar_loop(panel, params):
+    scores, prices, dates = panel
+    result = backtest(scores, prices, dates, **params)
+    np.testing.assert_allclose(
+        result.nav, loop_nav(scores, prices, dates, **params), rtol=1e-12
+    )
+    assert result.to_frame()["NAV"].iloc[-1] == result.nav[-1]
+
+
+def test_variants_match_single_runs(panel):
+    scores, prices, dates = panel
+    variants = [{"top_k": 3}, {"top_k": 6, "cost_bps": 5.0, "rebalance": "M"}]
+    for workers in (1, 2):
+        results = run_variants(scores, prices, dates, variants, max_workers=workers)
+        for params, result in zip(variants, results):
+            expected = backtest(scores, prices, dates, **params)
+            np.testing.assert_array_equal(result.nav, expected.nav)
+
+
+def test_panel_shape_mismatch(panel):
+    scores, prices, dates = panel
+    with pytest.raises(ValueError):
+        backtest(scores[:, :-1], prices, dates)
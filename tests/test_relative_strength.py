@@ -0,0 +1,115 @@
+"""상대강도 지표(상대 수익률, 롤링 베타/알파/상관계수, 심볼 패널) 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_ohlcv
+from src.relative_strength import (
+    align_benchmark,
+    close_panel,
+    relative_panel,
+    relative_strength,
+    rolling_regression,
+)
+from src.store import OHLCVStore
+from src.technical_indicator import TechnicalIndicator
+
+WINDOW = 30
+
+
+@pytest.fixture(scope="module")
+def closes() -> np.ndarray:
+    """(봉, 심볼) 종가 패널 (두 번째 심볼은 앞 100봉이 상장 전)"""
+    panel = np.column_stack(
+        [generate_ohlcv(400, seed=seed)["Close"].to_numpy() for seed in (11, 12, 13)]
+    )
+    panel[:100, 1] = np.nan
+    return panel
+
+
+@pytest.fixture(scope="module")
+def benchmark() -> np.ndarray:
+    return generate_ohlcv(400, seed=10)["Close"].to_numpy()
+
+
+def window_returns(prices: np.ndarray, end: int) -> np.ndarray:
+    """봉 end에서 끝나는 WINDOW개 일간 수익률"""
+    prices = prices[np.arange(end - WINDOW, end + 1)]
+    return prices[1:] / prices[:-1] - 1.0
+
+
+def test_rolling_beta_matches_polyfit(closes, benchmark):
+    result = rolling_regression(closes, benchmark, WINDOW)
+
+    for end in (WINDOW, 150, 260, 399):
+        x = window_returns(benchmark, end)
+        for symbol in range(closes.shape[1]):
+            y = window_returns(closes[:, symbol], end)
+            if np.isnan(y).any():
+                assert np.isnan(result["beta"][end, symbol])
+                continue
+            beta, alpha = np.polyfit(x, y, 1)
+            assert result["beta"][end, symbol] == pytest.approx(beta, rel=1e-6)
+            assert result["alpha"][end, symbol] == pytest.approx(alpha, abs=1e-10)
+            corr = np.corrcoef(x, y)[0, 1]
+            assert result["corr"][end, symbol] == pytest.approx(corr, rel=1e-6)
+
+
+def test_regression_requires_full_window(closes, benchmark):
+    result = rolling_regression(closes, benchmark, WINDOW)
+
+    assert np.isnan(result["beta"][:WINDOW]).all()
+    # 상장 첫 봉(100)의 수익률은 NaN이므로 관측 WINDOW개는 봉 100 + WINDOW 에서 채워짐
+    listed = result["beta"][:, 1]
+    first = 100 + WINDOW
+    assert np.isnan(listed[:first]).all()
+    assert not np.isnan(listed[first:]).any()
+    with pytest.raises(ValueError):
+        rolling_regression(closes, benchmark, 1)
+
+
+def test_relative_strength_is_return_ratio(closes, benchmark):
+    period = 20
+    result = relative_strength(closes, benchmark, period)
+
+    expected = (closes[period:] / closes[:-period]) / (
+        benchmark[period:] / benchmark[:-period]
+    )[:, np.newaxis] - 1.0
+    np.testing.assert_allclose(result[period:], expected)
+    assert np.isnan(result[:period]).all()
+    assert relative_strength(closes[:, 0], benchmark, period).shape == (400, 1)
+
+
+def test_align_benchmark_fills_missing_sessions():
+    benchmark = pd.DataFrame(
+        {"Date": pd.to_datetime(["2024-01-03", "2024-01-05"]), "Close": [10.0, 12.0]}
+    )
+    dates = pd.Series(pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]))
+
+    aligned = align_benchmark(dates, benchmark)
+    np.testing.assert_array_equal(aligned, [np.nan, 10.0, 10.0])
+
+
+def test_panel_matches_single_symbol_indicator(tmp_path):
+    store = OHLCVStore(tmp_path / "store")
+    bench = generate_ohlcv(400, seed=10)
+    store.upsert("^GSPC", bench)
+    symbols = {"AAA": generate_ohlcv(400, seed=11)}
+    symbols["BBB"] = generate_ohlcv(300, seed=12, start=str(bench["Date"][100].date()))
+    for symbol, df in symbols.items():
+        store.upsert(symbol, df)
+
+    panel = relative_panel(close_panel(list(symbols), store))
+    for symbol, df in symbols.items():
+        indicator = TechnicalIndicator(df=df, benchmark=bench)
+        indicator.calculate_all()
+        single = indicator.indicators_df.set_index("Date")
+        for name, values in panel.items():
+            column = values[symbol].dropna()
+            np.testing.assert_allclose(
+                column.to_numpy(),
+                single.loc[column.index, name].to_numpy(dtype=np.float64),
+                rtol=1e-6,
+                err_msg=f"{symbol} {name}",
+            )
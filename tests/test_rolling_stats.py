@@ -0,0 +1,61 @@
+"""증분 롤링 분위수와 pandas 롤링 분위수 일치 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.rolling_stats import RollingQuantile, RollingQuantiles
+
+
+def pandas_quantile(values: np.ndarray, window: int, q: float, min_periods=None):
+    rolling = pd.Series(values).rolling(
+        window, min_periods=window if min_periods is None else min_periods
+    )
+    return rolling.quantile(q).to_numpy()
+
+
+@pytest.fixture(scope="module")
+def values() -> np.ndarray:
+    """중복 값과 결측값이 섞인 무작위 보행"""
+    rng = np.random.default_rng(21)
+    values = np.round(rng.standard_normal(3000).cumsum(), 1)
+    values[rng.random(len(values)) < 0.03] = np.nan
+    return values
+
+
+@pytest.mark.parametrize("window", [1, 2, 21, 252])
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.5, 0.9, 1.0])
+def test_matches_pandas(values, window, q):
+    np.testing.assert_allclose(
+        RollingQuantile(window, q).update_many(values),
+        pandas_quantile(values, window, q),
+        rtol=1e-12,
+        equal_nan=True,
+    )
+
+
+def test_min_periods_matches_pandas(values):
+    np.testing.assert_allclose(
+        RollingQuantile(63, 0.25, min_periods=10).update_many(values),
+        pandas_quantile(values, 63, 0.25, min_periods=10),
+        rtol=1e-12,
+        equal_nan=True,
+    )
+
+
+def test_keyed_updates_continue_state(values):
+    quantiles = RollingQuantiles(window=50)
+    parts = [quantiles.update("RSI", 0.1, part) for part in np.array_split(values, 7)]
+    np.testing.assert_allclose(
+        np.concatenate(parts),
+        pandas_quantile(values, 50, 0.1),
+        rtol=1e-12,
+        equal_nan=True,
+    )
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        RollingQuantile(0, 0.5)
+    with pytest.raises(ValueError):
+        RollingQuantile(10, 1.5)
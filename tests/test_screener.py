@@ -0,0 +1,91 @@
+"""스크리너 정렬 인덱스와 전체 탐색 일치 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.screener import Screener
+
+PREDICATES = {
+    "[RSI(14)] < 30": lambda v: v["RSI(14)"] < 30,
+    "[RSI(14)] >= 70 and Close > [SMA_(50)]": lambda v: (v["RSI(14)"] >= 70)
+    & (v["Close"] > v["SMA_(50)"]),
+    "not [RSI(14)] > 50 or [MACD] is buy": lambda v: ~(v["RSI(14)"] > 50)
+    | (v["MACD"] == 1),
+    "[MACD] != neutral and 40 <= [RSI(14)]": lambda v: (v["MACD"] != 0)
+    & (40 <= v["RSI(14)"]),
+    "Close / [SMA_(50)] - 1 > 0.05": lambda v: v["Close"] / v["SMA_(50)"] - 1 > 0.05,
+    "[RSI(14)] == 50": lambda v: v["RSI(14)"] == 50,
+}
+
+
+def random_snapshot(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    """결측값과 중복 값이 섞인 심볼별 스냅샷"""
+    rsi = rng.integers(0, 101, n).astype(float)
+    rsi[rng.random(n) < 0.05] = np.nan
+    close = rng.uniform(50.0, 150.0, n)
+    sma = close * rng.uniform(0.9, 1.1, n)
+    sma[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame(
+        {
+            "Date": pd.Timestamp("2024-01-02"),
+            "RSI(14)": rsi,
+            "Close": close,
+            "SMA_(50)": sma,
+            "MACD": rng.choice([-1.0, 0.0, 1.0], n),
+        },
+        index=[f"SYM{i:04d}" for i in range(n)],
+    )
+
+
+def assert_matches_scan(screener: Screener) -> None:
+    """모든 조건식의 결과가 스냅샷 전체 탐색과 같은지 확인합니다."""
+    snapshot = screener.to_frame()
+    values = {column: snapshot[column].to_numpy() for column in screener.columns}
+    for predicate, scan in PREDICATES.items():
+        np.testing.assert_array_equal(
+            screener.mask(predicate), scan(values), err_msg=predicate
+        )
+
+
+@pytest.fixture
+def screener() -> Screener:
+    screener = Screener(capacity=8)
+    screener.load_frame(random_snapshot(np.random.default_rng(5), 500))
+    return screener
+
+
+def test_index_matches_full_scan(screener):
+    assert len(screener) == 500
+    assert_matches_scan(screener)
+
+
+def test_index_matches_full_scan_after_updates(screener):
+    assert_matches_scan(screener)  # 정렬 인덱스 생성
+    rng = np.random.default_rng(6)
+    for row in rng.integers(0, 520, 300):
+        values = {
+            "RSI(14)": np.nan if rng.random() < 0.1 else float(rng.integers(0, 101)),
+            "Close": rng.uniform(50.0, 150.0),
+            "MACD": float(rng.choice([-1, 0, 1])),
+        }
+        screener.update(f"SYM{row:04d}", "2024-01-03", values)
+    assert len(screener) > 500
+    assert_matches_scan(screener)
+
+
+def test_older_bar_is_ignored(screener):
+    assert not screener.update("SYM0000", "2023-12-29", {"RSI(14)": 10.0})
+    assert screener.select("[RSI(14)] == 10") == [
+        symbol
+        for symbol, value in screener.to_frame()["RSI(14)"].items()
+        if value == 10
+    ]
+
+
+def test_save_and_load(tmp_path, screener):
+    path = tmp_path / "screener_snapshot.npz"
+    screener.save(path)
+    loaded = Screener.load(path)
+    pd.testing.assert_frame_equal(loaded.to_frame(), screener.to_frame())
+    assert_matches_scan(loaded)
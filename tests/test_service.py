@@ -0,0 +1,130 @@
+"""서비스 모드(로드, 증분 반영, 응답 캐시, 감시 디렉토리, HTTP) 테스트"""
+
+import json
+import threading
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.service import SignalService
+
+
+@pytest.fixture
+def service(tmp_path, ohlcv) -> SignalService:
+    """앞 1400개 봉을 로드한 서비스"""
+    data_file = tmp_path / "ohlcv.csv"
+    ohlcv.iloc[:1400].to_csv(data_file, index=False)
+    service = SignalService(data_file=data_file, watch_dir=tmp_path / "incoming")
+    service.load()
+    return service
+
+
+def assert_matches_full_run(service, indicators, signals) -> None:
+    """서비스 상태가 전체 구간 계산 결과와 같은지 확인합니다."""
+    state = service.state
+    np.testing.assert_array_equal(state.dates, indicators["Date"].to_numpy())
+    np.testing.assert_allclose(
+        state.indicator_values,
+        indicators[state.indicator_columns].to_numpy(dtype=np.float64),
+        rtol=1e-6,
+        atol=1e-6,
+    )
+    np.testing.assert_array_equal(
+        state.signal_values, signals[state.signal_columns].to_numpy(dtype=np.int8)
+    )
+
+
+def test_ingest_matches_full_run(service, ohlcv, indicators, signals):
+    recomputed = service.ingest(ohlcv.iloc[1400:])
+
+    assert recomputed == 100
+    assert service.state.version == 1
+    assert_matches_full_run(service, indicators, signals)
+
+
+def test_ingest_replaces_overlapping_bars(service, ohlcv, indicators, signals):
+    changed = ohlcv.iloc[1390:1400].copy()
+    changed["Close"] *= 1.01
+    service.ingest(changed)
+
+    assert service.ingest(ohlcv.iloc[1390:]) == 110
+    assert_matches_full_run(service, indicators, signals)
+
+
+def test_handle_caches_per_version(service, ohlcv):
+    status, body = service.handle("/signals/latest")
+    assert status == 200
+    payload = json.loads(body)
+    assert payload["date"] == str(ohlcv["Date"].iloc[1399].date())
+    assert service.handle("/signals/latest")[1] is body
+
+    service.ingest(ohlcv.iloc[1400:1401])
+    status, body = service.handle("/signals/latest")
+    assert json.loads(body)["date"] == str(ohlcv["Date"].iloc[1400].date())
+
+    assert service.handle("/unknown")[0] == 404
+    assert service.handle("/screen")[0] == 400
+
+
+def test_indicators_range(service, ohlcv):
+    start, end = ohlcv["Date"].iloc[[100, 109]].dt.strftime("%Y-%m-%d")
+    status, body = service.handle(f"/indicators?from={start}&to={end}")
+
+    payload = json.loads(body)
+    assert status == 200
+    assert payload["index"][0] == start
+    assert payload["index"][-1] == end
+    assert len(payload["data"]) == 10
+    assert payload["columns"] == service.state.indicator_columns
+
+
+def test_score_uses_latest_signals(service):
+    payload = service.score()
+    weights = payload["weights"]
+    latest = service.latest_signals()["signals"]
+
+    assert weights
+    assert -1.0 <= payload["score"] <= 1.0
+    assert set(weights) <= set(latest)
+
+
+def test_poll_watch_dir_ingests_new_files_once(service, ohlcv, indicators, signals):
+    service.watch_dir.mkdir()
+    ohlcv.iloc[1400:].to_csv(service.watch_dir / "bars.csv", index=False)
+
+    assert service.poll_watch_dir() == 1
+    assert service.poll_watch_dir() == 0
+    assert_matches_full_run(service, indicators, signals)
+
+
+def test_http_server(service):
+    server = service.make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/signals/latest"
+        with urllib.request.urlopen(url) as response:
+            assert response.status == 200
+            assert json.loads(response.read()) == service.latest_signals()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_load_rejects_unknown_columns(tmp_path, ohlcv):
+    data_file = tmp_path / "ohlcv.csv"
+    ohlcv.drop(columns=["Volume"]).to_csv(data_file, index=False)
+
+    with pytest.raises(ValueError):
+        SignalService(data_file=data_file).load()
+
+
+def test_service_dates_are_sorted(tmp_path, ohlcv):
+    data_file = tmp_path / "ohlcv.csv"
+    ohlcv.iloc[:300].iloc[::-1].to_csv(data_file, index=False)
+    service = SignalService(data_file=data_file)
+    service.load()
+
+    assert pd.Index(service.state.dates).is_monotonic_increasing
@@ -0,0 +1,72 @@
+"""공유 메모리 데이터프레임(게시, 작업 프로세스 연결, 수명 관리) 테스트"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.shared_frame import SharedFrame, SharedFrameHandle
+
+
+def column_sums(handle: SharedFrameHandle) -> dict:
+    """작업 프로세스에서 세그먼트에 붙어 칼럼 합계를 계산합니다."""
+    frame = SharedFrame.attach(handle)
+    sums = {
+        column: float(values.sum())
+        for column, values in frame.arrays(["Close", "Volume"]).items()
+    }
+    frame.close()
+    return sums
+
+
+def segment_exists(name: str) -> bool:
+    """POSIX 공유 메모리 세그먼트가 남아 있는지 확인합니다."""
+    return (Path("/dev/shm") / name).exists()
+
+
+def test_publish_round_trip(ohlcv):
+    frame = ohlcv.assign(Flag=np.arange(len(ohlcv), dtype=np.int8))
+    with SharedFrame.publish(frame) as shared:
+        pd.testing.assert_frame_equal(shared.to_frame(), frame)
+        views = shared.arrays(["Close"])
+        assert list(views) == ["Close"]
+        assert not views["Close"].flags.writeable
+
+
+def test_object_columns_are_rejected(ohlcv):
+    with pytest.raises(TypeError):
+        SharedFrame.publish(ohlcv.assign(Symbol="SPY"))
+
+
+def test_workers_attach_without_unlinking(ohlcv):
+    shared = SharedFrame.publish(ohlcv)
+    name = shared.handle.name
+    try:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(column_sums, [shared.handle] * 4))
+
+        expected = {
+            "Close": float(ohlcv["Close"].sum()),
+            "Volume": float(ohlcv["Volume"].sum()),
+        }
+        assert results == [expected] * 4
+        if Path("/dev/shm").exists():
+            assert segment_exists(name)
+    finally:
+        shared.close()
+
+    if Path("/dev/shm").exists():
+        assert not segment_exists(name)
+    with pytest.raises(ValueError):
+        shared.arrays()
+    shared.close()
+
+
+def test_views_survive_owner_close(ohlcv):
+    shared = SharedFrame.publish(ohlcv)
+    close = shared.arrays(["Close"])["Close"]
+    shared.close()
+
+    np.testing.assert_array_equal(close, ohlcv["Close"].to_numpy())
@@ -0,0 +1,86 @@
+"""시그널 전환 이벤트 저장과 복원 테스트"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.signal_events import (
+    HEADER_PREFIX,
+    append_signal_events,
+    read_signal_events,
+    reconstruct_signals,
+    signal_events,
+)
+
+
+def assert_reconstructed(path, signals: pd.DataFrame) -> None:
+    """이벤트 파일에서 복원한 시그널이 원래 시그널과 같은지 확인합니다."""
+    restored = reconstruct_signals(read_signal_events(path), signals["Date"])
+    assert restored.columns.tolist() == signals.columns.tolist()
+    np.testing.assert_array_equal(
+        restored.drop(columns=["Date"]).to_numpy(dtype=np.int16),
+        signals.drop(columns=["Date"]).to_numpy(dtype=np.int16),
+    )
+
+
+def test_events_round_trip(tmp_path, signals):
+    path = tmp_path / "signal_events.csv"
+    events = append_signal_events(signals, path)
+
+    transitions = (signals.drop(columns=["Date"]).diff().iloc[1:] != 0).sum().sum()
+    assert len(events) == transitions + len(signals.columns) - 1
+    assert_reconstructed(path, signals)
+
+
+def test_append_writes_only_new_transitions(tmp_path, signals):
+    path = tmp_path / "signal_events.csv"
+    append_signal_events(signals.iloc[:1000], path)
+    added = append_signal_events(signals, path)
+
+    assert (added["Date"] > signals["Date"].iloc[999]).all()
+    pd.testing.assert_frame_equal(read_signal_events(path), signal_events(signals))
+    assert_reconstructed(path, signals)
+
+
+def test_append_rewrites_when_history_changed(tmp_path, signals):
+    path = tmp_path / "signal_events.csv"
+    append_signal_events(signals.iloc[:1000], path)
+
+    changed = signals.copy()
+    column = changed.columns[1]
+    changed.loc[500, column] = 1 if changed.loc[500, column] != 1 else -1
+    append_signal_events(changed, path)
+    assert_reconstructed(path, changed)
+
+
+def test_file_stores_codes_with_header_dictionary(tmp_path, signals):
+    path = tmp_path / "signal_events.csv"
+    append_signal_events(signals, path)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith(HEADER_PREFIX)
+    assert (
+        json.loads(lines[0].removeprefix(HEADER_PREFIX)) == signals.columns[1:].tolist()
+    )
+    assert lines[1] == "Date,Changes"
+    assert not any(column in "\n".join(lines[1:]) for column in signals.columns[1:])
+
+
+def test_legacy_file_is_rewritten(tmp_path, signals):
+    path = tmp_path / "signal_events.csv"
+    signal_events(signals.iloc[:1000]).to_csv(path, index=False)
+    pd.testing.assert_frame_equal(
+        read_signal_events(path), signal_events(signals.iloc[:1000])
+    )
+
+    append_signal_events(signals, path)
+    assert path.read_text(encoding="utf-8").startswith(HEADER_PREFIX)
+    assert_reconstructed(path, signals)
+
+
+def test_new_signal_column_rewrites_dictionary(tmp_path, signals):
+    path = tmp_path / "signal_events.csv"
+    append_signal_events(signals.drop(columns=[signals.columns[-1]]), path)
+    append_signal_events(signals, path)
+    assert_reconstructed(path, signals)
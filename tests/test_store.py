@@ -0,0 +1,61 @@
+"""심볼/연도 파티션 OHLCV 저장소 테스트"""
+
+import pandas as pd
+import pytest
+
+from src.store import OHLCVStore
+
+
+def make_bars(start: str, end: str, close: float = 100.0) -> pd.DataFrame:
+    """기간 안의 모든 평일에 대한 OHLCV 봉"""
+    sessions = pd.bdate_range(start, end)
+    return pd.DataFrame(
+        {
+            "Date": sessions,
+            "Open": close,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": 1000.0,
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path) -> OHLCVStore:
+    return OHLCVStore(tmp_path / "store")
+
+
+def test_upsert_returns_only_new_or_changed_bars(store):
+    bars = make_bars("2020-12-01", "2021-01-29")
+    assert len(store.upsert("SPY", bars)) == len(bars)
+    assert store.upsert("SPY", bars).empty
+
+    changed = bars.iloc[[3, 30]].assign(Close=120.0)
+    extra = make_bars("2021-02-01", "2021-02-05")
+    delta = store.upsert("SPY", pd.concat([changed, extra]))
+    assert delta["Date"].tolist() == (changed["Date"].tolist() + extra["Date"].tolist())
+
+    stored = store.read("SPY")
+    assert len(stored) == len(bars) + len(extra)
+    assert stored["Date"].is_monotonic_increasing
+    assert stored.set_index("Date").loc[changed["Date"], "Close"].eq(120.0).all()
+    assert store.last_date("SPY") == pd.Timestamp("2021-02-05")
+
+
+def test_upsert_writes_year_partitions_and_index(store):
+    store.upsert("SPY", make_bars("2020-12-01", "2021-01-29"))
+    index = store.index("SPY")
+    assert sorted(index) == ["2020", "2021"]
+    assert index["2020"]["first"] == "2020-12-01"
+    assert index["2021"]["last"] == "2021-01-29"
+    assert index["2020"]["rows"] + index["2021"]["rows"] == len(store.read("SPY"))
+
+    window = store.read("SPY", "2021-01-04", "2021-01-08")
+    assert window["Date"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2021-01-04",
+        "2021-01-05",
+        "2021-01-06",
+        "2021-01-07",
+        "2021-01-08",
+    ]
@@ -0,0 +1,89 @@
+"""스트리밍 파이프라인(재생, 봉 집계, 봉별 시그널) 테스트"""
+
+import argparse
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+from src.cli import run_stream
+from src.streaming import BarAggregator, ReplaySource, StreamingPipeline
+
+
+def aggregate(source: ReplaySource, freq: str) -> pd.DataFrame:
+    """소스의 틱을 봉으로 집계합니다."""
+
+    async def collect():
+        aggregator = BarAggregator(freq)
+        bars = [aggregator.add(tick) async for tick in source.ticks()]
+        return [bar for bar in bars + [aggregator.flush()] if bar is not None]
+
+    bars = asyncio.run(collect())
+    return pd.DataFrame(
+        [bar[:6] for bar in bars],
+        columns=["Date", "Open", "High", "Low", "Close", "Volume"],
+    )
+
+
+def test_replayed_bars_reproduce_ohlcv(ohlcv):
+    data = ohlcv.iloc[:200].reset_index(drop=True)
+    bars = aggregate(ReplaySource("unused.csv", speed=0, data=data), "D")
+
+    pd.testing.assert_frame_equal(bars, data, check_dtype=False)
+
+
+def test_ticks_are_aggregated_by_frequency(tmp_path):
+    stamps = pd.date_range("2024-01-02 09:30", periods=12, freq="1min")
+    ticks = pd.DataFrame(
+        {"Timestamp": stamps, "Price": np.arange(12.0) % 5 + 100, "Size": 1.0}
+    )
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+
+    bars = aggregate(ReplaySource(path, speed=0), "5min")
+    assert bars["Date"].tolist() == list(
+        pd.date_range(stamps[0], periods=3, freq="5min")
+    )
+    assert bars["Open"].tolist() == [100.0, 100.0, 100.0]
+    assert bars["High"].tolist() == [104.0, 104.0, 101.0]
+    assert bars["Low"].tolist() == [100.0, 100.0, 100.0]
+    assert bars["Close"].tolist() == [104.0, 104.0, 101.0]
+    assert bars["Volume"].tolist() == [5.0, 5.0, 2.0]
+
+
+def test_pipeline_signals_match_full_run(ohlcv, signals):
+    received = []
+    source = ReplaySource("unused.csv", speed=0, data=ohlcv.iloc[1400:1420])
+    pipeline = StreamingPipeline(
+        source,
+        history=ohlcv.iloc[:1400],
+        queue_size=1,
+        on_signal=lambda bar, values: received.append((bar.date, values)),
+    )
+    report = asyncio.run(pipeline.run())
+
+    assert report["count"] == pipeline.bars_processed == 20
+    dates = [date for date, _ in received]
+    assert dates == ohlcv["Date"].iloc[1400:1420].tolist()
+    actual = pd.DataFrame([values for _, values in received])
+    expected = signals.iloc[1400:1420][actual.columns].reset_index(drop=True)
+    np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+
+
+def test_run_stream_replays_only_remaining_bars(tmp_path, ohlcv, monkeypatch):
+    path = tmp_path / "ohlcv.csv"
+    ohlcv.iloc[:320].to_csv(path, index=False)
+    processed = []
+    run = StreamingPipeline.run
+
+    async def recording_run(pipeline):
+        report = await run(pipeline)
+        processed.append(pipeline.bars_processed)
+        return report
+
+    monkeypatch.setattr(StreamingPipeline, "run", recording_run)
+    args = argparse.Namespace(replay=path, history_bars=315, speed=0.0, freq="D")
+    run_stream(args)
+
+    assert processed == [5]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ohlcv.csv"]
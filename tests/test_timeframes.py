@@ -0,0 +1,96 @@
+"""다중 시간 프레임(리샘플링, 증분 캐시, 일봉 정렬) 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.timeframes import (
+    AVAILABLE_COLUMN,
+    MultiTimeframe,
+    ResampleCache,
+    align_to_daily,
+    resample_ohlcv,
+)
+
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+
+@pytest.fixture(scope="module")
+def daily(ohlcv) -> pd.DataFrame:
+    """휴장일(금요일 일부 포함)이 빠진 일봉"""
+    dropped = ohlcv.index[7::19]
+    return ohlcv.drop(dropped).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("freq, rule", [("W-FRI", "W-FRI"), ("M", "ME")])
+def test_resample_matches_pandas(daily, freq, rule):
+    bars = resample_ohlcv(daily, freq)
+
+    grouped = daily.set_index("Date").resample(rule)
+    expected = grouped.agg(
+        {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+    ).dropna()
+    np.testing.assert_allclose(bars[OHLCV].to_numpy(), expected.to_numpy())
+    last_dates = grouped["Close"].apply(lambda s: s.index.max()).dropna()
+    np.testing.assert_array_equal(bars["Date"].to_numpy(), last_dates.to_numpy())
+    np.testing.assert_array_equal(
+        bars[AVAILABLE_COLUMN].to_numpy(), expected.index.normalize().to_numpy()
+    )
+
+
+@pytest.mark.parametrize("freq", ["W-FRI", "M"])
+def test_incremental_resample_matches_full(daily, freq):
+    cache = ResampleCache()
+    for rows in (300, 303, 303, 420, 421, len(daily)):
+        bars = cache.bars(daily.iloc[:rows], freq)
+        pd.testing.assert_frame_equal(bars, resample_ohlcv(daily.iloc[:rows], freq))
+        if rows == 303:
+            assert cache.updated_bars[freq] <= 2
+
+    assert cache.updated_bars[freq] < len(bars)
+
+
+def test_cache_recomputes_when_history_changes(daily):
+    cache = ResampleCache()
+    cache.bars(daily.iloc[:400], "W-FRI")
+
+    shifted = daily.iloc[5:500].reset_index(drop=True)
+    bars = cache.bars(shifted, "W-FRI")
+    assert cache.updated_bars["W-FRI"] == len(bars)
+    pd.testing.assert_frame_equal(bars, resample_ohlcv(shifted, "W-FRI"))
+
+
+def test_weekly_values_are_used_only_after_the_week_ends():
+    dates = pd.Series(
+        pd.to_datetime(
+            ["2024-03-25", "2024-03-26", "2024-03-27", "2024-03-28"]  # 금요일 휴장
+            + ["2024-04-01", "2024-04-02", "2024-04-05", "2024-04-08"]
+        )
+    )
+    daily = pd.DataFrame({"Date": dates, **{c: np.arange(1.0, 9.0) for c in OHLCV}})
+    bars = resample_ohlcv(daily, "W-FRI")
+    values = pd.DataFrame({"Signal": np.array([1, -1, 1], dtype=np.int8)})
+
+    assert len(bars) == len(values)
+    aligned = align_to_daily(daily["Date"], bars, values, "W")
+    assert aligned.columns.tolist() == ["Signal@W"]
+    # 첫 주 봉(3/28)은 휴장인 금요일 3/29 다음 거래일 4/1부터, 둘째 주 봉은 4/5부터 사용
+    assert aligned["Signal@W"].tolist() == [0, 0, 0, 0, 1, 1, -1, -1]
+
+
+def test_multi_timeframe_run(daily):
+    mtf = MultiTimeframe({"W": "W-FRI"})
+    result = mtf.run(daily)
+
+    assert len(result) == len(daily)
+    signals = mtf.signals["W"]
+    columns = [c for c in result.columns if c != "Date"]
+    assert columns == [f"{c}@W" for c in signals.columns if c != "Date"]
+
+    bars = mtf.cache.bars(daily, "W-FRI")
+    assert mtf.cache.updated_bars["W-FRI"] == 0
+    for row in (200, 700, len(daily) - 1):
+        date = daily["Date"].iloc[row]
+        week = np.searchsorted(bars[AVAILABLE_COLUMN], date, side="right") - 1
+        expected = signals.drop(columns=["Date"]).iloc[week].to_numpy()
+        np.testing.assert_array_equal(result[columns].iloc[row].to_numpy(), expected)
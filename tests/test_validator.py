@@ -0,0 +1,77 @@
+"""OHLCV 검증기 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_ohlcv
+from src.fetch_planner import trading_sessions
+from src.validator import ERROR_CHECKS, OHLCVValidator
+
+
+@pytest.fixture
+def clean() -> pd.DataFrame:
+    """거래일 달력에 맞춘 문제 없는 일봉 데이터"""
+    sessions = trading_sessions("2018-01-02", "2021-12-31")
+    df = generate_ohlcv(len(sessions), seed=7)
+    df["Date"] = sessions
+    return df
+
+
+def test_clean_data_has_no_issues(clean):
+    report = OHLCVValidator().validate(clean)
+    assert report.ok
+    assert report.issues == {}
+    assert report.rows_checked == len(clean)
+
+
+def test_detects_injected_problems(clean):
+    df = clean.copy()
+    df.loc[100, "Date"] = df.loc[99, "Date"]  # 날짜 중복
+    df.loc[200, "Date"] = df.loc[190, "Date"]  # 날짜 역순
+    df.loc[300, "Close"] = np.nan  # 결측 가격
+    df.loc[400, "High"] = df.loc[400, ["Open", "Close"]].min() - 1.0  # 고가 < 시가·종가
+    df.loc[500, "Volume"] = -1.0  # 음수 거래량
+    df.loc[600, ["Open", "High", "Low", "Close"]] = df.loc[600, "Close"]  # 고가 = 저가
+    monday = int(np.flatnonzero(df["Date"].dt.dayofweek.iloc[700:] == 0)[0]) + 700
+    df.loc[monday, "Date"] -= pd.Timedelta(days=2)  # 토요일 (비거래일)
+    df.loc[800:, ["Open", "High", "Low", "Close"]] *= 3.0  # 이상 수익률
+
+    report = OHLCVValidator().validate(df)
+    assert not report.ok
+    issues = {name: rows.tolist() for name, rows in report.issues.items()}
+    assert issues["duplicate_date"] == [100]
+    assert issues["unordered_date"] == [200]
+    assert issues["non_finite"] == [300]
+    assert issues["ohlc_inconsistent"] == [400]
+    assert issues["negative_volume"] == [500]
+    assert issues["zero_range"] == [600]
+    assert issues["non_session"] == [monday]
+    assert 800 in issues["outlier_return"]
+
+
+def test_detects_calendar_gap(clean):
+    df = clean.drop(index=[50, 51]).reset_index(drop=True)
+    report = OHLCVValidator().validate(df)
+    assert report.ok
+    assert report.issues["calendar_gap"].tolist() == [50]
+
+
+def test_incremental_validation_checks_only_new_bars(clean):
+    df = clean.copy()
+    df.loc[900, "Volume"] = -1.0
+    df.loc[901, "Date"] = df.loc[900, "Date"]
+
+    validator = OHLCVValidator()
+    first = validator.validate(df.iloc[:850])
+    assert first.ok
+    second = validator.validate(df)
+    assert (second.start, second.end) == (850, len(df))
+
+    full = OHLCVValidator().validate(df)
+    for name in ERROR_CHECKS:
+        assert (
+            second.issues.get(name, np.empty(0)).tolist()
+            == full.issues.get(name, np.empty(0)).tolist()
+        )
+    assert validator.validate(df).rows_checked == 0